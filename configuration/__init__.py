@@ -4,6 +4,7 @@ Aidat Plus uygulaması için merkezi konfigürasyon yönetimi.
 
 Module exports:
     - ConfigurationManager: Merkezi konfigürasyon yöneticisi (Singleton)
+    - parse_bool_setting: Boolean ayar değerlerini doğrulayan yardımcı
     - ConfigKeys: Configuration anahtarları (constants)
     - ConfigDefaults: Varsayılan değerler
     - EnvironmentTypes: Environment tipleri
@@ -18,7 +19,7 @@ Example:
     >>> theme = config.get(ConfigKeys.UI_THEME, 'dark')
 """
 
-from configuration.config_manager import ConfigurationManager
+from configuration.config_manager import ConfigurationManager, parse_bool_setting
 from configuration.constants import (
     ConfigKeys,
     ConfigDefaults,
@@ -30,6 +31,7 @@ from configuration.constants import (
 
 __all__ = [
     'ConfigurationManager',
+    'parse_bool_setting',
     'ConfigKeys',
     'ConfigDefaults',
     'EnvironmentTypes',
@@ -22,6 +22,47 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Boolean ayarlar için kabul edilen metinler (küçük harfe çevrilerek karşılaştırılır)
+DOGRU_METINLERI = ('true', 'yes', 'on', '1')
+YANLIS_METINLERI = ('false', 'no', 'off', '0')
+
+
+def parse_bool_setting(value: Any, key: str) -> bool:
+    """Boolean ayar değerini doğrula ve çevir
+
+    ``bool("false")`` True döndürdüğü için JSON/.env kaynaklı metin değerler
+    açıkça ayrıştırılır.
+
+    Args:
+        value (Any): Ayar değeri (bool, 0/1 veya "true"/"false" gibi metin)
+        key (str): Ayar anahtarı (hata mesajı için)
+
+    Returns:
+        bool: Ayrıştırılan değer
+
+    Raises:
+        ConfigError: Değer tanınan bir boolean değilse
+
+    Example:
+        >>> parse_bool_setting("false", "backup.auto_enabled")
+        False
+    """
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        metin = value.strip().lower()
+        if metin in DOGRU_METINLERI:
+            return True
+        if metin in YANLIS_METINLERI:
+            return False
+    raise ConfigError(
+        f"Geçersiz boolean ayar: {key}={value}",
+        code="CFG_002",
+        details={"key": key, "allowed": list(DOGRU_METINLERI + YANLIS_METINLERI)}
+    )
+
 
 class ConfigurationManager:
     """Uygulama konfigürasyon yöneticisi
@@ -140,7 +181,17 @@ class ConfigurationManager:
                 'pool_size': 10,
                 'pool_recycle': 3600,
                 'echo': False,
-                'check_same_thread': False
+                'check_same_thread': False,
+                'journal_mode': 'WAL',
+                'synchronous': 'NORMAL',
+                'cache_size_kb': 65536,
+                'mmap_size': 268435456,
+                'temp_store': 'MEMORY',
+                'foreign_keys': True,
+                'busy_timeout_ms': 5000,
+                'pool_strategy': 'queue',
+                'max_overflow': 10,
+                'pool_timeout': 30
             },
             'ui': {
                 'theme': 'light',
@@ -156,6 +207,25 @@ class ConfigurationManager:
                 'max_bytes': 10485760,
                 'backup_count': 5
             },
+            'backup': {
+                'auto_enabled': True,
+                'interval_hours': 24,
+                'format': 'sqlite',
+                'directory': 'yedekler',
+                'keep_last': 7,
+                'keep_daily': 7,
+                'keep_monthly': 12,
+                'idle_seconds': 5
+            },
+            'profiling': {
+                'startup_trace': False,
+                'startup_report': 'logs/startup_trace.json',
+                'startup_budgets_ms': {},
+                'query_trace': False,
+                'query_report': 'logs/query_trace.json',
+                'slow_query_ms': 100,
+                'n_plus_one_threshold': 10
+            },
             'features': {
                 'enable_logging': True,
                 'enable_backup': True,
@@ -230,6 +300,9 @@ class ConfigurationManager:
             'DATABASE_URL': 'database.url',
             'DATABASE_POOL_SIZE': 'database.pool_size',
             'DATABASE_ECHO': 'database.echo',
+            'DATABASE_JOURNAL_MODE': 'database.journal_mode',
+            'DATABASE_SYNCHRONOUS': 'database.synchronous',
+            'DATABASE_POOL_STRATEGY': 'database.pool_strategy',
             'LOG_LEVEL': 'logging.level',
             'APP_ENV': 'app.env',
             'APP_DEBUG': 'app.debug',
@@ -56,6 +56,36 @@ class ConfigKeys:
     DATABASE_CHECK_SAME_THREAD = 'database.check_same_thread'
     """SQLite same thread check (bool)"""
     
+    DATABASE_JOURNAL_MODE = 'database.journal_mode'
+    """SQLite journal modu (str): 'WAL', 'DELETE', 'TRUNCATE', ..."""
+    
+    DATABASE_SYNCHRONOUS = 'database.synchronous'
+    """SQLite synchronous seviyesi (str): 'OFF', 'NORMAL', 'FULL', 'EXTRA'"""
+    
+    DATABASE_CACHE_SIZE_KB = 'database.cache_size_kb'
+    """Bağlantı başına sayfa cache boyutu KiB (int)"""
+    
+    DATABASE_MMAP_SIZE = 'database.mmap_size'
+    """Memory-mapped I/O boyutu byte (int), 0 = kapalı"""
+    
+    DATABASE_TEMP_STORE = 'database.temp_store'
+    """Geçici tablo/index deposu (str): 'DEFAULT', 'FILE', 'MEMORY'"""
+    
+    DATABASE_FOREIGN_KEYS = 'database.foreign_keys'
+    """Foreign key kontrolü (bool)"""
+    
+    DATABASE_BUSY_TIMEOUT_MS = 'database.busy_timeout_ms'
+    """Kilit bekleme süresi milisaniye (int)"""
+    
+    DATABASE_POOL_STRATEGY = 'database.pool_strategy'
+    """Bağlantı havuzu stratejisi (str): 'queue', 'null', 'static', 'singleton'"""
+    
+    DATABASE_MAX_OVERFLOW = 'database.max_overflow'
+    """Pool boyutunu aşabilecek ek bağlantı sayısı (int)"""
+    
+    DATABASE_POOL_TIMEOUT = 'database.pool_timeout'
+    """Pool'dan bağlantı bekleme süresi saniye (int)"""
+    
     # ==================== UI SECTION ====================
     
     UI_THEME = 'ui.theme'
@@ -104,6 +134,55 @@ class ConfigKeys:
     FEATURES_ENABLE_CHARTS = 'features.enable_charts'
     """Grafikler özelliği (bool)"""
     
+    # ==================== BACKUP SECTION ====================
+    
+    BACKUP_AUTO_ENABLED = 'backup.auto_enabled'
+    """Zamanlanmış otomatik yedekleme (bool)"""
+    
+    BACKUP_INTERVAL_HOURS = 'backup.interval_hours'
+    """Otomatik yedekler arası süre, saat (float)"""
+    
+    BACKUP_FORMAT = 'backup.format'
+    """Otomatik yedek biçimi (str): 'sqlite', 'xml', 'excel'"""
+    
+    BACKUP_DIRECTORY = 'backup.directory'
+    """Otomatik yedek dizini (str)"""
+    
+    BACKUP_KEEP_LAST = 'backup.keep_last'
+    """Her durumda saklanan en yeni yedek sayısı (int)"""
+    
+    BACKUP_KEEP_DAILY = 'backup.keep_daily'
+    """Günde bir saklanan yedek sayısı (int)"""
+    
+    BACKUP_KEEP_MONTHLY = 'backup.keep_monthly'
+    """Ayda bir saklanan yedek sayısı (int)"""
+    
+    BACKUP_IDLE_SECONDS = 'backup.idle_seconds'
+    """Yedeğin başlaması/sürmesi için gereken arayüz boşta kalma süresi, saniye (float)"""
+    
+    # ==================== PROFILING SECTION ====================
+    
+    PROFILING_STARTUP_TRACE = 'profiling.startup_trace'
+    """Açılış süresi raporu yazılsın mı (bool); AIDAT_STARTUP_TRACE=1 ile de açılır"""
+    
+    PROFILING_STARTUP_REPORT = 'profiling.startup_report'
+    """Açılış raporu JSON dosyası (str)"""
+    
+    PROFILING_STARTUP_BUDGETS_MS = 'profiling.startup_budgets_ms'
+    """Açılış ölçümü bütçeleri (dict): ölçüm adı -> milisaniye"""
+    
+    PROFILING_QUERY_TRACE = 'profiling.query_trace'
+    """SQL ifadeleri ölçülsün mü (bool); AIDAT_QUERY_TRACE=1 ile de açılır"""
+    
+    PROFILING_QUERY_REPORT = 'profiling.query_report'
+    """Kapanışta yazılan sorgu raporu JSON dosyası (str)"""
+    
+    PROFILING_SLOW_QUERY_MS = 'profiling.slow_query_ms'
+    """Bu süreyi aşan tek SQL ifadesi loglanır, milisaniye (float)"""
+    
+    PROFILING_N_PLUS_ONE_THRESHOLD = 'profiling.n_plus_one_threshold'
+    """Bir arayüz eyleminde bu kadar tekrar eden ifade N+1 şüphesi sayılır (int)"""
+    
     # ==================== USER PREFERENCES SECTION ====================
     
     USER_LAST_ACTIVE_LOJMAN_ID = 'user.last_active_lojman_id'
@@ -168,6 +247,16 @@ class ConfigDefaults:
     DEFAULT_DB_POOL_SIZE = 10
     DEFAULT_DB_POOL_RECYCLE = 3600
     DEFAULT_DB_ECHO = False
+    DEFAULT_DB_JOURNAL_MODE = 'WAL'
+    DEFAULT_DB_SYNCHRONOUS = 'NORMAL'
+    DEFAULT_DB_CACHE_SIZE_KB = 65536  # 64 MB
+    DEFAULT_DB_MMAP_SIZE = 268435456  # 256 MB
+    DEFAULT_DB_TEMP_STORE = 'MEMORY'
+    DEFAULT_DB_FOREIGN_KEYS = True
+    DEFAULT_DB_BUSY_TIMEOUT_MS = 5000
+    DEFAULT_DB_POOL_STRATEGY = 'queue'
+    DEFAULT_DB_MAX_OVERFLOW = 10
+    DEFAULT_DB_POOL_TIMEOUT = 30
     
     # UI
     DEFAULT_UI_THEME = 'dark'
@@ -181,6 +270,24 @@ class ConfigDefaults:
     DEFAULT_LOG_MAX_BYTES = 10485760  # 10 MB
     DEFAULT_LOG_BACKUP_COUNT = 5
     
+    # Backup
+    DEFAULT_BACKUP_AUTO_ENABLED = True
+    DEFAULT_BACKUP_INTERVAL_HOURS = 24.0
+    DEFAULT_BACKUP_FORMAT = 'sqlite'
+    DEFAULT_BACKUP_DIRECTORY = 'yedekler'
+    DEFAULT_BACKUP_KEEP_LAST = 7
+    DEFAULT_BACKUP_KEEP_DAILY = 7
+    DEFAULT_BACKUP_KEEP_MONTHLY = 12
+    DEFAULT_BACKUP_IDLE_SECONDS = 5.0
+    
+    # Profiling
+    DEFAULT_STARTUP_TRACE = False
+    DEFAULT_STARTUP_REPORT = 'logs/startup_trace.json'
+    DEFAULT_QUERY_TRACE = False
+    DEFAULT_QUERY_REPORT = 'logs/query_trace.json'
+    DEFAULT_SLOW_QUERY_MS = 100
+    DEFAULT_N_PLUS_ONE_THRESHOLD = 10
+    
     # Financial
     DEFAULT_CURRENCY = 'TRY'
     DEFAULT_DECIMAL_PLACES = 2
@@ -5,18 +5,29 @@ Bu modül, aidat oluşturma, ödeme takibi ve aidat-spesifik
 işlemleri gerçekleştirir.
 """
 
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, cast
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, joinedload
 from controllers.base_controller import BaseController
-from models.base import AidatIslem, AidatOdeme, FinansIslem, Daire
+from models.base import AidatIslem, AidatOdeme, FinansIslem, Daire, Blok
 from models.validation import Validator
-from models.exceptions import ValidationError, NotFoundError
+from models.exceptions import ValidationError, NotFoundError, DatabaseError
 from database.config import get_db, get_db_session
 from datetime import datetime
 
 # Logger import
 from utils.logger import get_logger
 
+# generate_month() şablonunda daire başına eklenebilen sabit kalemler
+AIDAT_SABLON_KALEMLERI = ("elektrik", "su", "isinma", "ek_giderler")
+
+# Varsayılan son ödeme günü (aidat formundaki varsayılan ile aynı)
+VARSAYILAN_SON_ODEME_GUNU = 16
+
+# Toplu insert parça boyutu
+TOPLU_INSERT_PARCA = 500
+
 class AidatIslemController(BaseController[AidatIslem]):
     """
     Aidat işlemleri için controller.
@@ -321,6 +332,170 @@ class AidatIslemController(BaseController[AidatIslem]):
             return cast(List[AidatIslem], result)
 
 
+    def generate_month(self, yil: int, ay: int, lojman_id: Optional[int] = None,
+                       template: Optional[Dict[str, Any]] = None,
+                       db: Optional[Session] = None) -> Dict[str, Any]:
+        """
+        Bir ay için tüm aktif dairelerin aidat işlemlerini toplu oluştur.
+
+        Her daire için bir AidatIslem ve ona bağlı ödenmemiş bir AidatOdeme
+        kaydı oluşturulur. Tutarlar dairenin ``guncel_aidat`` ve ``katki_payi``
+        değerlerinden hesaplanır; şablondaki sabit kalemler eklenir. Kayıtlar
+        parçalar halinde toplu insert edilir ve tek transaction'da commit edilir.
+
+        İşlem idempotenttir: aynı yıl/ay için aidat işlemi olan daireler
+        (``idx_aidat_islem_daire_yil_ay``) atlanır.
+
+        Args:
+            yil (int): Yıl
+            ay (int): Ay (1-12)
+            lojman_id (int, optional): Yalnızca bu lojmandaki daireler
+            template (dict, optional): Aidat şablonu
+                - elektrik, su, isinma, ek_giderler (float): Daire başına sabit kalemler
+                - son_odeme_tarihi (datetime): Son ödeme tarihi
+                - son_odeme_gunu (int): Son ödeme günü (varsayılan 16, tarih verilmezse)
+                - aciklama (str): Aidat açıklaması
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            Dict[str, Any]: Özet
+                - olusturulan (int): Oluşturulan aidat işlemi sayısı
+                - atlanan_mevcut (int): Zaten aidatı olduğu için atlanan daire sayısı
+                - atlanan_sifir (int): Toplam tutarı 0 olduğu için atlanan daire sayısı
+                - toplam_tutar (float): Oluşturulan aidatların toplamı
+
+        Raises:
+            ValidationError: Yıl, ay veya şablon geçersiz ise
+            DatabaseError: Veritabanı hatası
+
+        Example:
+            >>> controller.generate_month(2024, 11, template={"su": 50.0})
+            {'olusturulan': 1980, 'atlanan_mevcut': 20, 'atlanan_sifir': 0, 'toplam_tutar': 1188000.0}
+        """
+        # 1. VALIDASYON
+        Validator.validate_integer(ay, "Ay")
+        Validator.validate_choice(ay, "Ay", list(range(1, 13)))
+        Validator.validate_integer(yil, "Yıl")
+        Validator.validate_positive_number(yil, "Yıl")
+
+        template = dict(template or {})
+        sabit_kalemler: Dict[str, float] = {}
+        for kalem in AIDAT_SABLON_KALEMLERI:
+            deger = template.get(kalem) or 0.0
+            Validator.validate_positive_number(deger, kalem, allow_zero=True)
+            sabit_kalemler[kalem] = float(deger)
+
+        son_odeme_tarihi = template.get("son_odeme_tarihi")
+        if son_odeme_tarihi is None:
+            gun = int(template.get("son_odeme_gunu") or VARSAYILAN_SON_ODEME_GUNU)
+            try:
+                son_odeme_tarihi = datetime(int(yil), int(ay), gun)
+            except ValueError:
+                raise ValidationError(
+                    f"Geçersiz son ödeme günü: {gun}",
+                    code="VAL_006",
+                    details={"field": "son_odeme_gunu", "value": gun}
+                )
+        else:
+            son_odeme_tarihi = Validator.validate_date(son_odeme_tarihi)
+        aciklama = template.get("aciklama")
+
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            # 2. Aktif daireler (yalnızca gerekli kolonlar)
+            daire_query = session.query(Daire.id, Daire.guncel_aidat, Daire.katki_payi).filter(
+                Daire.aktif == True
+            )
+            if lojman_id is not None:
+                daire_query = daire_query.join(Blok, Daire.blok_id == Blok.id).filter(
+                    Blok.lojman_id == lojman_id
+                )
+            daireler = daire_query.order_by(Daire.id).all()
+
+            # 3. Idempotency: bu ay için aidatı olan daireler
+            mevcut = {
+                daire_id for (daire_id,) in session.query(AidatIslem.daire_id).filter(
+                    AidatIslem.yil == yil,
+                    AidatIslem.ay == ay
+                )
+            }
+
+            sabit_toplam = sum(sabit_kalemler.values())
+            islem_satirlari: List[Dict[str, Any]] = []
+            atlanan_mevcut = 0
+            atlanan_sifir = 0
+            for daire_id, guncel_aidat, katki_payi in daireler:
+                if daire_id in mevcut:
+                    atlanan_mevcut += 1
+                    continue
+                aidat_tutari = float(guncel_aidat or 0.0)
+                katki = float(katki_payi or 0.0)
+                toplam = round(aidat_tutari + katki + sabit_toplam, 2)
+                if toplam <= 0:
+                    atlanan_sifir += 1
+                    continue
+                islem_satirlari.append({
+                    "yil": yil,
+                    "ay": ay,
+                    "daire_id": daire_id,
+                    "aidat_tutari": aidat_tutari,
+                    "katki_payi": katki,
+                    **sabit_kalemler,
+                    "toplam_tutar": toplam,
+                    "son_odeme_tarihi": son_odeme_tarihi,
+                    "aciklama": aciklama,
+                    "aktif": True,
+                })
+
+            # 4. Toplu insert (AidatIslem → AidatOdeme), tek transaction
+            for i in range(0, len(islem_satirlari), TOPLU_INSERT_PARCA):
+                session.execute(insert(AidatIslem.__table__), islem_satirlari[i:i + TOPLU_INSERT_PARCA])
+
+            if islem_satirlari:
+                yeni_daireler = {satir["daire_id"]: satir["toplam_tutar"] for satir in islem_satirlari}
+                odeme_satirlari = [
+                    {
+                        "aidat_islem_id": islem_id,
+                        "tutar": yeni_daireler[daire_id],
+                        "son_odeme_tarihi": son_odeme_tarihi,
+                        "odendi": False,
+                        "aciklama": None,
+                    }
+                    for islem_id, daire_id in session.query(AidatIslem.id, AidatIslem.daire_id).filter(
+                        AidatIslem.yil == yil,
+                        AidatIslem.ay == ay
+                    )
+                    if daire_id in yeni_daireler and daire_id not in mevcut
+                ]
+                for i in range(0, len(odeme_satirlari), TOPLU_INSERT_PARCA):
+                    session.execute(insert(AidatOdeme.__table__), odeme_satirlari[i:i + TOPLU_INSERT_PARCA])
+
+            session.commit()
+
+            sonuc = {
+                "olusturulan": len(islem_satirlari),
+                "atlanan_mevcut": atlanan_mevcut,
+                "atlanan_sifir": atlanan_sifir,
+                "toplam_tutar": round(sum(s["toplam_tutar"] for s in islem_satirlari), 2),
+            }
+            self.logger.info(
+                f"Monthly dues generated for {yil}-{ay:02d} (lojman={lojman_id}): {sonuc}"
+            )
+            return sonuc
+        except SQLAlchemyError as e:
+            session.rollback()
+            self.logger.error(f"Monthly dues generation failed for {yil}-{ay}: {str(e)}")
+            raise DatabaseError(
+                f"Aylık aidat oluşturma başarısız: {str(e)}",
+                code="DB_AID_001",
+                details={"yil": yil, "ay": ay, "lojman_id": lojman_id}
+            )
+        finally:
+            if close_db:
+                session.close()
+
 class AidatOdemeController(BaseController[AidatOdeme]):
     """
     Aidat ödemeleri için controller.
@@ -0,0 +1,161 @@
+"""
+Arama controller - sakin, finans işlemi ve aidat işlemi genel araması.
+
+Arama ``database.fts`` modülündeki FTS5 indeksleri üzerinden yapılır:
+kelime önekleri Türkçe katlama ile eşleşir ("yildiz" → "YILDIZ", "Yıldız")
+ve sonuçlar kolon ağırlıklı bm25 puanına göre sıralanır. Her kaynaktan
+yalnızca en iyi ``limit`` eşleşme okunur, ardından birleştirilir; bu sayede
+yanıt süresi tablo boyutundan çok eşleşme sayısına bağlıdır.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from database.config import get_db
+from database.fts import FTS_TABLOLARI, doldur, fts_hazir, fts_sorgusu, turkce_katla
+from models.exceptions import DatabaseError
+from models.validation import Validator
+from utils.logger import get_logger
+
+# Kaynak adı -> (FTS tablosu, başlık SQL'i, kaynak tablo ek filtresi)
+ARAMA_KAYNAKLARI: Dict[str, Any] = {
+    "sakin": ("sakin_fts", "k.ad_soyad", "1 = 1"),
+    "finans_islem": ("finans_islem_fts", "k.aciklama", "k.aktif = 1"),
+    "aidat_islem": ("aidat_islem_fts", "k.aciklama", "1 = 1"),
+}
+
+
+class AramaController:
+    """
+    FTS5 tabanlı genel arama.
+
+    Example:
+        >>> controller = AramaController()
+        >>> controller.search("yildiz")
+        [{'kaynak': 'sakin', 'id': 12, 'baslik': 'Ahmet Yıldız', 'skor': -7.41}, ...]
+    """
+
+    def __init__(self) -> None:
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    def search(
+        self,
+        metin: str,
+        kaynaklar: Optional[Sequence[str]] = None,
+        limit: int = 50,
+        db: Session = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Sakinler, finans işlemleri ve aidat işlemlerinde sıralı arama yap.
+
+        Args:
+            metin (str): Arama metni; her kelime önek olarak aranır, tümü eşleşmelidir
+            kaynaklar (Sequence[str], optional): "sakin", "finans_islem", "aidat_islem";
+                None ise hepsi
+            limit (int): En fazla sonuç sayısı
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            List[Dict[str, Any]]: En iyi eşleşme önce olmak üzere
+            "kaynak", "id", "baslik" ve "skor" (bm25, küçük daha iyi) alanları
+
+        Raises:
+            ValidationError: Geçersiz kaynak veya limit
+            DatabaseError: Veritabanı hatası
+        """
+        secilenler = list(kaynaklar) if kaynaklar is not None else list(ARAMA_KAYNAKLARI)
+        for kaynak in secilenler:
+            Validator.validate_choice(kaynak, "Arama Kaynağı", list(ARAMA_KAYNAKLARI))
+        Validator.validate_positive_number(limit, "Sonuç Limiti")
+
+        sorgu = fts_sorgusu(metin)
+        if sorgu is None or not secilenler:
+            return []
+
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            sonuclar: List[Dict[str, Any]] = []
+            for kaynak in secilenler:
+                fts_tablosu, baslik, ek_filtre = ARAMA_KAYNAKLARI[kaynak]
+                if fts_hazir(session, fts_tablosu):
+                    satirlar = session.execute(text(
+                        f"SELECT k.id, {baslik} AS baslik, m.rank AS skor "
+                        f"FROM (SELECT rowid, rank FROM {fts_tablosu} WHERE {fts_tablosu} MATCH :sorgu "
+                        f"ORDER BY rank LIMIT :limit) m "
+                        f"JOIN {FTS_TABLOLARI[fts_tablosu][0]} k ON k.id = m.rowid "
+                        f"WHERE {ek_filtre}"
+                    ), {"sorgu": sorgu, "limit": int(limit)}).fetchall()
+                else:
+                    satirlar = self._like_ile_ara(session, fts_tablosu, baslik, ek_filtre, metin, int(limit))
+                sonuclar.extend(
+                    {"kaynak": kaynak, "id": s.id, "baslik": s.baslik, "skor": float(s.skor)}
+                    for s in satirlar
+                )
+
+            sonuclar.sort(key=lambda s: s["skor"])
+            self.logger.debug(f"Search for '{metin}' returned {len(sonuclar)} results")
+            return sonuclar[:int(limit)]
+        except SQLAlchemyError as e:
+            self.logger.error(f"Full-text search failed: {str(e)}")
+            raise DatabaseError(
+                f"Arama yapılamadı: {str(e)}",
+                code="DB_SRC_002",
+                details={"metin": metin, "kaynaklar": secilenler}
+            )
+        finally:
+            if close_db:
+                session.close()
+
+    @staticmethod
+    def _like_ile_ara(session: Session, fts_tablosu: str, baslik: str, ek_filtre: str,
+                      metin: str, limit: int) -> List[Any]:
+        """FTS5 yoksa LIKE ile ara (sıralamasız, skor 0; Türkçe katlama yalnızca ASCII düzeyinde)"""
+        kaynak_tablo, kolonlar, _ = FTS_TABLOLARI[fts_tablosu]
+        kosullar = []
+        parametreler: Dict[str, Any] = {"limit": limit}
+        for i, kelime in enumerate(turkce_katla(metin).split()):
+            parametreler[f"k{i}"] = f"%{kelime}%"
+            kosullar.append("(" + " OR ".join(f"k.{kolon} LIKE :k{i}" for kolon in kolonlar) + ")")
+        return session.execute(text(
+            f"SELECT k.id, {baslik} AS baslik, 0.0 AS skor FROM {kaynak_tablo} k "
+            f"WHERE {ek_filtre} AND {' AND '.join(kosullar) or '1 = 1'} LIMIT :limit"
+        ), parametreler).fetchall()
+
+    def rebuild(self, db: Session = None) -> Dict[str, int]:
+        """
+        Tüm FTS indekslerini kaynak tablolardan yeniden oluştur.
+
+        Args:
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            Dict[str, int]: FTS tablosu -> indekslenen kayıt sayısı
+        """
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            sonuc = {
+                fts_tablosu: doldur(session, fts_tablosu)
+                for fts_tablosu in FTS_TABLOLARI
+                if fts_hazir(session, fts_tablosu)
+            }
+            session.commit()
+            self.logger.info(f"Rebuilt full-text indexes: {sonuc}")
+            return sonuc
+        except SQLAlchemyError as e:
+            session.rollback()
+            self.logger.error(f"Failed to rebuild full-text indexes: {str(e)}")
+            raise DatabaseError(
+                f"Arama indeksi yeniden oluşturulamadı: {str(e)}",
+                code="DB_SRC_003",
+                details={}
+            )
+        finally:
+            if close_db:
+                session.close()
@@ -2,31 +2,131 @@
 Yedekleme ve geri yükleme işlemleri controller
 """
 
+import gzip
 import os
 import shutil
+import sqlite3
+import tempfile
+import time
+from contextlib import contextmanager
 import xml.etree.ElementTree as ET
 from datetime import datetime
-from typing import Optional, List, Dict, Any, Type
-import pandas as pd
+from functools import lru_cache
+from pathlib import Path
+from xml.sax.saxutils import escape, quoteattr
+from typing import TYPE_CHECKING, Optional, List, Dict, Any, Type, Callable, Iterator, Sequence, Tuple
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import Session
-from sqlalchemy import inspect
+from sqlalchemy import inspect, select, func, text, Boolean, DateTime, Float, Integer, Numeric, String, Text
 from sqlalchemy.ext.declarative import DeclarativeMeta
-from database.config import get_db, engine, Base, get_db_session
+from database import degisiklik_izleme, fts, sema_gocleri, tablo_surumleri
+from database.config import get_db, Base, get_db_session, checkpoint_wal
+from controllers.dashboard_controller import DashboardController
+from controllers.doluluk_controller import DolulukController
+from controllers.finans_ozet_controller import FinansOzetController
 from models.base import (
     Lojman, Blok, Daire, Sakin, Aidat, AidatIslem, AidatOdeme,
-    Hesap, Kategori, FinansIslem, Ayar, AnaKategori, AltKategori, Finans
+    Hesap, Kategori, FinansIslem, FinansAylikOzet, Ayar, AnaKategori, AltKategori, Finans
 )
 
 # Logger import
 from utils.logger import get_logger
 
+# pandas ve openpyxl yalnızca Excel yedekleme/geri yükleme sırasında import
+# edilir; uygulama açılışında (otomatik yedek zamanlayıcısı) yüklenmez.
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Akışlı yedeklemede veritabanından tek seferde okunan satır sayısı
+YEDEK_PARCA_BOYUTU = 1000
+
+# Geri yüklemede tek executemany ile eklenen satır sayısı
+TOPLU_EKLEME_BOYUTU = 2000
+
+# Fark yedeği uygulamada tek DELETE ile silinen kayıt sayısı (SQLite parametre sınırı)
+TOPLU_SILME_BOYUTU = 500
+
+# XML yedek dosyasının yazma tamponu (bayt)
+XML_YAZMA_TAMPONU = 1 << 20
+
+# SQLite online backup'ta adım başına kopyalanan sayfa sayısı; adımlar
+# arasında kilit bırakıldığı için uygulama yazmaya devam edebilir
+SQLITE_YEDEK_SAYFA_ADIMI = 256
+
+# Online backup hiç ilerlemeden (kilitli veritabanı) en fazla bu kadar saniye bekler
+SQLITE_YEDEK_BEKLEME_SURESI = 30.0
+
+# gzip dosyalarının ilk iki baytı
+GZIP_IMZASI = b"\x1f\x8b"
+
+
+def _xml_satiri(kolonlar: List[str], satir: Any) -> str:
+    """
+    Tek bir ``<Satir>`` öğesini girintili XML metni olarak oluştur.
+
+    ``ET.indent(space="  ")`` çıktısıyla aynıdır: None ve boş değerler
+    ``<kolon />``, tarih/saatler ISO biçiminde yazılır.
+    """
+    parcalar = ["    <Satir>\n"]
+    for kolon, deger in zip(kolonlar, satir):
+        if deger is not None:
+            deger = deger.isoformat() if isinstance(deger, datetime) else str(deger)
+        if deger:
+            parcalar.append(f"      <{kolon}>{escape(deger)}</{kolon}>\n")
+        else:
+            parcalar.append(f"      <{kolon} />\n")
+    parcalar.append("    </Satir>\n")
+    return "".join(parcalar)
+
+
+@lru_cache(maxsize=None)
+def _kolon_tipleri(model: type) -> Dict[str, str]:
+    """Model kolon adı -> SQL tip adı (``_convert_value`` için önbellekli)"""
+    return {col.name: str(col.type) for col in inspect(model).columns}
+
+
+class _YedekIlerlemesi:
+    """Okunan satır sayısını 0-100 arası ilerleme yüzdesine çeviren yardımcı"""
+
+    def __init__(self, toplam: int, callback: Optional[Callable[[int], None]]) -> None:
+        self.toplam = toplam
+        self.callback = callback
+        self.tamamlanan = 0
+        self._son_yuzde = -1
+
+    def ayarla(self, tamamlanan: int, toplam: int) -> None:
+        """Toplamı sonradan öğrenilen işlemler için (ör. SQLite sayfa kopyalama)"""
+        self.toplam = toplam
+        self.tamamlanan = 0
+        self.ilerle(tamamlanan)
+
+    def ilerle(self, adet: int) -> None:
+        """``adet`` satır daha yazıldı; yüzde değiştiyse callback'i çağır"""
+        self.tamamlanan += adet
+        if self.toplam:
+            self._bildir(min(100, self.tamamlanan * 100 // self.toplam))
+
+    def bitir(self) -> None:
+        """İşlem tamamlandı (%100)"""
+        self._bildir(100)
+
+    def _bildir(self, yuzde: int) -> None:
+        if self.callback is not None and yuzde != self._son_yuzde:
+            self._son_yuzde = yuzde
+            self.callback(yuzde)
+
+
 class BackupController:
     """Yedekleme ve geri yükleme işlemleri"""
 
     # Model sırası (foreign key dependencies için önemli)
+    # Referans verilen tablolar her zaman referans verenlerden önce gelir;
+    # foreign_keys=ON iken geri yükleme ve ters sırada silme buna dayanır.
     MODELS_ORDER: List[Type[Base]] = [
-        Lojman, Blok, Daire, Sakin, Aidat, AidatIslem, AidatOdeme,
-        Hesap, Kategori, FinansIslem, Ayar, AnaKategori, AltKategori, Finans
+        Lojman, Blok, Daire, Sakin, Aidat, Hesap, Kategori,
+        AnaKategori, AltKategori, FinansIslem, AidatIslem, AidatOdeme,
+        Ayar, Finans
     ]
 
     def __init__(self) -> None:
@@ -68,6 +168,8 @@ class BackupController:
             with get_db_session() as db:
                 for model in reversed(self.MODELS_ORDER):
                     db.query(model).delete()
+                # Türetilmiş aylık özet de aynı transaction'da boşaltılır
+                db.query(FinansAylikOzet).delete(synchronize_session=False)
                 db.commit()
             return True
             
@@ -99,119 +201,357 @@ class BackupController:
             self.db.close()
             self.db = None
 
-    def backup_to_excel(self, filepath: str) -> bool:
+    def backup_to_excel(
+        self,
+        filepath: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        chunk_size: int = YEDEK_PARCA_BOYUTU
+    ) -> bool:
         """
-        Veritabanını Excel formatında yedekle
-        
+        Veritabanını Excel formatında yedekle (akışlı).
+
+        Her tablo yalnızca kolonları seçen bir sorguyla ``chunk_size``
+        satırlık parçalar halinde okunur ve openpyxl'in write-only
+        çalışma kitabına satır satır yazılır. ORM nesnesi veya DataFrame
+        oluşturulmadığı için bellek kullanımı tablo boyutundan bağımsızdır.
+        Boş tablolar için sayfa oluşturulmaz.
+
         Args:
             filepath: Kaydedilecek dosya yolu
-            
+            progress_callback: İlerleme yüzdesini (0-100) alan fonksiyon;
+                ``run_with_progress`` fonksiyonunun verdiği callback doğrudan kullanılabilir
+            chunk_size: Veritabanından tek seferde okunacak satır sayısı
+
         Returns:
             bool: Başarılı olup olmadığı
+
+        Example:
+            >>> run_with_progress(
+            ...     root,
+            ...     lambda ilerleme: controller.backup_to_excel(path, progress_callback=ilerleme),
+            ...     "Yedekleme", 100
+            ... )
         """
+        workbook = None
         try:
             with get_db_session() as db:
-                # Excel yazıcısını oluştur ve context içinde kullan
-                with pd.ExcelWriter(filepath, engine='openpyxl') as excel_file:
-                    # Her tablo için verileri Excel'e yaz
-                    for model in self.MODELS_ORDER:
-                        table_name = model.__tablename__
-                        # Verileri sor
-                        data = db.query(model).all()
-                        if data:
-                            # Modeli DataFrame'e çevir
-                            df = self._model_list_to_dataframe(data)
-                            # Excel'e yaz
-                            df.to_excel(excel_file, sheet_name=table_name, index=False)
+                sayilar = self._tablo_satir_sayilari(db)
+                ilerleme = _YedekIlerlemesi(sum(sayilar.values()), progress_callback)
+
+                from openpyxl import Workbook
+
+                workbook = Workbook(write_only=True)
+                for model in self.MODELS_ORDER:
+                    table_name = model.__tablename__
+                    if not sayilar.get(table_name):
+                        continue
+
+                    columns = list(model.__table__.columns)
+                    sheet = workbook.create_sheet(title=table_name)
+                    sheet.append([column.name for column in columns])
+
+                    yazilan = 0
+                    for parca in self._tablo_parcalari(db, model, chunk_size):
+                        for satir in parca:
+                            sheet.append(list(satir))
+                        yazilan += len(parca)
+                        ilerleme.ilerle(len(parca))
+                    self.logger.debug(f"Excel backup wrote {yazilan} rows to sheet {table_name}")
+
+                # openpyxl en az bir sayfa ister (boş veritabanı)
+                if not workbook.worksheets:
+                    workbook.create_sheet(title=self.MODELS_ORDER[0].__tablename__)
+                workbook.save(filepath)
+                workbook = None
+                ilerleme.bitir()
             return True
-            
+
         except Exception as e:
+            # Otomatik yedekleme gözetimsiz çalışır; neden log dosyasına da yazılır
+            self.logger.error(f"Excel backup to {filepath} failed: {type(e).__name__}: {str(e)}")
             print(f"Excel yedekleme hatası: {str(e)}")
             return False
         finally:
+            if workbook is not None:
+                # Kaydedilmeden kalan write-only sayfaların geçici dosyalarını bırak
+                workbook.close()
             self._close_db()
 
-    def backup_to_xml(self, filepath: str) -> bool:
+    def _tablo_satir_sayilari(
+        self, db: Session, kosullar: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, int]:
         """
-        Veritabanını XML formatında yedekle
-        
+        Yedeklenecek tabloların satır sayılarını al (ilerleme hesabı için).
+
+        Args:
+            db: Veritabanı session'ı
+            kosullar: Tablo adı -> ek WHERE koşulu (fark yedeği için)
+
+        Returns:
+            Dict[str, int]: Tablo adı -> satır sayısı
+        """
+        kosullar = kosullar or {}
+        sayilar = {}
+        for model in self.MODELS_ORDER:
+            sorgu = select(func.count()).select_from(model.__table__)
+            kosul = kosullar.get(model.__tablename__)
+            if kosul is not None:
+                sorgu = sorgu.where(kosul)
+            sayilar[model.__tablename__] = int(db.execute(sorgu).scalar() or 0)
+        return sayilar
+
+    @staticmethod
+    def _tablo_parcalari(
+        db: Session, model: Type[Base], chunk_size: int, kosul: Optional[Any] = None
+    ) -> Iterator[List[Any]]:
+        """
+        Tablonun satırlarını kolon demetleri olarak parça parça oku.
+
+        ORM nesnesi oluşturulmaz; sonuç ``stream_results`` ile imleçten
+        ``chunk_size`` satırlık parçalar halinde çekilir.
+
+        Args:
+            db: Veritabanı session'ı
+            model: Okunacak model sınıfı
+            chunk_size: Parça başına satır sayısı
+            kosul: Ek WHERE koşulu (None ise tüm tablo)
+
+        Yields:
+            List[Row]: Kolon sırasıyla satırlar
+        """
+        table = model.__table__
+        sorgu = select(*table.columns)
+        if kosul is not None:
+            sorgu = sorgu.where(kosul)
+        sorgu = sorgu.order_by(*table.primary_key.columns).execution_options(stream_results=True)
+        result = db.execute(sorgu)
+        try:
+            for parca in result.partitions(chunk_size):
+                yield parca
+        finally:
+            result.close()
+
+    @staticmethod
+    def _degisiklik_kosulu(model: Type[Base], esik: Optional[datetime]) -> Optional[Any]:
+        """
+        ``esik`` anından sonra eklenen veya güncellenen satırlar için WHERE koşulu.
+
+        Args:
+            model: Model sınıfı
+            esik: Başlangıç zamanı (None ise koşul yok, tüm tablo)
+
+        Returns:
+            Koşul ifadesi veya None
+        """
+        if esik is None:
+            return None
+        columns = model.__table__.c
+        if "updated_at" in columns:
+            return func.coalesce(columns.updated_at, columns.created_at) >= esik
+        return columns.created_at >= esik
+
+    def _xml_tablolarini_yaz(
+        self,
+        f: Any,
+        db: Session,
+        sayilar: Dict[str, int],
+        ilerleme: "_YedekIlerlemesi",
+        chunk_size: int,
+        kosullar: Optional[Dict[str, Any]] = None,
+        tablo_ozellikleri: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Boş olmayan tabloları ``<Tablo>`` öğeleri olarak dosyaya yaz.
+
+        Args:
+            f: Yazılacak metin dosyası
+            db: Veritabanı session'ı
+            sayilar: ``_tablo_satir_sayilari`` sonucu (boş tablolar atlanır)
+            ilerleme: İlerleme takibi
+            chunk_size: Parça başına satır sayısı
+            kosullar: Tablo adı -> ek WHERE koşulu
+            tablo_ozellikleri: Tablo adı -> ``<Tablo>`` öğesine eklenecek ``taban`` değeri
+        """
+        kosullar = kosullar or {}
+        tablo_ozellikleri = tablo_ozellikleri or {}
+        for model in self.MODELS_ORDER:
+            table_name = model.__tablename__
+            if not sayilar.get(table_name):
+                continue
+
+            kolonlar = [column.name for column in model.__table__.columns]
+            taban = tablo_ozellikleri.get(table_name)
+            ek = f" taban={quoteattr(taban)}" if taban else ""
+            f.write(f"  <Tablo ad={quoteattr(table_name)}{ek}>\n")
+            for parca in self._tablo_parcalari(db, model, chunk_size, kosullar.get(table_name)):
+                f.writelines(_xml_satiri(kolonlar, satir) for satir in parca)
+                ilerleme.ilerle(len(parca))
+            f.write("  </Tablo>\n")
+
+    def backup_to_xml(
+        self,
+        filepath: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        chunk_size: int = YEDEK_PARCA_BOYUTU
+    ) -> bool:
+        """
+        Veritabanını XML formatında yedekle (akışlı).
+
+        Satırlar ``backup_to_excel`` ile aynı şekilde parça parça okunur ve
+        her ``<Satir>`` öğesi oluşturulduğu anda tamponlu dosyaya yazılır;
+        bellekte ağaç tutulmaz. Çıktı, önceki ``ElementTree`` + ``ET.indent``
+        çıktısıyla aynı biçimdedir (iki boşluk girinti, boş değerler
+        ``<kolon />``).
+
+        Kök öğedeki ``damga`` yedeğin veritabanı zamanıdır; aynı damga tablo
+        başına kaydedilir ve ``backup_differential_xml`` bu yedeği taban alır.
+
         Args:
             filepath: Kaydedilecek dosya yolu
-            
+            progress_callback: İlerleme yüzdesini (0-100) alan fonksiyon
+            chunk_size: Veritabanından tek seferde okunacak satır sayısı
+
         Returns:
             bool: Başarılı olup olmadığı
         """
         try:
             with get_db_session() as db:
-                # Root element oluştur
-                root = ET.Element("YedekVeri")
-                root.set("tarih", datetime.now().isoformat())
-                root.set("versiyon", "1.0")
+                damga = degisiklik_izleme.yeni_damga(db)
+                sayilar = self._tablo_satir_sayilari(db)
+                ilerleme = _YedekIlerlemesi(sum(sayilar.values()), progress_callback)
 
-                # Her tablo için veri ekle
-                for model in self.MODELS_ORDER:
-                    table_name = model.__tablename__
+                with open(filepath, "w", encoding="utf-8", newline="\n", buffering=XML_YAZMA_TAMPONU) as f:
+                    f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                    f.write(
+                        f'<YedekVeri tarih="{datetime.now().isoformat()}" versiyon="1.0" '
+                        f'damga="{damga.isoformat()}">\n'
+                    )
+                    self._xml_tablolarini_yaz(f, db, sayilar, ilerleme, chunk_size)
+                    f.write("</YedekVeri>\n")
 
-                    # Verileri sor
-                    data = db.query(model).all()
+                # Sonraki fark yedeği bu yedeğin damgasından başlar
+                degisiklik_izleme.damgalari_kaydet(db, [m.__tablename__ for m in self.MODELS_ORDER], damga)
+                db.commit()
+                ilerleme.bitir()
 
-                    if data:
-                        # Tablo elementi oluştur
-                        table_element = ET.SubElement(root, "Tablo")
-                        table_element.set("ad", table_name)
+            return True
 
-                        # Her satırı XML'e ekle
-                        for row in data:
-                            row_element = ET.SubElement(table_element, "Satir")
+        except Exception as e:
+            # Otomatik yedekleme gözetimsiz çalışır; neden log dosyasına da yazılır
+            self.logger.error(f"XML backup to {filepath} failed: {type(e).__name__}: {str(e)}")
+            print(f"XML yedekleme hatası: {str(e)}")
+            return False
+        finally:
+            self._close_db()
 
-                            # Kolon değerlerini ekle
-                            mapper = inspect(model)
-                            for column in mapper.columns:
-                                col_name = column.name
-                                col_value = getattr(row, col_name, None)
+    def backup_differential_xml(
+        self,
+        filepath: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        chunk_size: int = YEDEK_PARCA_BOYUTU
+    ) -> bool:
+        """
+        Son yedekten bu yana değişenleri XML fark yedeği olarak yaz.
 
-                                # Değeri string'e çevir
-                                if col_value is not None:
-                                    if isinstance(col_value, datetime):
-                                        col_value = col_value.isoformat()
-                                    else:
-                                        col_value = str(col_value)
+        Her tablodan yalnızca tablonun damgasından sonra (``updated_at``,
+        yoksa ``created_at``) eklenen veya güncellenen satırlar ile
+        ``silinen_kayitlar`` tablosundaki silmeler yazılır. Kök öğedeki
+        ``taban`` bir önceki yedeğin, ``damga`` bu yedeğin zamanıdır;
+        ``restore_from_xml(..., fark_dosyalari=[...])`` zinciri bu
+        değerlerle doğrular. İlk fark yedeğinden önce ``backup_to_xml`` ile
+        tam yedek alınmış olmalıdır.
 
-                                # Element ekle
-                                col_element = ET.SubElement(row_element, col_name)
-                                col_element.text = col_value or ""
+        Args:
+            filepath: Kaydedilecek dosya yolu
+            progress_callback: İlerleme yüzdesini (0-100) alan fonksiyon
+            chunk_size: Veritabanından tek seferde okunacak satır sayısı
 
-            # XML'i dosyaya yaz
-            tree = ET.ElementTree(root)
-            ET.indent(root, space="  ")  # Formatla
-            tree.write(filepath, encoding='utf-8', xml_declaration=True)
+        Returns:
+            bool: Başarılı olup olmadığı
+        """
+        try:
+            with get_db_session() as db:
+                damgalar = degisiklik_izleme.damgalari_al(db)
+                if not damgalar:
+                    print("Fark yedeği için önce tam XML yedeği alınmalı")
+                    return False
+
+                damga = degisiklik_izleme.yeni_damga(db)
+                taban = max(damgalar.values())
+                esikler = {
+                    model.__tablename__: degisiklik_izleme.fark_esigi(damgalar.get(model.__tablename__))
+                    for model in self.MODELS_ORDER
+                }
+                kosullar = {
+                    model.__tablename__: self._degisiklik_kosulu(model, esikler[model.__tablename__])
+                    for model in self.MODELS_ORDER
+                }
+                sayilar = self._tablo_satir_sayilari(db, kosullar)
+                silinenler = degisiklik_izleme.silinen_kayitlar
+                silinen_sorgusu = select(silinenler.c.tablo, silinenler.c.kayit_id).order_by(silinenler.c.id)
+                en_eski = min((e for e in esikler.values() if e is not None), default=None)
+                if en_eski is not None:
+                    silinen_sorgusu = silinen_sorgusu.where(silinenler.c.silinme_zamani >= en_eski)
+                ilerleme = _YedekIlerlemesi(sum(sayilar.values()), progress_callback)
+
+                with open(filepath, "w", encoding="utf-8", newline="\n", buffering=XML_YAZMA_TAMPONU) as f:
+                    f.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                    f.write(
+                        f'<FarkYedek tarih="{datetime.now().isoformat()}" versiyon="1.0" '
+                        f'taban="{taban.isoformat()}" damga="{damga.isoformat()}">\n'
+                    )
+                    # Silmeler önce uygulanır; aynı id ile yeniden eklenen satır sonra gelir
+                    f.write("  <Silinenler>\n")
+                    for satir in db.execute(silinen_sorgusu):
+                        f.write(f'    <Kayit tablo={quoteattr(satir.tablo)} id="{satir.kayit_id}" />\n')
+                    f.write("  </Silinenler>\n")
+                    self._xml_tablolarini_yaz(
+                        f, db, sayilar, ilerleme, chunk_size, kosullar,
+                        {tablo: d.isoformat() for tablo, d in damgalar.items()}
+                    )
+                    f.write("</FarkYedek>\n")
+
+                degisiklik_izleme.damgalari_kaydet(db, [m.__tablename__ for m in self.MODELS_ORDER], damga)
+                db.commit()
+                ilerleme.bitir()
 
+            print(f"Fark yedeği oluşturuldu: {sum(sayilar.values())} satır")
             return True
-            
+
         except Exception as e:
-            print(f"XML yedekleme hatası: {str(e)}")
+            print(f"Fark yedekleme hatası: {str(e)}")
             return False
         finally:
             self._close_db()
 
-    def restore_from_excel(self, filepath: str) -> bool:
+    def restore_from_excel(self, filepath: str, batch_size: int = TOPLU_EKLEME_BOYUTU) -> bool:
         """
-        Excel dosyasından veritabanını geri yükle
-        
+        Excel dosyasından veritabanını geri yükle (toplu, tipli).
+
+        Her sayfa açık ``ExcelFile`` üzerinden bir kez okunur, kolonlar
+        SQLAlchemy kolon tiplerine göre vektörel olarak dönüştürülür
+        (bkz. ``_sayfayi_donustur``) ve satırlar ``batch_size``'lık Core
+        ``insert`` gruplarıyla eklenir. Temizleme ve ekleme tek
+        transaction'dadır; foreign key kontrolleri commit'e ertelenir.
+
         Args:
             filepath: Yüklenecek dosya yolu
-            
+            batch_size: Tek ``executemany`` ile eklenecek satır sayısı
+
         Returns:
             bool: Başarılı olup olmadığı
         """
+        db = None
         try:
             with get_db_session() as db:
-                # Excel dosyasını oku (context manager ile) 
+                # Excel dosyasını oku (context manager ile)
                 try:
+                    import pandas as pd
+
                     with pd.ExcelFile(filepath) as xls:
-                        # Önce veritabanını temizle
+                        # Önce veritabanını temizle (commit en sonda)
                         try:
-                            self._clear_database(db)
+                            fts_tablolari = self._geri_yuklemeye_hazirla(db)
                         except Exception as e:
                             print(f"Veritabanı temizleme başarısız: {str(e)}")
                             db.rollback()
@@ -220,43 +560,31 @@ class BackupController:
                         # Sheet sırasına göre (foreign key dependencies)
                         for model in self.MODELS_ORDER:
                             table_name = model.__tablename__
+                            if table_name not in xls.sheet_names:
+                                continue
 
-                            # Sheet varsa oku
-                            if table_name in xls.sheet_names:
-                                try:
-                                    df = pd.read_excel(filepath, sheet_name=table_name)
-                                    row_count = 0
-
-                                    # Her satırı database'e ekle
-                                    for _, row in df.iterrows():
-                                        # NaN değerleri None'a çevir
-                                        row_dict = row.where(pd.notna(row), None).to_dict()
-
-                                        # Model instance'ı oluştur
-                                        try:
-                                            instance = model(**row_dict)
-                                            db.add(instance)
-                                            row_count += 1
-                                        except Exception as e:
-                                            print(f"Satır eklerken hata ({table_name}): {str(e)}")
-                                            db.rollback()
-                                            return False
-
-                                    # Commit et
-                                    db.commit()
-                                    print(f"{table_name}: {row_count} satır yüklendi")
-
-                                except Exception as e:
-                                    print(f"Excel sheet okunurken hata ({table_name}): {str(e)}")
-                                    db.rollback()
-                                    return False
+                            try:
+                                df = self._sayfayi_donustur(xls.parse(table_name), model.__table__)
+                                for baslangic in range(0, len(df), batch_size):
+                                    self._toplu_ekle(
+                                        db, model,
+                                        df.iloc[baslangic:baslangic + batch_size].to_dict("records")
+                                    )
+                                print(f"{table_name}: {len(df)} satır yüklendi")
+                            except Exception as e:
+                                print(f"Excel sheet okunurken hata ({table_name}): {str(e)}")
+                                db.rollback()
+                                return False
+
+                        self._geri_yuklemeyi_bitir(db, fts_tablolari)
                 except Exception as e:
                     print(f"Excel dosyası okunurken hata: {str(e)}")
+                    db.rollback()
                     return False
-            
+
             print("Excel geri yükleme başarılı")
             return True
-            
+
         except Exception as e:
             print(f"Excel geri yükleme genel hatası: {str(e)}")
             import traceback
@@ -267,89 +595,148 @@ class BackupController:
         finally:
             self._close_db()
 
-    def restore_from_xml(self, filepath: str) -> bool:
+    @staticmethod
+    def _sayfayi_donustur(df: "pd.DataFrame", table: Any) -> "pd.DataFrame":
         """
-        XML dosyasından veritabanını geri yükle
-        
+        Excel sayfasını tablonun kolon tiplerine göre vektörel olarak dönüştür.
+
+        * ``DateTime``: ``pd.to_datetime`` (okunamayan değerler None)
+        * ``Boolean``: True/False, 1/0 ve "true"/"false" metinleri
+        * ``Integer`` (kuruş tutarları dahil): yuvarlanmış tam sayı
+        * ``Float``: ondalık sayı
+        * ``String``/``Text``: metin; Excel'in sayıya çevirdiği değerler
+          (ör. telefon) tam sayı biçiminde metne döner
+
+        Boş hücreler None olur; sayfada bulunmayan kolonlar eklenmez
+        (veritabanı varsayılanları uygulanır).
+
         Args:
-            filepath: Yüklenecek dosya yolu
-            
+            df: ``ExcelFile.parse`` ile okunmuş sayfa
+            table: Hedef SQLAlchemy ``Table``
+
+        Returns:
+            pd.DataFrame: ``to_dict("records")`` ile doğrudan eklenebilir, object tipli DataFrame
+
+        Raises:
+            ValueError: Sayfada tabloya ait olmayan kolon varsa
+        """
+        import pandas as pd
+
+        bilinmeyen = [str(kolon) for kolon in df.columns if kolon not in table.columns]
+        if bilinmeyen:
+            raise ValueError(f"Bilinmeyen kolonlar: {', '.join(bilinmeyen)}")
+
+        kolonlar = {}
+        for column in table.columns:
+            if column.name not in df.columns:
+                continue
+            seri = df[column.name]
+            tip = column.type
+
+            if isinstance(tip, DateTime):
+                if not pd.api.types.is_datetime64_any_dtype(seri):
+                    seri = pd.to_datetime(seri, errors="coerce", format="mixed")
+                if seri.dt.tz is not None:
+                    seri = seri.dt.tz_localize(None)
+            elif isinstance(tip, Boolean):
+                if not pd.api.types.is_bool_dtype(seri):
+                    metin = seri.astype(str).str.strip().str.lower()
+                    seri = metin.isin(("true", "1", "1.0", "yes", "on")).astype(object).where(seri.notna(), None)
+            elif isinstance(tip, Integer):
+                seri = pd.to_numeric(seri, errors="coerce").round().astype("Int64")
+            elif isinstance(tip, (Float, Numeric)):
+                seri = pd.to_numeric(seri, errors="coerce")
+            elif isinstance(tip, (String, Text)) and pd.api.types.is_numeric_dtype(seri) \
+                    and not pd.api.types.is_bool_dtype(seri):
+                sayi = seri.astype(float)
+                if ((sayi % 1 == 0) | sayi.isna()).all():
+                    seri = sayi.round().astype("Int64")
+                seri = seri.astype(str).where(seri.notna(), None)
+
+            kolonlar[column.name] = seri
+
+        sonuc = pd.DataFrame(kolonlar, index=df.index)
+        return sonuc.astype(object).where(sonuc.notna(), None)
+
+    def restore_from_xml(
+        self,
+        filepath: str,
+        batch_size: int = TOPLU_EKLEME_BOYUTU,
+        fark_dosyalari: Sequence[str] = ()
+    ) -> bool:
+        """
+        XML dosyasından veritabanını geri yükle (akışlı).
+
+        Dosya ``iterparse`` ile okunur; her ``<Satir>`` işlendikten sonra
+        ağaçtan atılır ve satırlar ``batch_size``'lık gruplar halinde Core
+        ``insert`` ile eklenir. Temizleme ve ekleme tek transaction'da
+        yapılır: dosya yarıda bozuk çıkarsa veritabanı değişmeden kalır.
+
+        ``fark_dosyalari`` verilirse tam yedek yüklendikten sonra fark
+        yedekleri (bkz. ``backup_differential_xml``) sırayla aynı transaction
+        içinde uygulanır. Zincir önceden doğrulanır: her fark yedeğinin
+        ``taban`` damgası bir önceki yedeğin ``damga`` değeri olmalıdır.
+
+        Args:
+            filepath: Yüklenecek tam yedek dosyası
+            batch_size: Tek ``executemany`` ile eklenecek satır sayısı
+            fark_dosyalari: Eskiden yeniye fark yedeği dosyaları
+
         Returns:
             bool: Başarılı olup olmadığı
+
+        Example:
+            >>> controller.restore_from_xml(
+            ...     "tam_0101.xml", fark_dosyalari=["fark_0102.xml", "fark_0103.xml"]
+            ... )
         """
+        db = None
         try:
             with get_db_session() as db:
-                # XML'i oku
                 try:
-                    tree = ET.parse(filepath)
-                    root = tree.getroot()
-                except ET.ParseError as pe:
+                    olaylar = ET.iterparse(filepath, events=("start", "end"))
+                    _, root = next(olaylar)
+                except (ET.ParseError, StopIteration) as pe:
                     print(f"XML dosyası okunurken hata: {str(pe)}")
                     return False
 
-                # Önce veritabanını temizle
+                if root.tag != "YedekVeri":
+                    print(f"Geçersiz yedek dosyası (kök öğe: {root.tag})")
+                    return False
+
+                if fark_dosyalari and not self._fark_zincirini_dogrula(root.get("damga"), fark_dosyalari):
+                    return False
+
+                # Önce veritabanını temizle (commit en sonda)
                 try:
-                    self._clear_database(db)
+                    fts_tablolari = self._geri_yuklemeye_hazirla(db)
                 except Exception as e:
                     print(f"Veritabanı temizleme başarısız: {str(e)}")
                     db.rollback()
                     return False
 
-                # Her tablo için veri ekle
-                for table_elem in root.findall("Tablo"):
-                    table_name = table_elem.get("ad")
-
-                    # Modeli bul
-                    if table_name is not None:
-                        model = self._get_model_by_table_name(table_name)
-                        if not model:
-                            print(f"Model bulunamadı: {table_name}")
-                            continue
-                    else:
-                        print("Geçersiz tablo adı")
-                        continue
-
-                    # Her satırı işle
-                    row_count = 0
-                    for row_elem in table_elem.findall("Satir"):
-                        row_dict = {}
-
-                        # Kolon değerlerini oku
-                        for col_elem in row_elem:
-                            col_name = col_elem.tag
-                            col_value = col_elem.text or None
-
-                            # Tip dönüştürmesi yap
-                            col_value = self._convert_value(model, col_name, col_value)
-                            row_dict[col_name] = col_value
-
-                        # Model instance'ı oluştur ve ekle
-                        if row_dict:
-                            try:
-                                instance = model(**row_dict)
-                                db.add(instance)
-                                row_count += 1
-                            except TypeError as te:
-                                # Bilinmeyen kolon varsa atla
-                                print(f"Satır eklerken TypeError ({table_name}): {str(te)}")
-                                continue
-                            except Exception as e:
-                                print(f"Satır eklerken hata ({table_name}): {str(e)}")
-                                db.rollback()
-                                return False
+                dosya = filepath
+                try:
+                    self._xml_yukle(db, olaylar, root, batch_size, self._toplu_ekle)
+                    for dosya in fark_dosyalari:
+                        fark_olaylari = ET.iterparse(dosya, events=("start", "end"))
+                        _, fark_koku = next(fark_olaylari)
+                        self._xml_yukle(db, fark_olaylari, fark_koku, batch_size, self._toplu_guncelle)
+                        print(f"Fark yedeği uygulandı: {os.path.basename(dosya)}")
+                except ET.ParseError as pe:
+                    print(f"XML dosyası okunurken hata ({os.path.basename(dosya)}): {str(pe)}")
+                    db.rollback()
+                    return False
+                except Exception as e:
+                    print(f"Satır eklerken hata ({os.path.basename(dosya)}): {str(e)}")
+                    db.rollback()
+                    return False
 
-                    # Commit et
-                    try:
-                        db.commit()
-                        print(f"{table_name}: {row_count} satır yüklendi")
-                    except Exception as e:
-                        print(f"Commit hatası ({table_name}): {str(e)}")
-                        db.rollback()
-                        return False
+                self._geri_yuklemeyi_bitir(db, fts_tablolari)
 
             print("XML geri yükleme başarılı")
             return True
-            
+
         except Exception as e:
             print(f"XML geri yükleme genel hatası: {str(e)}")
             import traceback
@@ -361,6 +748,188 @@ class BackupController:
             # No explicit local db close required; get_db_session handles session cleanup if needed.
             pass
 
+    def _xml_yukle(
+        self,
+        db: Session,
+        olaylar: Iterator[Tuple[str, Any]],
+        root: Any,
+        batch_size: int,
+        ekle: Callable[[Session, Type[Base], List[Dict[str, Any]]], None]
+    ) -> None:
+        """
+        Açılmış bir yedek/fark dosyasının satırlarını gruplar halinde yaz.
+
+        Args:
+            db: Veritabanı session'ı
+            olaylar: ``iterparse`` olayları (kök öğe okunmuş)
+            root: Kök öğe
+            batch_size: Grup büyüklüğü
+            ekle: Grubu yazacak fonksiyon (``_toplu_ekle`` veya ``_toplu_guncelle``)
+        """
+        grup: List[Dict[str, Any]] = []
+        row_count = 0
+        silinenler: Dict[Type[Base], List[int]] = {}
+        for tur, model, veri in self._xml_kayitlari(olaylar, root):
+            if tur == "satir":
+                # Kolon kümesi değişirse executemany ayrı gruba geçmeli
+                if grup and grup[0].keys() != veri.keys():
+                    ekle(db, model, grup)
+                    grup = []
+                grup.append(veri)
+                row_count += 1
+                if len(grup) >= batch_size:
+                    ekle(db, model, grup)
+                    grup = []
+            elif tur == "tablo_sonu":
+                ekle(db, model, grup)
+                print(f"{model.__tablename__}: {row_count} satır yüklendi")
+                grup = []
+                row_count = 0
+            elif tur == "silinen":
+                silinenler.setdefault(model, []).append(veri)
+            elif tur == "silinenler_sonu":
+                self._silinenleri_uygula(db, silinenler)
+                silinenler = {}
+
+    def _xml_kayitlari(self, olaylar: Iterator[Tuple[str, Any]], root: Any) -> Iterator[Tuple[str, Any, Any]]:
+        """
+        ``iterparse`` olaylarını işlenmiş kayıtlara çevir; işlenen öğeler ağaçtan atılır.
+
+        Yields:
+            Tuple[str, Any, Any]: ``("satir", model, satir_sozlugu)``,
+            ``("tablo_sonu", model, None)``, ``("silinen", model, kayit_id)``
+            veya ``("silinenler_sonu", None, None)``
+        """
+        model = None
+        table_elem = None
+        for olay, elem in olaylar:
+            if olay == "start":
+                if elem.tag == "Tablo" and table_elem is None:
+                    table_elem = elem
+                    table_name = elem.get("ad")
+                    model = self._get_model_by_table_name(table_name) if table_name else None
+                    if model is None:
+                        print(f"Model bulunamadı: {table_name}" if table_name else "Geçersiz tablo adı")
+                continue
+
+            if elem is table_elem:
+                if model is not None:
+                    yield "tablo_sonu", model, None
+                model = table_elem = None
+                root.clear()
+            elif elem.tag == "Satir" and table_elem is not None:
+                if model is not None:
+                    row_dict = {
+                        col_elem.tag: self._convert_value(model, col_elem.tag, col_elem.text or None)
+                        for col_elem in elem
+                    }
+                    if row_dict:
+                        yield "satir", model, row_dict
+                # İşlenen satırı ağaçtan at (bellek sabit kalır)
+                table_elem.clear()
+            elif elem.tag == "Kayit":
+                silinen_model = self._get_model_by_table_name(elem.get("tablo", ""))
+                if silinen_model is not None:
+                    yield "silinen", silinen_model, int(elem.get("id"))
+            elif elem.tag == "Silinenler":
+                yield "silinenler_sonu", None, None
+                root.clear()
+
+    @staticmethod
+    def _xml_kok_ozellikleri(filepath: str) -> Tuple[str, Dict[str, str]]:
+        """XML dosyasının yalnızca kök öğesini oku: (etiket, öznitelikler)"""
+        _, root = next(ET.iterparse(filepath, events=("start",)))
+        return root.tag, dict(root.attrib)
+
+    def _fark_zincirini_dogrula(self, damga: Optional[str], fark_dosyalari: Sequence[str]) -> bool:
+        """
+        Fark yedeklerinin tam yedeğe ve birbirine kesintisiz bağlandığını kontrol et.
+
+        Args:
+            damga: Tam yedeğin ``damga`` değeri
+            fark_dosyalari: Eskiden yeniye fark yedeği dosyaları
+
+        Returns:
+            bool: Zincir geçerliyse True (değilse sebep yazdırılır)
+        """
+        if not damga:
+            print("Tam yedekte damga yok; fark yedekleri bu yedeğe uygulanamaz")
+            return False
+        for dosya in fark_dosyalari:
+            try:
+                etiket, ozellikler = self._xml_kok_ozellikleri(dosya)
+            except (ET.ParseError, StopIteration, OSError) as e:
+                print(f"Fark yedeği okunamadı ({os.path.basename(dosya)}): {str(e)}")
+                return False
+            if etiket != "FarkYedek":
+                print(f"Fark yedeği değil: {os.path.basename(dosya)}")
+                return False
+            if ozellikler.get("taban") != damga:
+                print(f"Fark yedeği zinciri kopuk: {os.path.basename(dosya)} "
+                      f"({ozellikler.get('taban')} != {damga})")
+                return False
+            damga = ozellikler.get("damga")
+        return True
+
+    @staticmethod
+    def _toplu_guncelle(db: Session, model: Type[Base], satirlar: List[Dict[str, Any]]) -> None:
+        """
+        Satırları ``id`` çakışmasında güncelleyerek ekle (fark yedeği uygulama).
+
+        Args:
+            db: Veritabanı session'ı
+            model: Hedef model sınıfı
+            satirlar: Kolon adı -> değer sözlükleri (aynı kolon kümesi)
+        """
+        if not satirlar:
+            return
+        table = model.__table__
+        kolonlar = [kolon for kolon in satirlar[0] if kolon in table.columns]
+        satirlar = [{k: satir[k] for k in kolonlar} for satir in satirlar]
+        sorgu = sqlite_insert(table)
+        sorgu = sorgu.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={kolon: sorgu.excluded[kolon] for kolon in kolonlar if kolon != "id"}
+        )
+        db.execute(sorgu, satirlar)
+
+    def _silinenleri_uygula(self, db: Session, silinenler: Dict[Type[Base], List[int]]) -> None:
+        """
+        Fark yedeğindeki silmeleri uygula (ters model sırasıyla).
+
+        Args:
+            db: Veritabanı session'ı
+            silinenler: Model -> silinen kayıt id'leri
+        """
+        for model in reversed(self.MODELS_ORDER):
+            idler = silinenler.get(model)
+            for baslangic in range(0, len(idler or []), TOPLU_SILME_BOYUTU):
+                parca = idler[baslangic:baslangic + TOPLU_SILME_BOYUTU]
+                db.execute(model.__table__.delete().where(model.__table__.c.id.in_(parca)))
+
+    @staticmethod
+    def _toplu_ekle(db: Session, model: Type[Base], satirlar: List[Dict[str, Any]]) -> None:
+        """
+        Aynı kolon kümesine sahip satırları tek ``executemany`` ile ekle.
+
+        Tabloda olmayan kolonlar (eski şema) atlanır.
+
+        Args:
+            db: Veritabanı session'ı
+            model: Hedef model sınıfı
+            satirlar: Kolon adı -> değer sözlükleri
+        """
+        if not satirlar:
+            return
+        table = model.__table__
+        bilinmeyen = [kolon for kolon in satirlar[0] if kolon not in table.columns]
+        if bilinmeyen:
+            satirlar = [
+                {k: v for k, v in satir.items() if k in table.columns}
+                for satir in satirlar
+            ]
+        db.execute(table.insert(), satirlar)
+
     def _clear_database(self, db: Session) -> None:
         """
         Veritabanını temizle - tüm tabloları boşalt.
@@ -374,42 +943,68 @@ class BackupController:
             Exception: Temizleme işlemi başarısız olursa
         """
         try:
-            # Ters sırada temizle (foreign key constraints)
-            for model in reversed(self.MODELS_ORDER):
-                db.query(model).delete()
+            self._tablolari_bosalt(db)
             db.commit()
         except Exception as e:
             db.rollback()
             print(f"Veritabanı temizleme hatası: {str(e)}")
             raise
 
-    def _model_list_to_dataframe(self, data: List[Any]) -> pd.DataFrame:
+    def _geri_yuklemeye_hazirla(self, db: Session) -> List[str]:
         """
-        Model instance listesini Pandas DataFrame'e çevir.
-        
+        Geri yükleme transaction'ını başlat.
+
+        SQLite'ta FTS ve silme izleme trigger'ları kaldırılır (bkz.
+        ``fts.toplu_yuklemeye_hazirla``), fark yedeği damgaları sıfırlanır ve foreign key kontrolleri commit anına ertelenir; ardından tablolar
+        commit edilmeden boşaltılır.
+
         Args:
-            data: ORM model instance'larının listesi
-            
+            db: SQLAlchemy database session
+
         Returns:
-            pd.DataFrame: Model verilerinin DataFrame temsili
+            List[str]: ``_geri_yuklemeyi_bitir``'e verilecek FTS tabloları
         """
-        if not data:
-            return pd.DataFrame()
-        
-        # İlk instance'dan kolon adlarını al
-        first_obj = data[0]
-        mapper = inspect(first_obj.__class__)
-        
-        rows = []
-        for obj in data:
-            row = {}
-            for column in mapper.columns:
-                col_name = column.name
-                col_value = getattr(obj, col_name, None)
-                row[col_name] = col_value
-            rows.append(row)
-        
-        return pd.DataFrame(rows)
+        fts_tablolari: List[str] = []
+        if db.get_bind().dialect.name == "sqlite":
+            fts_tablolari = fts.toplu_yuklemeye_hazirla(db)
+            degisiklik_izleme.toplu_yuklemeye_hazirla(db)
+            # Transaction sonunda (commit) otomatik olarak kapanır
+            db.execute(text("PRAGMA defer_foreign_keys = ON"))
+        self._tablolari_bosalt(db)
+        return fts_tablolari
+
+    def _geri_yuklemeyi_bitir(self, db: Session, fts_tablolari: List[str]) -> None:
+        """
+        FTS indekslerini ve aylık finans özetini yeniden kur, geri yükleme
+        transaction'ını commit et.
+
+        Türetilmiş tablolar geri yüklenen satırlarla aynı commit'te yazılır;
+        böylece geri yükleme atomiktir ve önbellekler yalnızca tutarlı veriyle
+        yeniden hesaplanır.
+
+        Args:
+            db: SQLAlchemy database session
+            fts_tablolari: ``_geri_yuklemeye_hazirla`` dönüş değeri
+        """
+        fts.toplu_yukleme_sonrasi(db, fts_tablolari)
+        if db.get_bind().dialect.name == "sqlite":
+            degisiklik_izleme.toplu_yukleme_sonrasi(db)
+        FinansOzetController().rebuild(db=db, commit=False)
+        db.commit()
+        # Core insert'ler session olaylarını tetiklemez
+        DolulukController.invalidate()
+        DashboardController.invalidate()
+        tablo_surumleri.hepsini_artir()
+
+    def _tablolari_bosalt(self, db: Session) -> None:
+        """
+        Tüm tabloları commit etmeden boşalt (ters sırada, foreign key constraints).
+
+        Args:
+            db: SQLAlchemy database session
+        """
+        for model in reversed(self.MODELS_ORDER):
+            db.query(model).delete()
 
     def _get_model_by_table_name(self, table_name: str) -> Optional[type]:
         """
@@ -448,14 +1043,8 @@ class BackupController:
             return None
             
         try:
-            mapper = inspect(model)
-            
             # Kolon tipini bul
-            col_type = None
-            for col in mapper.columns:
-                if col.name == column_name:
-                    col_type = str(col.type)
-                    break
+            col_type = _kolon_tipleri(model).get(column_name)
             
             if col_type is None:
                 return value
@@ -493,6 +1082,199 @@ class BackupController:
             print(f"Değer dönüştürme hatası ({column_name}={value}): {str(e)}")
             return value
 
+    def backup_to_sqlite(
+        self,
+        filepath: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        compress: bool = False,
+        pages: int = SQLITE_YEDEK_SAYFA_ADIMI
+    ) -> bool:
+        """
+        Veritabanının SQLite online backup API ile tutarlı kopyasını al.
+
+        Sayfalar ``pages``'lik adımlarla kopyalanır; adımlar arasında
+        veritabanı kilidi bırakıldığı için uygulama çalışmaya devam eder ve
+        kopya yine de tek bir an'ın görüntüsüdür. Tüm tipler, indeksler ve
+        FTS tabloları birebir korunur. Kopya ``PRAGMA integrity_check`` ile
+        doğrulanmadan hedef dosya oluşturulmaz.
+
+        Args:
+            filepath: Kaydedilecek dosya yolu
+            progress_callback: İlerleme yüzdesini (0-100) alan fonksiyon
+            compress: True ise kopya gzip ile sıkıştırılır (ör. ``.db.gz``)
+            pages: Adım başına kopyalanacak sayfa sayısı
+
+        Returns:
+            bool: Başarılı olup olmadığı
+        """
+        gecici = f"{filepath}.tmp"
+        try:
+            ilerleme = _YedekIlerlemesi(0, progress_callback)
+            with get_db_session() as db, self._sqlite_baglantisi(db) as kaynak:
+                hedef = sqlite3.connect(gecici)
+                try:
+                    kaynak.backup(hedef, pages=pages, progress=self._sayfa_ilerlemesi(ilerleme))
+                finally:
+                    hedef.close()
+
+            self._butunluk_kontrolu(gecici)
+            if compress:
+                with open(gecici, "rb") as kaynak_dosya, gzip.open(filepath, "wb", compresslevel=6) as gz:
+                    shutil.copyfileobj(kaynak_dosya, gz, XML_YAZMA_TAMPONU)
+            else:
+                os.replace(gecici, filepath)
+            ilerleme.bitir()
+            self.logger.info(f"SQLite backup written to {filepath} ({os.path.getsize(filepath)} bytes)")
+            return True
+
+        except Exception as e:
+            # Otomatik yedekleme gözetimsiz çalışır; neden log dosyasına da yazılır
+            self.logger.error(f"SQLite backup to {filepath} failed: {type(e).__name__}: {str(e)}")
+            print(f"SQLite yedekleme hatası: {str(e)}")
+            return False
+        finally:
+            if os.path.exists(gecici):
+                os.remove(gecici)
+            self._close_db()
+
+    def restore_from_sqlite(
+        self,
+        filepath: str,
+        progress_callback: Optional[Callable[[int], None]] = None,
+        pages: int = SQLITE_YEDEK_SAYFA_ADIMI
+    ) -> bool:
+        """
+        ``backup_to_sqlite`` ile alınmış yedekten veritabanını geri yükle.
+
+        Yedek (gzip ise önce geçici dosyaya açılarak) ``PRAGMA integrity_check``
+        ile doğrulanır ve online backup API ile canlı veritabanının üzerine
+        kopyalanır. Satır satır ekleme yapılmadığı için en hızlı geri yükleme
+        yoludur; türetilmiş tablolar ve arama indeksleri de yedekteki haliyle gelir.
+        Yedek daha eski bir şema sürümündeyse bekleyen göç adımları uygulanır;
+        aylık finans özeti geri yüklenen işlemlerden yeniden oluşturulur.
+
+        Args:
+            filepath: Yüklenecek dosya yolu (``.db`` veya gzip ``.db.gz``)
+            progress_callback: İlerleme yüzdesini (0-100) alan fonksiyon
+            pages: Adım başına kopyalanacak sayfa sayısı
+
+        Returns:
+            bool: Başarılı olup olmadığı
+        """
+        gecici = None
+        try:
+            with open(filepath, "rb") as f:
+                sikistirilmis = f.read(2) == GZIP_IMZASI
+
+            kaynak_yolu = filepath
+            if sikistirilmis:
+                fd, gecici = tempfile.mkstemp(suffix=".db")
+                with os.fdopen(fd, "wb") as acilmis, gzip.open(filepath, "rb") as gz:
+                    shutil.copyfileobj(gz, acilmis, XML_YAZMA_TAMPONU)
+                kaynak_yolu = gecici
+
+            self._butunluk_kontrolu(kaynak_yolu, uygulama_tablolari=True)
+
+            ilerleme = _YedekIlerlemesi(0, progress_callback)
+            with get_db_session() as db:
+                with self._sqlite_baglantisi(db) as hedef:
+                    kaynak = sqlite3.connect(kaynak_yolu)
+                    try:
+                        kaynak.backup(hedef, pages=pages, progress=self._sayfa_ilerlemesi(ilerleme))
+                    finally:
+                        kaynak.close()
+                # Eski sürümde alınmış yedeğin şemasını güncelle
+                sema_gocleri.guncelle(db.get_bind())
+                db.expire_all()
+                # Aylık özet yedekte hiç olmayabilir veya geri yüklenen işlemlerle uyuşmayabilir
+                FinansOzetController().rebuild(db=db)
+
+            DolulukController.invalidate()
+            DashboardController.invalidate()
+            tablo_surumleri.hepsini_artir()
+            ilerleme.bitir()
+            print("SQLite geri yükleme başarılı")
+            return True
+
+        except Exception as e:
+            print(f"SQLite geri yükleme hatası: {str(e)}")
+            return False
+        finally:
+            if gecici and os.path.exists(gecici):
+                os.remove(gecici)
+            self._close_db()
+
+    @staticmethod
+    @contextmanager
+    def _sqlite_baglantisi(db: Session) -> Iterator[sqlite3.Connection]:
+        """
+        Online backup için ham ``sqlite3.Connection`` al.
+
+        Session bir engine'e bağlıysa havuzdan ayrı bir bağlantı alınır;
+        böylece session'ın açık transaction'ı kopyayı etkilemez veya
+        kilitlemez. Session bir bağlantıya bağlıysa (ör. testler) o bağlantı
+        kullanılır.
+
+        Raises:
+            ValueError: Veritabanı SQLite değilse
+        """
+        bind = db.get_bind()
+        ham = bind.raw_connection() if isinstance(bind, Engine) else None
+        try:
+            baglanti = ham.dbapi_connection if ham is not None else db.connection().connection.dbapi_connection
+            if not isinstance(baglanti, sqlite3.Connection):
+                raise ValueError("Online yedekleme yalnızca SQLite veritabanlarında kullanılabilir")
+            yield baglanti
+        finally:
+            if ham is not None:
+                ham.close()
+
+    @staticmethod
+    def _sayfa_ilerlemesi(ilerleme: "_YedekIlerlemesi") -> Callable[[int, int, int], None]:
+        """
+        ``sqlite3.Connection.backup`` için progress fonksiyonu oluştur.
+
+        Kopyalama ``SQLITE_YEDEK_BEKLEME_SURESI`` saniye boyunca hiç
+        ilerlemezse (ör. karşı tarafta bitmeyen bir yazma transaction'ı)
+        ``TimeoutError`` fırlatarak işlemi sonlandırır.
+        """
+        son = {"kalan": -1, "zaman": time.monotonic()}
+
+        def progress(_durum: int, kalan: int, toplam: int) -> None:
+            simdi = time.monotonic()
+            if kalan != son["kalan"]:
+                son["kalan"], son["zaman"] = kalan, simdi
+            elif simdi - son["zaman"] > SQLITE_YEDEK_BEKLEME_SURESI:
+                raise TimeoutError("Veritabanı kilitli, online kopyalama ilerlemiyor")
+            ilerleme.ayarla(toplam - kalan, toplam)
+
+        return progress
+
+    def _butunluk_kontrolu(self, dosya_yolu: str, uygulama_tablolari: bool = False) -> None:
+        """
+        SQLite dosyasını ``PRAGMA integrity_check`` ile doğrula.
+
+        Args:
+            dosya_yolu: Kontrol edilecek veritabanı dosyası
+            uygulama_tablolari: True ise dosyada uygulama tablolarından en az biri aranır
+
+        Raises:
+            ValueError: Dosya bozuksa veya uygulama veritabanı değilse
+        """
+        baglanti = sqlite3.connect(f"{Path(dosya_yolu).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            sonuc = [satir[0] for satir in baglanti.execute("PRAGMA integrity_check").fetchall()]
+            if sonuc != ["ok"]:
+                raise ValueError(f"Bütünlük kontrolü başarısız: {'; '.join(sonuc[:5])}")
+            if uygulama_tablolari:
+                tablolar = {satir[0] for satir in baglanti.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table'"
+                )}
+                if not tablolar & {model.__tablename__ for model in self.MODELS_ORDER}:
+                    raise ValueError("Dosya bir Aidat Plus veritabanı değil")
+        finally:
+            baglanti.close()
+
     def backup_database_file(self, target_dir: str) -> bool:
         """
         Veritabanı dosyasını doğrudan kopyala
@@ -518,6 +1300,11 @@ class BackupController:
                     break
             
             if db_file:
+                # WAL modunda son commit'ler -wal dosyasında olabilir
+                try:
+                    checkpoint_wal()
+                except Exception as e:
+                    self.logger.warning(f"WAL checkpoint yapılamadı: {str(e)}")
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 target_file = os.path.join(target_dir, f"aidat_plus_backup_{timestamp}.db")
                 shutil.copy2(db_file, target_file)
@@ -1,16 +1,169 @@
 """
 Boş konut listesi hesaplama controller
 JS dosyasındaki hesaplama mantığının Python uyarlaması
+
+Boş günler aralık aritmetiğiyle bulunur: sakinler bir kez daireye göre
+gruplanır, tarihleri bir kez ayrıştırılır ve her dairenin doluluk aralıkları
+birleştirilip sıralanır (bkz. ``BosKonutIndex``). Bir ayın boş günleri, ay
+aralığından doluluk aralıklarının çıkarılmasıyla elde edilir; dönemler
+sıralı işlendiği için bir dairenin tüm dönemleri aralık listesi üzerinde
+tek geçişte hesaplanır. Maliyet O(daire × dönem + sakin) olur.
+
+Veritabanından çalışan ``get_empty_housing_report`` aynı kuralları NumPy
+ile uygular: dönemin doluluğu daire × gün boyutlu bir matristir (sakin
+aralıkları fark dizisi + kümülatif toplamla işaretlenir), aylık boş gün
+sayıları ve ilk/son boş günler ``reduceat`` ile, maliyetler ise daire
+payı × aylık günlük gider × boş gün çarpımıyla bulunur. Aylık gider
+toplamları ``finans_aylik_ozet`` tablosundan gruplu tek sorguyla okunur.
+
+Kurallar:
+    * Doluluk ``giris_tarihi`` ile başlar (``tahsis_tarihi`` değil); giriş
+      tarihi olmayan sakin hiçbir günü doldurmaz.
+    * Çıkış günü dolu sayılır; çıkış tarihi yoksa sakin hâlâ oturuyordur.
 """
 
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from calendar import monthrange
-from typing import List, Dict, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, or_, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
 from controllers.base_controller import BaseController
+from controllers.finans_ozet_controller import FinansOzetController
+from models.base import Blok, Daire, Lojman, Sakin
+from models.exceptions import DatabaseError
+from models.validation import Validator
+import database.config as db_config
 
 # Logger import
 from utils.logger import get_logger
 
+# Yarı açık doluluk aralığı: [giriş günü, çıkıştan sonraki gün)
+GunAraligi = Tuple[date, date]
+
+# (yıl, ay)
+Donem = Tuple[int, int]
+
+# (boş gün sayısı, ilk boş gün, son boş gün)
+BosDonem = Tuple[int, Optional[date], Optional[date]]
+
+_BIR_GUN = timedelta(days=1)
+
+# Gider dağıtım yöntemleri: konut başına eşit veya kiraya esas alana (m²) göre
+DAGITIM_YONTEMLERI = ("konut", "alan")
+
+
+def _donem_listesi(baslangic: Donem, bitis: Optional[Donem]) -> List[Donem]:
+    """[baslangic, bitis) aralığındaki (yıl, ay) dönemleri; bitis None ise tek ay"""
+    yil, ay = baslangic
+    if bitis is None:
+        return [(yil, ay)]
+    donemler = []
+    while (yil, ay) < bitis:
+        donemler.append((yil, ay))
+        yil, ay = (yil + 1, 1) if ay == 12 else (yil, ay + 1)
+    return donemler
+
+
+def _gune_cevir(deger: Any) -> Optional[date]:
+    """Tarih değerini güne çevir (datetime/date/ISO metin); çözülemezse None"""
+    if not deger:
+        return None
+    if isinstance(deger, datetime):
+        return deger.date()
+    if isinstance(deger, date):
+        return deger
+    try:
+        return datetime.fromisoformat(str(deger).split(' ')[0]).date()
+    except (ValueError, AttributeError, IndexError):
+        return None
+
+
+class BosKonutIndex:
+    """Daire başına birleştirilmiş, sıralı doluluk aralıkları.
+
+    Attributes:
+        sakin_sayisi (int): İndekse alınan sakin kaydı sayısı
+    """
+
+    def __init__(self, sakin_listesi: Iterable[Dict]) -> None:
+        """
+        İndeksi oluştur.
+
+        Args:
+            sakin_listesi: ``daire_id``, ``giris_tarihi`` ve ``cikis_tarihi`` alanlı sakinler
+        """
+        gruplar: Dict[Any, List[GunAraligi]] = {}
+        self.sakin_sayisi = 0
+        for sakin in sakin_listesi:
+            self.sakin_sayisi += 1
+            giris = _gune_cevir(sakin.get('giris_tarihi'))
+            if giris is None:
+                continue
+            cikis = _gune_cevir(sakin.get('cikis_tarihi'))
+            bitis = cikis + _BIR_GUN if cikis is not None else date.max
+            if bitis > giris:
+                gruplar.setdefault(sakin.get('daire_id'), []).append((giris, bitis))
+
+        self.araliklar: Dict[Any, List[GunAraligi]] = {
+            daire_id: self._birlestir(araliklar) for daire_id, araliklar in gruplar.items()
+        }
+
+    @staticmethod
+    def _birlestir(araliklar: List[GunAraligi]) -> List[GunAraligi]:
+        """Çakışan veya bitişik aralıkları birleştir"""
+        araliklar.sort()
+        birlesik = [araliklar[0]]
+        for baslangic, bitis in araliklar[1:]:
+            son_baslangic, son_bitis = birlesik[-1]
+            if baslangic <= son_bitis:
+                birlesik[-1] = (son_baslangic, max(son_bitis, bitis))
+            else:
+                birlesik.append((baslangic, bitis))
+        return birlesik
+
+    def bos_donemler(self, daire_id: Any, aylar: Sequence[GunAraligi]) -> List[BosDonem]:
+        """
+        Dairenin verilen aylardaki boş günlerini hesapla.
+
+        Args:
+            daire_id: Daire ID'si
+            aylar: Artan sırada, çakışmayan yarı açık ay aralıkları
+
+        Returns:
+            List[BosDonem]: Her ay için (boş gün sayısı, ilk boş gün, son boş gün)
+        """
+        araliklar = self.araliklar.get(daire_id, ())
+        sonuc: List[BosDonem] = []
+        i = 0
+        for ay_baslangic, ay_bitis in aylar:
+            # Bu aydan önce biten aralıklar sonraki aylar için de gereksiz
+            while i < len(araliklar) and araliklar[i][1] <= ay_baslangic:
+                i += 1
+
+            bos = 0
+            ilk_bos: Optional[date] = None
+            son_bos: Optional[date] = None
+            imlec = ay_baslangic
+            j = i
+            while j < len(araliklar) and araliklar[j][0] < ay_bitis and imlec < ay_bitis:
+                baslangic, bitis = araliklar[j]
+                if baslangic > imlec:
+                    bos += (baslangic - imlec).days
+                    ilk_bos = ilk_bos or imlec
+                    son_bos = baslangic - _BIR_GUN
+                imlec = max(imlec, bitis)
+                j += 1
+            if imlec < ay_bitis:
+                bos += (ay_bitis - imlec).days
+                ilk_bos = ilk_bos or imlec
+                son_bos = ay_bitis - _BIR_GUN
+            sonuc.append((bos, ilk_bos, son_bos))
+        return sonuc
+
 
 class BosKonutController(BaseController):
     """Boş konut listesi hesaplamaları"""
@@ -57,217 +210,304 @@ class BosKonutController(BaseController):
         Returns:
             (rapor kayıtları listesi, toplam maliyet)
         """
+        sonuclar = BosKonutController.calculate_empty_housing_costs_for_periods(
+            [(year, month)], daire_listesi, blok_listesi, lojman_listesi, gider_kayitlari, sakin_listesi
+        )
+        return sonuclar[(year, month)]
+
+    @staticmethod
+    def calculate_yearly_empty_housing_costs(
+        year: int,
+        daire_listesi: List[Dict],
+        blok_listesi: List[Dict],
+        lojman_listesi: List[Dict],
+        gider_kayitlari: List[Dict],
+        sakin_listesi: List[Dict],
+    ) -> Dict[int, Tuple[List[Dict], float]]:
+        """
+        Bir yılın 12 ayı için boş konut maliyetlerini tek geçişte hesapla.
+
+        Args:
+            year: Yıl
+            daire_listesi, blok_listesi, lojman_listesi, gider_kayitlari, sakin_listesi:
+                ``calculate_empty_housing_costs`` ile aynı
+
+        Returns:
+            Dict[int, Tuple[List[Dict], float]]: Ay (1-12) -> (rapor kayıtları, toplam maliyet)
+        """
+        sonuclar = BosKonutController.calculate_empty_housing_costs_for_periods(
+            [(year, ay) for ay in range(1, 13)],
+            daire_listesi, blok_listesi, lojman_listesi, gider_kayitlari, sakin_listesi
+        )
+        return {ay: sonuc for (_, ay), sonuc in sonuclar.items()}
+
+    @staticmethod
+    def calculate_empty_housing_costs_for_periods(
+        donemler: Iterable[Donem],
+        daire_listesi: List[Dict],
+        blok_listesi: List[Dict],
+        lojman_listesi: List[Dict],
+        gider_kayitlari: List[Dict],
+        sakin_listesi: List[Dict],
+    ) -> Dict[Donem, Tuple[List[Dict], float]]:
+        """
+        Birden çok ay için boş konut maliyetlerini hesapla.
+
+        Sakinler ve giderler bir kez işlenir; her daire için tüm dönemler
+        ``BosKonutIndex.bos_donemler`` ile tek geçişte hesaplanır. Her ayın
+        giderleri o ayın gün ve daire sayısına bölünür, boş daireye boş gün
+        sayısı kadar yansıtılır.
+
+        Args:
+            donemler: (yıl, ay) çiftleri
+            daire_listesi: Daireler (``id``, ``daire_no``, ``bagliBlokId``, ``kiraya_esasi_alan``)
+            blok_listesi: Bloklar (``id``, ``blok_adi``, ``bagliLojmanId``)
+            lojman_listesi: Lojmanlar (``id``, ``lojman_adi``)
+            gider_kayitlari: Giderler (``islem_tarihi``, ``tutar``)
+            sakin_listesi: Sakinler (``daire_id``, ``giris_tarihi``, ``cikis_tarihi``)
+
+        Returns:
+            Dict[Donem, Tuple[List[Dict], float]]: (yıl, ay) -> (rapor kayıtları, toplam maliyet)
+        """
         logger = get_logger("BosKonutController.calculate_empty_housing_costs")
-        
-        days_in_month = BosKonutController.get_days_in_month(year, month)
-        month_start, month_end = BosKonutController.get_month_start_end(year, month)
-        
-        logger.debug(f"Ay: {year}-{month}, Gün Sayısı: {days_in_month}")
-        
-        # Seçilen ay için giderleri filtrele
-        month_giderler = []
+
+        donemler = sorted(set(donemler))
+        aylar = [
+            (date(yil, ay, 1), date(yil, ay, 1) + timedelta(days=monthrange(yil, ay)[1]))
+            for yil, ay in donemler
+        ]
+
+        # Giderleri bir kez aylara dağıt
+        aylik_giderler: Dict[Donem, float] = dict.fromkeys(donemler, 0.0)
         for gider in gider_kayitlari:
-            if not gider.get('islem_tarihi'):
-                continue
-            try:
-                gider_date = datetime.fromisoformat(str(gider['islem_tarihi']).split(' ')[0])
-                if gider_date.year == year and gider_date.month == month:
-                    month_giderler.append(gider)
-            except (ValueError, AttributeError, IndexError):
+            gider_gunu = _gune_cevir(gider.get('islem_tarihi'))
+            if gider_gunu is None:
                 continue
-        
-        # Toplam aylık giderleri hesapla
-        total_monthly_expenses = sum(g.get('tutar', 0) for g in month_giderler)
+            anahtar = (gider_gunu.year, gider_gunu.month)
+            if anahtar in aylik_giderler:
+                aylik_giderler[anahtar] += gider.get('tutar', 0)
+
         total_housing_count = len(daire_listesi)
-        
         # Konut başına günlük maliyet
-        daily_cost_per_housing = (
-            total_monthly_expenses / total_housing_count / days_in_month
-            if total_housing_count > 0
-            else 0
-        )
-        
-        # Her daire için işle
-        records = []
-        record_index = 1
-        
-        # Debug: İlk daire için sakin bilgilerini log et
-        if daire_listesi:
-            first_daire = daire_listesi[0]
-            first_daire_sakinleri = [
-                s for s in sakin_listesi
-                if s.get('daire_id') == first_daire.get('id') or s.get('bagliDaireId') == first_daire.get('id')
-            ]
-            if first_daire_sakinleri:
-                logger.debug(f"İlk dairenin sakinleri:")
-                for s in first_daire_sakinleri[:3]:
-                    logger.debug(f"  - Giriş: {s.get('giris_tarihi')} (type: {type(s.get('giris_tarihi')).__name__}), Çıkış: {s.get('cikis_tarihi')} (type: {type(s.get('cikis_tarihi')).__name__})")
-        
+        gunluk_maliyetler = [
+            aylik_giderler[donem] / total_housing_count / (bitis - baslangic).days
+            if total_housing_count > 0 else 0
+            for donem, (baslangic, bitis) in zip(donemler, aylar)
+        ]
+
+        index = BosKonutIndex(sakin_listesi)
+        bloklar = {b.get('id'): b for b in blok_listesi}
+        lojmanlar = {l.get('id'): l for l in lojman_listesi}
+        kayitlar: List[List[Dict]] = [[] for _ in donemler]
+
         for daire in daire_listesi:
-            daire_id = daire.get('id')
-            
-            # Bu dairenin sakinlerini bul (daire_id)
-            # raporlar_panel.py'de sakin_listesi'ndeki daire_id, eski_daire_id fallback'i içeriyor
-            daire_sakinleri = [
-                s for s in sakin_listesi
-                if s.get('daire_id') == daire_id
-            ]
-            
-            # Ayda her gün için işgal durumunu kontrol et
-            occupied_days = [False] * days_in_month
-            
-            for sakin in daire_sakinleri:
-                # Giriş tarihi: giris_tarihi (konut kullanan başlangıç tarihi)
-                # NOT: tahsis_tarihi ≠ giris_tarihi (tahsis = tahsis, giriş = gerçek yerleşim)
-                entry_date = None
-                date_str = sakin.get('giris_tarihi')  # Sadece giris_tarihi kullan!
-                if date_str:
-                    try:
-                        # datetime nesnesi olup olmadığını kontrol et
-                        if isinstance(date_str, datetime):
-                            entry_date = datetime(date_str.year, date_str.month, date_str.day)
-                        else:
-                            parsed = datetime.fromisoformat(str(date_str).split(' ')[0])
-                            entry_date = datetime(parsed.year, parsed.month, parsed.day)
-                    except (ValueError, AttributeError, IndexError) as e:
-                        logger.debug(f"Giriş tarihi parse hatası: {e}, date_str: {date_str}")
-                
-                # Çıkış tarihi (sadece cikis_tarihi kontrol et)
-                exit_date = None
-                exit_date_str = sakin.get('cikis_tarihi')
-                if exit_date_str:
-                    try:
-                        # datetime nesnesi olup olmadığını kontrol et
-                        if isinstance(exit_date_str, datetime):
-                            exit_date = datetime(exit_date_str.year, exit_date_str.month, exit_date_str.day)
-                        else:
-                            parsed = datetime.fromisoformat(str(exit_date_str).split(' ')[0])
-                            exit_date = datetime(parsed.year, parsed.month, parsed.day)
-                    except (ValueError, AttributeError, IndexError) as e:
-                        logger.debug(f"Çıkış tarihi parse hatası: {e}, exit_date_str: {exit_date_str}")
-                
-                # Dönem sınırlarını belirle
-                # Eğer giriş tarihi yoksa, bu sakin bu ayda hiç olmamış demektir
-                if entry_date is None:
-                    continue
-                
-                # Giriş tarihi seçili aydan sonraki ayda ise, bu ay için skip
-                if entry_date.year > year or (entry_date.year == year and entry_date.month > month):
+            bos_donemler = index.bos_donemler(daire.get('id'), aylar)
+            if not any(bos for bos, _, _ in bos_donemler):
+                continue
+
+            blok = bloklar.get(daire.get('bagliBlokId'))
+            lojman = lojmanlar.get(blok.get('bagliLojmanId')) if blok else None
+            lojman_adi = lojman.get('lojman_adi', 'Bilinmeyen Lojman') if lojman else 'Bilinmeyen Lojman'
+            blok_adi = blok.get('blok_adi', 'Bilinmeyen Blok') if blok else 'Bilinmeyen Blok'
+
+            for k, (bos_gun, ilk_bos, son_bos) in enumerate(bos_donemler):
+                if bos_gun == 0:
                     continue
-                
-                period_start = entry_date
-                # Çıkış tarihi dahil olmalı (çıkış günü dahil işgal sayılır), o yüzden sonraki günü limit yap
-                if exit_date:
-                    # Çıkış gününün sonraki günü limit olsun (günü dahil et)
-                    period_end = exit_date + timedelta(days=1)
-                else:
-                    period_end = datetime(2100, 12, 31)
-                
-                # İşgal günlerini işaretle (ay içinde)
-                for day in range(1, days_in_month + 1):
-                    current_date = datetime(year, month, day)
-                    # Sakin bu gün dairede mi?
-                    if period_start <= current_date < period_end:
-                        occupied_days[day - 1] = True
-            
-            # Boş gün sayısını hesapla
-            empty_days = sum(1 for day in occupied_days if not day)
-            
-            # Sakin yoksa tüm ay boş
-            final_empty_days = days_in_month if len(daire_sakinleri) == 0 else empty_days
-            
-            # Debug
-            occupied_list = [d+1 for d in range(days_in_month) if occupied_days[d]]
-            empty_list = [d+1 for d in range(days_in_month) if not occupied_days[d]]
-            logger.debug(f"Daire {daire.get('daire_no')}: Sakin={len(daire_sakinleri)}, İşgal={len(occupied_list)}, Boş={final_empty_days}")
-            if len(daire_sakinleri) > 0:
-                logger.debug(f"  İşgal günleri: {occupied_list}")
-                logger.debug(f"  Boş günleri: {empty_list}")
-            
-            if final_empty_days > 0:
-                # Daire, blok, lojman bilgisini bul
-                blok = next(
-                    (b for b in blok_listesi if b.get('id') == daire.get('bagliBlokId')),
-                    None
-                )
-                lojman = (
-                    next(
-                        (l for l in lojman_listesi if l.get('id') == blok.get('bagliLojmanId')),
-                        None
-                    )
-                    if blok
-                    else None
-                )
-                
-                lojman_adi = lojman.get('lojman_adi', 'Bilinmeyen Lojman') if lojman else 'Bilinmeyen Lojman'
-                blok_adi = blok.get('blok_adi', 'Bilinmeyen Blok') if blok else 'Bilinmeyen Blok'
-                daire_adi = f"{lojman_adi} - {blok_adi}"
-                
-                konut_aidat_bedeli = daily_cost_per_housing * final_empty_days
-                
-                # Boş dönemin başlangıç ve bitiş tarihlerini hesapla
-                if len(daire_sakinleri) == 0:
-                    # Dairede hiç sakin yok → Tüm ay boş
-                    empty_period_start = month_start
-                    # Ayın son günü
-                    empty_period_end = datetime(year, month, days_in_month)
-                else:
-                    # Dairede sakin(ler) var → Boş günleri bul
-                    first_empty_index = None
-                    last_empty_index = None
-                    consecutive_empty_start = None
-                    consecutive_empty_end = None
-                    
-                    for day in range(days_in_month):
-                        if not occupied_days[day]:
-                            if first_empty_index is None:
-                                first_empty_index = day  # İlk boş gün indeksi
-                                consecutive_empty_start = day
-                            consecutive_empty_end = day
-                            last_empty_index = day
-                        else:
-                            # İşgal gün bulundu, ardışık boş dönem sonlanıyor
-                            consecutive_empty_start = None
-                            consecutive_empty_end = None
-                    
-                    # Hiç boş gün yoksa bu dairenin boş konut raporu yok
-                    if first_empty_index is None:
-                        continue
-                    
-                    # Boş dönem türü belirle
-                    # Eğer boş günler ay başından başlamışsa: ay başlangıcını kullan
-                    # Eğer boş günler ay sonunda bitmişse: ay sonunu kullan
-                    # Aksi halde: boş günlerin gerçek başlangıcını ve bitişini kullan
-                    
-                    if first_empty_index == 0:
-                        # Ay başından boş
-                        empty_period_start = month_start
-                    else:
-                        # Orta bölgede başlayan boş gün
-                        empty_period_start = datetime(year, month, first_empty_index + 1)
-                    
-                    if last_empty_index == days_in_month - 1:
-                        # Ay sonuna kadar boş
-                        empty_period_end = datetime(year, month, days_in_month)
-                    else:
-                        # Orta bölgede biten boş gün
-                        empty_period_end = datetime(year, month, last_empty_index + 1)
-                
-                records.append({
-                    'sira_no': record_index,
-                    'daire_adi': daire_adi,
+                kayitlar[k].append({
+                    'sira_no': len(kayitlar[k]) + 1,
+                    'daire_adi': f"{lojman_adi} - {blok_adi}",
                     'daire_no': daire.get('daire_no'),
                     'alan': daire.get('kiraya_esasi_alan', 0),
-                    'ilk_tarih': empty_period_start,
-                    'son_tarih': empty_period_end,
-                    'sorumlu_gun_sayisi': final_empty_days,
-                    'konut_aidat_bedeli': konut_aidat_bedeli,
+                    'ilk_tarih': datetime(ilk_bos.year, ilk_bos.month, ilk_bos.day),
+                    'son_tarih': datetime(son_bos.year, son_bos.month, son_bos.day),
+                    'sorumlu_gun_sayisi': bos_gun,
+                    'konut_aidat_bedeli': gunluk_maliyetler[k] * bos_gun,
                 })
-                record_index += 1
-        
-        total_cost = sum(r.get('konut_aidat_bedeli', 0) for r in records)
-        
-        return records, total_cost
+
+        logger.debug(
+            f"Computed vacancy for {total_housing_count} units x {len(donemler)} months "
+            f"from {index.sakin_sayisi} residents"
+        )
+        return {
+            donem: (records, sum(r['konut_aidat_bedeli'] for r in records))
+            for donem, records in zip(donemler, kayitlar)
+        }
+    
+    def get_empty_housing_report(
+        self,
+        baslangic: Donem,
+        bitis: Optional[Donem] = None,
+        dagitim: str = "konut",
+        db: Session = None
+    ) -> Dict[Donem, Tuple[List[Dict], float]]:
+        """
+        Boş konut raporunu veritabanından vektörel olarak hesapla.
+
+        Aktif daireler, dönemle kesişen sakinler ve aylık gider toplamları
+        üç sorguyla okunur; hesaplama ``_bos_konut_matrisi`` ile yapılır.
+
+        Args:
+            baslangic (Donem): (yıl, ay) başlangıç dönemi (dahil)
+            bitis (Donem, optional): (yıl, ay) bitiş dönemi (hariç); None ise yalnızca başlangıç ayı
+            dagitim (str): "konut" (aylık gider daireler arasında eşit) veya
+                "alan" (``kiraya_esas_alan`` m² payına göre)
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            Dict[Donem, Tuple[List[Dict], float]]: (yıl, ay) -> (rapor kayıtları, toplam maliyet);
+            kayıt biçimi ``calculate_empty_housing_costs`` ile aynıdır
+
+        Raises:
+            ValidationError: Geçersiz dağıtım yöntemi
+            DatabaseError: Veritabanı hatası
+
+        Example:
+            >>> # 2024 yılının tamamı, m² payına göre
+            >>> BosKonutController().get_empty_housing_report((2024, 1), (2025, 1), dagitim="alan")
+        """
+        Validator.validate_choice(dagitim, "Dağıtım Yöntemi", list(DAGITIM_YONTEMLERI))
+        donemler = _donem_listesi(baslangic, bitis)
+        if not donemler:
+            return {}
+        son_yil, son_ay = donemler[-1]
+        sonraki = (son_yil + 1, 1) if son_ay == 12 else (son_yil, son_ay + 1)
+        ilk_an = datetime(*donemler[0], 1)
+        son_an = datetime(*sonraki, 1)
+
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            daireler = session.execute(
+                select(Daire.id, Daire.daire_no, Daire.kiraya_esas_alan, Lojman.ad, Blok.ad)
+                .select_from(Daire)
+                .outerjoin(Blok, Daire.blok_id == Blok.id)
+                .outerjoin(Lojman, Blok.lojman_id == Lojman.id)
+                .where(Daire.aktif == True)
+                .order_by(Daire.id)
+            ).all()
+            # Yalnızca dönemle kesişen kalışlar (çıkış günü dahil)
+            sakinler = session.execute(
+                select(func.coalesce(Sakin.daire_id, Sakin.eski_daire_id), Sakin.giris_tarihi, Sakin.cikis_tarihi)
+                .where(
+                    Sakin.giris_tarihi.isnot(None),
+                    Sakin.giris_tarihi < son_an,
+                    or_(Sakin.cikis_tarihi.is_(None), Sakin.cikis_tarihi >= ilk_an),
+                )
+            ).all()
+            gider_satirlari = FinansOzetController().get_toplamlar(
+                ["month"], tur="Gider", baslangic=donemler[0], bitis=sonraki, db=session
+            )
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to load empty housing data: {str(e)}")
+            raise DatabaseError(
+                f"Boş konut verileri alınamadı: {str(e)}",
+                code="DB_BKN_001",
+                details={"baslangic": baslangic, "bitis": bitis}
+            )
+        finally:
+            if close_db:
+                session.close()
+
+        donem_sirasi = {donem: k for k, donem in enumerate(donemler)}
+        giderler = np.zeros(len(donemler))
+        for satir in gider_satirlari:
+            k = donem_sirasi.get((satir["yil"], satir["ay"]))
+            if k is not None:
+                giderler[k] = satir["toplam_kurus"] / 100.0
+
+        sonuc = self._bos_konut_matrisi(donemler, daireler, sakinler, giderler, dagitim)
+        self.logger.debug(
+            f"Empty housing report for {len(daireler)} units x {len(donemler)} months "
+            f"({len(sakinler)} residents, allocation={dagitim})"
+        )
+        return sonuc
+
+    @staticmethod
+    def _bos_konut_matrisi(
+        donemler: List[Donem],
+        daireler: Sequence[Tuple[Any, ...]],
+        sakinler: Sequence[Tuple[Any, Any, Any]],
+        giderler: np.ndarray,
+        dagitim: str = "konut"
+    ) -> Dict[Donem, Tuple[List[Dict], float]]:
+        """
+        Doluluk matrisinden boş gün ve maliyetleri hesapla.
+
+        Args:
+            donemler: Artan sırada, ardışık (yıl, ay) dönemleri
+            daireler: (id, daire_no, kiraya_esas_alan, lojman_adi, blok_adi) satırları
+            sakinler: (daire_id, giris_tarihi, cikis_tarihi) satırları
+            giderler: Dönem başına toplam gider (TL)
+            dagitim: "konut" veya "alan"
+
+        Returns:
+            Dict[Donem, Tuple[List[Dict], float]]: (yıl, ay) -> (rapor kayıtları, toplam maliyet)
+        """
+        ilk_gun = date(*donemler[0], 1)
+        gun_sayilari = np.array([monthrange(yil, ay)[1] for yil, ay in donemler])
+        ay_baslari = np.concatenate(([0], np.cumsum(gun_sayilari)[:-1]))
+        toplam_gun = int(gun_sayilari.sum())
+        daire_sayisi = len(daireler)
+        if daire_sayisi == 0:
+            return {donem: ([], 0.0) for donem in donemler}
+
+        # Sakin aralıklarını dönem içindeki [başlangıç, bitiş) gün indekslerine çevir
+        satir_no = {daire[0]: i for i, daire in enumerate(daireler)}
+        satirlar, baslangiclar, bitisler = [], [], []
+        for daire_id, giris, cikis in sakinler:
+            i = satir_no.get(daire_id)
+            giris_gunu = _gune_cevir(giris)
+            if i is None or giris_gunu is None:
+                continue
+            cikis_gunu = _gune_cevir(cikis)
+            satirlar.append(i)
+            baslangiclar.append((giris_gunu - ilk_gun).days)
+            bitisler.append((cikis_gunu - ilk_gun).days + 1 if cikis_gunu is not None else toplam_gun)
+        baslangic_dizisi = np.clip(np.array(baslangiclar, dtype=np.int64), 0, toplam_gun)
+        bitis_dizisi = np.clip(np.array(bitisler, dtype=np.int64), 0, toplam_gun)
+        satir_dizisi = np.array(satirlar, dtype=np.int64)
+        gecerli = baslangic_dizisi < bitis_dizisi
+
+        # Fark dizisi: kalış başında +1, bitişinde -1; kümülatif toplam > 0 ise gün dolu
+        fark = np.zeros((daire_sayisi, toplam_gun + 1), dtype=np.int32)
+        np.add.at(fark, (satir_dizisi[gecerli], baslangic_dizisi[gecerli]), 1)
+        np.add.at(fark, (satir_dizisi[gecerli], bitis_dizisi[gecerli]), -1)
+        bos = np.cumsum(fark[:, :toplam_gun], axis=1) <= 0
+
+        gun_no = np.arange(toplam_gun)
+        bos_gun = np.add.reduceat(bos, ay_baslari, axis=1)
+        ilk_bos = np.minimum.reduceat(np.where(bos, gun_no, toplam_gun), ay_baslari, axis=1)
+        son_bos = np.maximum.reduceat(np.where(bos, gun_no, -1), ay_baslari, axis=1)
+
+        # Daire payı: eşit veya kiraya esas alan oranı
+        if dagitim == "alan":
+            alanlar = np.array([daire[2] or 0.0 for daire in daireler], dtype=float)
+            toplam_alan = alanlar.sum()
+            paylar = alanlar / toplam_alan if toplam_alan > 0 else np.zeros(daire_sayisi)
+        else:
+            paylar = np.full(daire_sayisi, 1.0 / daire_sayisi)
+        maliyet = paylar[:, None] * (giderler / gun_sayilari)[None, :] * bos_gun
+
+        sonuc: Dict[Donem, Tuple[List[Dict], float]] = {}
+        for k, donem in enumerate(donemler):
+            kayitlar = []
+            for i in np.flatnonzero(bos_gun[:, k]):
+                _, daire_no, alan, lojman_adi, blok_adi = daireler[i]
+                ilk = ilk_gun + timedelta(days=int(ilk_bos[i, k]))
+                son = ilk_gun + timedelta(days=int(son_bos[i, k]))
+                kayitlar.append({
+                    'sira_no': len(kayitlar) + 1,
+                    'daire_adi': f"{lojman_adi or 'Bilinmeyen Lojman'} - {blok_adi or 'Bilinmeyen Blok'}",
+                    'daire_no': daire_no,
+                    'alan': alan,
+                    'ilk_tarih': datetime(ilk.year, ilk.month, ilk.day),
+                    'son_tarih': datetime(son.year, son.month, son.day),
+                    'sorumlu_gun_sayisi': int(bos_gun[i, k]),
+                    'konut_aidat_bedeli': float(maliyet[i, k]),
+                })
+            sonuc[donem] = (kayitlar, float(maliyet[:, k].sum()))
+        return sonuc
     
     @staticmethod
     def format_currency(amount: float) -> str:
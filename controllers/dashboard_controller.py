@@ -0,0 +1,335 @@
+"""
+Dashboard controller - KPI kartları ve grafik serileri için anlık görüntü.
+
+Dashboard'daki tüm değerler sabit sayıda toplama sorgusuyla hesaplanır:
+    1. Aktif hesapların ad/bakiye listesi (toplam bakiye ve dağılım grafiği)
+    2. ``finans_aylik_ozet`` rollup'ından son 12 ayın gelir/gider toplamları
+       (aylık trend)
+    3. Ayın başından şu ana kadarki (bu an dahil) gelir/gider toplamları (bu
+       ayın kartları) ve bu ay içinde şu andan sonraki ilk işlemin tarihi
+    4. Sakini olan aktif daire sayısı
+    5. Aktif aidatların tahakkuk/ödenen toplamları (genel ve bu ay)
+
+Sonuç ``DashboardSnapshot`` olarak süreç içinde paylaşılır ve finans
+işlemi, hesap, aidat, aidat ödemesi, sakin veya daire yazan her
+flush/commit sonrasında geçersiz kılınır (bkz. ``DolulukController``). Ay
+değiştiğinde ya da bu ay içindeki ileri tarihli bir işlemin zamanı geldiğinde
+(kartlara girmesi gerektiğinde) de yeniden hesaplanır. Session üzerinden çalışan toplu
+``insert``/``update``/``delete`` ifadeleri (ör. aylık aidat üretimi) de
+yakalanır. Böylece otomatik yenileme, veri değişmediyse veritabanına hiç
+gitmez.
+"""
+
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Optional, Tuple
+
+from sqlalchemy import and_, case, event, func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+import database.config as db_config
+from controllers.finans_islem_controller import FinansIslemController
+from controllers.finans_ozet_controller import FinansOzetController
+from models.base import AidatIslem, AidatOdeme, Daire, FinansAylikOzet, FinansIslem, Hesap, Sakin
+from models.exceptions import DatabaseError
+from utils.logger import get_logger
+
+# Trend grafiğindeki ay sayısı (bu ay dahil)
+TREND_AY_SAYISI = 12
+
+TR_AY_KISALTMALARI = ("Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara")
+
+# Yazıldığında anlık görüntüyü geçersiz kılan modeller
+IZLENEN_MODELLER = (FinansIslem, FinansAylikOzet, Hesap, AidatIslem, AidatOdeme, Sakin, Daire)
+IZLENEN_TABLOLAR = frozenset(model.__tablename__ for model in IZLENEN_MODELLER)
+
+
+@dataclass(frozen=True)
+class DashboardSnapshot:
+    """Dashboard'un tek seferde hesaplanan değerleri.
+
+    Attributes:
+        olusturma (datetime): Hesaplama zamanı
+        yil (int): Hesaplamanın yapıldığı yıl ("bu ay" değerleri için)
+        ay (int): Hesaplamanın yapıldığı ay
+        toplam_bakiye (float): Aktif hesapların toplam bakiyesi
+        bu_ay_geliri (float): Bu ayın gelir toplamı
+        bu_ay_gideri (float): Bu ayın gider toplamı
+        dolu_daire_sayisi (int): Sakini olan aktif daire sayısı
+        aidat_tahsilat_orani (float): Tüm aktif aidatlarda ödenen/tahakkuk yüzdesi (0-100)
+        trend_aylar (Tuple[str, ...]): Son 12 ayın kısaltmaları (eskiden yeniye)
+        trend_gelirler (Tuple[float, ...]): Aylık gelir toplamları
+        trend_giderler (Tuple[float, ...]): Aylık gider toplamları
+        hesap_adlari (Tuple[str, ...]): Pozitif bakiyeli aktif hesaplar
+        hesap_bakiyeleri (Tuple[float, ...]): Bu hesapların bakiyeleri
+        aidat_odenen (float): Bu ayın aidatlarında ödenen tutar
+        aidat_odenmeyen (float): Bu ayın aidatlarında kalan tutar
+        gecerlilik_sonu (Optional[datetime]): Bu ay içinde hesaplama anından sonraki
+            ilk gelir/gider işleminin tarihi; bu an geldiğinde "bu ay" kartları eskir
+    """
+
+    olusturma: datetime
+    yil: int
+    ay: int
+    toplam_bakiye: float
+    bu_ay_geliri: float
+    bu_ay_gideri: float
+    dolu_daire_sayisi: int
+    aidat_tahsilat_orani: float
+    trend_aylar: Tuple[str, ...]
+    trend_gelirler: Tuple[float, ...]
+    trend_giderler: Tuple[float, ...]
+    hesap_adlari: Tuple[str, ...]
+    hesap_bakiyeleri: Tuple[float, ...]
+    aidat_odenen: float
+    aidat_odenmeyen: float
+    gecerlilik_sonu: Optional[datetime] = None
+
+    @property
+    def net_durum(self) -> float:
+        """Bu ayın gelir - gider farkı"""
+        return self.bu_ay_geliri - self.bu_ay_gideri
+
+    def gecerli_mi(self, simdi: datetime) -> bool:
+        """
+        Değerler verilen an için hâlâ doğru mu?
+
+        Args:
+            simdi (datetime): Şimdiki zaman
+
+        Returns:
+            bool: Aynı ay içindeyse ve ileri tarihli bir işlemin zamanı gelmediyse True
+        """
+        return (
+            (self.yil, self.ay) == (simdi.year, simdi.month)
+            and (self.gecerlilik_sonu is None or simdi < self.gecerlilik_sonu)
+        )
+
+
+def _ay_kaydir(yil: int, ay: int, fark: int) -> Tuple[int, int]:
+    """(yıl, ay) dönemini ``fark`` ay ileri/geri kaydır"""
+    sira = yil * 12 + (ay - 1) + fark
+    return sira // 12, sira % 12 + 1
+
+
+class DashboardController:
+    """
+    Paylaşılan dashboard anlık görüntüsünü yöneten controller.
+
+    Example:
+        >>> controller = DashboardController()
+        >>> snapshot = controller.get_snapshot()
+        >>> snapshot.toplam_bakiye, snapshot.aidat_tahsilat_orani
+        (125000.0, 87.5)
+    """
+
+    _snapshot: Optional[DashboardSnapshot] = None
+    # Her geçersiz kılmada artar; hesaplama sürerken gelen yazmalar eski sonucun saklanmasını engeller
+    _surum = 0
+    _lock = threading.Lock()
+
+    def __init__(self, saat: Callable[[], datetime] = datetime.now) -> None:
+        """
+        Args:
+            saat: Şimdiki zamanı veren fonksiyon (testler için)
+        """
+        self.saat = saat
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    def get_snapshot(self, db: Optional[Session] = None) -> DashboardSnapshot:
+        """
+        Güncel anlık görüntüyü döndür; yoksa veya artık geçerli değilse hesapla.
+
+        Args:
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            DashboardSnapshot: Güncel değerler
+
+        Raises:
+            DatabaseError: Veritabanı hatası
+        """
+        simdi = self.saat()
+        snapshot = DashboardController._snapshot
+        if snapshot is not None and snapshot.gecerli_mi(simdi):
+            return snapshot
+
+        with DashboardController._lock:
+            snapshot = DashboardController._snapshot
+            if snapshot is not None and snapshot.gecerli_mi(simdi):
+                return snapshot
+            surum = DashboardController._surum
+
+        snapshot = self._hesapla(simdi, db)
+
+        with DashboardController._lock:
+            if DashboardController._surum == surum:
+                DashboardController._snapshot = snapshot
+        return snapshot
+
+    def guncel_mi(self, snapshot: Optional[DashboardSnapshot]) -> bool:
+        """
+        Verilen anlık görüntü hâlâ geçerli mi? (veritabanına gitmez)
+
+        Args:
+            snapshot: Daha önce ``get_snapshot`` ile alınan değer
+
+        Returns:
+            bool: Sonraki ``get_snapshot`` aynı nesneyi döndürecekse True
+        """
+        simdi = self.saat()
+        return (
+            snapshot is not None
+            and snapshot is DashboardController._snapshot
+            and snapshot.gecerli_mi(simdi)
+        )
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Paylaşılan anlık görüntüyü geçersiz kıl (sonraki istekte yeniden hesaplanır)"""
+        with cls._lock:
+            cls._snapshot = None
+            cls._surum += 1
+
+    def _hesapla(self, simdi: datetime, db: Optional[Session]) -> DashboardSnapshot:
+        """Tüm KPI ve grafik serilerini sabit sayıda sorguyla hesapla"""
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            # 1. Hesaplar
+            hesaplar = session.query(Hesap.ad, Hesap.bakiye_kurus).filter(
+                Hesap.aktif == True
+            ).order_by(Hesap.id).all()
+            toplam_bakiye = sum(h.bakiye_kurus or 0 for h in hesaplar) / 100.0
+            pozitif = [(h.ad, h.bakiye_kurus / 100.0) for h in hesaplar if (h.bakiye_kurus or 0) > 0]
+
+            # 2. Son 12 ayın gelir/gider toplamları (rollup)
+            donemler = [_ay_kaydir(simdi.year, simdi.month, -i) for i in range(TREND_AY_SAYISI - 1, -1, -1)]
+            satirlar = FinansOzetController().get_toplamlar(
+                group_by=["month", "tur"],
+                tur=["Gelir", "Gider"],
+                baslangic=donemler[0],
+                bitis=_ay_kaydir(simdi.year, simdi.month, 1),
+                db=session
+            )
+            toplamlar = {(r["yil"], r["ay"], r["tur"]): r["toplam"] for r in satirlar}
+            gelirler = tuple(toplamlar.get((y, a, "Gelir"), 0.0) for y, a in donemler)
+            giderler = tuple(toplamlar.get((y, a, "Gider"), 0.0) for y, a in donemler)
+
+            # 3. Bu ayın kartları: ayın başından şu ana kadar (bitiş anı dahil)
+            bu_ay_toplamlari = {
+                r["tur"]: r["toplam"]
+                for r in FinansIslemController().aggregate(
+                    group_by=["tur"],
+                    tur=["Gelir", "Gider"],
+                    date_range=(datetime(simdi.year, simdi.month, 1), simdi),
+                    bitis_dahil=True,
+                    db=session
+                )
+            }
+            # Bu ay içindeki ileri tarihli ilk işlem: zamanı gelince kartlar yeniden hesaplanır
+            gecerlilik_sonu = session.query(func.min(FinansIslem.tarih)).filter(
+                FinansIslem.aktif == True,
+                FinansIslem.tur.in_(["Gelir", "Gider"]),
+                FinansIslem.tarih > simdi,
+                FinansIslem.tarih < datetime(*_ay_kaydir(simdi.year, simdi.month, 1), 1)
+            ).scalar()
+
+            # 4. Sakini olan aktif daireler
+            dolu_daire = session.query(func.count(func.distinct(Daire.id))).join(
+                Sakin, Sakin.daire_id == Daire.id
+            ).filter(Daire.aktif == True).scalar() or 0
+
+            # 5. Aidat tahakkuk/ödeme toplamları
+            odenen = session.query(
+                AidatOdeme.aidat_islem_id.label("aidat_islem_id"),
+                func.sum(AidatOdeme.tutar).label("tutar")
+            ).filter(AidatOdeme.odendi == True).group_by(AidatOdeme.aidat_islem_id).subquery()
+            odenen_tutar = func.coalesce(odenen.c.tutar, 0.0)
+            bu_ay = and_(AidatIslem.yil == simdi.year, AidatIslem.ay == simdi.month)
+            aidat = session.query(
+                func.coalesce(func.sum(AidatIslem.toplam_tutar), 0.0).label("tahakkuk"),
+                func.coalesce(func.sum(odenen_tutar), 0.0).label("odenen"),
+                func.coalesce(func.sum(case((bu_ay, AidatIslem.toplam_tutar), else_=0.0)), 0.0).label("bu_ay_tahakkuk"),
+                func.coalesce(func.sum(case((bu_ay, odenen_tutar), else_=0.0)), 0.0).label("bu_ay_odenen"),
+            ).outerjoin(odenen, odenen.c.aidat_islem_id == AidatIslem.id).filter(
+                AidatIslem.aktif == True
+            ).one()
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to compute dashboard snapshot: {str(e)}")
+            raise DatabaseError(
+                f"Dashboard verileri hesaplanamadı: {str(e)}",
+                code="DB_DSH_001",
+                details={"yil": simdi.year, "ay": simdi.month}
+            )
+        finally:
+            if close_db:
+                session.close()
+
+        tahakkuk = float(aidat.tahakkuk)
+        tahsilat_orani = min(float(aidat.odenen) / tahakkuk * 100.0, 100.0) if tahakkuk else 0.0
+
+        snapshot = DashboardSnapshot(
+            olusturma=simdi,
+            yil=simdi.year,
+            ay=simdi.month,
+            toplam_bakiye=toplam_bakiye,
+            bu_ay_geliri=bu_ay_toplamlari.get("Gelir", 0.0),
+            bu_ay_gideri=bu_ay_toplamlari.get("Gider", 0.0),
+            dolu_daire_sayisi=int(dolu_daire),
+            aidat_tahsilat_orani=tahsilat_orani,
+            trend_aylar=tuple(TR_AY_KISALTMALARI[a - 1] for _, a in donemler),
+            trend_gelirler=gelirler,
+            trend_giderler=giderler,
+            hesap_adlari=tuple(ad for ad, _ in pozitif),
+            hesap_bakiyeleri=tuple(bakiye for _, bakiye in pozitif),
+            aidat_odenen=float(aidat.bu_ay_odenen),
+            aidat_odenmeyen=float(aidat.bu_ay_tahakkuk) - float(aidat.bu_ay_odenen),
+            gecerlilik_sonu=gecerlilik_sonu,
+        )
+        self.logger.debug(f"Dashboard snapshot computed for {simdi.year}-{simdi.month:02d}")
+        return snapshot
+
+
+def _izlenen_degisti(session: Session) -> bool:
+    """Session'da bekleyen değişiklikler arasında dashboard'u etkileyen kayıt var mı?"""
+    return any(
+        isinstance(obj, IZLENEN_MODELLER)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    """İzlenen bir kayıt yazıldıysa anlık görüntüyü geçersiz kıl ve commit'te tekrar kıl"""
+    if _izlenen_degisti(session):
+        session.info["dashboard_degisti"] = True
+        DashboardController.invalidate()
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_do_orm_execute(orm_execute_state: Any) -> None:
+    """Session üzerinden çalışan toplu INSERT/UPDATE/DELETE ifadelerini de yakala"""
+    if orm_execute_state.is_select:
+        return
+    tablo = getattr(orm_execute_state.statement, "table", None)
+    if getattr(tablo, "name", None) in IZLENEN_TABLOLAR:
+        orm_execute_state.session.info["dashboard_degisti"] = True
+        DashboardController.invalidate()
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Flush ile commit arasında eski veriyle hesaplanmış görüntüyü de at"""
+    if session.info.pop("dashboard_degisti", False):
+        DashboardController.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    """Geri alınan değişiklikler sonrası görüntüyü yenile"""
+    if session.info.pop("dashboard_degisti", False):
+        DashboardController.invalidate()
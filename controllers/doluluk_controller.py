@@ -0,0 +1,247 @@
+"""
+Doluluk controller - "X dairesinde D tarihinde kim oturuyordu?" sorgusu.
+
+Sakinler tablosu tek sorguda okunur ve her daire için tahsis tarihine göre
+sıralı aralık listeleri (tahsis_tarihi, cikis_tarihi) oluşturulur. Tarih
+sorgusu ``bisect`` ile O(log n) çalışır. İndeks süreç içinde paylaşılır ve
+sakinler tablosuna yazan her flush/commit sonrasında geçersiz kılınır
+(SakinController yazmaları dahil).
+
+Eşleşme kuralı ``AidatPanel.get_sakin_at_date`` ile aynıdır:
+    1. ``daire_id`` eşleşen ve tarihi kapsayan aralıklardan en son tahsis edilen
+    2. Yoksa ``eski_daire_id`` eşleşen aralıklardan en son tahsis edilen
+"""
+
+import threading
+from bisect import bisect_right
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+import database.config as db_config
+from models.base import Sakin
+from utils.logger import get_logger
+
+# (tahsis_tarihi, cikis_tarihi, sakin adı)
+Aralik = Tuple[datetime, Optional[datetime], str]
+
+# Toplu çözümleme anahtarı: (daire_id, yil, ay)
+DaireDonem = Tuple[int, int, int]
+
+
+class DolulukIndex:
+    """Daire başına sıralı doluluk aralıkları.
+
+    Attributes:
+        sakin_sayisi (int): İndekse alınan sakin kaydı sayısı
+    """
+
+    def __init__(self, rows: Iterable[Tuple[Any, ...]]) -> None:
+        """
+        İndeksi oluştur.
+
+        Args:
+            rows: (ad_soyad, daire_id, eski_daire_id, tahsis_tarihi, cikis_tarihi) satırları
+        """
+        guncel: Dict[int, List[Aralik]] = {}
+        eski: Dict[int, List[Aralik]] = {}
+        self.sakin_sayisi = 0
+
+        for ad_soyad, daire_id, eski_daire_id, tahsis_tarihi, cikis_tarihi in rows:
+            self.sakin_sayisi += 1
+            # Tahsis tarihi olmayan kayıt hiçbir tarihi kapsamaz
+            if tahsis_tarihi is None:
+                continue
+            aralik = (tahsis_tarihi, cikis_tarihi, ad_soyad if ad_soyad else "İsimsiz")
+            if daire_id is not None:
+                guncel.setdefault(daire_id, []).append(aralik)
+            if eski_daire_id is not None:
+                eski.setdefault(eski_daire_id, []).append(aralik)
+
+        self._guncel = self._sirala(guncel)
+        self._eski = self._sirala(eski)
+
+    @staticmethod
+    def _sirala(araliklar: Dict[int, List[Aralik]]) -> Dict[int, Tuple[List[datetime], List[Aralik]]]:
+        """Her dairenin aralıklarını tahsis tarihine göre sırala"""
+        sonuc = {}
+        for daire_id, liste in araliklar.items():
+            liste.sort(key=lambda a: a[0])
+            sonuc[daire_id] = ([a[0] for a in liste], liste)
+        return sonuc
+
+    @staticmethod
+    def _bul(kayit: Optional[Tuple[List[datetime], List[Aralik]]], tarih: datetime) -> Optional[str]:
+        """Tarihi kapsayan en son tahsisli aralığın sakinini döndür"""
+        if kayit is None:
+            return None
+        baslangiclar, araliklar = kayit
+        # tahsis_tarihi <= tarih olan son aralıktan geriye doğru bak.
+        # Aralıklar çakışmadığı için (SakinController doğrular) genelde ilk aday eşleşir.
+        for i in range(bisect_right(baslangiclar, tarih) - 1, -1, -1):
+            _, cikis_tarihi, ad = araliklar[i]
+            if cikis_tarihi is None or cikis_tarihi >= tarih:
+                return ad
+        return None
+
+    def sakin_at(self, daire_id: int, tarih: datetime) -> Optional[str]:
+        """
+        Verilen tarihte dairede oturan sakinin adını döndür.
+
+        Args:
+            daire_id (int): Daire ID'si
+            tarih (datetime): Sorgu tarihi
+
+        Returns:
+            Optional[str]: Sakin adı ya da None
+        """
+        ad = self._bul(self._guncel.get(daire_id), tarih)
+        if ad is None:
+            ad = self._bul(self._eski.get(daire_id), tarih)
+        return ad
+
+    def resolve_many(self, anahtarlar: Iterable[DaireDonem]) -> Dict[DaireDonem, Optional[str]]:
+        """
+        (daire_id, yil, ay) listesini toplu çözümle (ayın ilk günü esas alınır).
+
+        Args:
+            anahtarlar: (daire_id, yil, ay) demetleri
+
+        Returns:
+            Dict[DaireDonem, Optional[str]]: Anahtar → sakin adı
+        """
+        sonuc: Dict[DaireDonem, Optional[str]] = {}
+        for anahtar in anahtarlar:
+            if anahtar not in sonuc:
+                daire_id, yil, ay = anahtar
+                sonuc[anahtar] = self.sakin_at(daire_id, datetime(yil, ay, 1))
+        return sonuc
+
+
+class DolulukController:
+    """
+    Paylaşılan doluluk indeksini yöneten controller.
+
+    Example:
+        >>> controller = DolulukController()
+        >>> controller.sakin_at_date(5, 2024, 11)
+        'Ali Yıldız'
+        >>> controller.resolve_many([(5, 2024, 11), (6, 2024, 11)])
+    """
+
+    _index: Optional[DolulukIndex] = None
+    # Her geçersiz kılmada artar; oluşturma sürerken gelen yazmalar eski indeksin saklanmasını engeller
+    _surum = 0
+    _lock = threading.Lock()
+
+    def __init__(self) -> None:
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    def get_index(self, db: Optional[Session] = None) -> DolulukIndex:
+        """
+        Doluluk indeksini döndür; yoksa tek sorguda oluştur.
+
+        Args:
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            DolulukIndex: Güncel indeks
+        """
+        index = DolulukController._index
+        if index is not None:
+            return index
+
+        with DolulukController._lock:
+            if DolulukController._index is not None:
+                return DolulukController._index
+            surum = DolulukController._surum
+
+        session = db or db_config.get_db()
+        close_db = db is None
+        try:
+            rows = session.query(
+                Sakin.ad_soyad, Sakin.daire_id, Sakin.eski_daire_id,
+                Sakin.tahsis_tarihi, Sakin.cikis_tarihi
+            ).filter(
+                (Sakin.daire_id != None) | (Sakin.eski_daire_id != None)
+            ).all()
+            index = DolulukIndex(rows)
+        finally:
+            if close_db:
+                session.close()
+
+        with DolulukController._lock:
+            # Oluşturma sırasında sakin yazıldıysa indeks eski satırlardan kurulmuştur;
+            # bu çağrıda kullanılır ama saklanmaz
+            if DolulukController._surum == surum:
+                DolulukController._index = index
+        self.logger.debug(f"Occupancy index built from {index.sakin_sayisi} residents")
+        return index
+
+    def sakin_at_date(self, daire_id: int, yil: int, ay: int, db: Optional[Session] = None) -> Optional[str]:
+        """
+        Verilen ayın ilk gününde dairede oturan sakinin adını döndür.
+
+        Args:
+            daire_id (int): Daire ID'si
+            yil (int): Yıl
+            ay (int): Ay (1-12)
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            Optional[str]: Sakin adı ya da None
+        """
+        return self.get_index(db).sakin_at(daire_id, datetime(yil, ay, 1))
+
+    def resolve_many(self, anahtarlar: Iterable[DaireDonem],
+                     db: Optional[Session] = None) -> Dict[DaireDonem, Optional[str]]:
+        """
+        (daire_id, yil, ay) listesini tek indeksle toplu çözümle.
+
+        Args:
+            anahtarlar: (daire_id, yil, ay) demetleri
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            Dict[DaireDonem, Optional[str]]: Anahtar → sakin adı
+        """
+        return self.get_index(db).resolve_many(anahtarlar)
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Paylaşılan indeksi geçersiz kıl (sonraki sorguda yeniden oluşturulur)"""
+        with cls._lock:
+            cls._index = None
+            cls._surum += 1
+
+
+def _sakin_degisti(session: Session) -> bool:
+    """Session'da bekleyen değişiklikler arasında Sakin var mı?"""
+    return any(
+        isinstance(obj, Sakin)
+        for obj in (*session.new, *session.dirty, *session.deleted)
+    )
+
+
+@event.listens_for(Session, "after_flush")
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    """Sakin yazıldıysa indeksi geçersiz kıl ve commit'te tekrar kıl"""
+    if _sakin_degisti(session):
+        session.info["doluluk_degisti"] = True
+        DolulukController.invalidate()
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Flush ile commit arasında eski veriyle oluşturulmuş indeksi de at"""
+    if session.info.pop("doluluk_degisti", False):
+        DolulukController.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    """Geri alınan değişiklikler sonrası indeksi yenile"""
+    if session.info.pop("doluluk_degisti", False):
+        DolulukController.invalidate()
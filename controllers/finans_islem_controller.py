@@ -5,20 +5,43 @@ Bu modül, gelir, gider ve transfer işlemlerini gerçekleştirir
 ve hesap bakiyelerini yönetir.
 """
 
-from typing import List, Optional, cast
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union, cast
+from sqlalchemy import Integer, and_, cast as sql_cast, column, func, or_, text
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from controllers.base_controller import BaseController
-from models.base import FinansIslem, AltKategori, Hesap
+from models.base import FinansIslem, AltKategori, AnaKategori, Hesap
 from models.validation import Validator
 from models.exceptions import ValidationError, NotFoundError, DatabaseError
 from database.config import get_db_session, get_db
+from database.fts import fts_hazir, fts_sorgusu
 from datetime import datetime
 from controllers.hesap_controller import HesapController
+from controllers.finans_ozet_controller import FinansOzetController
+from utils.pagination import KeysetPage
 
 # Logger import
 from utils.logger import get_logger
 
+# aggregate() için geçerli gruplama anahtarları
+AGGREGATE_GROUPS = ("month", "year", "tur", "hesap", "ana_kategori", "alt_kategori")
+
+# search() için geçerli filtre anahtarları
+SEARCH_FILTERS = ("tur", "hesap_id", "kategori_id", "ana_kategori_id", "tarih_araligi", "aciklama", "belgeli")
+
+# search() sıralamaları: ad -> (kolon, azalan mı)
+SEARCH_SORTS = {
+    "id_desc": ("id", True),
+    "id_asc": ("id", False),
+    "tarih_desc": ("tarih", True),
+    "tarih_asc": ("tarih", False),
+    "tutar_desc": ("tutar_kurus", True),
+    "tutar_asc": ("tutar_kurus", False),
+}
+
+# search() için en büyük sayfa boyutu
+SEARCH_MAX_LIMIT = 1000
+
 class FinansIslemController(BaseController[FinansIslem]):
     """
     Finans işlemleri için controller.
@@ -34,6 +57,7 @@ class FinansIslemController(BaseController[FinansIslem]):
     def __init__(self) -> None:
         super().__init__(FinansIslem)
         self.logger = get_logger(f"{self.__class__.__name__}")
+        self.ozet_controller = FinansOzetController()
 
     def create(self, data: dict, db: Session = None) -> FinansIslem:
         """
@@ -200,6 +224,11 @@ class FinansIslemController(BaseController[FinansIslem]):
                     
                     self.logger.debug(f"{islem_tur} atomic update: {hesap_id} ({'+' if islem_tur == 'Gelir' else '-'}{tutar})")
                 
+                # Aylık özet tablosunu güncelle (aynı transaction'ın içinde)
+                self.ozet_controller.apply_islem(
+                    session, FinansOzetController.islem_anahtari(islem), islem.tutar_kurus
+                )
+                
                 # Tüm değişiklikleri commit et (ATOMIC)
                 session.commit()
                 session.refresh(islem)
@@ -331,6 +360,38 @@ class FinansIslemController(BaseController[FinansIslem]):
             if close_db:
                 session.close()
 
+    def get_with_details(self, id: int, db: Session = None) -> Optional[FinansIslem]:
+        """
+        İşlemi hesap, hedef hesap ve kategori ilişkileriyle birlikte getir.
+
+        Args:
+            id (int): İşlem ID'si
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            FinansIslem | None: İşlem (session kapandıktan sonra da ilişkileri okunabilir)
+        """
+        self.logger.debug(f"Fetching transaction {id} with details")
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            return session.query(FinansIslem).options(
+                joinedload(FinansIslem.hesap),
+                joinedload(FinansIslem.hedef_hesap),
+                joinedload(FinansIslem.kategori).joinedload(AltKategori.ana_kategori)
+            ).filter(FinansIslem.id == id).first()
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to fetch transaction {id}: {str(e)}")
+            raise DatabaseError(
+                f"İşlem getirilemedi: {str(e)}",
+                code="DB_001",
+                details={"id": id}
+            )
+        finally:
+            if close_db:
+                session.close()
+
     def get_by_hesap(self, hesap_id: int, db: Session = None) -> List[FinansIslem]:
         """
         Hesaba göre işlemleri getir.
@@ -426,6 +487,358 @@ class FinansIslemController(BaseController[FinansIslem]):
             if close_db:
                 session.close()
 
+    def _search_query(self, session: Session, filters: Optional[Dict[str, Any]]) -> Any:
+        """
+        Filtre sözlüğünü ``FinansIslem`` sorgusuna çevir (sıralama/sayfalama yok).
+
+        Args:
+            session (Session): Veritabanı session
+            filters (Dict[str, Any], optional): ``search`` filtreleri
+
+        Returns:
+            Query: Filtrelenmiş sorgu
+
+        Raises:
+            ValidationError: Bilinmeyen filtre anahtarı veya geçersiz değer
+        """
+        filters = dict(filters or {})
+        for key in filters:
+            Validator.validate_choice(key, "Filtre", list(SEARCH_FILTERS))
+
+        query = session.query(FinansIslem).filter(FinansIslem.aktif == True)
+
+        tur = filters.get("tur")
+        if tur:
+            turler = [tur] if isinstance(tur, str) else list(tur)
+            for t in turler:
+                Validator.validate_choice(t, "İşlem Türü", ["Gelir", "Gider", "Transfer"])
+            query = query.filter(FinansIslem.tur.in_(turler))
+
+        hesap_id = filters.get("hesap_id")
+        if hesap_id is not None:
+            hesap_idleri = [hesap_id] if isinstance(hesap_id, int) else list(hesap_id)
+            query = query.filter(FinansIslem.hesap_id.in_(hesap_idleri))
+
+        if filters.get("kategori_id") is not None:
+            query = query.filter(FinansIslem.kategori_id == filters["kategori_id"])
+
+        if filters.get("ana_kategori_id") is not None:
+            alt_kategoriler = session.query(AltKategori.id).filter(
+                AltKategori.parent_id == filters["ana_kategori_id"]
+            )
+            query = query.filter(FinansIslem.kategori_id.in_(alt_kategoriler.subquery()))
+
+        tarih_araligi = filters.get("tarih_araligi")
+        if tarih_araligi is not None:
+            baslangic, bitis = tarih_araligi
+            if baslangic is not None:
+                query = query.filter(FinansIslem.tarih >= baslangic)
+            if bitis is not None:
+                query = query.filter(FinansIslem.tarih < bitis)
+
+        aciklama = (filters.get("aciklama") or "").strip()
+        fts_ifadesi = fts_sorgusu(aciklama)
+        if fts_ifadesi is not None and fts_hazir(session, "finans_islem_fts"):
+            # FTS5 indeksi: kelime önekleri Türkçe katlama ile eşleşir
+            eslesenler = text(
+                "SELECT rowid FROM finans_islem_fts WHERE finans_islem_fts MATCH :sorgu"
+            ).bindparams(sorgu=fts_ifadesi).columns(column("rowid", Integer))
+            query = query.filter(FinansIslem.id.in_(eslesenler))
+        elif aciklama:
+            # İndeks yoksa LIKE; joker karakterler metin olarak aranır. SQLite
+            # LIKE zaten (ASCII) büyük/küçük harf duyarsızdır; ilike'ın lower()
+            # sarmalı her satırda ek fonksiyon çağrısı demektir.
+            desen = aciklama.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            query = query.filter(FinansIslem.aciklama.like(f"%{desen}%", escape="\\"))
+
+        belgeli = filters.get("belgeli")
+        if belgeli is True:
+            query = query.filter(FinansIslem.belge_yolu != None, FinansIslem.belge_yolu != "")
+        elif belgeli is False:
+            query = query.filter((FinansIslem.belge_yolu == None) | (FinansIslem.belge_yolu == ""))
+
+        return query
+
+    def search(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        sort: str = "id_desc",
+        limit: int = 200,
+        offset: int = 0,
+        after: Optional[Tuple[Any, ...]] = None,
+        db: Session = None
+    ) -> KeysetPage:
+        """
+        Filtrelenmiş işlemlerin tek sayfasını getir (keyset pagination).
+
+        Filtreler tek bir SQL sorgusuna çevrilir; sıralama her zaman ``id`` ile
+        tamamlandığı için ``after`` imleci satırları atlamadan veya tekrarlamadan
+        sonraki sayfaya geçer. ``tarih`` ve ``id`` sıralamaları mevcut
+        indeksleri (``ix_finans_islemleri_tarih`` / birincil anahtar) kullanır;
+        sayfa derinliği sorgu süresini etkilemez. ``offset`` yalnızca imleç
+        bilinmeyen rastgele atlamalar içindir.
+
+        Args:
+            filters (Dict[str, Any], optional): Filtreler
+                - tur (str | Sequence[str]): "Gelir", "Gider", "Transfer"
+                - hesap_id (int | Sequence[int]): Kaynak hesap ID'si
+                - kategori_id (int): Alt kategori ID'si
+                - ana_kategori_id (int): Ana kategori ID'si
+                - tarih_araligi (Tuple[datetime, datetime]): (başlangıç, bitiş);
+                  başlangıç dahil, bitiş hariç, uçlardan biri None olabilir
+                - aciklama (str): Açıklama araması; kelime önekleri FTS5 indeksiyle,
+                  Türkçe büyük/küçük harf ve aksan duyarsız eşleşir
+                - belgeli (bool): Yalnızca belgeli (True) / belgesiz (False) işlemler
+            sort (str): Sıralama ("id_desc", "id_asc", "tarih_desc", "tarih_asc",
+                "tutar_desc", "tutar_asc")
+            limit (int): Sayfa boyutu (1-1000)
+            offset (int): Atlanacak satır sayısı (imleçten sonra uygulanır)
+            after (Tuple, optional): Önceki sayfanın ``next_cursor`` değeri
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            KeysetPage: Sayfa işlemleri (hesap, hedef hesap ve kategori yüklü),
+            sonraki sayfa imleci ve devam olup olmadığı
+
+        Raises:
+            ValidationError: Geçersiz filtre, sıralama, limit veya imleç
+            DatabaseError: Veritabanı hatası
+
+        Example:
+            >>> sayfa = controller.search({"tur": "Gider", "belgeli": True}, sort="tarih_desc", limit=100)
+            >>> sonraki = controller.search({"tur": "Gider", "belgeli": True}, sort="tarih_desc",
+            ...                             limit=100, after=sayfa.next_cursor)
+        """
+        Validator.validate_choice(sort, "Sıralama", list(SEARCH_SORTS))
+        if not isinstance(limit, int) or not 1 <= limit <= SEARCH_MAX_LIMIT:
+            raise ValidationError(
+                f"Sayfa boyutu 1 ile {SEARCH_MAX_LIMIT} arasında olmalıdır",
+                code="VAL_SRC_001",
+                details={"limit": limit}
+            )
+        if not isinstance(offset, int) or offset < 0:
+            raise ValidationError(
+                "Offset negatif olamaz",
+                code="VAL_SRC_001",
+                details={"offset": offset}
+            )
+
+        kolon_adi, azalan = SEARCH_SORTS[sort]
+        kolon = getattr(FinansIslem, kolon_adi)
+        if after is not None and len(after) != (1 if kolon_adi == "id" else 2):
+            raise ValidationError(
+                "Geçersiz sayfa imleci",
+                code="VAL_SRC_002",
+                details={"after": after, "sort": sort}
+            )
+
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            query = self._search_query(session, filters).options(
+                joinedload(FinansIslem.hesap),
+                joinedload(FinansIslem.hedef_hesap),
+                joinedload(FinansIslem.kategori).joinedload(AltKategori.ana_kategori)
+            )
+
+            if after is not None:
+                if kolon_adi == "id":
+                    son_id = after[0]
+                    query = query.filter(FinansIslem.id < son_id if azalan else FinansIslem.id > son_id)
+                else:
+                    son_deger, son_id = after
+                    if azalan:
+                        query = query.filter(or_(kolon < son_deger, and_(kolon == son_deger, FinansIslem.id < son_id)))
+                    else:
+                        query = query.filter(or_(kolon > son_deger, and_(kolon == son_deger, FinansIslem.id > son_id)))
+
+            siralama = [kolon.desc() if azalan else kolon.asc()]
+            if kolon_adi != "id":
+                siralama.append(FinansIslem.id.desc() if azalan else FinansIslem.id.asc())
+
+            # Bir fazla satır okunur: devam olup olmadığı ek COUNT sorgusu olmadan bilinir
+            satirlar = query.order_by(*siralama).offset(offset).limit(limit + 1).all()
+            has_next = len(satirlar) > limit
+            items = cast(List[FinansIslem], satirlar[:limit])
+
+            next_cursor: Optional[Tuple[Any, ...]] = None
+            if has_next and items:
+                son = items[-1]
+                next_cursor = (son.id,) if kolon_adi == "id" else (getattr(son, kolon_adi), son.id)
+
+            self.logger.debug(f"Search returned {len(items)} transactions (sort={sort}, has_next={has_next})")
+            return KeysetPage(items=items, next_cursor=next_cursor, has_next=has_next)
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to search transactions: {str(e)}")
+            raise DatabaseError(
+                f"İşlemler aranamadı: {str(e)}",
+                code="DB_SRC_001",
+                details={"filters": filters, "sort": sort}
+            )
+        finally:
+            if close_db:
+                session.close()
+
+    def count(self, filters: Optional[Dict[str, Any]] = None, db: Session = None) -> int:
+        """
+        ``search`` filtrelerine uyan işlem sayısını döndür.
+
+        Args:
+            filters (Dict[str, Any], optional): ``search`` ile aynı filtreler
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            int: Eşleşen aktif işlem sayısı
+
+        Raises:
+            ValidationError: Geçersiz filtre
+            DatabaseError: Veritabanı hatası
+        """
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            query = self._search_query(session, filters).with_entities(func.count(FinansIslem.id))
+            return int(query.scalar() or 0)
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to count transactions: {str(e)}")
+            raise DatabaseError(
+                f"İşlemler sayılamadı: {str(e)}",
+                code="DB_SRC_001",
+                details={"filters": filters}
+            )
+        finally:
+            if close_db:
+                session.close()
+
+    def aggregate(
+        self,
+        group_by: Optional[Sequence[str]] = None,
+        tur: Optional[Union[str, Sequence[str]]] = None,
+        date_range: Optional[Tuple[Optional[datetime], Optional[datetime]]] = None,
+        bitis_dahil: bool = False,
+        db: Session = None
+    ) -> List[Dict[str, Any]]:
+        """
+        İşlem tutarlarını veritabanında grupla ve topla.
+
+        ``SUM(tutar_kurus)`` ve ``COUNT(*)`` SQLite'ta hesaplanır; tarih ve tür
+        filtreleri ``idx_finans_islem_tarih_tur`` indeksini kullanır. Dönen satır
+        sayısı işlem sayısına değil grup (bucket) sayısına bağlıdır.
+
+        Args:
+            group_by (Sequence[str], optional): Gruplama anahtarları
+                ("month", "year", "tur", "hesap", "ana_kategori", "alt_kategori").
+                None/boş ise tek bir toplam satırı döner.
+            tur (str | Sequence[str], optional): İşlem türü filtresi ("Gelir", "Gider", "Transfer")
+            date_range (Tuple[datetime, datetime], optional): (başlangıç, bitiş) aralığı.
+                Başlangıç dahil, bitiş hariçtir; uçlardan biri None olabilir.
+            bitis_dahil (bool): True ise bitiş anı da dahil edilir
+                (ör. "ayın başından şu ana kadar" toplamları)
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            List[Dict[str, Any]]: Her grup için bir satır. Gruplama anahtarlarına göre
+            "yil", "ay", "tur", "hesap_id", "hesap_adi", "ana_kategori_id",
+            "ana_kategori", "alt_kategori_id", "alt_kategori" alanları ile
+            "toplam_kurus", "toplam" (float) ve "adet" alanlarını içerir.
+
+        Raises:
+            ValidationError: Geçersiz gruplama anahtarı veya işlem türü
+            DatabaseError: Veritabanı hatası
+
+        Example:
+            >>> controller.aggregate(["month"], tur="Gelir",
+            ...                      date_range=(datetime(2024, 1, 1), datetime(2025, 1, 1)))
+            [{'yil': 2024, 'ay': 1, 'toplam_kurus': 1250000, 'toplam': 12500.0, 'adet': 42}, ...]
+        """
+        group_keys = list(group_by or [])
+        for key in group_keys:
+            Validator.validate_choice(key, "Gruplama", list(AGGREGATE_GROUPS))
+
+        turler: List[str] = []
+        if tur is not None:
+            turler = [tur] if isinstance(tur, str) else list(tur)
+            for t in turler:
+                Validator.validate_choice(t, "İşlem Türü", ["Gelir", "Gider", "Transfer"])
+
+        # (etiket, SQL ifadesi) çiftleri - seçim ve gruplama sırası aynıdır
+        columns: List[Tuple[str, Any]] = []
+        for key in group_keys:
+            if key == "year":
+                columns.append(("yil", sql_cast(func.strftime("%Y", FinansIslem.tarih), Integer)))
+            elif key == "month":
+                if "year" not in group_keys:
+                    columns.append(("yil", sql_cast(func.strftime("%Y", FinansIslem.tarih), Integer)))
+                columns.append(("ay", sql_cast(func.strftime("%m", FinansIslem.tarih), Integer)))
+            elif key == "tur":
+                columns.append(("tur", FinansIslem.tur))
+            elif key == "hesap":
+                columns.append(("hesap_id", FinansIslem.hesap_id))
+                columns.append(("hesap_adi", Hesap.ad))
+            elif key == "ana_kategori":
+                columns.append(("ana_kategori_id", AnaKategori.id))
+                columns.append(("ana_kategori", AnaKategori.name))
+            elif key == "alt_kategori":
+                columns.append(("alt_kategori_id", FinansIslem.kategori_id))
+                columns.append(("alt_kategori", AltKategori.name))
+
+        self.logger.debug(f"Aggregating transactions by {group_keys} (tur={turler}, range={date_range})")
+        session = db or get_db()
+        close_db = db is None
+
+        try:
+            query = session.query(
+                *[expr.label(label) for label, expr in columns],
+                func.coalesce(func.sum(FinansIslem.tutar_kurus), 0).label("toplam_kurus"),
+                func.count(FinansIslem.id).label("adet")
+            ).select_from(FinansIslem)
+
+            if "hesap" in group_keys:
+                query = query.outerjoin(Hesap, FinansIslem.hesap_id == Hesap.id)
+            if "ana_kategori" in group_keys or "alt_kategori" in group_keys:
+                query = query.outerjoin(AltKategori, FinansIslem.kategori_id == AltKategori.id)
+            if "ana_kategori" in group_keys:
+                query = query.outerjoin(AnaKategori, AltKategori.parent_id == AnaKategori.id)
+
+            query = query.filter(FinansIslem.aktif == True)
+            if turler:
+                query = query.filter(FinansIslem.tur.in_(turler))
+            if date_range is not None:
+                baslangic, bitis = date_range
+                if baslangic is not None:
+                    query = query.filter(FinansIslem.tarih >= baslangic)
+                if bitis is not None:
+                    query = query.filter(
+                        FinansIslem.tarih <= bitis if bitis_dahil else FinansIslem.tarih < bitis
+                    )
+
+            if columns:
+                exprs = [expr for _, expr in columns]
+                query = query.group_by(*exprs).order_by(*exprs)
+
+            result = []
+            for row in query.all():
+                item = {label: getattr(row, label) for label, _ in columns}
+                item["toplam_kurus"] = int(row.toplam_kurus or 0)
+                item["toplam"] = float(item["toplam_kurus"] / 100.0)
+                item["adet"] = int(row.adet or 0)
+                result.append(item)
+
+            self.logger.debug(f"Aggregated transactions into {len(result)} rows")
+            return result
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to aggregate transactions: {str(e)}")
+            raise DatabaseError(
+                f"İşlem toplamları hesaplanamadı: {str(e)}",
+                code="DB_AGG_001",
+                details={"group_by": group_keys, "tur": turler}
+            )
+        finally:
+            if close_db:
+                session.close()
+
     def update_with_balance_adjustment(self, id: int, data: dict, db: Session = None) -> Optional[FinansIslem]:
         """
         Kayıt güncelle ve hesap bakiyelerini uygun şekilde ayarla (ATOMIC).
@@ -618,10 +1031,18 @@ class FinansIslemController(BaseController[FinansIslem]):
                     self.logger.debug(f"Apply new expense: {new_hesap_id} (-{new_tutar})")
                 
                 # İşlem kaydını güncelle
+                old_anahtar = FinansOzetController.islem_anahtari(existing_islem)
+                old_tutar_kurus = existing_islem.tutar_kurus
                 for key, value in data.items():
                     if hasattr(existing_islem, key):
                         setattr(existing_islem, key, value)
                 
+                # Aylık özet tablosunda eski katkıyı çıkar, yenisini ekle
+                self.ozet_controller.apply_islem(session, old_anahtar, old_tutar_kurus, carpan=-1)
+                self.ozet_controller.apply_islem(
+                    session, FinansOzetController.islem_anahtari(existing_islem), existing_islem.tutar_kurus
+                )
+                
                 # Tüm değişiklikleri commit et (ATOMIC)
                 session.commit()
                 session.refresh(existing_islem)
@@ -746,6 +1167,11 @@ class FinansIslemController(BaseController[FinansIslem]):
                     
                     self.logger.debug(f"Expense reversal: {hesap_id} (+{tutar})")
                 
+                # Aylık özet tablosundan işlemin katkısını çıkar
+                self.ozet_controller.apply_islem(
+                    session, FinansOzetController.islem_anahtari(islem), islem.tutar_kurus, carpan=-1
+                )
+                
                 # İşlemi sil
                 session.delete(islem)
                 
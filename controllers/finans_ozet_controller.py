@@ -0,0 +1,340 @@
+"""
+Finans aylık özet controller - finans_aylik_ozet rollup tablosu.
+
+Rollup tablosu her (yıl, ay, hesap_id, kategori_id, tür) için toplam tutarı
+ve işlem adedini tutar. FinansIslemController yazma işlemlerinde
+``apply_islem`` ile tabloyu aynı transaction içinde günceller. Raporlardaki
+dönem öncesi bakiyeler ve yıllık trendler işlem sayısına değil ay sayısına
+bağlı sorgularla hesaplanır.
+
+Mevcut veritabanları için ``rebuild`` ve ``verify`` metodları (ve
+``scripts/rebuild_finans_ozet.py`` komutu) kullanılır.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+from sqlalchemy import Integer, cast as sql_cast, func, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from controllers.base_controller import BaseController
+from models.base import FinansAylikOzet, FinansIslem, AltKategori, AnaKategori, Hesap
+from models.validation import Validator
+from models.exceptions import DatabaseError
+import database.config as db_config
+
+# Logger import
+from utils.logger import get_logger
+
+# Rollup anahtarı: (yil, ay, hesap_id, kategori_id, tur)
+OzetAnahtari = Tuple[int, int, Optional[int], Optional[int], str]
+
+# get_toplamlar() için geçerli gruplama anahtarları
+OZET_GROUPS = ("month", "year", "tur", "hesap", "ana_kategori", "alt_kategori")
+
+
+class FinansOzetController(BaseController[FinansAylikOzet]):
+    """
+    finans_aylik_ozet rollup tablosu için controller.
+
+    Example:
+        >>> controller = FinansOzetController()
+        >>> controller.get_toplamlar(["month"], tur="Gelir", baslangic=(2024, 1), bitis=(2025, 1))
+    """
+
+    def __init__(self) -> None:
+        super().__init__(FinansAylikOzet)
+        self.logger = get_logger(f"{self.__class__.__name__}")
+
+    @staticmethod
+    def islem_anahtari(islem: FinansIslem) -> Optional[OzetAnahtari]:
+        """
+        İşlemin rollup anahtarını döndür.
+
+        Args:
+            islem (FinansIslem): Finans işlemi
+
+        Returns:
+            OzetAnahtari | None: Rollup anahtarı; pasif veya tarihsiz işlemler için None
+        """
+        if not islem.aktif or islem.tarih is None:
+            return None
+        return (islem.tarih.year, islem.tarih.month, islem.hesap_id, islem.kategori_id, islem.tur)
+
+    def apply_islem(self, session: Session, anahtar: Optional[OzetAnahtari],
+                    tutar_kurus: int, carpan: int = 1) -> None:
+        """
+        Bir işlemin katkısını rollup tablosuna ekle (carpan=1) veya çıkar (carpan=-1).
+
+        Commit yapmaz; çağıran controller'ın transaction'ı içinde çalışır.
+
+        Args:
+            session (Session): Aktif veritabanı session
+            anahtar (OzetAnahtari | None): ``islem_anahtari`` sonucu (None ise işlem yapılmaz)
+            tutar_kurus (int): İşlem tutarı (kuruş)
+            carpan (int): 1 (ekle) veya -1 (çıkar)
+        """
+        if anahtar is None:
+            return
+
+        yil, ay, hesap_id, kategori_id, tur = anahtar
+        satir: Optional[FinansAylikOzet] = session.query(FinansAylikOzet).filter(
+            FinansAylikOzet.yil == yil,
+            FinansAylikOzet.ay == ay,
+            FinansAylikOzet.hesap_id == hesap_id,
+            FinansAylikOzet.kategori_id == kategori_id,
+            FinansAylikOzet.tur == tur
+        ).first()
+
+        if satir is None:
+            satir = FinansAylikOzet(
+                yil=yil, ay=ay, hesap_id=hesap_id, kategori_id=kategori_id,
+                tur=tur, toplam_kurus=0, adet=0
+            )
+            session.add(satir)
+
+        satir.toplam_kurus = (satir.toplam_kurus or 0) + carpan * int(tutar_kurus or 0)
+        satir.adet = (satir.adet or 0) + carpan
+
+        # Boşalan kovayı sil; tablo yalnızca işlem içeren ayları tutar
+        if satir.adet <= 0:
+            if satir in session.new:
+                session.expunge(satir)
+            else:
+                session.delete(satir)
+        session.flush()
+
+    def rebuild(self, db: Session = None, commit: bool = True) -> int:
+        """
+        Rollup tablosunu finans_islemleri'nden yeniden oluştur.
+
+        Args:
+            db (Session, optional): Veritabanı session
+            commit (bool): False ise commit ve hata durumunda rollback çağıranın
+                transaction'ına bırakılır (ör. geri yükleme ile aynı commit)
+
+        Returns:
+            int: Oluşturulan özet satırı sayısı
+
+        Raises:
+            DatabaseError: Veritabanı hatası
+        """
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            yil = sql_cast(func.strftime("%Y", FinansIslem.tarih), Integer)
+            ay = sql_cast(func.strftime("%m", FinansIslem.tarih), Integer)
+            kaynak = select(
+                yil, ay, FinansIslem.hesap_id, FinansIslem.kategori_id, FinansIslem.tur,
+                func.sum(FinansIslem.tutar_kurus), func.count(FinansIslem.id)
+            ).where(
+                FinansIslem.aktif == True,
+                FinansIslem.tarih.isnot(None)
+            ).group_by(yil, ay, FinansIslem.hesap_id, FinansIslem.kategori_id, FinansIslem.tur)
+
+            session.query(FinansAylikOzet).delete(synchronize_session=False)
+            session.execute(
+                insert(FinansAylikOzet.__table__).from_select(
+                    ["yil", "ay", "hesap_id", "kategori_id", "tur", "toplam_kurus", "adet"],
+                    kaynak
+                )
+            )
+            if commit:
+                session.commit()
+
+            adet = session.query(func.count(FinansAylikOzet.id)).scalar() or 0
+            self.logger.info(f"Finance monthly summary rebuilt ({adet} rows)")
+            return int(adet)
+        except SQLAlchemyError as e:
+            if commit:
+                session.rollback()
+            self.logger.error(f"Failed to rebuild finance monthly summary: {str(e)}")
+            raise DatabaseError(
+                f"Aylık finans özeti yeniden oluşturulamadı: {str(e)}",
+                code="DB_OZT_001"
+            )
+        finally:
+            if close_db:
+                session.close()
+
+    def verify(self, db: Session = None) -> List[Dict[str, Any]]:
+        """
+        Rollup tablosunu finans_islemleri ile karşılaştır.
+
+        Args:
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            List[Dict[str, Any]]: Uyuşmayan anahtarlar. Her satır "anahtar",
+            "beklenen" ve "mevcut" ((toplam_kurus, adet) veya None) alanlarını içerir.
+            Boş liste tablonun tutarlı olduğunu gösterir.
+        """
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            yil = sql_cast(func.strftime("%Y", FinansIslem.tarih), Integer)
+            ay = sql_cast(func.strftime("%m", FinansIslem.tarih), Integer)
+            beklenen = {
+                (r[0], r[1], r[2], r[3], r[4]): (int(r[5] or 0), int(r[6]))
+                for r in session.query(
+                    yil, ay, FinansIslem.hesap_id, FinansIslem.kategori_id, FinansIslem.tur,
+                    func.sum(FinansIslem.tutar_kurus), func.count(FinansIslem.id)
+                ).filter(
+                    FinansIslem.aktif == True,
+                    FinansIslem.tarih.isnot(None)
+                ).group_by(yil, ay, FinansIslem.hesap_id, FinansIslem.kategori_id, FinansIslem.tur)
+            }
+            mevcut = {
+                (r.yil, r.ay, r.hesap_id, r.kategori_id, r.tur): (int(r.toplam_kurus or 0), int(r.adet or 0))
+                for r in session.query(FinansAylikOzet)
+            }
+
+            farklar = [
+                {"anahtar": anahtar, "beklenen": beklenen.get(anahtar), "mevcut": mevcut.get(anahtar)}
+                for anahtar in sorted(set(beklenen) | set(mevcut), key=str)
+                if beklenen.get(anahtar) != mevcut.get(anahtar)
+            ]
+            if farklar:
+                self.logger.warning(f"Finance monthly summary has {len(farklar)} mismatched rows")
+            return farklar
+        finally:
+            if close_db:
+                session.close()
+
+    def ensure_built(self, db: Session = None) -> bool:
+        """
+        Rollup tablosu boşsa ama işlem varsa tabloyu oluştur.
+
+        Tablo eklenmeden önce oluşturulmuş veritabanlarının ilk açılışı içindir.
+
+        Args:
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            bool: Yeniden oluşturma yapıldıysa True
+        """
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            if session.query(FinansAylikOzet.id).first() is not None:
+                return False
+            if session.query(FinansIslem.id).first() is None:
+                return False
+            self.rebuild(db=session)
+            return True
+        finally:
+            if close_db:
+                session.close()
+
+    def get_toplamlar(
+        self,
+        group_by: Optional[Sequence[str]] = None,
+        tur: Optional[Union[str, Sequence[str]]] = None,
+        baslangic: Optional[Tuple[int, int]] = None,
+        bitis: Optional[Tuple[int, int]] = None,
+        db: Session = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Rollup tablosundan dönem toplamlarını getir.
+
+        Satır biçimi ``FinansIslemController.aggregate`` ile aynıdır; maliyet
+        işlem sayısına değil ay sayısına bağlıdır.
+
+        Args:
+            group_by (Sequence[str], optional): Gruplama anahtarları
+                ("month", "year", "tur", "hesap", "ana_kategori", "alt_kategori")
+            tur (str | Sequence[str], optional): İşlem türü filtresi
+            baslangic (Tuple[int, int], optional): (yıl, ay) başlangıç dönemi (dahil)
+            bitis (Tuple[int, int], optional): (yıl, ay) bitiş dönemi (hariç)
+            db (Session, optional): Veritabanı session
+
+        Returns:
+            List[Dict[str, Any]]: Gruplara göre "toplam_kurus", "toplam" ve "adet" içeren satırlar
+
+        Raises:
+            ValidationError: Geçersiz gruplama anahtarı veya işlem türü
+            DatabaseError: Veritabanı hatası
+
+        Example:
+            >>> # Mart 2024 öncesi tüm gelir/gider toplamları (açılış bakiyesi)
+            >>> controller.get_toplamlar(["tur"], tur=["Gelir", "Gider"], bitis=(2024, 3))
+        """
+        group_keys = list(group_by or [])
+        for key in group_keys:
+            Validator.validate_choice(key, "Gruplama", list(OZET_GROUPS))
+
+        turler: List[str] = []
+        if tur is not None:
+            turler = [tur] if isinstance(tur, str) else list(tur)
+            for t in turler:
+                Validator.validate_choice(t, "İşlem Türü", ["Gelir", "Gider", "Transfer"])
+
+        columns: List[Tuple[str, Any]] = []
+        for key in group_keys:
+            if key == "year":
+                columns.append(("yil", FinansAylikOzet.yil))
+            elif key == "month":
+                if "year" not in group_keys:
+                    columns.append(("yil", FinansAylikOzet.yil))
+                columns.append(("ay", FinansAylikOzet.ay))
+            elif key == "tur":
+                columns.append(("tur", FinansAylikOzet.tur))
+            elif key == "hesap":
+                columns.append(("hesap_id", FinansAylikOzet.hesap_id))
+                columns.append(("hesap_adi", Hesap.ad))
+            elif key == "ana_kategori":
+                columns.append(("ana_kategori_id", AnaKategori.id))
+                columns.append(("ana_kategori", AnaKategori.name))
+            elif key == "alt_kategori":
+                columns.append(("alt_kategori_id", FinansAylikOzet.kategori_id))
+                columns.append(("alt_kategori", AltKategori.name))
+
+        session = db or db_config.get_db()
+        close_db = db is None
+
+        try:
+            query = session.query(
+                *[expr.label(label) for label, expr in columns],
+                func.coalesce(func.sum(FinansAylikOzet.toplam_kurus), 0).label("toplam_kurus"),
+                func.coalesce(func.sum(FinansAylikOzet.adet), 0).label("adet")
+            ).select_from(FinansAylikOzet)
+
+            if "hesap" in group_keys:
+                query = query.outerjoin(Hesap, FinansAylikOzet.hesap_id == Hesap.id)
+            if "ana_kategori" in group_keys or "alt_kategori" in group_keys:
+                query = query.outerjoin(AltKategori, FinansAylikOzet.kategori_id == AltKategori.id)
+            if "ana_kategori" in group_keys:
+                query = query.outerjoin(AnaKategori, AltKategori.parent_id == AnaKategori.id)
+
+            if turler:
+                query = query.filter(FinansAylikOzet.tur.in_(turler))
+            # (yil, ay) karşılaştırması tek bir sayıya indirgenir: yil * 12 + ay
+            donem = FinansAylikOzet.yil * 12 + FinansAylikOzet.ay
+            if baslangic is not None:
+                query = query.filter(donem >= baslangic[0] * 12 + baslangic[1])
+            if bitis is not None:
+                query = query.filter(donem < bitis[0] * 12 + bitis[1])
+
+            if columns:
+                exprs = [expr for _, expr in columns]
+                query = query.group_by(*exprs).order_by(*exprs)
+
+            result = []
+            for row in query.all():
+                item = {label: getattr(row, label) for label, _ in columns}
+                item["toplam_kurus"] = int(row.toplam_kurus or 0)
+                item["toplam"] = float(item["toplam_kurus"] / 100.0)
+                item["adet"] = int(row.adet or 0)
+                result.append(item)
+            return result
+        except SQLAlchemyError as e:
+            self.logger.error(f"Failed to read finance monthly summary: {str(e)}")
+            raise DatabaseError(
+                f"Aylık finans özeti okunamadı: {str(e)}",
+                code="DB_OZT_002",
+                details={"group_by": group_keys, "tur": turler}
+            )
+        finally:
+            if close_db:
+                session.close()
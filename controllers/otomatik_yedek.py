@@ -0,0 +1,393 @@
+"""
+Zamanlanmış otomatik yedekleme
+
+``OtomatikYedekleyici`` arka planda tek bir daemon thread çalıştırır:
+
+* Hedef dizindeki en yeni otomatik yedek ``backup.interval_hours`` saatten
+  eskiyse (veya hiç yoksa) ``BackupController`` ile yeni yedek alınır.
+  Zamanlama dosya adlarındaki tarihten okunur; uygulama yeniden başlasa da
+  aralık korunur.
+* Thread düşük CPU/I/O önceliğiyle çalışır (bkz. ``_dusuk_oncelik``).
+* Arayüz ``etkinlik_bildir()`` ile tuş/tıklama etkinliğini bildirir. Son
+  etkinlikten bu yana ``backup.idle_seconds`` saniye geçmeden yedek
+  başlamaz; yedek sürerken etkinlik olursa ilerleme adımlarında beklenir.
+* Her yedekten sonra saklama politikası uygulanır: son N yedek, son N günün
+  ve son N ayın en yeni yedekleri tutulur, diğer otomatik yedekler silinir.
+  Elle alınan yedeklere (farklı dosya adı) dokunulmaz.
+
+Süre, boyut ve silinen dosya sayısı loglanır; son sonuç ``son_sonuc``
+özelliğinden okunabilir.
+
+Ayarlar ConfigurationManager'daki ``backup.*`` anahtarlarından okunur (bkz.
+``configuration.constants.ConfigKeys``).
+"""
+
+import os
+import re
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Iterable, List, Optional, Set, Tuple
+
+from configuration.config_manager import parse_bool_setting
+from configuration.constants import ConfigDefaults
+from controllers.backup_controller import BackupController
+from models.exceptions import ConfigError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Biçim -> dosya uzantısı
+YEDEK_BICIMLERI = {"sqlite": ".db.gz", "xml": ".xml", "excel": ".xlsx"}
+
+OTOMATIK_YEDEK_ONEKI = "aidat_plus_oto_"
+_ZAMAN_BICIMI = "%Y%m%d_%H%M%S"
+_DOSYA_ADI = re.compile(
+    rf"^{OTOMATIK_YEDEK_ONEKI}(\d{{8}}_\d{{6}})({'|'.join(re.escape(u) for u in YEDEK_BICIMLERI.values())})$"
+)
+
+# Zamanlayıcının yedek zamanını kontrol etme aralığı (saniye)
+KONTROL_ARALIGI = 60.0
+
+# Arayüz meşgulken beklemede yoklama aralığı (saniye)
+BEKLEME_ADIMI = 0.2
+
+# Windows: thread'i arka plan moduna al (düşük CPU, I/O ve bellek önceliği)
+_THREAD_MODE_BACKGROUND_BEGIN = 0x00010000
+
+
+@dataclass
+class OtomatikYedekAyarlari:
+    """Otomatik yedekleme ayarları (``backup.*``)"""
+    etkin: bool = ConfigDefaults.DEFAULT_BACKUP_AUTO_ENABLED
+    aralik_saat: float = ConfigDefaults.DEFAULT_BACKUP_INTERVAL_HOURS
+    bicim: str = ConfigDefaults.DEFAULT_BACKUP_FORMAT
+    dizin: str = ConfigDefaults.DEFAULT_BACKUP_DIRECTORY
+    son_n: int = ConfigDefaults.DEFAULT_BACKUP_KEEP_LAST
+    gunluk: int = ConfigDefaults.DEFAULT_BACKUP_KEEP_DAILY
+    aylik: int = ConfigDefaults.DEFAULT_BACKUP_KEEP_MONTHLY
+    bosta_suresi: float = ConfigDefaults.DEFAULT_BACKUP_IDLE_SECONDS
+
+
+@dataclass
+class YedekSonucu:
+    """Bir otomatik yedekleme çalışmasının ölçümleri"""
+    basarili: bool
+    dosya: Optional[Path]
+    bicim: str
+    sure: float
+    boyut: int = 0
+    silinen: int = 0
+
+
+def get_backup_settings(config: Optional[Any] = None) -> OtomatikYedekAyarlari:
+    """
+    Otomatik yedekleme ayarlarını konfigürasyondan oku ve doğrula.
+
+    Args:
+        config: ConfigurationManager instance'ı. None ise singleton kullanılır.
+
+    Returns:
+        OtomatikYedekAyarlari: Doğrulanmış ayarlar
+
+    Raises:
+        ConfigError: Ayarlardan biri geçersiz ise
+    """
+    if config is None:
+        from configuration.config_manager import ConfigurationManager
+        config = ConfigurationManager.get_instance()
+
+    varsayilan = OtomatikYedekAyarlari()
+    anahtarlar = {
+        "etkin": "backup.auto_enabled",
+        "aralik_saat": "backup.interval_hours",
+        "bicim": "backup.format",
+        "dizin": "backup.directory",
+        "son_n": "backup.keep_last",
+        "gunluk": "backup.keep_daily",
+        "aylik": "backup.keep_monthly",
+        "bosta_suresi": "backup.idle_seconds",
+    }
+    degerler = {alan: config.get(anahtar, getattr(varsayilan, alan)) for alan, anahtar in anahtarlar.items()}
+
+    bicim = str(degerler["bicim"]).lower()
+    if bicim not in YEDEK_BICIMLERI:
+        raise ConfigError(
+            f"Geçersiz otomatik yedek biçimi: {degerler['bicim']}",
+            code="CFG_002",
+            details={"key": "backup.format", "allowed": list(YEDEK_BICIMLERI)}
+        )
+    degerler["bicim"] = bicim
+
+    try:
+        for alan in ("aralik_saat", "bosta_suresi"):
+            degerler[alan] = float(degerler[alan])
+        for alan in ("son_n", "gunluk", "aylik"):
+            degerler[alan] = int(degerler[alan])
+    except (TypeError, ValueError):
+        raise ConfigError(
+            f"Geçersiz sayısal yedekleme ayarı: {anahtarlar[alan]}={degerler[alan]}",
+            code="CFG_002",
+            details={"key": anahtarlar[alan]}
+        )
+    if degerler["aralik_saat"] <= 0 or degerler["son_n"] < 1:
+        raise ConfigError(
+            "Yedekleme aralığı pozitif olmalı ve en az bir yedek saklanmalı",
+            code="CFG_002",
+            details={"key": "backup.interval_hours/backup.keep_last"}
+        )
+
+    degerler["etkin"] = parse_bool_setting(degerler["etkin"], anahtarlar["etkin"])
+    degerler["dizin"] = str(degerler["dizin"])
+    return OtomatikYedekAyarlari(**degerler)
+
+
+def saklanacak_yedekler(
+    zamanlar: Iterable[datetime], son_n: int, gunluk: int, aylik: int
+) -> Set[datetime]:
+    """
+    Saklama politikasına göre tutulacak yedekleri seç.
+
+    Son ``son_n`` yedek, yedek bulunan son ``gunluk`` günün ve son ``aylik``
+    ayın her birinin en yeni yedeği tutulur.
+
+    Args:
+        zamanlar: Yedek zamanları
+        son_n: Her durumda tutulan en yeni yedek sayısı
+        gunluk: Günlük tutulan yedek sayısı
+        aylik: Aylık tutulan yedek sayısı
+
+    Returns:
+        Set[datetime]: Tutulacak yedeklerin zamanları
+
+    Example:
+        >>> saklanacak_yedekler([datetime(2024, 1, 1), datetime(2024, 1, 2)], 1, 0, 0)
+        {datetime.datetime(2024, 1, 2, 0, 0)}
+    """
+    sirali = sorted(set(zamanlar), reverse=True)
+    tutulacak = set(sirali[:son_n])
+    for adet, anahtar in ((gunluk, lambda z: z.date()), (aylik, lambda z: (z.year, z.month))):
+        donemler: Set[Any] = set()
+        for zaman in sirali:
+            if len(donemler) >= adet:
+                break
+            donem = anahtar(zaman)
+            if donem not in donemler:
+                donemler.add(donem)
+                tutulacak.add(zaman)
+    return tutulacak
+
+
+def _dusuk_oncelik() -> None:
+    """Çalışan thread'in CPU/I/O önceliğini düşür (desteklenmiyorsa geç)"""
+    try:
+        if sys.platform == "win32":
+            import ctypes
+            kernel32 = ctypes.windll.kernel32
+            kernel32.SetThreadPriority(kernel32.GetCurrentThread(), _THREAD_MODE_BACKGROUND_BEGIN)
+        elif sys.platform.startswith("linux"):
+            # Linux'ta nice thread başınadır; I/O zamanlayıcı best-effort önceliği nice'tan türetir
+            os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (OSError, AttributeError) as e:
+        logger.debug(f"Could not lower backup thread priority: {e}")
+
+
+class YedeklemeDurduruldu(Exception):
+    """Uygulama kapanırken süren otomatik yedek yarıda bırakıldı"""
+
+
+class OtomatikYedekleyici:
+    """
+    Arka plan thread'inde zamanlanmış yedek alan sınıf.
+
+    Example:
+        >>> yedekleyici = OtomatikYedekleyici(get_backup_settings())
+        >>> root.bind_all("<KeyPress>", lambda _e: yedekleyici.etkinlik_bildir(), add="+")
+        >>> yedekleyici.baslat()
+        >>> ...
+        >>> yedekleyici.durdur()
+    """
+
+    def __init__(self, ayarlar: OtomatikYedekAyarlari,
+                 controller: Optional[BackupController] = None,
+                 saat: Callable[[], datetime] = datetime.now) -> None:
+        """
+        Args:
+            ayarlar: Yedekleme ayarları
+            controller: Kullanılacak BackupController (None ise yenisi oluşturulur)
+            saat: Yerel zaman kaynağı (dosya adları ve saklama politikası için)
+        """
+        self.ayarlar = ayarlar
+        self.controller = controller or BackupController()
+        self.saat = saat
+        self.son_sonuc: Optional[YedekSonucu] = None
+        self._son_etkinlik = float("-inf")
+        self._dur = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def dizin(self) -> Path:
+        """Otomatik yedeklerin yazıldığı dizin"""
+        return Path(self.ayarlar.dizin)
+
+    # ------------------------------------------------------------------
+    # Arayüz etkinliği
+
+    def etkinlik_bildir(self) -> None:
+        """Kullanıcı etkinliğini kaydet (Tk ana thread'inden çağrılır, ucuzdur)"""
+        self._son_etkinlik = time.monotonic()
+
+    def bosta_mi(self) -> bool:
+        """Son etkinlikten bu yana ``bosta_suresi`` geçti mi?"""
+        return time.monotonic() - self._son_etkinlik >= self.ayarlar.bosta_suresi
+
+    def _bosta_bekle(self) -> bool:
+        """
+        Arayüz boşa çıkana kadar bekle.
+
+        Returns:
+            bool: Beklemeden durdurma isteğiyle çıkıldıysa False
+        """
+        while not self.bosta_mi():
+            if self._dur.wait(BEKLEME_ADIMI):
+                return False
+        return not self._dur.is_set()
+
+    # ------------------------------------------------------------------
+    # Thread yönetimi
+
+    def baslat(self) -> bool:
+        """
+        Zamanlayıcı thread'ini başlat (ayarlarda kapalıysa başlatmaz).
+
+        Returns:
+            bool: Thread başlatıldıysa True
+        """
+        if not self.ayarlar.etkin or (self._thread is not None and self._thread.is_alive()):
+            return False
+        self._dur.clear()
+        self._thread = threading.Thread(target=self._calis, name="otomatik-yedek", daemon=True)
+        self._thread.start()
+        logger.info(
+            f"Automatic backups enabled: every {self.ayarlar.aralik_saat:g} h, "
+            f"format={self.ayarlar.bicim}, directory={self.dizin}"
+        )
+        return True
+
+    def durdur(self, bekle: float = 5.0) -> None:
+        """
+        Zamanlayıcıyı durdur; süren yedek bir sonraki ilerleme adımında bırakılır.
+
+        Args:
+            bekle: Thread'in bitmesi için beklenecek en uzun süre (saniye)
+        """
+        self._dur.set()
+        if self._thread is not None:
+            self._thread.join(bekle)
+            self._thread = None
+
+    def _calis(self) -> None:
+        """Thread döngüsü: zamanı gelince ve arayüz boştayken yedek al"""
+        _dusuk_oncelik()
+        while not self._dur.wait(KONTROL_ARALIGI):
+            try:
+                if self.zamani_geldi_mi() and self._bosta_bekle():
+                    self.yedekle()
+            except Exception as e:
+                logger.error(f"Automatic backup scheduler error: {e}", exc_info=True)
+
+    # ------------------------------------------------------------------
+    # Yedekleme
+
+    def mevcut_yedekler(self) -> List[Tuple[datetime, Path]]:
+        """
+        Hedef dizindeki otomatik yedekleri listele (yeniden eskiye).
+
+        Returns:
+            List[Tuple[datetime, Path]]: (yedek zamanı, dosya yolu)
+        """
+        if not self.dizin.is_dir():
+            return []
+        yedekler = []
+        for yol in self.dizin.iterdir():
+            eslesme = _DOSYA_ADI.match(yol.name)
+            if eslesme and yol.is_file():
+                yedekler.append((datetime.strptime(eslesme.group(1), _ZAMAN_BICIMI), yol))
+        return sorted(yedekler, reverse=True)
+
+    def zamani_geldi_mi(self) -> bool:
+        """En yeni otomatik yedek ``aralik_saat``'ten eskiyse (veya yoksa) True"""
+        yedekler = self.mevcut_yedekler()
+        if not yedekler:
+            return True
+        return self.saat() - yedekler[0][0] >= timedelta(hours=self.ayarlar.aralik_saat)
+
+    def yedekle(self) -> YedekSonucu:
+        """
+        Hemen bir otomatik yedek al ve saklama politikasını uygula.
+
+        Yedek önce geçici bir dosyaya yazılır ve başarılıysa yerine taşınır;
+        yarım kalan dosya otomatik yedek olarak görünmez.
+
+        Returns:
+            YedekSonucu: Süre, boyut ve silinen dosya sayısı
+        """
+        bicim = self.ayarlar.bicim
+        self.dizin.mkdir(parents=True, exist_ok=True)
+        hedef = self.dizin / f"{OTOMATIK_YEDEK_ONEKI}{self.saat().strftime(_ZAMAN_BICIMI)}{YEDEK_BICIMLERI[bicim]}"
+        gecici = hedef.with_name("~" + hedef.name)
+
+        baslangic = time.perf_counter()
+        if bicim == "sqlite":
+            basarili = self.controller.backup_to_sqlite(str(gecici), progress_callback=self._ilerleme, compress=True)
+        elif bicim == "xml":
+            basarili = self.controller.backup_to_xml(str(gecici), progress_callback=self._ilerleme)
+        else:
+            basarili = self.controller.backup_to_excel(str(gecici), progress_callback=self._ilerleme)
+        sure = time.perf_counter() - baslangic
+
+        if not basarili or not gecici.exists():
+            gecici.unlink(missing_ok=True)
+            self.son_sonuc = YedekSonucu(False, None, bicim, sure)
+            logger.error(f"Automatic {bicim} backup failed after {sure:.2f} s")
+            return self.son_sonuc
+
+        os.replace(gecici, hedef)
+        boyut = hedef.stat().st_size
+        silinen = self.eski_yedekleri_sil()
+        self.son_sonuc = YedekSonucu(True, hedef, bicim, sure, boyut, silinen)
+        logger.info(
+            f"Automatic backup written: {hedef.name} ({boyut} bytes, {sure:.2f} s, "
+            f"{boyut / max(sure, 1e-6) / 1048576:.1f} MB/s); removed {silinen} old backups"
+        )
+        return self.son_sonuc
+
+    def eski_yedekleri_sil(self) -> int:
+        """
+        Saklama politikası dışında kalan otomatik yedekleri sil.
+
+        Returns:
+            int: Silinen dosya sayısı
+        """
+        yedekler = self.mevcut_yedekler()
+        tutulacak = saklanacak_yedekler(
+            (zaman for zaman, _ in yedekler), self.ayarlar.son_n, self.ayarlar.gunluk, self.ayarlar.aylik
+        )
+        silinen = 0
+        for zaman, yol in yedekler:
+            if zaman in tutulacak:
+                continue
+            try:
+                yol.unlink()
+                silinen += 1
+            except OSError as e:
+                logger.warning(f"Could not remove old backup {yol.name}: {e}")
+        return silinen
+
+    def _ilerleme(self, _yuzde: int) -> None:
+        """Yedek ilerlerken arayüz meşgulse bekle; kapanışta yedeği bırak"""
+        if not self._bosta_bekle():
+            raise YedeklemeDurduruldu("Uygulama kapanıyor")
@@ -7,12 +7,13 @@ işlemleri gerçekleştirir (aktif/pasif yönetimi vb.).
 
 from typing import List, Optional, cast, Union
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import or_
+from sqlalchemy import Integer, column, or_, text
 from controllers.base_controller import BaseController
 from models.base import Sakin
 from models.validation import Validator
 from models.exceptions import ValidationError
 from database.config import get_db
+from database.fts import fts_hazir, fts_sorgusu
 from datetime import datetime, date
 from utils.logger import get_logger
 from utils.pagination import PaginationHelper, PaginationResult
@@ -573,7 +574,7 @@ class SakinController(BaseController[Sakin]):
         db: Session = None
     ) -> PaginationResult:
         """
-        Sakin adına göre sayfalı arama yap (Index ile optimize)
+        Sakin ad, ünvan, telefon ve notlarında sayfalı arama yap (FTS5 indeksi)
         
         Args:
             search_text: Aranacak metin
@@ -593,11 +594,19 @@ class SakinController(BaseController[Sakin]):
         close_db = db is None
         
         try:
-            # Index kullanacak şekilde LIKE filtresi
-            query = session.query(Sakin).filter(
-                Sakin.ad_soyad.ilike(f"%{search_text}%"),
-                Sakin.aktif == True
-            ).order_by(Sakin.ad_soyad)
+            query = session.query(Sakin).filter(Sakin.aktif == True)
+
+            # FTS5 indeksi: kelime önekleri Türkçe katlama ile eşleşir
+            # ("yildiz" → "YILDIZ", "Yıldız"); indeks yoksa LIKE'a dön
+            fts_ifadesi = fts_sorgusu(search_text)
+            if fts_ifadesi is not None and fts_hazir(session, "sakin_fts"):
+                eslesenler = text(
+                    "SELECT rowid FROM sakin_fts WHERE sakin_fts MATCH :sorgu"
+                ).bindparams(sorgu=fts_ifadesi).columns(column("rowid", Integer))
+                query = query.filter(Sakin.id.in_(eslesenler))
+            else:
+                query = query.filter(Sakin.ad_soyad.ilike(f"%{search_text}%"))
+            query = query.order_by(Sakin.ad_soyad)
             
             result = PaginationHelper.paginate(query, page, page_size)
             self.logger.info(f"Search for '{search_text}' returned {result.total_count} results")
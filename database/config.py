@@ -1,31 +1,294 @@
 """
 Veritabanı konfigürasyonu
+
+SQLite engine'i bir "engine profili" ile oluşturulur. Profil, her yeni
+bağlantıda uygulanan PRAGMA ayarlarını (WAL, synchronous, cache_size,
+mmap_size, temp_store, foreign_keys, busy_timeout) ve bağlantı havuzu
+stratejisini tanımlar. Değerler ConfigurationManager'daki ``database.*``
+anahtarlarından okunur (bkz. ``configuration.constants.ConfigKeys``).
 """
 
 import os
-from sqlalchemy import create_engine
+from typing import Any, Dict, Optional
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import NullPool, QueuePool, SingletonThreadPool, StaticPool
 from contextlib import contextmanager
 
+from configuration.config_manager import parse_bool_setting
+from configuration.constants import ConfigDefaults
+from models.exceptions import ConfigError
+
 # Veritabanı dosyası
 DATABASE_URL = "sqlite:///./aidat_plus.db"
 
+# Varsayılan engine profili (ConfigDefaults ile aynı değerler)
+DEFAULT_ENGINE_PROFILE: Dict[str, Any] = {
+    "journal_mode": ConfigDefaults.DEFAULT_DB_JOURNAL_MODE,
+    "synchronous": ConfigDefaults.DEFAULT_DB_SYNCHRONOUS,
+    "cache_size_kb": ConfigDefaults.DEFAULT_DB_CACHE_SIZE_KB,
+    "mmap_size": ConfigDefaults.DEFAULT_DB_MMAP_SIZE,
+    "temp_store": ConfigDefaults.DEFAULT_DB_TEMP_STORE,
+    "foreign_keys": ConfigDefaults.DEFAULT_DB_FOREIGN_KEYS,
+    "busy_timeout_ms": ConfigDefaults.DEFAULT_DB_BUSY_TIMEOUT_MS,
+    "pool_strategy": ConfigDefaults.DEFAULT_DB_POOL_STRATEGY,
+    "pool_size": ConfigDefaults.DEFAULT_DB_POOL_SIZE,
+    "max_overflow": ConfigDefaults.DEFAULT_DB_MAX_OVERFLOW,
+    "pool_timeout": ConfigDefaults.DEFAULT_DB_POOL_TIMEOUT,
+    "pool_recycle": ConfigDefaults.DEFAULT_DB_POOL_RECYCLE,
+    "echo": ConfigDefaults.DEFAULT_DB_ECHO,
+}
+
+# Profil değerleri için izin verilen seçenekler
+JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+TEMP_STORE_MODES = ("DEFAULT", "FILE", "MEMORY")
+POOL_STRATEGIES = {
+    "queue": QueuePool,
+    "null": NullPool,
+    "static": StaticPool,
+    "singleton": SingletonThreadPool,
+}
+
+
+def get_engine_profile(config: Optional[Any] = None) -> Dict[str, Any]:
+    """Engine profilini konfigürasyondan oku ve doğrula.
+
+    Args:
+        config: ConfigurationManager instance'ı. None ise singleton kullanılır.
+
+    Returns:
+        Dict[str, Any]: Doğrulanmış engine profili
+
+    Raises:
+        ConfigError: Profil değerlerinden biri geçersiz ise
+    """
+    if config is None:
+        from configuration.config_manager import ConfigurationManager
+        config = ConfigurationManager.get_instance()
+
+    profile = dict(DEFAULT_ENGINE_PROFILE)
+    for key, default in DEFAULT_ENGINE_PROFILE.items():
+        profile[key] = config.get(f"database.{key}", default)
+
+    return validate_engine_profile(profile)
+
+
+def validate_engine_profile(profile: Dict[str, Any]) -> Dict[str, Any]:
+    """Engine profilini doğrula ve normalize et.
+
+    Args:
+        profile: Doğrulanacak profil (eksik anahtarlar varsayılanlarla doldurulur)
+
+    Returns:
+        Dict[str, Any]: Normalize edilmiş profil
+
+    Raises:
+        ConfigError: Değerlerden biri geçersiz ise (CFG_002)
+    """
+    result = dict(DEFAULT_ENGINE_PROFILE)
+    result.update(profile)
+
+    choices = {
+        "journal_mode": JOURNAL_MODES,
+        "synchronous": SYNCHRONOUS_MODES,
+        "temp_store": TEMP_STORE_MODES,
+    }
+    for key, allowed in choices.items():
+        value = str(result[key]).upper()
+        if value not in allowed:
+            raise ConfigError(
+                f"Geçersiz veritabanı ayarı: {key}={result[key]}",
+                code="CFG_002",
+                details={"key": f"database.{key}", "allowed": list(allowed)}
+            )
+        result[key] = value
+
+    strategy = str(result["pool_strategy"]).lower()
+    if strategy not in POOL_STRATEGIES:
+        raise ConfigError(
+            f"Geçersiz bağlantı havuzu stratejisi: {result['pool_strategy']}",
+            code="CFG_002",
+            details={"key": "database.pool_strategy", "allowed": list(POOL_STRATEGIES)}
+        )
+    result["pool_strategy"] = strategy
+
+    try:
+        for key in ("cache_size_kb", "mmap_size", "busy_timeout_ms",
+                    "pool_size", "max_overflow", "pool_timeout", "pool_recycle"):
+            result[key] = int(result[key])
+    except (TypeError, ValueError):
+        raise ConfigError(
+            f"Geçersiz sayısal veritabanı ayarı: {key}={result[key]}",
+            code="CFG_002",
+            details={"key": f"database.{key}"}
+        )
+
+    for key in ("foreign_keys", "echo"):
+        result[key] = parse_bool_setting(result[key], f"database.{key}")
+    return result
+
+
+def apply_sqlite_pragmas(dbapi_connection: Any, profile: Dict[str, Any]) -> None:
+    """Profil PRAGMA'larını ham DBAPI bağlantısına uygula.
+
+    Args:
+        dbapi_connection: sqlite3 bağlantısı
+        profile: Doğrulanmış engine profili
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(f"PRAGMA journal_mode={profile['journal_mode']}")
+        cursor.execute(f"PRAGMA synchronous={profile['synchronous']}")
+        # Negatif değer: KiB cinsinden cache boyutu
+        cursor.execute(f"PRAGMA cache_size=-{int(profile['cache_size_kb'])}")
+        cursor.execute(f"PRAGMA mmap_size={int(profile['mmap_size'])}")
+        cursor.execute(f"PRAGMA temp_store={profile['temp_store']}")
+        cursor.execute(f"PRAGMA foreign_keys={'ON' if profile['foreign_keys'] else 'OFF'}")
+        cursor.execute(f"PRAGMA busy_timeout={int(profile['busy_timeout_ms'])}")
+    finally:
+        cursor.close()
+
+
+def create_configured_engine(url: str, profile: Optional[Dict[str, Any]] = None) -> Engine:
+    """Profil ile SQLite engine oluştur.
+
+    Havuz stratejisi profilden seçilir; in-memory veritabanlarında tek bağlantı
+    paylaşılması gerektiği için her zaman StaticPool kullanılır. PRAGMA'lar
+    engine ``connect`` event'i ile her yeni bağlantıda uygulanır.
+
+    Args:
+        url: Veritabanı URL'i
+        profile: Engine profili (None ise varsayılan profil)
+
+    Returns:
+        Engine: Yapılandırılmış SQLAlchemy engine
+    """
+    profile = validate_engine_profile(profile or {})
+
+    is_memory = url in ("sqlite://", "sqlite:///:memory:")
+    strategy = "static" if is_memory else profile["pool_strategy"]
+    pool_class = POOL_STRATEGIES[strategy]
+
+    engine_kwargs: Dict[str, Any] = {
+        "connect_args": {"check_same_thread": False},  # SQLite için gerekli
+        "poolclass": pool_class,
+        "echo": profile["echo"],
+    }
+    if pool_class is QueuePool:
+        engine_kwargs.update(
+            pool_size=profile["pool_size"],
+            max_overflow=profile["max_overflow"],
+            pool_timeout=profile["pool_timeout"],
+            pool_recycle=profile["pool_recycle"],
+        )
+
+    new_engine = create_engine(url, **engine_kwargs)
+
+    @event.listens_for(new_engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        apply_sqlite_pragmas(dbapi_connection, profile)
+
+    return new_engine
+
+
+# Aktif engine profili
+engine_profile: Dict[str, Any] = validate_engine_profile(DEFAULT_ENGINE_PROFILE)
+
 # SQLAlchemy engine
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False}  # SQLite için gerekli
-)
+engine = create_configured_engine(DATABASE_URL, engine_profile)
+
+class ScopedSession(Session):
+    """Unit of work içinde paylaşılabilen oturum.
+
+    ``uow_depth`` sıfırdan büyükken oturum bir unit of work'e aittir:
+    ``commit()`` yalnızca flush yapıp commit isteğini kaydeder, ``close()``
+    ise hiçbir şey yapmaz. ``rollback()`` transaction'ı gerçekten geri alır
+    (oturum hata sonrası kullanılabilir kalsın diye) ve unit of work'ü
+    başarısız olarak işaretler; unit of work sonunda geri alma sonrası
+    yapılan yazmalar da commit edilmez. Gerçek commit/close unit of work
+    bitince yapılır (bkz. ``database.unit_of_work``). Unit of work dışında
+    normal Session gibi davranır.
+    """
+
+    uow_depth = 0
+    commit_requested = False
+    rollback_requested = False
+
+    def commit(self) -> None:
+        if self.uow_depth:
+            self.flush()
+            self.commit_requested = True
+            return
+        super().commit()
+        self.commit_requested = False
+
+    def rollback(self) -> None:
+        if self.uow_depth:
+            # Önceki commit istekleri geri alındı; unit of work artık commit edilemez
+            self.rollback_requested = True
+            self.commit_requested = False
+        super().rollback()
+
+    def close(self) -> None:
+        if self.uow_depth:
+            return
+        super().close()
+
 
 # Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+SessionLocal = sessionmaker(class_=ScopedSession, autocommit=False, autoflush=False, bind=engine)
 
 # Base class for models
 Base = declarative_base()
 
+
+def configure_engine(profile: Optional[Dict[str, Any]] = None) -> Engine:
+    """Modül engine'ini verilen profil ile yeniden yapılandır.
+
+    Profil mevcut profil ile aynıysa engine olduğu gibi bırakılır. Aksi halde
+    eski engine kapatılır, yenisi oluşturulur ve SessionLocal yeni engine'e
+    bağlanır.
+
+    Args:
+        profile: Engine profili. None ise ConfigurationManager'dan okunur.
+
+    Returns:
+        Engine: Aktif engine
+    """
+    global engine, engine_profile
+
+    profile = validate_engine_profile(profile) if profile is not None else get_engine_profile()
+    if profile == engine_profile:
+        return engine
+
+    old_engine = engine
+    engine = create_configured_engine(DATABASE_URL, profile)
+    engine_profile = profile
+    SessionLocal.configure(bind=engine)
+    old_engine.dispose()
+    return engine
+
+
+def checkpoint_wal() -> None:
+    """WAL dosyasındaki sayfaları ana veritabanı dosyasına yaz.
+
+    Veritabanı dosyası doğrudan kopyalanmadan önce çağrılmalıdır; aksi halde
+    WAL modunda son commit'ler yalnızca ``-wal`` dosyasında bulunabilir.
+    """
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
 def get_db() -> Session:
-    """Veritabanı oturumu döndür"""
-    return SessionLocal()
+    """Veritabanı oturumu döndür.
+
+    Thread'de aktif bir unit of work varsa onun paylaşılan oturumu döner.
+    """
+    from database.unit_of_work import acquire_session
+    return acquire_session()
 
 
 @contextmanager
@@ -47,9 +310,16 @@ def get_db_session() -> Session:
             pass
 
 def create_tables() -> None:
-    """Veritabanı tablolarını oluştur"""
-    Base.metadata.create_all(bind=engine)
+    """Veritabanını güncel şema sürümüne getir.
+
+    Şema sürümü güncelse yalnızca sürüm satırı okunur; aksi halde eksik
+    tablolar, indeksler ve bekleyen göç adımları uygulanır (bkz.
+    ``database.sema_gocleri``).
+    """
+    from database import sema_gocleri
+    sema_gocleri.guncelle(engine)
 
 def init_database() -> None:
     """Veritabanını başlat"""
-    create_tables()
\ No newline at end of file
+    configure_engine()
+    create_tables()
@@ -0,0 +1,205 @@
+"""
+Fark (differential) yedekleri için değişiklik izleme
+
+Değişen satırlar her tablodaki ``updated_at``/``created_at`` kolonlarıyla
+bulunur; bu kolonlar silinen satırları göstermediği için silmeler
+``silinen_kayitlar`` tablosuna (tombstone) trigger'larla yazılır. Her tam
+veya fark yedeğinden sonra tablo başına alınan damga (watermark)
+``yedek_damgalari`` tablosunda tutulur; sonraki fark yedeği yalnızca bu
+damgadan sonra değişen satırları ve silmeleri içerir.
+
+Zamanlar SQLite saatiyle (UTC) yazılır; ORM'in ``onupdate=func.now()``
+değeri de aynı saattir. Kayıt zamanları saniye hassasiyetinde olduğundan ve
+damga alınırken henüz commit edilmemiş transaction'lar bulunabileceğinden
+fark sorguları damgadan
+``GUVENLIK_PAYI`` kadar geriden başlar; fark uygulama upsert olduğu için
+tekrar gelen satırlar zararsızdır. Damgalar milisaniye hassasiyetindedir
+ve her yedeğin damgası öncekinden büyüktür (bkz. ``yeni_damga``); yedek
+zinciri bu değerlerle doğrulanır.
+
+Trigger'lar ``Base.metadata.create_all`` sonrasında oluşturulur (bkz.
+``database.fts``). Toplu geri yükleme trigger'ları transaction süresince
+kaldırır; geri yüklenen veritabanı yeni bir başlangıç noktası olduğu için
+damgalar ve tombstone'lar temizlenir.
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, Table, event, func, select, text
+from sqlalchemy.exc import OperationalError
+
+from database.config import Base
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fark sorgularının damgadan ne kadar geriden başlayacağı
+GUVENLIK_PAYI = timedelta(seconds=60)
+
+silinen_kayitlar = Table(
+    "silinen_kayitlar",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("tablo", String(50), nullable=False),
+    Column("kayit_id", Integer, nullable=False),
+    Column("silinme_zamani", DateTime, nullable=False, server_default=func.now(), index=True),
+)
+
+yedek_damgalari = Table(
+    "yedek_damgalari",
+    Base.metadata,
+    Column("tablo", String(50), primary_key=True),
+    Column("damga", DateTime, nullable=False),
+)
+
+# Tombstone trigger'ı kurulan tablolar (yedeklenen modeller, bkz. BackupController.MODELS_ORDER)
+IZLENEN_TABLOLAR = (
+    "lojmanlar", "bloklar", "daireler", "sakinler", "aidatlar", "hesaplar", "kategoriler",
+    "ana_kategoriler", "alt_kategoriler", "finans_islemleri", "aidat_islemleri",
+    "aidat_odemeleri", "ayarlar", "finans",
+)
+
+
+def _trigger_adi(tablo: str) -> str:
+    return f"{tablo}_silinen_ad"
+
+
+def _trigger_ddl(tablo: str) -> str:
+    """Silinen satırı ``silinen_kayitlar`` tablosuna yazan trigger"""
+    return (
+        f"CREATE TRIGGER IF NOT EXISTS {_trigger_adi(tablo)} AFTER DELETE ON {tablo} BEGIN "
+        f"INSERT INTO silinen_kayitlar(tablo, kayit_id) VALUES ('{tablo}', old.id); END"
+    )
+
+
+def simdi(connection: Any) -> datetime:
+    """
+    Veritabanı saatini al (kayıt zamanlarıyla aynı kaynak, UTC).
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+
+    Returns:
+        datetime: Milisaniye hassasiyetinde UTC zaman
+    """
+    return datetime.fromisoformat(
+        connection.execute(text("SELECT strftime('%Y-%m-%d %H:%M:%f', 'now')")).scalar()
+    )
+
+
+def yeni_damga(connection: Any) -> datetime:
+    """
+    Yeni yedek için damga al; kayıtlı son damgadan her zaman büyüktür.
+
+    Aynı milisaniyede alınan iki yedek zincirde ayırt edilebilsin diye
+    gerekirse son damgaya bir milisaniye eklenir.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+
+    Returns:
+        datetime: Yedeğin damgası
+    """
+    damga = simdi(connection)
+    onceki = connection.execute(select(func.max(yedek_damgalari.c.damga))).scalar()
+    if onceki is not None and damga <= onceki:
+        damga = onceki + timedelta(milliseconds=1)
+    return damga
+
+
+def damgalari_al(connection: Any) -> Dict[str, datetime]:
+    """
+    Son yedekte kaydedilen tablo damgalarını oku.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+
+    Returns:
+        Dict[str, datetime]: Tablo adı -> damga (hiç yedek alınmadıysa boş)
+    """
+    return {
+        satir.tablo: satir.damga
+        for satir in connection.execute(select(yedek_damgalari.c.tablo, yedek_damgalari.c.damga))
+    }
+
+
+def damgalari_kaydet(connection: Any, tablolar: List[str], damga: datetime) -> None:
+    """
+    Tabloların damgasını güncelle ve artık gerekmeyen tombstone'ları sil.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+        tablolar: Yedeklenen tablolar
+        damga: Yedeğin başladığı an (``simdi``)
+    """
+    connection.execute(yedek_damgalari.delete())
+    if tablolar:
+        connection.execute(yedek_damgalari.insert(), [{"tablo": t, "damga": damga} for t in tablolar])
+    # Sonraki fark yedeği en erken (damga - pay) anından başlar
+    connection.execute(silinen_kayitlar.delete().where(silinen_kayitlar.c.silinme_zamani < damga - GUVENLIK_PAYI))
+
+
+def fark_esigi(damga: Optional[datetime]) -> Optional[datetime]:
+    """
+    Fark sorgusunun başlangıç zamanı.
+
+    Args:
+        damga: Tablonun son damgası (None ise tablo tamamen yedeklenir)
+
+    Returns:
+        Optional[datetime]: ``damga - GUVENLIK_PAYI`` veya None
+    """
+    return damga - GUVENLIK_PAYI if damga is not None else None
+
+
+def olustur(connection: Any) -> None:
+    """
+    Eksik tombstone trigger'larını oluştur.
+
+    Args:
+        connection: SQLAlchemy Connection
+    """
+    mevcut = {
+        satir[0] for satir in connection.execute(text("SELECT name FROM sqlite_master WHERE type = 'table'"))
+    }
+    for tablo in IZLENEN_TABLOLAR:
+        if tablo in mevcut:
+            connection.execute(text(_trigger_ddl(tablo)))
+
+
+def toplu_yuklemeye_hazirla(connection: Any) -> None:
+    """
+    Toplu geri yükleme öncesi tombstone'ları ve damgaları temizle, trigger'ları kaldır.
+
+    İlk ifade bir ``DELETE`` olduğu için trigger'lar açık transaction içinde
+    kaldırılır; transaction geri alınırsa geri gelirler.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session (açık transaction içinde kalmalı)
+    """
+    connection.execute(silinen_kayitlar.delete())
+    connection.execute(yedek_damgalari.delete())
+    for tablo in IZLENEN_TABLOLAR:
+        connection.execute(text(f"DROP TRIGGER IF EXISTS {_trigger_adi(tablo)}"))
+
+
+def toplu_yukleme_sonrasi(connection: Any) -> None:
+    """
+    ``toplu_yuklemeye_hazirla`` ile kaldırılan trigger'ları geri koy.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session (aynı transaction)
+    """
+    olustur(connection)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _metadata_after_create(target: Any, connection: Any, **kw: Any) -> None:
+    """create_all sonrasında tombstone trigger'larını oluştur"""
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        olustur(connection)
+    except OperationalError as e:
+        logger.warning(f"Delete tracking disabled: {e}")
@@ -0,0 +1,250 @@
+"""
+Tam metin arama (SQLite FTS5) indeksleri
+
+Sakinler, finans işlemleri ve aidat işlemleri için birer FTS5 tablosu
+tutulur. Her FTS satırının ``rowid`` değeri kaynak kaydın ``id``'sidir; bu
+sayede güncelleme/silme O(log n) çalışır.
+
+Türkçe büyük/küçük harf katlama:
+    ``unicode61 remove_diacritics 2`` tokenizer'ı büyük harfleri küçültür ve
+    aksanları kaldırır (İ→i, Ö→o, Ş→s, Ç→c, Ğ→g, Ü→u). Noktasız ``ı`` ise
+    Unicode'da ayrı bir harftir ve tokenizer tarafından katlanmaz; bu yüzden
+    indekse yazılan metinde ``ı`` → ``i`` dönüşümü trigger içinde ``replace``
+    ile yapılır. Sonuçta "YILDIZ", "Yıldız" ve "yildiz" aynı terime
+    ("yildiz") indekslenir. Sorgu tarafında aynı katlama ``turkce_katla`` ile
+    uygulanır.
+
+Senkronizasyon:
+    Indeksler kaynak tablolardaki trigger'larla güncel tutulur; ORM dışı
+    yazmalar (Core ``insert``, toplu geri yükleme) da kapsanır. Trigger'lar
+    yalnızca yerleşik SQL fonksiyonlarını kullandığı için harici araçlarla
+    açılan bağlantılarda da çalışır. Toplu geri yükleme trigger'ları
+    transaction süresince kaldırır ve indeksleri sonunda tek sorguda doldurur
+    (bkz. ``toplu_yuklemeye_hazirla``).
+
+Tablolar ve trigger'lar ``Base.metadata.create_all`` sonrasında oluşturulur
+(``CREATE ... IF NOT EXISTS``); FTS tablosu ilk kez oluşturulduğunda mevcut
+kayıtlarla doldurulur. SQLite FTS5 desteği olmadan derlenmişse indeksler
+oluşturulmaz ve arama yapan kod LIKE'a geri döner (bkz. ``fts_hazir``).
+"""
+
+import re
+import unicodedata
+from typing import Any, Dict, List, Optional, Tuple
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from database.config import Base
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# FTS tablosu -> (kaynak tablo, indekslenen kolonlar, bm25 kolon ağırlıkları)
+FTS_TABLOLARI: Dict[str, Tuple[str, Tuple[str, ...], Tuple[float, ...]]] = {
+    "sakin_fts": ("sakinler", ("ad_soyad", "rutbe_unvan", "telefon", "notlar"), (10.0, 3.0, 2.0, 1.0)),
+    "finans_islem_fts": ("finans_islemleri", ("aciklama",), (1.0,)),
+    "aidat_islem_fts": ("aidat_islemleri", ("aciklama",), (1.0,)),
+}
+
+FTS_TOKENIZER = "unicode61 remove_diacritics 2"
+
+_KELIME = re.compile(r"\w+", re.UNICODE)
+
+
+def turkce_katla(metin: Optional[str]) -> str:
+    """
+    Metni FTS indeksiyle aynı kurallara göre katla (Türkçe İ/ı dahil).
+
+    Python'un ``str.lower()`` fonksiyonu "İ" harfini "i̇" (i + birleşik nokta)
+    yapar ve "I" harfini "ı" yerine "i" yapar; bu fonksiyon her ikisini de
+    düz "i" harfine indirger ve aksanları kaldırır.
+
+    Args:
+        metin (str): Katlanacak metin (None boş kabul edilir)
+
+    Returns:
+        str: Küçük harfli, aksansız metin
+
+    Example:
+        >>> turkce_katla("ŞAHİN Yıldız")
+        'sahin yildiz'
+    """
+    if not metin:
+        return ""
+    metin = metin.replace("İ", "i").replace("I", "i").replace("ı", "i").lower()
+    ayrik = unicodedata.normalize("NFKD", metin)
+    return "".join(c for c in ayrik if not unicodedata.combining(c))
+
+
+def fts_sorgusu(metin: Optional[str]) -> Optional[str]:
+    """
+    Kullanıcı metnini FTS5 MATCH ifadesine çevir.
+
+    Her kelime önek (prefix) araması olarak aranır ve tüm kelimeler
+    eşleşmelidir (AND). FTS5 sorgu sözdizimi karakterleri etkisizdir.
+
+    Args:
+        metin (str): Kullanıcının yazdığı arama metni
+
+    Returns:
+        Optional[str]: MATCH ifadesi; aranacak kelime yoksa None
+
+    Example:
+        >>> fts_sorgusu("Ali YILDIZ")
+        '"ali"* AND "yildiz"*'
+    """
+    kelimeler = _KELIME.findall(turkce_katla(metin))
+    if not kelimeler:
+        return None
+    return " AND ".join(f'"{kelime}"*' for kelime in kelimeler)
+
+
+def fts_hazir(connection: Any, fts_tablosu: str) -> bool:
+    """
+    FTS tablosunun bu veritabanında var olup olmadığını kontrol et.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+        fts_tablosu (str): ``FTS_TABLOLARI`` anahtarlarından biri
+
+    Returns:
+        bool: Tablo varsa True
+    """
+    sonuc = connection.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :ad"),
+        {"ad": fts_tablosu}
+    ).first()
+    return sonuc is not None
+
+
+def _katlanmis(prefix: str, kolon: str) -> str:
+    """Trigger içinde indekse yazılacak katlanmış kolon ifadesi"""
+    return f"replace(coalesce({prefix}.{kolon}, ''), 'ı', 'i')"
+
+
+def _trigger_ddl(fts_tablosu: str, kaynak: str, kolonlar: Tuple[str, ...]) -> List[str]:
+    """Kaynak tablo için insert/update/delete trigger DDL'leri"""
+    kolon_listesi = ", ".join(kolonlar)
+    yeni_degerler = ", ".join(_katlanmis("new", k) for k in kolonlar)
+    ekle = f"INSERT INTO {fts_tablosu}(rowid, {kolon_listesi}) VALUES (new.id, {yeni_degerler});"
+    sil = f"DELETE FROM {fts_tablosu} WHERE rowid = old.id;"
+    return [
+        f"CREATE TRIGGER IF NOT EXISTS {fts_tablosu}_ai AFTER INSERT ON {kaynak} BEGIN {ekle} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_tablosu}_ad AFTER DELETE ON {kaynak} BEGIN {sil} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts_tablosu}_au AFTER UPDATE OF id, {kolon_listesi} ON {kaynak} "
+        f"BEGIN {sil} {ekle} END",
+    ]
+
+
+def doldur(connection: Any, fts_tablosu: str) -> int:
+    """
+    FTS tablosunu kaynak tablodan baştan doldur.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+        fts_tablosu (str): ``FTS_TABLOLARI`` anahtarlarından biri
+
+    Returns:
+        int: İndekslenen kayıt sayısı
+    """
+    kaynak, kolonlar, _ = FTS_TABLOLARI[fts_tablosu]
+    kolon_listesi = ", ".join(kolonlar)
+    degerler = ", ".join(_katlanmis(kaynak, k) for k in kolonlar)
+    connection.execute(text(f"DELETE FROM {fts_tablosu}"))
+    sonuc = connection.execute(text(
+        f"INSERT INTO {fts_tablosu}(rowid, {kolon_listesi}) SELECT id, {degerler} FROM {kaynak}"
+    ))
+    return int(sonuc.rowcount or 0)
+
+
+def olustur(connection: Any) -> List[str]:
+    """
+    Eksik FTS tablolarını ve trigger'ları oluştur; yeni tabloları doldur.
+
+    Args:
+        connection: SQLAlchemy Connection
+
+    Returns:
+        List[str]: Bu çağrıda oluşturulup doldurulan FTS tabloları
+    """
+    olusturulan = []
+    for fts_tablosu, (kaynak, kolonlar, agirliklar) in FTS_TABLOLARI.items():
+        yeni = not fts_hazir(connection, fts_tablosu)
+        if yeni:
+            connection.execute(text(
+                f"CREATE VIRTUAL TABLE {fts_tablosu} USING fts5("
+                f"{', '.join(kolonlar)}, tokenize = '{FTS_TOKENIZER}')"
+            ))
+            # Varsayılan sıralama: kolon ağırlıklı bm25 (ORDER BY rank)
+            connection.execute(text(
+                f"INSERT INTO {fts_tablosu}({fts_tablosu}, rank) "
+                f"VALUES ('rank', 'bm25({', '.join(str(a) for a in agirliklar)})')"
+            ))
+        for ddl in _trigger_ddl(fts_tablosu, kaynak, kolonlar):
+            connection.execute(text(ddl))
+        if yeni:
+            adet = doldur(connection, fts_tablosu)
+            olusturulan.append(fts_tablosu)
+            logger.info(f"Created full-text index {fts_tablosu} with {adet} rows")
+    return olusturulan
+
+
+def toplu_yuklemeye_hazirla(connection: Any) -> List[str]:
+    """
+    Toplu yükleme öncesi FTS indekslerini boşalt ve trigger'ları kaldır.
+
+    Satır başına trigger çalıştırmak yerine indeksler yükleme sonunda
+    ``toplu_yukleme_sonrasi`` ile tek sorguda doldurulur. İlk ifade bir
+    ``DELETE`` olduğu için SQLite transaction'ı trigger'lar kaldırılmadan
+    önce başlar; transaction geri alınırsa trigger'lar da geri gelir.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session (açık transaction içinde kalmalı)
+
+    Returns:
+        List[str]: Trigger'ları kaldırılan FTS tabloları
+    """
+    tablolar = [t for t in FTS_TABLOLARI if fts_hazir(connection, t)]
+    for fts_tablosu in tablolar:
+        connection.execute(text(f"DELETE FROM {fts_tablosu}"))
+    for fts_tablosu in tablolar:
+        for ek in ("ai", "ad", "au"):
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {fts_tablosu}_{ek}"))
+    return tablolar
+
+
+def toplu_yukleme_sonrasi(connection: Any, tablolar: List[str]) -> None:
+    """
+    ``toplu_yuklemeye_hazirla`` ile kaldırılan trigger'ları geri koy ve indeksleri doldur.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session (aynı transaction)
+        tablolar: ``toplu_yuklemeye_hazirla`` dönüş değeri
+    """
+    for fts_tablosu in tablolar:
+        kaynak, kolonlar, _ = FTS_TABLOLARI[fts_tablosu]
+        for ddl in _trigger_ddl(fts_tablosu, kaynak, kolonlar):
+            connection.execute(text(ddl))
+        doldur(connection, fts_tablosu)
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _metadata_after_create(target: Any, connection: Any, **kw: Any) -> None:
+    """create_all sonrasında FTS tablolarını ve trigger'ları oluştur"""
+    if connection.dialect.name != "sqlite":
+        return
+    try:
+        olustur(connection)
+    except OperationalError as e:
+        # SQLite FTS5 olmadan derlenmiş olabilir - arama LIKE'a geri döner
+        logger.warning(f"Full-text search disabled: {e}")
+
+
+@event.listens_for(Base.metadata, "before_drop")
+def _metadata_before_drop(target: Any, connection: Any, **kw: Any) -> None:
+    """drop_all öncesinde FTS tablolarını kaldır (trigger'lar kaynak tabloyla silinir)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for fts_tablosu in FTS_TABLOLARI:
+        connection.execute(text(f"DROP TABLE IF EXISTS {fts_tablosu}"))
@@ -0,0 +1,205 @@
+"""
+Şema sürümü ve göç (migration) adımları
+
+Veritabanının şema sürümü tek satırlık ``sema_surumu`` tablosunda tutulur.
+Açılışta yalnızca bu satır okunur; sürüm ``GUNCEL_SURUM`` ile aynıysa
+``create_all`` ve indeks kontrolleri (her tablo ve indeks için ayrı bir
+yansıtma sorgusu) tamamen atlanır. Sürüm eskiyse ``GOCLER`` listesindeki
+bekleyen adımlar sırayla uygulanır ve her adımdan sonra sürüm damgalanır.
+
+Modellere yeni tablo, kolon veya indeks eklendiğinde ``GOCLER`` sonuna
+daha büyük sürümlü yeni bir adım eklenir; aksi halde sıcak açılışta
+değişiklik veritabanına hiç uygulanmaz. SQLite DDL ifadeleri her zaman
+transaction içinde çalışmadığı için adımlar tekrar çalıştırılabilir
+yazılmalıdır (``checkfirst``, ``IF NOT EXISTS``); yarıda kalan bir adım
+sonraki açılışta baştan denenir.
+
+Sürüm tablosundan önce oluşturulmuş veritabanları sürüm 0 sayılır. İlk
+adımlar eksik tabloları, FTS indekslerini, silme izleme trigger'larını ve
+mevcut tablolara sonradan eklenen indeksleri tamamladığı için bu
+veritabanları (ve eski SQLite yedekleri) güvenle yükseltilir.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Optional, Sequence, Union
+
+from sqlalchemy import Column, DateTime, Integer, Table, func, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import OperationalError
+
+from database.config import Base
+from models.exceptions import DatabaseError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sürüm satırının sabit anahtarı (tabloda yalnızca bu satır bulunur)
+SURUM_SATIRI = 1
+
+sema_surumu = Table(
+    "sema_surumu",
+    Base.metadata,
+    Column("id", Integer, primary_key=True),
+    Column("surum", Integer, nullable=False),
+    Column("guncelleme_zamani", DateTime, nullable=False, server_default=func.now(),
+           onupdate=func.now()),
+)
+
+
+@dataclass(frozen=True)
+class Goc:
+    """
+    Tek bir şema göç adımı.
+
+    Attributes:
+        surum (int): Adım uygulandıktan sonraki şema sürümü
+        aciklama (str): Adımın kısa açıklaması (loglarda görünür)
+        uygula (Callable[[Connection], None]): Adımı verilen bağlantıda uygulayan fonksiyon
+    """
+
+    surum: int
+    aciklama: str
+    uygula: Callable[[Connection], None]
+
+
+def indeksleri_olustur(connection: Connection, tablolar: Optional[Iterable[str]] = None) -> None:
+    """
+    Modellerde tanımlı ama veritabanında bulunmayan indeksleri oluştur.
+
+    ``create_all`` mevcut tablolara sonradan eklenen indeksleri oluşturmaz;
+    yeni performans indeksleri bu fonksiyonu çağıran bir göç adımıyla eklenir.
+
+    Args:
+        connection: SQLAlchemy Connection
+        tablolar: Yalnızca bu tabloların indeksleri; None ise tüm tablolar
+    """
+    secili = set(tablolar) if tablolar is not None else None
+    for table in Base.metadata.sorted_tables:
+        if secili is not None and table.name not in secili:
+            continue
+        for index in table.indexes:
+            index.create(bind=connection, checkfirst=True)
+
+
+def _temel_sema(connection: Connection) -> None:
+    """Eksik tabloları oluştur (FTS ve silme izleme ``after_create`` ile kurulur)"""
+    Base.metadata.create_all(bind=connection)
+
+
+# Sırası önemlidir: yeni adımlar yalnızca sona, daha büyük sürümle eklenir
+GOCLER: Sequence[Goc] = (
+    Goc(1, "Temel şema, FTS indeksleri ve silme izleme trigger'ları", _temel_sema),
+    Goc(2, "Mevcut tablolara eklenen performans indeksleri", indeksleri_olustur),
+)
+
+# Bu kodun beklediği şema sürümü
+GUNCEL_SURUM = GOCLER[-1].surum
+
+
+def surum_oku(connection: Connection) -> int:
+    """
+    Veritabanının şema sürümünü oku (tek satırlık sorgu).
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+
+    Returns:
+        int: Şema sürümü; sürüm tablosu yoksa veya boşsa 0
+    """
+    try:
+        surum = connection.execute(
+            select(sema_surumu.c.surum).where(sema_surumu.c.id == SURUM_SATIRI)
+        ).scalar()
+    except OperationalError as e:
+        if "no such table" not in str(e):
+            raise
+        return 0
+    return int(surum or 0)
+
+
+def surum_yaz(connection: Connection, surum: int) -> None:
+    """
+    Şema sürümünü damgala.
+
+    Args:
+        connection: SQLAlchemy Connection veya Session
+        surum: Yeni şema sürümü
+    """
+    guncellenen = connection.execute(
+        sema_surumu.update()
+        .where(sema_surumu.c.id == SURUM_SATIRI)
+        .values(surum=surum)
+    ).rowcount
+    if not guncellenen:
+        connection.execute(sema_surumu.insert().values(id=SURUM_SATIRI, surum=surum))
+
+
+def _gocleri_uygula(connection: Connection, gocler: Sequence[Goc]) -> List[int]:
+    """Bekleyen göç adımlarını sırayla uygula ve her adımdan sonra sürümü damgala"""
+    mevcut = surum_oku(connection)
+    hedef = gocler[-1].surum if gocler else 0
+    if mevcut == hedef:
+        return []
+    if mevcut > hedef:
+        logger.warning(
+            f"Database schema version {mevcut} is newer than application version {hedef}; "
+            f"skipping migrations"
+        )
+        return []
+
+    if mevcut == 0:
+        # Sürüm tablosu yoksa ilk damgadan önce oluşturulmalı
+        sema_surumu.create(bind=connection, checkfirst=True)
+
+    uygulanan = []
+    for goc in gocler:
+        if goc.surum <= mevcut:
+            continue
+        try:
+            goc.uygula(connection)
+            surum_yaz(connection, goc.surum)
+        except Exception as e:
+            raise DatabaseError(
+                f"Şema göçü uygulanamadı (sürüm {goc.surum}): {goc.aciklama}",
+                code="DB_001",
+                details={"surum": goc.surum, "mevcut_surum": mevcut, "hata": str(e)}
+            ) from e
+        logger.info(f"Applied schema migration {goc.surum}: {goc.aciklama}")
+        uygulanan.append(goc.surum)
+    return uygulanan
+
+
+def guncelle(bind: Union[Engine, Connection], gocler: Optional[Sequence[Goc]] = None) -> List[int]:
+    """
+    Veritabanını güncel şema sürümüne getir.
+
+    Sıcak açılışta yalnızca sürüm satırı okunur. Engine verilirse adımlar
+    tek bir bağlantıda çalıştırılıp commit edilir; Connection verilirse
+    çağıranın transaction'ı kullanılır.
+
+    Args:
+        bind: SQLAlchemy Engine veya Connection
+        gocler: Göç adımları (artan sürüm sırasıyla); None ise ``GOCLER``
+
+    Returns:
+        List[int]: Uygulanan adımların sürümleri (sıcak açılışta boş)
+
+    Raises:
+        DatabaseError: Göç adımlarının sırası bozuksa veya bir adım başarısız olursa
+    """
+    gocler = GOCLER if gocler is None else gocler
+    surumler = [goc.surum for goc in gocler]
+    if any(onceki >= sonraki for onceki, sonraki in zip(surumler, surumler[1:])):
+        raise DatabaseError(
+            "Şema göç adımları artan sürüm sırasında değil",
+            code="DB_001",
+            details={"surumler": surumler}
+        )
+
+    # Modeller Base.metadata'ya kaydolsun
+    import models.base  # noqa: F401
+
+    if isinstance(bind, Engine):
+        with bind.begin() as connection:
+            return _gocleri_uygula(connection, gocler)
+    return _gocleri_uygula(bind, gocler)
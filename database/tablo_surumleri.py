@@ -0,0 +1,109 @@
+"""
+Tablo bazında değişiklik sayaçları
+
+Her tablo için süreç içinde artan bir sürüm numarası tutulur. Session
+üzerinden yapılan her yazma (ORM flush veya Session ile çalıştırılan Core
+INSERT/UPDATE/DELETE) ilgili tabloların sürümünü artırır; commit ve
+rollback sonrasında sürüm bir kez daha artırılır ki flush ile commit
+arasında okunan veri de eski sayılsın (bkz. ``DashboardController``).
+
+Bir ekran gösterildiği andaki sürümü ``surum(tablolar)`` ile saklar, tekrar
+gösterilirken aynı değeri alırsa verisi hâlâ günceldir. Session dışından
+yapılan toplu yazmalar (ör. yedekten geri yükleme) ``hepsini_artir`` ile
+bildirilir.
+"""
+
+import threading
+from typing import Any, Dict, Iterable, Optional, Set
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+_surumler: Dict[str, int] = {}
+# Tüm tabloları etkileyen değişiklikler (ör. geri yükleme)
+_genel_surum = 0
+_lock = threading.Lock()
+
+
+def surum(tablolar: Optional[Iterable[str]] = None) -> int:
+    """
+    Tabloların toplam değişiklik sürümünü döndür.
+
+    Değer yalnızca artar; iki okuma arasında tablolardan biri değiştiyse
+    farklı bir değer döner.
+
+    Args:
+        tablolar: Tablo adları; None ise tüm tablolar
+
+    Returns:
+        int: Sürüm değeri
+    """
+    with _lock:
+        if tablolar is None:
+            return _genel_surum + sum(_surumler.values())
+        return _genel_surum + sum(_surumler.get(tablo, 0) for tablo in tablolar)
+
+
+def artir(tablolar: Iterable[str]) -> None:
+    """
+    Tabloların sürümünü artır.
+
+    Args:
+        tablolar: Değişen tablo adları
+    """
+    with _lock:
+        for tablo in tablolar:
+            _surumler[tablo] = _surumler.get(tablo, 0) + 1
+
+
+def hepsini_artir() -> None:
+    """Tüm tabloları değişmiş say (Session dışı toplu yazmalar için)"""
+    global _genel_surum
+    with _lock:
+        _genel_surum += 1
+
+
+def _degisen_tablolar(session: Session) -> Set[str]:
+    """Flush edilen kayıtların tabloları"""
+    tablolar = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        tablo = getattr(inspect(obj).mapper.local_table, "name", None)
+        if tablo:
+            tablolar.add(tablo)
+    return tablolar
+
+
+def _bekleyenlere_ekle(session: Session, tablolar: Set[str]) -> None:
+    """Commit/rollback'te tekrar artırılacak tabloları kaydet"""
+    session.info.setdefault("degisen_tablolar", set()).update(tablolar)
+    artir(tablolar)
+
+
+@event.listens_for(Session, "after_flush")
+def _on_after_flush(session: Session, flush_context: Any) -> None:
+    """Yazılan kayıtların tablolarının sürümünü artır"""
+    tablolar = _degisen_tablolar(session)
+    if tablolar:
+        _bekleyenlere_ekle(session, tablolar)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _on_do_orm_execute(orm_execute_state: Any) -> None:
+    """Session üzerinden çalışan toplu INSERT/UPDATE/DELETE ifadelerini de yakala"""
+    if orm_execute_state.is_select:
+        return
+    tablo = getattr(getattr(orm_execute_state.statement, "table", None), "name", None)
+    if tablo:
+        _bekleyenlere_ekle(orm_execute_state.session, {tablo})
+
+
+@event.listens_for(Session, "after_commit")
+def _on_after_commit(session: Session) -> None:
+    """Flush ile commit arasında okunan veriyi de eski say"""
+    artir(session.info.pop("degisen_tablolar", ()))
+
+
+@event.listens_for(Session, "after_rollback")
+def _on_after_rollback(session: Session) -> None:
+    """Geri alınan değişiklikler sonrası okunan veriyi de eski say"""
+    artir(session.info.pop("degisen_tablolar", ()))
@@ -0,0 +1,256 @@
+"""
+Unit of work - UI aksiyonu başına paylaşılan veritabanı oturumu
+
+Bir ekran yüklemesi (ör. dashboard yenileme) sırasında çağrılan tüm
+controller metodları, kendi ``get_db()`` / ``get_db_session()`` çağrılarında
+thread'e bağlı tek bir oturumu paylaşır. Böylece identity map ve lazy load'lar
+aksiyon boyunca geçerli kalır; değişiklikler aksiyon sonunda bir kez commit
+edilir veya hata durumunda bir kez geri alınır.
+
+Aksiyon içindeki bir controller ``rollback()`` çağırırsa (ör. ``except``
+bloğunda) o ana kadar flush edilen tüm yazmalar geri alınır ve unit of work
+başarısız sayılır. Hata yakalanıp aksiyon sürdürülse bile sonraki yazmalar
+commit edilmez; kısmi yazma yerine aksiyon sonunda ``DatabaseError``
+fırlatılır.
+
+Örnek:
+    >>> from database.unit_of_work import unit_of_work, transactional
+    >>> with unit_of_work("dashboard.refresh"):
+    ...     hesaplar = HesapController().get_aktif_hesaplar()
+    ...     gelirler = FinansIslemController().get_gelirler()
+    >>>
+    >>> @transactional("finans.load_data")
+    ... def load_data(self) -> None:
+    ...     ...
+
+Oturum sayaçları ``session_metrics`` üzerinden okunabilir.
+"""
+
+import threading
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional, TypeVar, cast
+
+from sqlalchemy.orm import Session
+
+import database.config as db_config
+from models.exceptions import DatabaseError
+from utils.logger import get_logger
+
+F = TypeVar('F', bound=Callable[..., Any])
+
+logger = get_logger("UnitOfWork")
+
+# Unit of work dışında açılan oturumların sayıldığı aksiyon adı
+NO_ACTION = "(unit of work dışı)"
+
+
+class SessionMetrics:
+    """UI aksiyonu başına oturum sayaçları (thread-safe).
+
+    Her aksiyon için tutulan sayaçlar:
+        - runs: Aksiyonun kaç kez çalıştığı
+        - sessions_opened: Açılan gerçek oturum sayısı
+        - session_requests: get_db() çağrı sayısı
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._actions: Dict[str, Dict[str, int]] = {}
+
+    def record(self, action: str, runs: int = 0, sessions_opened: int = 0,
+               session_requests: int = 0) -> None:
+        """Aksiyon sayaçlarını artır"""
+        with self._lock:
+            counters = self._actions.setdefault(
+                action, {"runs": 0, "sessions_opened": 0, "session_requests": 0}
+            )
+            counters["runs"] += runs
+            counters["sessions_opened"] += sessions_opened
+            counters["session_requests"] += session_requests
+
+    def snapshot(self) -> Dict[str, Dict[str, int]]:
+        """Sayaçların kopyasını döndür"""
+        with self._lock:
+            return {action: dict(counters) for action, counters in self._actions.items()}
+
+    def reset(self) -> None:
+        """Tüm sayaçları sıfırla"""
+        with self._lock:
+            self._actions.clear()
+
+
+session_metrics = SessionMetrics()
+
+
+class UnitOfWork:
+    """Bir UI aksiyonu boyunca paylaşılan oturumu yöneten nesne.
+
+    Oturum ilk ihtiyaç anında açılır; hiç sorgu yapılmayan aksiyonlar
+    veritabanı bağlantısı almaz.
+
+    Attributes:
+        action (str): Aksiyon adı (metrikler ve loglar için)
+        session_requests (int): Aksiyon içindeki get_db() çağrı sayısı
+        sessions_opened (int): Aksiyon içinde açılan oturum sayısı (0 veya 1)
+    """
+
+    def __init__(self, action: str) -> None:
+        self.action = action
+        self.session_requests = 0
+        self.sessions_opened = 0
+        self._session: Optional[Session] = None
+        self._depth = 0
+
+    @property
+    def session(self) -> Session:
+        """Aksiyonun paylaşılan oturumu"""
+        return db_config.get_db()
+
+    def _acquire(self) -> Session:
+        """Paylaşılan oturumu döndür, gerekirse aç"""
+        self.session_requests += 1
+        if self._session is None:
+            self._session = db_config.SessionLocal(expire_on_commit=False)
+            self._session.uow_depth = 1
+            self.sessions_opened += 1
+        return self._session
+
+    def _finish(self, failed: bool) -> None:
+        """Aksiyon sonunda tek commit/rollback ve close
+
+        Raises:
+            DatabaseError: Aksiyon içinde geri alma yapıldıktan sonra commit
+                edilmeyi bekleyen yazmalar varsa (kısmi yazma engellenir)
+        """
+        session = self._session
+        self._session = None
+        if session is None:
+            return
+
+        session.uow_depth = 0
+        bekleyen = (getattr(session, "commit_requested", False)
+                    or session.new or session.dirty or session.deleted)
+        try:
+            if failed:
+                session.rollback()
+            elif getattr(session, "rollback_requested", False):
+                session.rollback()
+                if bekleyen:
+                    logger.warning(f"Unit of work '{self.action}' discarded writes after an inner rollback")
+                    raise DatabaseError(
+                        "İşlem sırasında geri alma yapıldığı için değişiklikler kaydedilmedi",
+                        code="DB_001",
+                        details={"action": self.action}
+                    )
+            elif bekleyen:
+                session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+
+_state = threading.local()
+
+
+def _stack() -> List[UnitOfWork]:
+    """Bu thread'in aktif unit of work yığını"""
+    stack = getattr(_state, "stack", None)
+    if stack is None:
+        stack = []
+        _state.stack = stack
+    return cast(List[UnitOfWork], stack)
+
+
+def current_unit_of_work() -> Optional[UnitOfWork]:
+    """Bu thread'de aktif unit of work'ü döndür (yoksa None)"""
+    stack = _stack()
+    return stack[-1] if stack else None
+
+
+def acquire_session() -> Session:
+    """Aktif unit of work oturumunu veya yeni bir oturum döndür.
+
+    ``database.config.get_db()`` tarafından kullanılır.
+    """
+    uow = current_unit_of_work()
+    if uow is not None:
+        return uow._acquire()
+
+    session_metrics.record(NO_ACTION, sessions_opened=1, session_requests=1)
+    return cast(Session, db_config.SessionLocal())
+
+
+@contextmanager
+def unit_of_work(action: str = "") -> Iterator[UnitOfWork]:
+    """UI aksiyonu için paylaşılan oturum aç.
+
+    İç içe kullanımda dıştaki unit of work'e katılır; commit/rollback yalnızca
+    en dıştaki blok bittiğinde yapılır.
+
+    Args:
+        action: Aksiyon adı (ör. "dashboard.refresh")
+
+    Yields:
+        UnitOfWork: Aktif unit of work (``.session`` ile oturuma erişilir)
+    """
+    stack = _stack()
+    if stack:
+        outer = stack[-1]
+        outer._depth += 1
+        try:
+            yield outer
+        finally:
+            outer._depth -= 1
+        return
+
+    uow = UnitOfWork(action or NO_ACTION)
+    uow._depth = 1
+    stack.append(uow)
+    failed = False
+    try:
+        yield uow
+    except BaseException:
+        failed = True
+        raise
+    finally:
+        stack.pop()
+        try:
+            uow._finish(failed)
+        finally:
+            session_metrics.record(
+                uow.action,
+                runs=1,
+                sessions_opened=uow.sessions_opened,
+                session_requests=uow.session_requests
+            )
+            logger.debug(
+                f"Unit of work '{uow.action}' tamamlandı: "
+                f"{uow.sessions_opened} oturum, {uow.session_requests} istek"
+            )
+
+
+def transactional(action: Optional[str] = None) -> Callable[[F], F]:
+    """Fonksiyonu bir unit of work içinde çalıştıran decorator.
+
+    Args:
+        action: Aksiyon adı. None ise fonksiyonun qualname'i kullanılır.
+
+    Example:
+        >>> @transactional("raporlar.load_bilanco")
+        ... def load_bilanco(self) -> None:
+        ...     ...
+    """
+    def decorator(func: F) -> F:
+        name = action or func.__qualname__
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with unit_of_work(name):
+                return func(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorator
@@ -4,38 +4,49 @@ Aidat Plus - Modern Lojman Yönetim Uygulaması
 Offline çalışan, Python tabanlı lojman aidat yönetim sistemi
 """
 
-import customtkinter as ctk
-from tkinter import messagebox
 import sys
 import os
 import logging
-from typing import Dict
+from typing import TYPE_CHECKING, Optional
 
 # Proje klasörünü Python path'e ekle
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Açılış ölçümü ağır import'lardan önce başlar (bkz. utils.startup_trace);
+# import süreleri yalnızca izleme açıksa ölçülür
+from utils.startup_trace import get_startup_tracer, get_startup_trace_settings, izleme_istendi
+startup_tracer = get_startup_tracer()
+startup_tracer.baslat(importlari_izle=izleme_istendi())
+
+import customtkinter as ctk
+from tkinter import messagebox
+
 # Configuration Manager'ı başlat
 from configuration import ConfigurationManager, ConfigKeys
 from utils.logger import AidatPlusLogger
 from ui.responsive import ResponsiveWindow
+from ui.panel_registry import PanelRegistry, PanelTanimi
+from utils.query_trace import get_query_tracer, get_query_trace_settings
+from models.exceptions import ConfigError
 
-config_mgr = ConfigurationManager.get_instance()
+if TYPE_CHECKING:
+    from controllers.otomatik_yedek import OtomatikYedekleyici
 
-# Logging ayarlarını uygula (UTF-8 support ile)
-logging_level = config_mgr.get(ConfigKeys.LOGGING_LEVEL, 'INFO')
-logger_instance = AidatPlusLogger(
-    name="AidatPlus",
-    log_level=getattr(logging, logging_level)
-)
-logger = logger_instance.logger
+with startup_tracer.asama("konfigurasyon"):
+    config_mgr = ConfigurationManager.get_instance()
+
+    # Logging ayarlarını uygula (UTF-8 support ile)
+    logging_level = config_mgr.get(ConfigKeys.LOGGING_LEVEL, 'INFO')
+    logger_instance = AidatPlusLogger(
+        name="AidatPlus",
+        log_level=getattr(logging, logging_level)
+    )
+    logger = logger_instance.logger
 
 logger.info("=== Aidat Plus başlatılıyor ===")
 logger.info(f"Environment: {config_mgr.get(ConfigKeys.APP_ENV)}")
 logger.info(f"Debug Mode: {config_mgr.get(ConfigKeys.APP_DEBUG)}")
 
-# Modelleri import et ki tablolar oluşturulsun
-from models.base import *
-
 # Uygulama renk şeması (Resmi kurum renkleri - Light tema için)
 # Dark mode CustomTkinter otomatik olarak uyarlanır
 COLORS = {
@@ -52,6 +63,41 @@ COLORS = {
     "error": "#DC3545"         # Kırmızı
 }
 
+# Ana sayfa dashboard'unun pencere açıldıktan ne kadar sonra kurulacağı
+DASHBOARD_YUKLEME_GECIKMESI_MS = 50
+
+# Modül panelleri: ilk açılışta oluşturulur, kapatılınca gizlenir.
+# Tablolar panelin gösterdiği veriyi belirler; yalnızca bunlar değiştiyse
+# tekrar açılışta panel verisi yenilenir (None: her değişiklikte).
+PANEL_TANIMLARI = (
+    PanelTanimi(
+        "Dashboard", "📊 Dashboard", "ui.dashboard_panel", "DashboardPanel", 1400, 900,
+        tablolar=("finans_islemleri", "hesaplar", "aidat_islemleri", "aidat_odemeleri", "sakinler", "daireler"),
+        yenileme_metodu="refresh_dashboard"
+    ),
+    PanelTanimi(
+        "Finans", "💰 Finans Yönetimi", "ui.finans_panel", "FinansPanel",
+        tablolar=("hesaplar", "finans_islemleri", "ana_kategoriler", "alt_kategoriler")
+    ),
+    PanelTanimi(
+        "Aidat", "💳 Aidat Yönetimi", "ui.aidat_panel", "AidatPanel",
+        tablolar=("aidat_islemleri", "aidat_odemeleri", "daireler", "sakinler", "hesaplar", "finans_islemleri")
+    ),
+    PanelTanimi(
+        "Sakin", "👥 Sakin Yönetimi", "ui.sakin_panel", "SakinPanel",
+        tablolar=("sakinler", "daireler", "bloklar", "lojmanlar")
+    ),
+    PanelTanimi(
+        "Lojman", "🏠 Lojman Yönetimi", "ui.lojman_panel", "LojmanPanel",
+        tablolar=("lojmanlar", "bloklar", "daireler", "sakinler")
+    ),
+    PanelTanimi("Raporlar", "📊 Raporlar", "ui.raporlar_panel", "RaporlarPanel", 1200, 650),
+    PanelTanimi(
+        "Ayarlar", "⚙️ Ayarlar", "ui.ayarlar_panel", "AyarlarPanel",
+        tablolar=("ana_kategoriler", "alt_kategoriler")
+    ),
+)
+
 class AidatPlusApp:
     """Ana uygulama sınıfı"""
 
@@ -104,8 +150,10 @@ class AidatPlusApp:
         except Exception as e:
             logger.debug(f"Icon not found: {e}")
 
-        # Panel referansları
-        self.panels: Dict[str, ctk.CTkToplevel] = {}
+        # Modül panelleri (tembel oluşturulur, kapatılınca gizlenir)
+        self.panel_registry = PanelRegistry(self.root, COLORS, self.center_window)
+        for tanim in PANEL_TANIMLARI:
+            self.panel_registry.kaydet(tanim)
 
         self.setup_ui()
 
@@ -149,8 +197,9 @@ class AidatPlusApp:
         self.dashboard_container = ctk.CTkFrame(content_frame, fg_color=COLORS["surface"])
         self.dashboard_container.pack(fill="both", expand=True, padx=20, pady=20)
         
-        # Dashboard'u yükle
-        self.load_dashboard_home()
+        # Dashboard'u ana pencere gösterildikten sonra yükle (grafik
+        # kütüphaneleri ve ilk sorgular açılışı bekletmesin)
+        self.root.after(DASHBOARD_YUKLEME_GECIKMESI_MS, self.load_dashboard_home)
 
     def create_navigation_buttons(self, parent: ctk.CTkFrame) -> None:
         """Navigasyon butonlarını oluştur"""
@@ -206,371 +255,31 @@ class AidatPlusApp:
 
     def open_dashboard_panel(self) -> None:
         """Dashboard panelini aç"""
-        from ui.dashboard_panel import DashboardPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Dashboard" in self.panels:
-            panel_window = self.panels["Dashboard"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 📊 Dashboard")
-        self.center_window(panel_window, 1400, 900)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Dashboard"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Dashboard", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="📊 Dashboard",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Dashboard panelini oluştur
-        DashboardPanel(panel_window, COLORS)
+        self.panel_registry.goster("Dashboard")
 
     def open_finans_panel(self) -> None:
         """Finans panelini aç"""
-        from ui.finans_panel import FinansPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Finans" in self.panels:
-            panel_window = self.panels["Finans"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 💰 Finans Yönetimi")
-        self.center_window(panel_window, 1200, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Finans"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Finans", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="💰 Finans Yönetimi",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Finans panelini oluştur
-        FinansPanel(panel_window, COLORS)
+        self.panel_registry.goster("Finans")
 
     def open_aidat_panel(self) -> None:
         """Aidat panelini aç"""
-        from ui.aidat_panel import AidatPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Aidat" in self.panels:
-            panel_window = self.panels["Aidat"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 💳 Aidat Yönetimi")
-        self.center_window(panel_window, 1200, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Aidat"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Aidat", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="💳 Aidat Yönetimi",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Aidat panelini oluştur
-        AidatPanel(panel_window, COLORS)
+        self.panel_registry.goster("Aidat")
 
     def open_sakin_panel(self) -> None:
         """Sakin panelini aç"""
-        from ui.sakin_panel import SakinPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Sakin" in self.panels:
-            panel_window = self.panels["Sakin"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 👥 Sakin Yönetimi")
-        self.center_window(panel_window, 1200, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Sakin"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Sakin", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="👥 Sakin Yönetimi",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Sakin panelini oluştur
-        SakinPanel(panel_window, COLORS)
+        self.panel_registry.goster("Sakin")
 
     def open_lojman_panel(self) -> None:
         """Lojman panelini aç"""
-        from ui.lojman_panel import LojmanPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Lojman" in self.panels:
-            panel_window = self.panels["Lojman"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 🏠 Lojman Yönetimi")
-        self.center_window(panel_window, 1200, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Lojman"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Lojman", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="🏠 Lojman Yönetimi",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Lojman panelini oluştur
-        LojmanPanel(panel_window, COLORS)
+        self.panel_registry.goster("Lojman")
 
     def open_raporlar_panel(self) -> None:
         """Raporlar panelini aç"""
-        from ui.raporlar_panel import RaporlarPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Raporlar" in self.panels:
-            panel_window = self.panels["Raporlar"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - 📊 Raporlar")
-        self.center_window(panel_window, 1200, 650)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Raporlar"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Raporlar", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="📊 Raporlar",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Raporlar panelini oluştur
-        RaporlarPanel(panel_window, COLORS)
+        self.panel_registry.goster("Raporlar")
 
     def open_ayarlar_panel(self) -> None:
         """Ayarlar panelini aç"""
-        from ui.ayarlar_panel import AyarlarPanel
-
-        # Eğer panel zaten açıksa, onu öne getir
-        if "Ayarlar" in self.panels:
-            panel_window = self.panels["Ayarlar"]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - ⚙️ Ayarlar")
-        self.center_window(panel_window, 1200, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels["Ayarlar"] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel("Ayarlar", panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text="⚙️ Ayarlar",
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Ayarlar panelini oluştur
-        AyarlarPanel(panel_window, COLORS)
-
-    def open_panel(self, panel_name: str, title: str) -> None:
-        """Yeni panel penceresi aç"""
-        # Eğer panel zaten açıksa, onu öne getir
-        if panel_name in self.panels:
-            panel_window = self.panels[panel_name]
-            if panel_window.winfo_exists():
-                panel_window.lift()
-                panel_window.focus_force()
-                return
-
-        # Yeni panel penceresi oluştur
-        panel_window = ctk.CTkToplevel(self.root)
-        panel_window.title(f"Aidat Plus - {title}")
-        self.center_window(panel_window, 1000, 700)
-
-        # Ana pencerenin önünde kalması için
-        panel_window.transient(self.root)
-        panel_window.lift()
-        panel_window.focus_force()
-
-        # Panel referansını sakla
-        self.panels[panel_name] = panel_window
-
-        # Panel kapatıldığında referansı temizle
-        panel_window.protocol("WM_DELETE_WINDOW",
-            lambda: self.close_panel(panel_name, panel_window))
-
-        # Panel başlığı
-        header_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["primary"], height=60)
-        header_frame.pack(fill="x", padx=0, pady=0)
-        header_frame.pack_propagate(False)
-
-        title_label = ctk.CTkLabel(
-            header_frame,
-            text=title,
-            font=ctk.CTkFont(size=20, weight="bold"),
-            text_color=COLORS["surface"]
-        )
-        title_label.pack(pady=15)
-
-        # Ana panel içeriği
-        content_frame = ctk.CTkFrame(panel_window, fg_color=COLORS["background"])
-        content_frame.pack(fill="both", expand=True, padx=20, pady=20)
-
-        # Geçici içerik
-        temp_label = ctk.CTkLabel(
-            content_frame,
-            text=f"{panel_name} paneli yakında eklenecek...",
-            font=ctk.CTkFont(size=16),
-            text_color=COLORS["text_secondary"]
-        )
-        temp_label.pack(expand=True)
+        self.panel_registry.goster("Ayarlar")
 
     def center_window(self, window: ctk.CTkToplevel, width: int, height: int) -> None:
         """
@@ -587,41 +296,152 @@ class AidatPlusApp:
             window, width, height, offset_y=0
         )
 
-    def close_panel(self, panel_name: str, window: ctk.CTkToplevel) -> None:
-        """Paneli kapat"""
-        if panel_name in self.panels:
-            del self.panels[panel_name]
-        window.destroy()
-
     def run(self) -> None:
         """Uygulamayı çalıştır"""
         self.root.mainloop()
 
 
+def veritabanini_hazirla() -> None:
+    """Modelleri yükle, tabloları oluştur ve aylık özeti hazırla (arayüzsüz açılış adımları)"""
+    # Veritabanı tablolarını kontrol et ve oluştur
+    from database.config import init_database
+
+    with startup_tracer.asama("modeller"):
+        import models.base  # noqa: F401 - modeller Base.metadata'ya kaydolsun
+    with startup_tracer.asama("mapper_yapilandirma"):
+        from sqlalchemy.orm import configure_mappers
+        configure_mappers()
+
+    # Engine profilini uygula ve tabloları oluştur (varsa dokunma, yoksa oluştur)
+    with startup_tracer.asama("veritabani"):
+        init_database()
+    logger.info("Veritabanı tabloları hazırlandı")
+
+    # Aylık finans özeti eski veritabanlarında boşsa bir kez oluştur
+    with startup_tracer.asama("finans_ozeti"):
+        from controllers.finans_ozet_controller import FinansOzetController
+        if FinansOzetController().ensure_built():
+            logger.info("Aylık finans özeti oluşturuldu")
+
+
+def baslangic_olcumunu_bitir() -> None:
+    """İlk pencere çizilince açılış ölçümünü kapat; etkinse raporu yaz ve bütçeleri denetle"""
+    startup_tracer.isaretle("ilk_pencere")
+    startup_tracer.durdur()
+    try:
+        ayarlar = get_startup_trace_settings(config_mgr)
+        if not ayarlar.etkin:
+            return
+        rapor_yolu = startup_tracer.rapor_yaz(ayarlar.rapor_yolu, ayarlar.butceler_ms)
+        sureler = startup_tracer.sureler()
+        logger.info(
+            f"Startup trace written to {rapor_yolu}: first window after {sureler['ilk_pencere']:.0f} ms"
+        )
+        for asim in startup_tracer.butce_asimlari(ayarlar.butceler_ms):
+            logger.warning(
+                f"Startup budget exceeded: {asim.ad} took {asim.sure_ms:.0f} ms (budget {asim.butce_ms:.0f} ms)"
+            )
+    except Exception as e:
+        logger.warning(f"Startup trace report failed: {e}")
+
+
+def sorgu_izlemeyi_baslat() -> None:
+    """Ayarlarda açıksa SQL ifadelerinin ölçümünü başlat (bkz. ``utils.query_trace``)"""
+    try:
+        ayarlar = get_query_trace_settings(config_mgr)
+    except Exception as e:
+        logger.warning(f"Query trace disabled: {e}")
+        return
+    if ayarlar.etkin:
+        get_query_tracer().baslat(ayarlar.yavas_sorgu_ms, ayarlar.tekrar_esigi)
+        logger.info(
+            f"Query trace enabled (slow query {ayarlar.yavas_sorgu_ms:.0f} ms, "
+            f"N+1 threshold {ayarlar.tekrar_esigi})"
+        )
+
+
+def sorgu_izlemeyi_bitir() -> None:
+    """Sorgu ölçümünü kapat; özeti loga ve JSON rapora yaz"""
+    tracer = get_query_tracer()
+    if not tracer.etkin:
+        return
+    tracer.durdur()
+    try:
+        tracer.ozeti_logla()
+        rapor_yolu = tracer.rapor_yaz(get_query_trace_settings(config_mgr).rapor_yolu)
+        logger.info(f"Query trace written to {rapor_yolu}")
+    except Exception as e:
+        logger.warning(f"Query trace report failed: {e}")
+
+
+def otomatik_yedeklemeyi_baslat(app: "AidatPlusApp") -> Optional["OtomatikYedekleyici"]:
+    """Zamanlanmış otomatik yedeklemeyi başlat.
+
+    Otomatik yedekleme isteğe bağlı bir arka plan özelliğidir; ``backup``
+    ayarları geçersizse uygulama otomatik yedekleme olmadan açılır.
+
+    Args:
+        app: Ana uygulama (kullanıcı etkinliği pencereden izlenir)
+
+    Returns:
+        OtomatikYedekleyici: Başlatılan zamanlayıcı; ayarlar geçersizse None
+    """
+    from controllers.otomatik_yedek import OtomatikYedekleyici, get_backup_settings
+
+    try:
+        ayarlar = get_backup_settings(config_mgr)
+    except ConfigError as e:
+        logger.error(f"Automatic backup disabled, invalid backup settings: {e}")
+        return None
+
+    yedekleyici = OtomatikYedekleyici(ayarlar)
+    for olay in ("<KeyPress>", "<ButtonPress>"):
+        app.root.bind_all(olay, lambda _e: yedekleyici.etkinlik_bildir(), add="+")
+    yedekleyici.baslat()
+    return yedekleyici
+
+
 def main() -> None:
     """Ana fonksiyon
     
     1. Configuration Manager'ı başlatır
     2. Logging'i ayarlar
     3. Veritabanı tablolarını oluşturur
-    4. Uygulamayı çalıştırır
+    4. Otomatik yedekleme zamanlayıcısını başlatır
+    5. Uygulamayı çalıştırır
+    
+    Her adımın süresi açılış izleyicisiyle ölçülür (bkz. ``utils.startup_trace``).
+    Ayarlarda açıksa SQL ifadeleri sorgu izleyicisiyle ölçülür (bkz. ``utils.query_trace``).
     
     Raises:
         Exception: Kritik hata durumlarında
     """
     try:
-        logger.info("Veritabanı tabloları kontrol ediliyor...")
-        # Veritabanı tablolarını kontrol et ve oluştur
-        from database.config import Base, engine
+        sorgu_izlemeyi_baslat()
 
-        # Veritabanı tablolarını oluştur (varsa dokunma, yoksa oluştur)
-        Base.metadata.create_all(bind=engine)
-        logger.info("Veritabanı tabloları hazırlandı")
+        logger.info("Veritabanı tabloları kontrol ediliyor...")
+        veritabanini_hazirla()
 
         logger.info("Uygulama penceresi oluşturuluyor...")
-        app = AidatPlusApp()
+        with startup_tracer.asama("pencere"):
+            app = AidatPlusApp()
+
+        # Zamanlanmış otomatik yedekleme (arka plan thread'i, arayüz meşgulken bekler)
+        with startup_tracer.asama("otomatik_yedek"):
+            yedekleyici = otomatik_yedeklemeyi_baslat(app)
+
+        # Ana döngü ilk kez boşta kaldığında pencere çizilmiş olur
+        app.root.after_idle(baslangic_olcumunu_bitir)
+
         logger.info("Aidat Plus başarıyla başlatıldı")
         app.run()
+
+        # Süren otomatik yedeği bırak ve arka plan yükleme havuzunu kapat
+        if yedekleyici is not None:
+            yedekleyici.durdur()
+        from ui.background_loader import shutdown_executor
+        shutdown_executor()
+        sorgu_izlemeyi_bitir()
         
     except Exception as e:
         logger.critical(f"Uygulama başlatılırken kritik hata: {str(e)}", exc_info=True)
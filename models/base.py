@@ -378,6 +378,8 @@ class FinansIslem(Base):
         Index('idx_finans_islem_tarih_tur', 'tarih', 'tur'),  # Tarih + tür kombinasyonu
         Index('idx_finans_islem_hesap_tarih', 'hesap_id', 'tarih'),  # Hesap + tarih kombinasyonu
         Index('idx_finans_islem_tur_aktif', 'tur', 'aktif'),  # Tür + aktif filtresi
+        Index('idx_finans_islem_aktif_tarih', 'aktif', 'tarih'),  # Arama: aktif + tarih sıralaması (keyset)
+        Index('idx_finans_islem_aktif_tur_tarih', 'aktif', 'tur', 'tarih'),  # Arama: tür filtresi + tarih sıralaması
     )
 
     @property
@@ -398,6 +400,38 @@ class FinansIslem(Base):
     def __repr__(self) -> str:
         return f"<FinansIslem {self.tur} {self.tutar}>"
 
+class FinansAylikOzet(Base):
+    """Aylık finans özeti (rollup) modeli
+
+    finans_islemleri tablosundan türetilir ve FinansIslemController'ın
+    create/update/delete işlemlerinde aynı transaction içinde güncellenir.
+    Türetilmiş veri olduğu için foreign key tanımlanmaz; tablo her zaman
+    ``FinansOzetController.rebuild()`` ile yeniden oluşturulabilir.
+    """
+    __tablename__ = "finans_aylik_ozet"
+
+    id = Column(Integer, primary_key=True, index=True)
+    yil = Column(Integer, nullable=False)
+    ay = Column(Integer, nullable=False)
+    hesap_id = Column(Integer, nullable=True)
+    kategori_id = Column(Integer, nullable=True)  # alt_kategoriler.id
+    tur = Column(String(20), nullable=False)  # Gelir, Gider, Transfer
+    toplam_kurus = Column(Integer, nullable=False, default=0)
+    adet = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index('idx_finans_aylik_ozet_anahtar', 'yil', 'ay', 'hesap_id', 'kategori_id', 'tur', unique=True),
+        Index('idx_finans_aylik_ozet_tur_donem', 'tur', 'yil', 'ay'),
+    )
+
+    @property
+    def toplam(self) -> float:
+        """Toplam tutar (TL cinsinden)"""
+        return float(self.toplam_kurus / 100.0)
+
+    def __repr__(self) -> str:
+        return f"<FinansAylikOzet {self.yil}-{self.ay:02d} {self.tur} {self.toplam}>"
+
 # Eski Finans modelini kaldırıp yeni modele yönlendirelim
 class Finans(Base):
     """Eski finans hareketleri modeli - geriye uyumluluk için"""
@@ -472,3 +506,13 @@ class AltKategori(Base):
     def __repr__(self) -> str:
         return f"<AltKategori {self.name}>"
 
+
+
+# FTS5 arama indekslerini metadata'nın create_all/drop_all olaylarına bağla
+import database.fts  # noqa: E402,F401
+
+# Fark yedekleri için silme izleme (tombstone) tablosu ve trigger'ları
+import database.degisiklik_izleme  # noqa: E402,F401
+
+# Şema sürümü tablosu (bkz. database.sema_gocleri)
+import database.sema_gocleri  # noqa: E402,F401
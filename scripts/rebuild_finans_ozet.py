@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+finans_aylik_ozet rollup tablosunu doğrula veya yeniden oluştur.
+
+Rollup tablosu normalde FinansIslemController tarafından güncel tutulur. Bu
+komut, tablo eklenmeden önce oluşturulmuş veya dışarıdan değiştirilmiş
+veritabanları için kullanılır.
+
+Usage:
+    python scripts/rebuild_finans_ozet.py            # yeniden oluştur
+    python scripts/rebuild_finans_ozet.py --verify   # yalnızca doğrula (uyuşmazlıkta çıkış kodu 1)
+
+"""
+import argparse
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Aylık finans özeti tablosunu doğrula / yeniden oluştur")
+    parser.add_argument("--verify", action="store_true", help="Yeniden oluşturmadan yalnızca doğrula")
+    args = parser.parse_args()
+
+    from database.config import init_database
+    from controllers.finans_ozet_controller import FinansOzetController
+
+    init_database()
+    controller = FinansOzetController()
+
+    if args.verify:
+        farklar = controller.verify()
+        if not farklar:
+            print("Aylık finans özeti tutarlı")
+            return 0
+        print(f"Aylık finans özetinde {len(farklar)} uyuşmayan satır bulundu:")
+        for fark in farklar:
+            print(f"  {fark['anahtar']}: beklenen={fark['beklenen']} mevcut={fark['mevcut']}")
+        return 1
+
+    adet = controller.rebuild()
+    print(f"Aylık finans özeti yeniden oluşturuldu ({adet} satır)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
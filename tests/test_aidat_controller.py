@@ -1,6 +1,9 @@
+import pytest
 from datetime import datetime
 from controllers.aidat_controller import AidatIslemController
 from controllers.sakin_controller import SakinController
+from models.base import Lojman, Blok, Daire, AidatIslem, AidatOdeme
+from models.exceptions import ValidationError
 
 
 def test_create_aidat_islem(db_session, sample_lojer_and_daire):
@@ -27,3 +30,56 @@ def test_create_aidat_islem(db_session, sample_lojer_and_daire):
     assert islem.id is not None
     res = aidat_controller.get_by_daire(daire.id, db=session)
     assert len(res) >= 1
+
+
+def test_generate_month_bulk_and_idempotent(db_session, sample_lojer_and_daire):
+    session = sample_lojer_and_daire['db']
+    lojman = sample_lojer_and_daire['lojman']
+    blok = sample_lojer_and_daire['blok']
+    ilk_daire = sample_lojer_and_daire['daire']
+    ilk_daire.guncel_aidat = 500.0
+    ilk_daire.katki_payi = 50.0
+
+    for no, aidat in [('102', 400.0), ('103', 0.0)]:
+        session.add(Daire(daire_no=no, blok_id=blok.id, kat=1, guncel_aidat=aidat, katki_payi=0.0))
+    session.add(Daire(daire_no='104', blok_id=blok.id, kat=1, guncel_aidat=300.0, aktif=False))
+
+    diger_lojman = Lojman(ad='Diger Lojman', adres='Adres')
+    session.add(diger_lojman)
+    session.flush()
+    diger_blok = Blok(ad='B', kat_sayisi=2, lojman_id=diger_lojman.id)
+    session.add(diger_blok)
+    session.flush()
+    session.add(Daire(daire_no='201', blok_id=diger_blok.id, kat=2, guncel_aidat=250.0))
+    session.commit()
+
+    controller = AidatIslemController()
+    sonuc = controller.generate_month(2025, 3, lojman_id=lojman.id,
+                                      template={"su": 10.0}, db=session)
+    # 101: 500+50+10, 102: 400+10, 103: 0+10; pasif 104 ve diğer lojman hariç
+    assert sonuc == {"olusturulan": 3, "atlanan_mevcut": 0, "atlanan_sifir": 0,
+                     "toplam_tutar": 980.0}
+
+    islemler = session.query(AidatIslem).filter_by(yil=2025, ay=3).all()
+    assert len(islemler) == 3
+    ilk = next(i for i in islemler if i.daire_id == ilk_daire.id)
+    assert (ilk.aidat_tutari, ilk.katki_payi, ilk.su, ilk.toplam_tutar) == (500.0, 50.0, 10.0, 560.0)
+    assert ilk.son_odeme_tarihi == datetime(2025, 3, 16)
+    assert len(ilk.odemeler) == 1
+    assert ilk.odemeler[0].tutar == 560.0 and ilk.odemeler[0].odendi is False
+
+    # Tekrar çalıştırma: mevcut aidatlar atlanır, yalnızca yeni kapsam eklenir
+    tekrar = controller.generate_month(2025, 3, db=session)
+    assert tekrar["olusturulan"] == 1 and tekrar["atlanan_mevcut"] == 3
+    assert session.query(AidatIslem).filter_by(yil=2025, ay=3).count() == 4
+    assert session.query(AidatOdeme).count() == 4
+
+
+def test_generate_month_rejects_invalid_input(db_session):
+    controller = AidatIslemController()
+    with pytest.raises(ValidationError):
+        controller.generate_month(2025, 13, db=db_session)
+    with pytest.raises(ValidationError):
+        controller.generate_month(2025, 2, template={"son_odeme_gunu": 30}, db=db_session)
+    with pytest.raises(ValidationError):
+        controller.generate_month(2025, 2, template={"elektrik": -5}, db=db_session)
@@ -0,0 +1,81 @@
+import pytest
+from datetime import datetime
+from sqlalchemy import insert
+
+from controllers.arama_controller import AramaController
+from controllers.finans_islem_controller import FinansIslemController
+from controllers.hesap_controller import HesapController
+from controllers.sakin_controller import SakinController
+from database.fts import fts_sorgusu, turkce_katla
+from models.base import AidatIslem, Sakin
+from models.exceptions import ValidationError
+
+
+def test_turkce_katla_and_query_builder():
+    assert turkce_katla("ŞAHİN Yıldız IŞIK") == "sahin yildiz isik"
+    assert turkce_katla(None) == ""
+    assert fts_sorgusu('Ali "YILDIZ" *') == '"ali"* AND "yildiz"*'
+    assert fts_sorgusu("  -- ") is None
+
+
+def test_search_ranks_and_follows_writes(db_session, sample_lojer_and_daire):
+    session = db_session
+    daire = sample_lojer_and_daire['daire']
+    sakin_ctrl = SakinController()
+    arama = AramaController()
+
+    yildiz = sakin_ctrl.create({"ad_soyad": "AHMET YILDIZ", "rutbe_unvan": "Yüzbaşı",
+                                "daire_id": daire.id, "giris_tarihi": datetime(2024, 1, 1)}, db=session)
+    session.add_all([
+        Sakin(ad_soyad="Mehmet Kaya", notlar="Yıldız sokağına taşındı"),
+        Sakin(ad_soyad="İsmail Işık", telefon="05321234567"),
+    ])
+    session.flush()
+
+    hesap = HesapController().create({"ad": "FTS1", "tur": "Banka", "bakiye": 100.0}, db=session)
+    islem = FinansIslemController().create({"tur": "Gider", "tutar": 10.0, "hesap_id": hesap.id,
+                                            "tarih": datetime(2024, 2, 1),
+                                            "aciklama": "Yıldız Elektrik faturası"}, db=session)
+    # Core insert (toplu aidat üretimi gibi) trigger ile indekslenir
+    session.execute(insert(AidatIslem.__table__), [{
+        "daire_id": daire.id, "yil": 2024, "ay": 3, "aidat_tutari": 1.0, "toplam_tutar": 1.0,
+        "son_odeme_tarihi": datetime(2024, 3, 15), "aciklama": "Mart aidatı - yıldız blok", "aktif": True,
+    }])
+
+    sonuclar = arama.search("yildiz", db=session)
+    assert [(s["kaynak"], s["baslik"]) for s in sonuclar][0] == ("sakin", "AHMET YILDIZ")
+    assert {s["kaynak"] for s in sonuclar} == {"sakin", "finans_islem", "aidat_islem"}
+    assert len(sonuclar) == 4
+    assert [s["skor"] for s in sonuclar] == sorted(s["skor"] for s in sonuclar)
+
+    assert [s["baslik"] for s in arama.search("ismail isik", kaynaklar=["sakin"], db=session)] == ["İsmail Işık"]
+    assert len(arama.search("0532", db=session)) == 1
+    assert arama.search("yüzbaşı ahm", db=session)[0]["id"] == yildiz.id
+
+    # Güncelleme ve silme indeksi günceller
+    sakin_ctrl.update(yildiz.id, {"ad_soyad": "Ahmet Demir"}, db=session)
+    assert [s["kaynak"] for s in arama.search("yildiz", kaynaklar=["sakin"], db=session)] == ["sakin"]
+    FinansIslemController().delete(islem.id, db=session)
+    assert arama.search("elektrik", db=session) == []
+
+    assert arama.rebuild(db=session) == {"sakin_fts": 3, "finans_islem_fts": 0, "aidat_islem_fts": 1}
+    assert len(arama.search("yildiz", db=session)) == 2
+
+
+def test_paginated_resident_search_uses_turkish_folding(db_session):
+    sakin_ctrl = SakinController()
+    db_session.add_all([Sakin(ad_soyad=ad) for ad in ["ŞÜKRÜ ÇELİK", "Şükrü Yılmaz", "Ali Çelikkol"]])
+    db_session.flush()
+
+    sonuc = sakin_ctrl.search_sakinler_paginated("celik", db=db_session)
+    assert [s.ad_soyad for s in sonuc.items] == ["Ali Çelikkol", "ŞÜKRÜ ÇELİK"]
+    assert sakin_ctrl.search_sakinler_paginated("sukru yil", db=db_session).total_count == 1
+
+
+def test_search_validates_arguments(db_session):
+    arama = AramaController()
+    with pytest.raises(ValidationError):
+        arama.search("ali", kaynaklar=["daire"], db=db_session)
+    with pytest.raises(ValidationError):
+        arama.search("ali", limit=0, db=db_session)
+    assert arama.search("   ", db=db_session) == []
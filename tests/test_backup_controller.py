@@ -5,6 +5,7 @@ from pathlib import Path
 from controllers.backup_controller import BackupController
 from models.base import Lojman, Blok, Daire, Sakin, Hesap
 import pandas as pd
+import pytest
 
 
 def test_backup_excel_and_restore(sample_lojer_and_daire, db_session, tmp_path, monkeypatch):
@@ -117,3 +118,344 @@ def test_backup_database_file(monkeypatch, tmp_path):
     finally:
         if proj_db.exists():
             proj_db.unlink()
+
+
+def test_backup_excel_streams_in_chunks_and_reports_progress(sample_lojer_and_daire, db_session, tmp_path, monkeypatch):
+    db = sample_lojer_and_daire['db']
+    for i in range(7):
+        db.add(Hesap(ad=f'Hesap {i}', tur='Banka', bakiye=100.0 * i))
+    db.commit()
+
+    controller = BackupController()
+    import database.config as db_config
+    monkeypatch.setattr(db_config, 'get_db', lambda: db)
+
+    # Parça boyutundan büyük tabloda birden çok parça okunmalı
+    parcalar = [len(p) for p in controller._tablo_parcalari(db, Hesap, 3)]
+    assert parcalar == [3, 3, 1]
+
+    ilerlemeler = []
+    excel_file = tmp_path / 'stream_backup.xlsx'
+    assert controller.backup_to_excel(str(excel_file), progress_callback=ilerlemeler.append, chunk_size=3) is True
+
+    assert ilerlemeler == sorted(ilerlemeler)
+    assert ilerlemeler[-1] == 100
+    assert len(ilerlemeler) == len(set(ilerlemeler))
+
+    with pd.ExcelFile(excel_file) as xls:
+        # Boş tablolar için sayfa oluşturulmaz
+        assert 'aidat_odemeleri' not in xls.sheet_names
+        hesaplar = pd.read_excel(xls, sheet_name='hesaplar')
+    assert len(hesaplar) == 7
+    assert list(hesaplar.columns) == [c.name for c in Hesap.__table__.columns]
+    assert sorted(hesaplar['ad']) == sorted(f'Hesap {i}' for i in range(7))
+
+    assert controller.reset_database() is True
+    assert controller.restore_from_excel(str(excel_file)) is True
+    assert db.query(Hesap).count() == 7
+
+
+def test_backup_xml_streams_same_format_and_restores_in_batches(sample_lojer_and_daire, db_session, tmp_path, monkeypatch):
+    import xml.etree.ElementTree as ET
+    db = sample_lojer_and_daire['db']
+    db.add(Sakin(ad_soyad='XML Sakin', daire_id=sample_lojer_and_daire['daire'].id))
+    for i in range(5):
+        db.add(Hesap(ad=f'Hesap <{i}> & Co', tur='Banka', bakiye=10.0 * i))
+    db.commit()
+
+    controller = BackupController()
+    import database.config as db_config
+    monkeypatch.setattr(db_config, 'get_db', lambda: db)
+
+    ilerlemeler = []
+    xml_file = tmp_path / 'stream_backup.xml'
+    assert controller.backup_to_xml(str(xml_file), progress_callback=ilerlemeler.append, chunk_size=2) is True
+    assert ilerlemeler[-1] == 100
+
+    # Akışlı çıktı, ElementTree + ET.indent çıktısıyla birebir aynı olmalı
+    content = xml_file.read_text(encoding='utf-8')
+    root = ET.fromstring(content.encode('utf-8'))
+    ET.indent(root, space="  ")
+    beklenen = "<?xml version='1.0' encoding='utf-8'?>\n" + ET.tostring(root, encoding='unicode') + "\n"
+    assert content == beklenen
+
+    assert controller.reset_database() is True
+    assert controller.restore_from_xml(str(xml_file), batch_size=2) is True
+    assert sorted(h.ad for h in db.query(Hesap)) == sorted(f'Hesap <{i}> & Co' for i in range(5))
+    assert db.query(Lojman).count() == 1
+
+    # Toplu yüklemeden sonra arama indeksi yeniden kurulmuş olmalı
+    from controllers.arama_controller import AramaController
+    sonuclar = AramaController().search('xml sakin', kaynaklar=['sakin'], db=db)
+    assert [s['baslik'] for s in sonuclar] == ['XML Sakin']
+
+
+def test_restore_xml_truncated_file_leaves_database_unchanged(dosya_db, tmp_path):
+    # Savepoint'li test session'ı rollback'i dış transaction'a taşır; ayrı dosya veritabanı kullan
+    db = dosya_db
+    for i in range(30):
+        db.add(Hesap(ad=f'Hesap {i}', tur='Banka', bakiye=1.0))
+    db.commit()
+
+    controller = BackupController()
+    xml_file = tmp_path / 'full.xml'
+    assert controller.backup_to_xml(str(xml_file)) is True
+    content = xml_file.read_text(encoding='utf-8')
+    bozuk = tmp_path / 'truncated.xml'
+    bozuk.write_text(content[: len(content) // 2], encoding='utf-8')
+
+    db.query(Hesap).filter(Hesap.id > 10).delete()
+    db.commit()
+    assert controller.restore_from_xml(str(bozuk), batch_size=4) is False
+    assert db.query(Hesap).count() == 10
+    # Geri alınan transaction FTS ve silme izleme trigger'larını da geri getirmeli
+    triggerlar = db.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger'").scalar()
+    assert triggerlar == 9 + 14
+
+
+def test_differential_xml_chain_restores_changes_and_deletes(dosya_db, tmp_path):
+    from sqlalchemy import text
+    db = dosya_db
+    for i in range(5):
+        db.add(Hesap(ad=f'Hesap {i}', tur='Banka', bakiye=1.0))
+    db.commit()
+    # Fark sorguları damgadan bir güvenlik payı geriden başlar; eski kayıtlar payın dışında kalmalı
+    db.execute(text("UPDATE hesaplar SET created_at = datetime('now', '-1 day'), updated_at = NULL"))
+    db.commit()
+
+    controller = BackupController()
+    tam = tmp_path / 'tam.xml'
+    fark1 = tmp_path / 'fark1.xml'
+    fark2 = tmp_path / 'fark2.xml'
+    # Tam yedek olmadan fark yedeği alınamaz
+    assert controller.backup_differential_xml(str(fark1)) is False
+    assert controller.backup_to_xml(str(tam)) is True
+
+    db.query(Hesap).filter(Hesap.ad == 'Hesap 1').delete()
+    db.query(Hesap).filter(Hesap.ad == 'Hesap 2').one().aciklama = 'Güncellendi'
+    db.add(Hesap(ad='Yeni Hesap', tur='Nakit', bakiye=2.0))
+    db.commit()
+    assert controller.backup_differential_xml(str(fark1)) is True
+    assert 'Hesap 0' not in fark1.read_text(encoding='utf-8')
+
+    db.query(Hesap).filter(Hesap.ad == 'Yeni Hesap').delete()
+    db.commit()
+    assert controller.backup_differential_xml(str(fark2)) is True
+    beklenen = sorted((h.id, h.ad, h.aciklama) for h in db.query(Hesap))
+
+    db.query(Hesap).delete()
+    db.commit()
+    # Sırası bozuk zincir reddedilir ve veritabanına dokunulmaz
+    assert controller.restore_from_xml(str(tam), fark_dosyalari=[str(fark2)]) is False
+    assert db.query(Hesap).count() == 0
+
+    assert controller.restore_from_xml(str(tam), batch_size=2, fark_dosyalari=[str(fark1), str(fark2)]) is True
+    db.expire_all()
+    assert sorted((h.id, h.ad, h.aciklama) for h in db.query(Hesap)) == beklenen
+    # Geri yükleme yeni başlangıç noktasıdır: damgalar ve tombstone'lar temizlenir
+    assert db.execute(text("SELECT count(*) FROM yedek_damgalari")).scalar() == 0
+    assert db.execute(text("SELECT count(*) FROM silinen_kayitlar")).scalar() == 0
+
+
+def test_restore_excel_coerces_column_types_in_bulk(db_session, tmp_path, monkeypatch):
+    from datetime import datetime
+    import numpy as np
+    db = db_session
+    import database.config as db_config
+    monkeypatch.setattr(db_config, 'get_db', lambda: db)
+
+    excel_file = tmp_path / 'typed.xlsx'
+    with pd.ExcelWriter(excel_file, engine='openpyxl') as writer:
+        pd.DataFrame({
+            'id': [1.0, 2.0, 3.0],
+            'ad': ['Kasa', 'Banka', 'Eski'],
+            'tur': ['Nakit', 'Banka', 'Banka'],
+            'bakiye_kurus': ['1250', 7.0, np.nan],
+            'aktif': ['True', 0, 'false'],
+            'para_birimi': ['₺', '₺', '$'],
+            'created_at': ['2024-01-02 10:30:00', np.nan, '2023-12-31'],
+        }).to_excel(writer, sheet_name='hesaplar', index=False)
+
+    controller = BackupController()
+    # Eklemeler birden çok parçaya bölünmeli
+    assert controller.restore_from_excel(str(excel_file), batch_size=2) is True
+
+    hesaplar = {h.id: h for h in db.query(Hesap)}
+    assert sorted(hesaplar) == [1, 2, 3]
+    assert [hesaplar[i].bakiye_kurus for i in (1, 2, 3)] == [1250, 7, None]
+    assert [hesaplar[i].aktif for i in (1, 2, 3)] == [True, False, False]
+    assert hesaplar[1].created_at == datetime(2024, 1, 2, 10, 30)
+    assert hesaplar[2].created_at is None
+
+
+def test_sayfayi_donustur_keeps_numeric_text_as_integer_strings():
+    df = pd.DataFrame({'telefon': [5321234567.0, None], 'ad_soyad': ['A', 'B'], 'daire_id': [1.0, None]})
+    sonuc = BackupController._sayfayi_donustur(df, Sakin.__table__)
+    kayitlar = sonuc.to_dict('records')
+    assert kayitlar[0]['telefon'] == '5321234567' and kayitlar[1]['telefon'] is None
+    assert kayitlar[0]['daire_id'] == 1 and type(kayitlar[0]['daire_id']) is int
+    assert kayitlar[1]['daire_id'] is None
+
+
+def test_backup_to_sqlite_compressed_snapshot_is_verified(dosya_db, tmp_path):
+    import gzip
+    import sqlite3
+    db = dosya_db
+    db.add(Hesap(ad='Online Hesap', tur='Banka', bakiye=5.0))
+    db.commit()
+    # Session'daki commit edilmemiş değişiklik kopyaya girmez ve kopyayı kilitlemez
+    db.add(Hesap(ad='Bekleyen', tur='Nakit', bakiye=1.0))
+    db.flush()
+
+    controller = BackupController()
+    ilerlemeler = []
+    yedek = tmp_path / 'snapshot.db.gz'
+    assert controller.backup_to_sqlite(str(yedek), progress_callback=ilerlemeler.append, compress=True, pages=2) is True
+    assert ilerlemeler[-1] == 100 and len(ilerlemeler) > 2
+    assert not (tmp_path / 'snapshot.db.gz.tmp').exists()
+    db.rollback()
+
+    acik = tmp_path / 'snapshot.db'
+    acik.write_bytes(gzip.decompress(yedek.read_bytes()))
+    baglanti = sqlite3.connect(acik)
+    try:
+        assert baglanti.execute("SELECT ad FROM hesaplar").fetchall() == [('Online Hesap',)]
+        # FTS tabloları ve trigger'lar kopyada da bulunur
+        assert baglanti.execute("SELECT count(*) FROM sqlite_master WHERE type = 'trigger'").fetchone()[0] == 9 + 14
+    finally:
+        baglanti.close()
+
+
+def test_restore_from_sqlite_replaces_live_database_and_rejects_bad_files(dosya_db, tmp_path):
+    import sqlite3
+    db = dosya_db
+    db.add(Hesap(ad='Yedekteki', tur='Banka', bakiye=1.0))
+    db.commit()
+
+    controller = BackupController()
+    yedek = tmp_path / 'yedek.db.gz'
+    assert controller.backup_to_sqlite(str(yedek), compress=True) is True
+
+    db.query(Hesap).delete()
+    db.add(Hesap(ad='Sonradan', tur='Nakit', bakiye=2.0))
+    db.commit()
+
+    # Bozuk veya uygulamaya ait olmayan dosyalar canlı veritabanına dokunmaz
+    bozuk = tmp_path / 'bozuk.db'
+    bozuk.write_bytes(b'SQLite format 3\x00' + b'\x00' * 100)
+    assert controller.restore_from_sqlite(str(bozuk)) is False
+    baska = tmp_path / 'baska.db'
+    baglanti = sqlite3.connect(baska)
+    baglanti.execute("CREATE TABLE x (id INTEGER)")
+    baglanti.close()
+    assert controller.restore_from_sqlite(str(baska)) is False
+    assert [h.ad for h in db.query(Hesap)] == ['Sonradan']
+    db.commit()
+
+    ilerlemeler = []
+    assert controller.restore_from_sqlite(str(yedek), progress_callback=ilerlemeler.append) is True
+    assert ilerlemeler[-1] == 100
+    assert [h.ad for h in db.query(Hesap)] == ['Yedekteki']
+
+
+def test_reset_database_clears_monthly_rollup_and_dashboard(db_session, monkeypatch):
+    from datetime import datetime
+    from controllers.dashboard_controller import DashboardController
+    from controllers.finans_islem_controller import FinansIslemController
+    from controllers.finans_ozet_controller import FinansOzetController
+    from models.base import FinansAylikOzet, FinansIslem
+    import database.config as db_config
+
+    db = db_session
+    monkeypatch.setattr(db_config, 'get_db', lambda: db)
+    hesap = Hesap(ad='Sıfırlama Kasa', tur='Kasa', bakiye=0.0)
+    db.add(hesap)
+    db.commit()
+    FinansIslemController().create(
+        {"tur": "Gelir", "tutar": 100.0, "hesap_id": hesap.id, "tarih": datetime(2025, 3, 10)}, db=db
+    )
+    dashboard = DashboardController(saat=lambda: datetime(2025, 3, 20))
+    DashboardController.invalidate()
+    assert dashboard.get_snapshot(db=db).bu_ay_geliri == 100.0
+
+    assert BackupController().reset_database() is True
+
+    assert db.query(FinansIslem).count() == 0
+    assert db.query(FinansAylikOzet).count() == 0
+    assert FinansOzetController().verify(db=db) == []
+    assert dashboard.get_snapshot(db=db).bu_ay_geliri == 0.0
+
+
+def test_restore_rebuilds_rollup_in_same_transaction(dosya_db, tmp_path, monkeypatch):
+    from datetime import datetime
+    from controllers.finans_islem_controller import FinansIslemController
+    from controllers.finans_ozet_controller import FinansOzetController
+    from models.base import FinansAylikOzet, FinansIslem
+    from models.exceptions import DatabaseError
+
+    db = dosya_db
+    hesap = Hesap(ad='Özet Kasa', tur='Kasa', bakiye=0.0)
+    db.add(hesap)
+    db.commit()
+    FinansIslemController().create(
+        {"tur": "Gelir", "tutar": 100.0, "hesap_id": hesap.id, "tarih": datetime(2025, 3, 10)}, db=db
+    )
+    controller = BackupController()
+    xml_file = tmp_path / 'ozet.xml'
+    assert controller.backup_to_xml(str(xml_file)) is True
+
+    assert controller.reset_database() is True
+    assert controller.restore_from_xml(str(xml_file)) is True
+    assert db.query(FinansAylikOzet).count() == 1
+    assert FinansOzetController().verify(db=db) == []
+
+    # Özet kurulamazsa geri yüklenen satırlar da commit edilmez
+    assert controller.reset_database() is True
+    gercek_rebuild = FinansOzetController.rebuild
+
+    def bozuk_rebuild(self, db=None, commit=True):
+        assert commit is False
+        gercek_rebuild(self, db=db, commit=False)
+        raise DatabaseError("özet bozuk", code="DB_OZT_001")
+
+    monkeypatch.setattr(FinansOzetController, 'rebuild', bozuk_rebuild)
+    assert controller.restore_from_xml(str(xml_file)) is False
+    assert db.query(FinansIslem).count() == 0
+    assert db.query(Hesap).count() == 0
+    assert db.query(FinansAylikOzet).count() == 0
+
+
+def test_restore_from_sqlite_upgrades_old_backup_and_rebuilds_rollup(dosya_db, tmp_path):
+    import sqlite3
+    from datetime import datetime
+    from controllers.dashboard_controller import DashboardController
+    from controllers.finans_islem_controller import FinansIslemController
+    from controllers.finans_ozet_controller import FinansOzetController
+    from models.base import FinansAylikOzet
+
+    db = dosya_db
+    hesap = Hesap(ad='Eski Kasa', tur='Kasa', bakiye=0.0)
+    db.add(hesap)
+    db.commit()
+    FinansIslemController().create(
+        {"tur": "Gelir", "tutar": 100.0, "hesap_id": hesap.id, "tarih": datetime(2025, 3, 10)}, db=db
+    )
+    controller = BackupController()
+    yedek = tmp_path / 'eski.db'
+    assert controller.backup_to_sqlite(str(yedek), compress=False) is True
+
+    # Özet tablosu ve şema sürümünden önce alınmış bir yedek
+    baglanti = sqlite3.connect(yedek)
+    baglanti.execute("DROP TABLE finans_aylik_ozet")
+    baglanti.execute("DROP TABLE IF EXISTS sema_surumu")
+    baglanti.commit()
+    baglanti.close()
+
+    assert controller.reset_database() is True
+    dashboard = DashboardController(saat=lambda: datetime(2025, 3, 20))
+    assert dashboard.get_snapshot(db=db).bu_ay_geliri == 0.0
+
+    assert controller.restore_from_sqlite(str(yedek)) is True
+    assert db.query(FinansAylikOzet).count() == 1
+    assert FinansOzetController().verify(db=db) == []
+    assert dashboard.get_snapshot(db=db).bu_ay_geliri == 100.0
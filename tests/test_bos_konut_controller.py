@@ -1,5 +1,8 @@
+import pytest
+
 from controllers.bos_konut_controller import BosKonutController
 from datetime import datetime
+from models.exceptions import ValidationError
 
 
 def test_get_days_in_month():
@@ -202,4 +205,135 @@ def test_format_date():
     # Test another date
     test_date = datetime(2024, 12, 31)
     result = controller.format_date(test_date)
-    assert result == "31.12.2024"
\ No newline at end of file
+    assert result == "31.12.2024"
+
+def test_empty_housing_interval_engine_merges_residents_and_finds_gaps():
+    """Overlapping residents are merged; a mid-month gap reports its first/last empty day"""
+    from controllers.bos_konut_controller import BosKonutIndex
+    from datetime import date
+
+    index = BosKonutIndex([
+        {'daire_id': 1, 'giris_tarihi': '2023-01-01', 'cikis_tarihi': '2023-01-10'},
+        {'daire_id': 1, 'giris_tarihi': datetime(2023, 1, 5), 'cikis_tarihi': '2023-01-12 00:00:00'},
+        {'daire_id': 1, 'giris_tarihi': '2023-01-20', 'cikis_tarihi': None},
+        {'daire_id': 1, 'giris_tarihi': None, 'cikis_tarihi': '2023-01-31'},
+    ])
+    assert index.araliklar[1] == [(date(2023, 1, 1), date(2023, 1, 13)), (date(2023, 1, 20), date.max)]
+
+    ocak = (date(2023, 1, 1), date(2023, 2, 1))
+    subat = (date(2023, 2, 1), date(2023, 3, 1))
+    assert index.bos_donemler(1, [ocak, subat]) == [(7, date(2023, 1, 13), date(2023, 1, 19)), (0, None, None)]
+    assert index.bos_donemler(2, [ocak]) == [(31, date(2023, 1, 1), date(2023, 1, 31))]
+
+
+def test_calculate_yearly_empty_housing_costs_matches_monthly_calls():
+    """Yearly one-pass results equal twelve monthly calculations"""
+    daire_listesi = [
+        {'id': i, 'daire_no': str(100 + i), 'bagliBlokId': 1, 'kiraya_esasi_alan': 70.0} for i in range(1, 4)
+    ]
+    blok_listesi = [{'id': 1, 'blok_adi': 'A Blok', 'bagliLojmanId': 1}]
+    lojman_listesi = [{'id': 1, 'lojman_adi': 'Test Lojmanı'}]
+    gider_kayitlari = [{'islem_tarihi': f'2024-{ay:02d}-05', 'tutar': 300.0 * ay} for ay in range(1, 13)]
+    sakin_listesi = [
+        {'daire_id': 1, 'giris_tarihi': '2023-06-01', 'cikis_tarihi': '2024-03-14'},
+        {'daire_id': 1, 'giris_tarihi': '2024-05-01', 'cikis_tarihi': None},
+        {'daire_id': 2, 'giris_tarihi': '2024-02-10', 'cikis_tarihi': '2024-11-30'},
+    ]
+
+    yillik = BosKonutController.calculate_yearly_empty_housing_costs(
+        2024, daire_listesi, blok_listesi, lojman_listesi, gider_kayitlari, sakin_listesi
+    )
+    assert sorted(yillik) == list(range(1, 13))
+    for ay in range(1, 13):
+        assert yillik[ay] == BosKonutController.calculate_empty_housing_costs(
+            2024, ay, daire_listesi, blok_listesi, lojman_listesi, gider_kayitlari, sakin_listesi
+        )
+
+    mart_kayitlari, _ = yillik[3]
+    assert [(k['daire_no'], k['sorumlu_gun_sayisi']) for k in mart_kayitlari] == [('101', 17), ('103', 31)]
+    assert mart_kayitlari[0]['ilk_tarih'] == datetime(2024, 3, 15)
+
+
+def _bos_konut_verisi(session):
+    """Lojman/blok/daire/sakin ve giderleri oluştur; dict listelerini de döndür"""
+    from controllers.finans_islem_controller import FinansIslemController
+    from controllers.hesap_controller import HesapController
+    from models.base import Lojman, Blok, Daire, Sakin
+
+    lojman = Lojman(ad='Vektör Lojmanı', adres='Test')
+    session.add(lojman)
+    session.flush()
+    blok = Blok(ad='B1', lojman_id=lojman.id, kat_sayisi=3)
+    session.add(blok)
+    session.flush()
+    daireler = [Daire(daire_no=str(i), kat=1, blok_id=blok.id, kiraya_esas_alan=alan)
+                for i, alan in ((1, 100.0), (2, 50.0), (3, 50.0))]
+    session.add_all(daireler)
+    session.flush()
+    session.add_all([
+        Sakin(ad_soyad='S1', daire_id=daireler[0].id, giris_tarihi=datetime(2023, 12, 1),
+              cikis_tarihi=datetime(2024, 2, 9)),
+        Sakin(ad_soyad='S2', eski_daire_id=daireler[1].id, giris_tarihi=datetime(2024, 1, 16),
+              cikis_tarihi=datetime(2024, 3, 31)),
+        Sakin(ad_soyad='S3', daire_id=daireler[2].id, giris_tarihi=datetime(1999, 5, 1)),
+    ])
+    session.commit()
+
+    hesap = HesapController().create({"ad": "BK", "tur": "Banka", "bakiye": 100000.0}, db=session)
+    for ay, tutar in ((1, 3100.0), (2, 2900.0), (3, 930.0)):
+        FinansIslemController().create(
+            {"tur": "Gider", "tutar": tutar, "hesap_id": hesap.id, "tarih": datetime(2024, ay, 10)}, db=session
+        )
+
+    sozluk = dict(
+        daire_listesi=[{'id': d.id, 'daire_no': d.daire_no, 'bagliBlokId': blok.id,
+                        'kiraya_esasi_alan': d.kiraya_esas_alan} for d in daireler],
+        blok_listesi=[{'id': blok.id, 'blok_adi': 'B1', 'bagliLojmanId': lojman.id}],
+        lojman_listesi=[{'id': lojman.id, 'lojman_adi': 'Vektör Lojmanı'}],
+        gider_kayitlari=[{'islem_tarihi': f'2024-{ay:02d}-10', 'tutar': t}
+                         for ay, t in ((1, 3100.0), (2, 2900.0), (3, 930.0))],
+        sakin_listesi=[{'daire_id': s.daire_id or s.eski_daire_id, 'giris_tarihi': s.giris_tarihi,
+                        'cikis_tarihi': s.cikis_tarihi} for s in session.query(Sakin)],
+    )
+    return sozluk
+
+
+def test_get_empty_housing_report_matches_dict_engine(db_session):
+    """Vectorized DB report equals the list-based calculation for a multi-month range"""
+    veri = _bos_konut_verisi(db_session)
+    rapor = BosKonutController().get_empty_housing_report((2024, 1), (2024, 4), db=db_session)
+    beklenen = BosKonutController.calculate_empty_housing_costs_for_periods(
+        [(2024, 1), (2024, 2), (2024, 3)], **veri
+    )
+    assert sorted(rapor) == sorted(beklenen)
+    for donem, (kayitlar, toplam) in beklenen.items():
+        vektorel, vektorel_toplam = rapor[donem]
+        assert [(k['daire_no'], k['ilk_tarih'], k['son_tarih'], k['sorumlu_gun_sayisi']) for k in vektorel] == \
+            [(k['daire_no'], k['ilk_tarih'], k['son_tarih'], k['sorumlu_gun_sayisi']) for k in kayitlar]
+        assert [round(k['konut_aidat_bedeli'], 6) for k in vektorel] == \
+            [round(k['konut_aidat_bedeli'], 6) for k in kayitlar]
+        assert abs(vektorel_toplam - toplam) < 1e-6
+
+    ocak, _ = rapor[(2024, 1)]
+    # Daire 2: 16 Ocak'a kadar boş (eski_daire_id kaydı da sayılır)
+    assert [k['daire_no'] for k in ocak] == ['2']
+    assert ocak[0]['ilk_tarih'] == datetime(2024, 1, 1) and ocak[0]['son_tarih'] == datetime(2024, 1, 15)
+
+
+def test_get_empty_housing_report_allocates_by_area(db_session):
+    """Per-m² allocation weights the monthly daily cost by kiraya_esas_alan"""
+    _bos_konut_verisi(db_session)
+    rapor = BosKonutController().get_empty_housing_report((2024, 1), (2025, 1), dagitim="alan", db=db_session)
+    assert len(rapor) == 12
+
+    # Mart: 930 TL / 31 gün = 30 TL/gün; daire 1 (100 m² / 200 m²) tüm ay boş
+    mart, mart_toplam = rapor[(2024, 3)]
+    assert [(k['daire_no'], k['sorumlu_gun_sayisi']) for k in mart] == [('1', 31)]
+    assert abs(mart[0]['konut_aidat_bedeli'] - 30.0 * 0.5 * 31) < 1e-9
+    assert mart_toplam == mart[0]['konut_aidat_bedeli']
+    # Gider olmayan aylarda boş daireler listelenir ama maliyet yoktur
+    nisan, nisan_toplam = rapor[(2024, 4)]
+    assert [k['daire_no'] for k in nisan] == ['1', '2'] and nisan_toplam == 0.0
+
+    with pytest.raises(ValidationError):
+        BosKonutController().get_empty_housing_report((2024, 1), dagitim="m3", db=db_session)
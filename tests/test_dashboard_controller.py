@@ -0,0 +1,124 @@
+from datetime import datetime
+
+from controllers.aidat_controller import AidatIslemController
+from controllers.dashboard_controller import DashboardController
+from controllers.finans_islem_controller import FinansIslemController
+from controllers.hesap_controller import HesapController
+from models.base import AidatOdeme, Sakin
+
+
+def test_snapshot_values_cached_and_invalidated_on_writes(db_session, sample_lojer_and_daire):
+    session = sample_lojer_and_daire['db']
+    daire = sample_lojer_and_daire['daire']
+    daire.guncel_aidat = 500.0
+    session.add(Sakin(ad_soyad='Dashboard Sakin', daire_id=daire.id, giris_tarihi=datetime(2024, 1, 1)))
+    session.commit()
+
+    hesap = HesapController().create({"ad": "Kasa", "tur": "Kasa", "bakiye": 5000.0}, db=session)
+    HesapController().create({"ad": "Boş", "tur": "Banka", "bakiye": 0.0}, db=session)
+    finans = FinansIslemController()
+    for tur, tutar, tarih in (("Gelir", 300.0, datetime(2025, 3, 5)), ("Gider", 100.0, datetime(2025, 3, 6)),
+                              ("Gelir", 200.0, datetime(2024, 12, 1)), ("Gider", 999.0, datetime(2024, 3, 31))):
+        finans.create({"tur": tur, "tutar": tutar, "hesap_id": hesap.id, "tarih": tarih}, db=session)
+    AidatIslemController().generate_month(2025, 3, db=session)
+
+    DashboardController.invalidate()
+    controller = DashboardController(saat=lambda: datetime(2025, 3, 20))
+    snapshot = controller.get_snapshot(db=session)
+
+    assert snapshot.toplam_bakiye == 4401.0
+    assert (snapshot.hesap_adlari, snapshot.hesap_bakiyeleri) == (("Kasa",), (4401.0,))
+    assert (snapshot.bu_ay_geliri, snapshot.bu_ay_gideri, snapshot.net_durum) == (300.0, 100.0, 200.0)
+    # Nisan 2024 - Mart 2025; Mart 2024 gideri pencerenin dışında
+    assert snapshot.trend_aylar[0] == "Nis" and snapshot.trend_aylar[-1] == "Mar"
+    assert snapshot.trend_gelirler[-4] == 200.0 and sum(snapshot.trend_giderler) == 100.0
+    assert snapshot.dolu_daire_sayisi == 1
+    assert (snapshot.aidat_odenen, snapshot.aidat_odenmeyen, snapshot.aidat_tahsilat_orani) == (0.0, 500.0, 0.0)
+
+    # Veri değişmediyse aynı nesne döner
+    assert controller.get_snapshot(db=session) is snapshot
+    assert controller.guncel_mi(snapshot)
+
+    # ORM yazması geçersiz kılar
+    odeme = session.query(AidatOdeme).one()
+    odeme.odendi = True
+    session.commit()
+    assert not controller.guncel_mi(snapshot)
+    odenmis = controller.get_snapshot(db=session)
+    assert (odenmis.aidat_odenen, odenmis.aidat_odenmeyen, odenmis.aidat_tahsilat_orani) == (500.0, 0.0, 100.0)
+
+    # Session üzerinden toplu Core insert (aylık aidat üretimi) de geçersiz kılar
+    AidatIslemController().generate_month(2025, 2, db=session)
+    assert not controller.guncel_mi(odenmis)
+    assert controller.get_snapshot(db=session).aidat_tahsilat_orani == 50.0
+
+    DashboardController.invalidate()
+
+
+def test_snapshot_recomputed_when_month_changes(db_session):
+    hesap = HesapController().create({"ad": "Kasa", "tur": "Kasa", "bakiye": 0.0}, db=db_session)
+    FinansIslemController().create(
+        {"tur": "Gelir", "tutar": 80.0, "hesap_id": hesap.id, "tarih": datetime(2025, 3, 5)}, db=db_session
+    )
+
+    DashboardController.invalidate()
+    mart = DashboardController(saat=lambda: datetime(2025, 3, 31)).get_snapshot(db=db_session)
+    nisan_controller = DashboardController(saat=lambda: datetime(2025, 4, 1))
+    assert not nisan_controller.guncel_mi(mart)
+
+    nisan = nisan_controller.get_snapshot(db=db_session)
+    assert nisan is not mart
+    assert (mart.bu_ay_geliri, nisan.bu_ay_geliri) == (80.0, 0.0)
+    assert nisan.trend_gelirler[-2] == 80.0
+
+    DashboardController.invalidate()
+
+
+def test_bu_ay_kartlari_include_transactions_stamped_at_now(db_session):
+    hesap = HesapController().create({"ad": "Kasa", "tur": "Kasa", "bakiye": 1000.0}, db=db_session)
+    simdi = datetime(2025, 3, 20, 14, 30)
+    finans = FinansIslemController()
+    for tur, tutar, tarih in (("Gelir", 40.0, datetime(2025, 3, 1)), ("Gelir", 60.0, simdi),
+                              ("Gider", 25.0, simdi), ("Gelir", 500.0, datetime(2025, 3, 20, 14, 31)),
+                              ("Gider", 75.0, datetime(2025, 3, 28))):
+        finans.create({"tur": tur, "tutar": tutar, "hesap_id": hesap.id, "tarih": tarih}, db=db_session)
+
+    DashboardController.invalidate()
+    snapshot = DashboardController(saat=lambda: simdi).get_snapshot(db=db_session)
+
+    # Ayın başı ve şu an dahil; şu andan sonraki tarihli işlemler kartlara girmez
+    assert (snapshot.bu_ay_geliri, snapshot.bu_ay_gideri) == (100.0, 25.0)
+    # Trend grafiği ayın tamamını gösterir
+    assert (snapshot.trend_gelirler[-1], snapshot.trend_giderler[-1]) == (600.0, 100.0)
+
+    DashboardController.invalidate()
+
+
+def test_snapshot_recomputed_when_future_dated_transaction_falls_due(db_session):
+    hesap = HesapController().create({"ad": "Kasa", "tur": "Kasa", "bakiye": 1000.0}, db=db_session)
+    finans = FinansIslemController()
+    for tur, tutar, tarih in (("Gelir", 40.0, datetime(2025, 3, 1)), ("Gider", 75.0, datetime(2025, 3, 28)),
+                              ("Gelir", 500.0, datetime(2025, 4, 2))):
+        finans.create({"tur": tur, "tutar": tutar, "hesap_id": hesap.id, "tarih": tarih}, db=db_session)
+
+    DashboardController.invalidate()
+    simdi = [datetime(2025, 3, 20)]
+    controller = DashboardController(saat=lambda: simdi[0])
+    snapshot = controller.get_snapshot(db=db_session)
+    assert (snapshot.bu_ay_geliri, snapshot.bu_ay_gideri) == (40.0, 0.0)
+    # Bir sonraki ayın işlemi geçerlilik sınırını belirlemez
+    assert snapshot.gecerlilik_sonu == datetime(2025, 3, 28)
+
+    # Yazma olmadan da işlemin zamanı gelmeden önbellek kullanılır
+    simdi[0] = datetime(2025, 3, 27, 23, 59)
+    assert controller.guncel_mi(snapshot)
+    assert controller.get_snapshot(db=db_session) is snapshot
+
+    # İşlemin tarihi geçince kartlar yeniden hesaplanır
+    simdi[0] = datetime(2025, 3, 28)
+    assert not controller.guncel_mi(snapshot)
+    yeni = controller.get_snapshot(db=db_session)
+    assert (yeni.bu_ay_geliri, yeni.bu_ay_gideri) == (40.0, 75.0)
+    assert yeni.gecerlilik_sonu is None
+
+    DashboardController.invalidate()
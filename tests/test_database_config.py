@@ -42,3 +42,144 @@ def test_init_database_calls_create_tables(monkeypatch):
 
     db_config.init_database()
     assert called['value'] is True
+
+
+def test_configured_engine_applies_pragmas(tmp_path):
+    file_engine = db_config.create_configured_engine(f"sqlite:///{tmp_path / 'profile.db'}")
+    try:
+        with file_engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar().lower() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+            assert conn.exec_driver_sql("PRAGMA temp_store").scalar() == 2  # MEMORY
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 1
+        from sqlalchemy.pool import QueuePool
+        assert isinstance(file_engine.pool, QueuePool)
+    finally:
+        file_engine.dispose()
+
+
+def test_configured_engine_custom_profile(tmp_path):
+    profile = {"journal_mode": "delete", "foreign_keys": False, "pool_strategy": "null"}
+    file_engine = db_config.create_configured_engine(f"sqlite:///{tmp_path / 'custom.db'}", profile)
+    try:
+        with file_engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar().lower() == "delete"
+            assert conn.exec_driver_sql("PRAGMA foreign_keys").scalar() == 0
+        from sqlalchemy.pool import NullPool
+        assert isinstance(file_engine.pool, NullPool)
+    finally:
+        file_engine.dispose()
+
+
+def test_memory_engine_always_uses_static_pool():
+    from sqlalchemy.pool import StaticPool
+    mem_engine = db_config.create_configured_engine("sqlite:///:memory:", {"pool_strategy": "queue"})
+    try:
+        assert isinstance(mem_engine.pool, StaticPool)
+    finally:
+        mem_engine.dispose()
+
+
+def test_invalid_engine_profile_raises_config_error():
+    from models.exceptions import ConfigError
+    with pytest.raises(ConfigError) as exc:
+        db_config.validate_engine_profile({"journal_mode": "BOGUS"})
+    assert exc.value.code == "CFG_002"
+    with pytest.raises(ConfigError):
+        db_config.validate_engine_profile({"pool_strategy": "bogus"})
+    with pytest.raises(ConfigError):
+        db_config.validate_engine_profile({"cache_size_kb": "lots"})
+    with pytest.raises(ConfigError):
+        db_config.validate_engine_profile({"echo": "sometimes"})
+
+
+def test_engine_profile_parses_string_booleans():
+    profil = db_config.validate_engine_profile({"foreign_keys": "false", "echo": "FALSE"})
+    assert profil["foreign_keys"] is False and profil["echo"] is False
+    profil = db_config.validate_engine_profile({"foreign_keys": "yes", "echo": 0})
+    assert profil["foreign_keys"] is True and profil["echo"] is False
+
+
+def test_get_engine_profile_reads_configuration():
+    class FakeConfig:
+        def get(self, key, default=None):
+            return {"database.synchronous": "full", "database.cache_size_kb": "1024"}.get(key, default)
+
+    profile = db_config.get_engine_profile(FakeConfig())
+    assert profile["synchronous"] == "FULL"
+    assert profile["cache_size_kb"] == 1024
+    assert profile["journal_mode"] == "WAL"
+
+
+def test_configure_engine_keeps_engine_when_profile_unchanged():
+    current = db_config.engine
+    assert db_config.configure_engine(dict(db_config.engine_profile)) is current
+
+
+def test_schema_migrations_upgrade_legacy_database_then_skip_on_warm_start(tmp_path):
+    from sqlalchemy import event, text
+    from database import sema_gocleri
+
+    file_engine = db_config.create_configured_engine(f"sqlite:///{tmp_path / 'eski.db'}")
+    try:
+        # Sürüm tablosundan önceki bir veritabanı: tablo var, sonradan eklenen indeks ve sürüm yok
+        with file_engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE hesaplar (id INTEGER PRIMARY KEY, ad VARCHAR(100))")
+        assert "sema_surumu" not in inspect(file_engine).get_table_names()
+
+        assert sema_gocleri.guncelle(file_engine) == [1, 2]
+        with file_engine.connect() as conn:
+            assert sema_gocleri.surum_oku(conn) == sema_gocleri.GUNCEL_SURUM
+        inspector = inspect(file_engine)
+        assert {"sema_surumu", "finans_islemleri", "silinen_kayitlar"} <= set(inspector.get_table_names())
+        assert "idx_finans_islem_aktif_tarih" in {i["name"] for i in inspector.get_indexes("finans_islemleri")}
+
+        # Sıcak açılış: yalnızca sürüm satırı okunur, yansıtma sorgusu yapılmaz
+        ifadeler = []
+        event.listen(file_engine, "before_cursor_execute",
+                     lambda conn, cursor, statement, *args: ifadeler.append(statement))
+        assert sema_gocleri.guncelle(file_engine) == []
+        assert len(ifadeler) == 1 and "sema_surumu" in ifadeler[0]
+
+        # Yeni bir adım eklendiğinde yalnızca o adım uygulanır
+        yeni = sema_gocleri.Goc(
+            sema_gocleri.GUNCEL_SURUM + 1, "Test indeksi",
+            lambda conn: conn.execute(text("CREATE INDEX IF NOT EXISTS idx_test_hesap_ad ON hesaplar (ad)"))
+        )
+        gocler = (*sema_gocleri.GOCLER, yeni)
+        assert sema_gocleri.guncelle(file_engine, gocler) == [yeni.surum]
+        assert "idx_test_hesap_ad" in {i["name"] for i in inspect(file_engine).get_indexes("hesaplar")}
+
+        # Uygulamadan yeni bir şema: dokunulmaz
+        assert sema_gocleri.guncelle(file_engine) == []
+        with file_engine.connect() as conn:
+            assert sema_gocleri.surum_oku(conn) == yeni.surum
+    finally:
+        file_engine.dispose()
+
+
+def test_schema_migration_errors_raise_database_error(tmp_path):
+    from database import sema_gocleri
+    from models.exceptions import DatabaseError
+
+    file_engine = db_config.create_configured_engine(f"sqlite:///{tmp_path / 'hata.db'}")
+    try:
+        def bozuk(conn):
+            raise RuntimeError("adım bozuk")
+
+        gocler = (*sema_gocleri.GOCLER, sema_gocleri.Goc(sema_gocleri.GUNCEL_SURUM + 1, "Bozuk", bozuk))
+        with pytest.raises(DatabaseError) as exc:
+            sema_gocleri.guncelle(file_engine, gocler)
+        assert exc.value.code == "DB_001"
+        assert exc.value.details["surum"] == sema_gocleri.GUNCEL_SURUM + 1
+
+        # Sürüm damgalanmadığı için adımlar sonraki açılışta yeniden denenir
+        with file_engine.connect() as conn:
+            assert sema_gocleri.surum_oku(conn) == 0
+        assert sema_gocleri.guncelle(file_engine) == [1, 2]
+
+        with pytest.raises(DatabaseError):
+            sema_gocleri.guncelle(file_engine, tuple(reversed(sema_gocleri.GOCLER)))
+    finally:
+        file_engine.dispose()
@@ -0,0 +1,76 @@
+from datetime import datetime
+
+from controllers.doluluk_controller import DolulukController, DolulukIndex
+from controllers.sakin_controller import SakinController
+
+
+def test_index_interval_lookup_and_priority():
+    index = DolulukIndex([
+        ("Eski", None, 1, datetime(2020, 1, 1), datetime(2023, 12, 31)),
+        ("Yeni", 1, None, datetime(2024, 1, 1), None),
+        ("Ara", 2, None, datetime(2022, 1, 1), datetime(2022, 6, 30)),
+        ("Tarihsiz", 3, None, None, None),
+    ])
+
+    assert index.sakin_at(1, datetime(2024, 2, 1)) == "Yeni"
+    # Güncel dairede kapsayan kayıt yoksa eski_daire_id kayıtlarına bakılır
+    assert index.sakin_at(1, datetime(2023, 12, 31)) == "Eski"
+    assert index.sakin_at(1, datetime(2019, 12, 1)) is None
+    # Çıkış günü dahil, sonrası hariç
+    assert index.sakin_at(2, datetime(2022, 6, 30)) == "Ara"
+    assert index.sakin_at(2, datetime(2022, 7, 1)) is None
+    assert index.sakin_at(3, datetime(2024, 1, 1)) is None
+
+    assert index.resolve_many([(1, 2024, 5), (2, 2022, 3), (9, 2024, 1)]) == {
+        (1, 2024, 5): "Yeni",
+        (2, 2022, 3): "Ara",
+        (9, 2024, 1): None,
+    }
+
+
+def test_index_invalidated_on_sakin_writes(db_session, sample_lojer_and_daire):
+    session = sample_lojer_and_daire['db']
+    daire = sample_lojer_and_daire['daire']
+    DolulukController.invalidate()
+
+    doluluk = DolulukController()
+    sakin_ctrl = SakinController()
+
+    assert doluluk.sakin_at_date(daire.id, 2025, 3, db=session) is None
+
+    sakin = sakin_ctrl.create({
+        'ad_soyad': 'Doluluk Test',
+        'daire_id': daire.id,
+        'tahsis_tarihi': datetime(2025, 1, 1),
+        'giris_tarihi': datetime(2025, 1, 1),
+    }, db=session)
+    assert doluluk.sakin_at_date(daire.id, 2025, 3, db=session) == 'Doluluk Test'
+
+    sakin_ctrl.update(sakin.id, {'cikis_tarihi': datetime(2025, 2, 15)}, db=session)
+    assert doluluk.sakin_at_date(daire.id, 2025, 3, db=session) is None
+    assert doluluk.sakin_at_date(daire.id, 2025, 2, db=session) == 'Doluluk Test'
+
+    DolulukController.invalidate()
+
+
+def test_index_built_during_write_is_not_cached(db_session, monkeypatch):
+    import controllers.doluluk_controller as doluluk_modulu
+
+    DolulukController.invalidate()
+
+    class YazmaSirasindaIndex(DolulukIndex):
+        def __init__(self, rows):
+            # Satırlar okunduktan sonra başka bir thread'de sakin yazıldı
+            DolulukController.invalidate()
+            super().__init__(rows)
+
+    monkeypatch.setattr(doluluk_modulu, "DolulukIndex", YazmaSirasindaIndex)
+    eski = DolulukController().get_index(db=db_session)
+    assert isinstance(eski, YazmaSirasindaIndex)
+    assert DolulukController._index is None
+
+    monkeypatch.setattr(doluluk_modulu, "DolulukIndex", DolulukIndex)
+    yeni = DolulukController().get_index(db=db_session)
+    assert DolulukController._index is yeni
+
+    DolulukController.invalidate()
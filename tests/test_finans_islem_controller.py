@@ -1,3 +1,4 @@
+import pytest
 from controllers.finans_islem_controller import FinansIslemController
 from controllers.hesap_controller import HesapController
 from datetime import datetime
@@ -326,3 +327,142 @@ def test_update_gider_to_transfer_and_adjust_balances(db_session):
     # - Apply new Transfer: s=450, d=150
     assert abs(s_final.bakiye - 450.0) < 0.001, f"Expected s=450, got {s_final.bakiye}"
     assert abs(d_final.bakiye - 150.0) < 0.001, f"Expected d=150, got {d_final.bakiye}"
+
+
+def test_aggregate_groups_sums_in_sql(db_session):
+    from models.base import AnaKategori, AltKategori
+    session = db_session
+    hesap_ctrl = HesapController()
+    finans_ctrl = FinansIslemController()
+
+    h1 = hesap_ctrl.create({"ad": "AGG1", "tur": "Banka", "bakiye": 1000.0}, db=session)
+    h2 = hesap_ctrl.create({"ad": "AGG2", "tur": "Kasa", "bakiye": 1000.0}, db=session)
+    ana = AnaKategori(name="Aidatlar", tip="gelir")
+    session.add(ana)
+    session.flush()
+    alt = AltKategori(name="Aylık Aidat AGG", parent_id=ana.id)
+    session.add(alt)
+    session.flush()
+
+    for tutar, hesap_id, tarih, tur, kategori_id in [
+        (100.0, h1.id, datetime(2024, 1, 5), "Gelir", alt.id),
+        (50.25, h1.id, datetime(2024, 1, 20), "Gelir", None),
+        (70.0, h2.id, datetime(2024, 2, 1), "Gelir", alt.id),
+        (30.0, h1.id, datetime(2024, 2, 3), "Gider", None),
+        (10.0, h1.id, datetime(2025, 3, 1), "Gelir", alt.id),
+    ]:
+        finans_ctrl.create({"tur": tur, "tutar": tutar, "hesap_id": hesap_id,
+                            "tarih": tarih, "kategori_id": kategori_id}, db=session)
+
+    aylik = finans_ctrl.aggregate(
+        ["month"], tur="Gelir",
+        date_range=(datetime(2024, 1, 1), datetime(2025, 1, 1)), db=session
+    )
+    assert [(r["yil"], r["ay"], r["toplam_kurus"], r["adet"]) for r in aylik] == [
+        (2024, 1, 15025, 2),
+        (2024, 2, 7000, 1),
+    ]
+    assert aylik[0]["toplam"] == 150.25
+
+    toplam = finans_ctrl.aggregate(db=session)
+    assert len(toplam) == 1
+    assert toplam[0]["toplam_kurus"] == 26025 and toplam[0]["adet"] == 5
+
+    by_hesap = finans_ctrl.aggregate(["hesap", "tur"], db=session)
+    assert {(r["hesap_adi"], r["tur"]): r["toplam_kurus"] for r in by_hesap} == {
+        ("AGG1", "Gelir"): 16025,
+        ("AGG1", "Gider"): 3000,
+        ("AGG2", "Gelir"): 7000,
+    }
+
+    by_kategori = finans_ctrl.aggregate(["year", "ana_kategori"], tur=["Gelir"], db=session)
+    assert {(r["yil"], r["ana_kategori"]): r["toplam_kurus"] for r in by_kategori} == {
+        (2024, None): 5025,
+        (2024, "Aidatlar"): 17000,
+        (2025, "Aidatlar"): 1000,
+    }
+
+    by_alt = finans_ctrl.aggregate(["alt_kategori"], date_range=(None, datetime(2025, 1, 1)), db=session)
+    assert {r["alt_kategori"]: r["adet"] for r in by_alt} == {None: 2, "Aylık Aidat AGG": 2}
+
+    # Bitiş varsayılan olarak hariç; bitis_dahil ile tam bitiş anındaki işlem de sayılır
+    aralik = (datetime(2024, 2, 1), datetime(2024, 2, 3))
+    assert finans_ctrl.aggregate(date_range=aralik, db=session)[0]["adet"] == 1
+    assert finans_ctrl.aggregate(date_range=aralik, bitis_dahil=True, db=session)[0]["adet"] == 2
+
+
+def test_aggregate_rejects_unknown_group_and_tur(db_session):
+    finans_ctrl = FinansIslemController()
+    with pytest.raises(ValidationError):
+        finans_ctrl.aggregate(["week"], db=db_session)
+    with pytest.raises(ValidationError):
+        finans_ctrl.aggregate(["month"], tur="Bilinmeyen", db=db_session)
+
+
+def test_search_filters_and_keyset_pages(db_session):
+    from models.base import AnaKategori, AltKategori
+    session = db_session
+    hesap_ctrl = HesapController()
+    finans_ctrl = FinansIslemController()
+
+    h1 = hesap_ctrl.create({"ad": "SRC1", "tur": "Banka", "bakiye": 1000.0}, db=session)
+    h2 = hesap_ctrl.create({"ad": "SRC2", "tur": "Kasa", "bakiye": 1000.0}, db=session)
+    ana = AnaKategori(name="Giderler SRC", tip="gider")
+    session.add(ana)
+    session.flush()
+    alt = AltKategori(name="Bakım SRC", parent_id=ana.id)
+    session.add(alt)
+    session.flush()
+
+    islemler = []
+    for gun in range(1, 8):
+        islemler.append(finans_ctrl.create({
+            "tur": "Gider" if gun % 2 else "Gelir", "tutar": float(gun),
+            "hesap_id": h1.id if gun <= 5 else h2.id, "tarih": datetime(2024, 3, gun),
+            "aciklama": f"Asansör bakımı 100%_{gun}" if gun % 3 == 0 else f"Kayıt {gun}",
+            "kategori_id": alt.id if gun % 2 else None,
+        }, db=session))
+    islemler[1].belge_yolu = "belgeler/fatura.pdf"
+    session.flush()
+
+    def ids(sayfa):
+        return [i.id for i in sayfa.items]
+
+    assert ids(finans_ctrl.search({"tur": "Gider", "hesap_id": h1.id}, db=session)) == \
+        [islemler[4].id, islemler[2].id, islemler[0].id]
+    assert ids(finans_ctrl.search({"ana_kategori_id": ana.id, "tarih_araligi": (datetime(2024, 3, 3), datetime(2024, 3, 7))},
+                                  sort="tarih_asc", db=session)) == [islemler[2].id, islemler[4].id]
+    # LIKE joker karakterleri metin olarak aranır
+    assert ids(finans_ctrl.search({"aciklama": "100%_6"}, db=session)) == [islemler[5].id]
+    assert finans_ctrl.count({"aciklama": "kayıt"}, db=session) == 5
+    assert ids(finans_ctrl.search({"aciklama": "asans"}, db=session)) == [islemler[5].id, islemler[2].id]
+    assert ids(finans_ctrl.search({"belgeli": True}, db=session)) == [islemler[1].id]
+    assert finans_ctrl.count({"belgeli": False}, db=session) == 6
+
+    # Keyset sayfaları tüm satırları bir kez verir
+    gorulen = []
+    sayfa = finans_ctrl.search({"hesap_id": [h1.id, h2.id]}, sort="tarih_desc", limit=3, db=session)
+    while True:
+        gorulen.extend(ids(sayfa))
+        if not sayfa.has_next:
+            break
+        sayfa = finans_ctrl.search({"hesap_id": [h1.id, h2.id]}, sort="tarih_desc", limit=3,
+                                   after=sayfa.next_cursor, db=session)
+    assert gorulen == [i.id for i in reversed(islemler)]
+    assert sayfa.next_cursor is None
+
+    # İlişkiler eager-load edilir
+    ilk = finans_ctrl.search({"tur": "Gider"}, limit=1, db=session).items[0]
+    assert ilk.hesap.ad == "SRC2" and ilk.kategori.ana_kategori.name == "Giderler SRC"
+
+
+def test_search_rejects_invalid_arguments(db_session):
+    finans_ctrl = FinansIslemController()
+    with pytest.raises(ValidationError):
+        finans_ctrl.search({"bilinmeyen": 1}, db=db_session)
+    with pytest.raises(ValidationError):
+        finans_ctrl.search(sort="ad_desc", db=db_session)
+    with pytest.raises(ValidationError):
+        finans_ctrl.search(limit=0, db=db_session)
+    with pytest.raises(ValidationError):
+        finans_ctrl.search(sort="tarih_desc", after=(5,), db=db_session)
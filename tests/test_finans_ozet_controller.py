@@ -0,0 +1,100 @@
+from datetime import datetime
+
+from controllers.finans_islem_controller import FinansIslemController
+from controllers.finans_ozet_controller import FinansOzetController
+from controllers.hesap_controller import HesapController
+from models.base import FinansAylikOzet
+
+
+def _ozet(session):
+    return {
+        (r.yil, r.ay, r.hesap_id, r.kategori_id, r.tur): (r.toplam_kurus, r.adet)
+        for r in session.query(FinansAylikOzet).all()
+    }
+
+
+def test_rollup_follows_create_update_delete(db_session):
+    session = db_session
+    hesap_ctrl = HesapController()
+    finans_ctrl = FinansIslemController()
+    ozet_ctrl = FinansOzetController()
+
+    h1 = hesap_ctrl.create({"ad": "OZ1", "tur": "Banka", "bakiye": 1000.0}, db=session)
+    h2 = hesap_ctrl.create({"ad": "OZ2", "tur": "Kasa", "bakiye": 0.0}, db=session)
+
+    g1 = finans_ctrl.create({"tur": "Gelir", "tutar": 100.0, "hesap_id": h1.id,
+                             "tarih": datetime(2024, 1, 10)}, db=session)
+    finans_ctrl.create({"tur": "Gelir", "tutar": 50.5, "hesap_id": h1.id,
+                        "tarih": datetime(2024, 1, 20)}, db=session)
+    gider = finans_ctrl.create({"tur": "Gider", "tutar": 30.0, "hesap_id": h1.id,
+                                "tarih": datetime(2024, 2, 1)}, db=session)
+
+    assert _ozet(session) == {
+        (2024, 1, h1.id, None, "Gelir"): (15050, 2),
+        (2024, 2, h1.id, None, "Gider"): (3000, 1),
+    }
+
+    # Tarih, hesap ve tutar değişikliği: eski kovadan çıkıp yenisine girer
+    finans_ctrl.update_with_balance_adjustment(
+        g1.id, {"tutar": 40.0, "hesap_id": h2.id, "tarih": datetime(2024, 3, 5)}, db=session
+    )
+    assert _ozet(session) == {
+        (2024, 1, h1.id, None, "Gelir"): (5050, 1),
+        (2024, 2, h1.id, None, "Gider"): (3000, 1),
+        (2024, 3, h2.id, None, "Gelir"): (4000, 1),
+    }
+
+    # Son işlem silinince boşalan kova kaldırılır
+    finans_ctrl.delete(gider.id, db=session)
+    assert (2024, 2, h1.id, None, "Gider") not in _ozet(session)
+
+    assert ozet_ctrl.verify(db=session) == []
+
+
+def test_get_toplamlar_opening_balance_and_monthly(db_session):
+    session = db_session
+    hesap_ctrl = HesapController()
+    finans_ctrl = FinansIslemController()
+    ozet_ctrl = FinansOzetController()
+
+    h1 = hesap_ctrl.create({"ad": "OZ3", "tur": "Banka", "bakiye": 1000.0}, db=session)
+    for tur, tutar, tarih in [
+        ("Gelir", 100.0, datetime(2023, 12, 31)),
+        ("Gider", 20.0, datetime(2024, 1, 15)),
+        ("Gelir", 70.0, datetime(2024, 2, 1)),
+        ("Gelir", 10.0, datetime(2024, 3, 1)),
+    ]:
+        finans_ctrl.create({"tur": tur, "tutar": tutar, "hesap_id": h1.id, "tarih": tarih}, db=session)
+
+    acilis = ozet_ctrl.get_toplamlar(["tur"], tur=["Gelir", "Gider"], bitis=(2024, 2), db=session)
+    assert {r["tur"]: r["toplam"] for r in acilis} == {"Gelir": 100.0, "Gider": 20.0}
+
+    aylik = ozet_ctrl.get_toplamlar(["month"], tur="Gelir", baslangic=(2024, 1), bitis=(2025, 1), db=session)
+    assert [(r["yil"], r["ay"], r["toplam_kurus"]) for r in aylik] == [(2024, 2, 7000), (2024, 3, 1000)]
+
+    # Rollup ile canlı aggregate aynı sonucu verir
+    canli = finans_ctrl.aggregate(["month", "tur"], db=session)
+    assert ozet_ctrl.get_toplamlar(["month", "tur"], db=session) == canli
+
+
+def test_verify_detects_drift_and_rebuild_fixes_it(db_session):
+    session = db_session
+    hesap_ctrl = HesapController()
+    finans_ctrl = FinansIslemController()
+    ozet_ctrl = FinansOzetController()
+
+    h1 = hesap_ctrl.create({"ad": "OZ4", "tur": "Banka", "bakiye": 0.0}, db=session)
+    finans_ctrl.create({"tur": "Gelir", "tutar": 10.0, "hesap_id": h1.id,
+                        "tarih": datetime(2024, 5, 1)}, db=session)
+
+    session.query(FinansAylikOzet).update({FinansAylikOzet.toplam_kurus: 1})
+    session.add(FinansAylikOzet(yil=2000, ay=1, hesap_id=h1.id, kategori_id=None,
+                                tur="Gider", toplam_kurus=5, adet=1))
+    session.flush()
+
+    farklar = ozet_ctrl.verify(db=session)
+    assert len(farklar) == 2
+
+    assert ozet_ctrl.rebuild(db=session) == 1
+    assert ozet_ctrl.verify(db=session) == []
+    assert ozet_ctrl.ensure_built(db=session) is False
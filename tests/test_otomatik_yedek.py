@@ -0,0 +1,143 @@
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from controllers.otomatik_yedek import (
+    OtomatikYedekAyarlari,
+    OtomatikYedekleyici,
+    get_backup_settings,
+    saklanacak_yedekler,
+)
+from models.base import Hesap
+from models.exceptions import ConfigError
+
+
+def test_saklanacak_yedekler_keeps_last_daily_and_monthly():
+    # 1 Ocak'tan itibaren 12 saatte bir, 90 gün
+    zamanlar = [datetime(2024, 1, 1) + timedelta(hours=12 * i) for i in range(180)]
+    assert len(saklanacak_yedekler(zamanlar, son_n=3, gunluk=0, aylik=0)) == 3
+
+    tutulacak = saklanacak_yedekler(zamanlar, son_n=1, gunluk=3, aylik=3)
+    # Son üç günün ve son üç ayın her birinin en yeni yedeği
+    assert tutulacak == {
+        datetime(2024, 3, 30, 12), datetime(2024, 3, 29, 12), datetime(2024, 3, 28, 12),
+        datetime(2024, 2, 29, 12), datetime(2024, 1, 31, 12),
+    }
+
+
+def test_get_backup_settings_reads_and_validates_config(tmp_path):
+    from configuration.config_manager import ConfigurationManager
+    config = ConfigurationManager(str(tmp_path))
+    config.set_override('backup.format', 'XML')
+    config.set_override('backup.keep_last', '3')
+    ayarlar = get_backup_settings(config)
+    assert ayarlar.bicim == 'xml' and ayarlar.son_n == 3
+
+    config.set_override('backup.format', 'zip')
+    with pytest.raises(ConfigError):
+        get_backup_settings(config)
+
+    # JSON/.env'den gelen metin boolean'lar açıkça ayrıştırılır
+    config.set_override('backup.format', 'sqlite')
+    config.set_override('backup.auto_enabled', 'false')
+    assert get_backup_settings(config).etkin is False
+    config.set_override('backup.auto_enabled', 'On')
+    assert get_backup_settings(config).etkin is True
+    config.set_override('backup.auto_enabled', 'belki')
+    with pytest.raises(ConfigError):
+        get_backup_settings(config)
+
+
+def test_yedekle_writes_backup_and_applies_retention(dosya_db, tmp_path):
+    db = dosya_db
+    db.add(Hesap(ad='Oto Hesap', tur='Banka', bakiye=1.0))
+    db.commit()
+
+    dizin = tmp_path / 'yedekler'
+    dizin.mkdir()
+    eski = [dizin / f'aidat_plus_oto_2024010{i}_030000.db.gz' for i in range(1, 5)]
+    for yol in eski:
+        yol.write_bytes(b'eski')
+    elle = dizin / 'aidat_plus_yedek_20240101_030000.db.gz'
+    elle.write_bytes(b'elle')
+
+    ayarlar = OtomatikYedekAyarlari(dizin=str(dizin), son_n=2, gunluk=0, aylik=0, bosta_suresi=0)
+    yedekleyici = OtomatikYedekleyici(ayarlar, saat=lambda: datetime(2024, 1, 5, 3, 0, 1))
+    assert yedekleyici.zamani_geldi_mi() is True
+
+    sonuc = yedekleyici.yedekle()
+    assert sonuc.basarili and sonuc.boyut == sonuc.dosya.stat().st_size > 0
+    assert sonuc.dosya.name == 'aidat_plus_oto_20240105_030001.db.gz'
+    assert sonuc.silinen == 3
+    assert sorted(p.name for p in dizin.iterdir()) == sorted([elle.name, eski[-1].name, sonuc.dosya.name])
+    assert yedekleyici.zamani_geldi_mi() is False
+
+
+def test_yedekle_failure_logs_cause(dosya_db, tmp_path, monkeypatch, caplog):
+    from controllers.backup_controller import BackupController
+
+    def disk_dolu(self, db):
+        raise OSError("disk dolu")
+
+    monkeypatch.setattr(BackupController, "_sqlite_baglantisi", disk_dolu)
+    dizin = tmp_path / 'yedekler'
+    yedekleyici = OtomatikYedekleyici(OtomatikYedekAyarlari(dizin=str(dizin), bosta_suresi=0))
+
+    with caplog.at_level("ERROR"):
+        sonuc = yedekleyici.yedekle()
+
+    assert sonuc.basarili is False and list(dizin.iterdir()) == []
+    # Gözetimsiz çalışmada hatanın nedeni log'a düşer (yalnızca stdout'a değil)
+    assert any("disk dolu" in r.getMessage() for r in caplog.records)
+
+
+def test_yedekle_waits_for_idle_ui_and_stops_on_shutdown(dosya_db, tmp_path):
+    dizin = tmp_path / 'yedekler'
+    ayarlar = OtomatikYedekAyarlari(bicim='xml', dizin=str(dizin), bosta_suresi=60)
+    yedekleyici = OtomatikYedekleyici(ayarlar)
+    yedekleyici.etkinlik_bildir()
+
+    sonuclar = []
+    thread = threading.Thread(target=lambda: sonuclar.append(yedekleyici.yedekle()))
+    thread.start()
+    time.sleep(0.5)
+    # Arayüz meşgulken yedek ilerlemiyor
+    assert thread.is_alive() and sonuclar == []
+
+    yedekleyici.durdur()
+    thread.join(5)
+    assert sonuclar[0].basarili is False
+    assert list(dizin.iterdir()) == []
+
+
+def test_scheduler_import_does_not_load_excel_dependencies():
+    """Açılışta zamanlayıcı import edilir; pandas/openpyxl yalnızca Excel işlemlerinde yüklenir"""
+    kod = ("import sys, controllers.otomatik_yedek; "
+           "print(sorted(m for m in ('pandas', 'openpyxl') if m in sys.modules))")
+    sonuc = subprocess.run([sys.executable, "-c", kod], capture_output=True, text=True, timeout=60,
+                           cwd=str(Path(__file__).resolve().parent.parent))
+    assert sonuc.returncode == 0, sonuc.stderr
+    assert sonuc.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_invalid_backup_settings_start_app_without_scheduler(monkeypatch):
+    from unittest.mock import MagicMock
+    import controllers.otomatik_yedek as otomatik_yedek
+    import main
+
+    def bozuk_ayarlar(config=None):
+        raise ConfigError("Geçersiz yedekleme ayarı", code="CFG_002")
+
+    monkeypatch.setattr(otomatik_yedek, "get_backup_settings", bozuk_ayarlar)
+    baslat = MagicMock()
+    monkeypatch.setattr(otomatik_yedek.OtomatikYedekleyici, "baslat", baslat)
+    app = MagicMock()
+
+    assert main.otomatik_yedeklemeyi_baslat(app) is None
+    baslat.assert_not_called()
+    app.root.bind_all.assert_not_called()
@@ -0,0 +1,128 @@
+import logging
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from models.exceptions import ConfigError
+from ui.background_loader import BackgroundLoader
+from ui.dashboard_panel import DashboardPanel
+from utils.query_trace import QueryTracer, get_query_trace_settings, get_query_tracer, parmak_izi
+
+
+class SahteConfig:
+    def __init__(self, degerler):
+        self.degerler = degerler
+
+    def get(self, anahtar, varsayilan=None):
+        return self.degerler.get(anahtar, varsayilan)
+
+
+@pytest.fixture
+def bellek_engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE daireler (id INTEGER PRIMARY KEY, no VARCHAR(10))"))
+        conn.execute(text("INSERT INTO daireler (id, no) VALUES (1, '101'), (2, '102')"))
+    yield engine
+    engine.dispose()
+
+
+def test_fingerprint_strips_literals_and_collapses_in_lists():
+    assert parmak_izi("SELECT *  FROM daireler\n WHERE id IN (?, ?, ?) AND no = '1''01' LIMIT 20") == \
+        "SELECT * FROM daireler WHERE id IN (?) AND no = ? LIMIT ?"
+    assert parmak_izi("SELECT anon_1.id FROM t AS anon_1 WHERE x = 2.5") == \
+        "SELECT anon_1.id FROM t AS anon_1 WHERE x = ?"
+
+
+def test_tracer_records_statements_callers_and_flags_n_plus_one(bellek_engine, caplog):
+    tracer = QueryTracer()
+    tracer.baslat(yavas_sorgu_ms=1e9, tekrar_esigi=5, hedef=bellek_engine)
+    # Controller metodu gibi görünen çağıran (modül adı "controllers." ile başlar)
+    kapsam = {"__name__": "controllers.sahte_controller", "text": text}
+    exec(
+        "class SahteController:\n"
+        "    def daire_no(self, conn, daire_id):\n"
+        "        return conn.execute(text('SELECT no FROM daireler WHERE id = :id'), {'id': daire_id}).scalar()\n",
+        kapsam,
+    )
+    controller = kapsam["SahteController"]()
+    try:
+        with caplog.at_level(logging.WARNING, logger="utils.query_trace"):
+            with tracer.eylem("AidatPanel:islemler"):
+                with bellek_engine.connect() as conn:
+                    for i in range(6):
+                        controller.daire_no(conn, i % 2 + 1)
+                    conn.execute(text("SELECT count(*) FROM daireler")).scalar()
+                    # İç içe eylem dıştakine katılır
+                    with tracer.eylem("ic"):
+                        conn.execute(text("UPDATE daireler SET no = no WHERE id = 1"))
+            with tracer.eylem("az_sorgu"):
+                with bellek_engine.connect() as conn:
+                    controller.daire_no(conn, 1)
+    finally:
+        tracer.durdur()
+    with bellek_engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+    iz = "SELECT no FROM daireler WHERE id = ?"
+    istatistikler = {s.parmak_izi: s for s in tracer.istatistikler()}
+    assert set(istatistikler) == {iz, "SELECT count(*) FROM daireler", "UPDATE daireler SET no = no WHERE id = ?"}
+    assert istatistikler[iz].adet == 7
+    assert istatistikler[iz].cagiranlar == {"controllers.sahte_controller.SahteController.daire_no": 7}
+    assert istatistikler["UPDATE daireler SET no = no WHERE id = ?"].satir == 1
+
+    ozetler = tracer.eylem_ozetleri()
+    assert [(o.ad, o.sorgu_sayisi) for o in ozetler] == [("AidatPanel:islemler", 8), ("az_sorgu", 1)]
+    tekrar, = ozetler[0].tekrarlar
+    assert (tekrar.parmak_izi, tekrar.adet, tekrar.farkli_parametre) == (iz, 6, 2)
+    assert tekrar.cagiran.endswith("SahteController.daire_no")
+    assert ozetler[1].tekrarlar == []
+    assert any("Possible N+1 in AidatPanel:islemler" in r.message for r in caplog.records)
+
+    rapor = tracer.rapor(limit=1)
+    assert rapor["toplam_sorgu"] == 9 and len(rapor["en_pahali"]) == 1
+    assert [(t["eylem"], t["adet"]) for t in rapor["n_arti_bir"]] == [("AidatPanel:islemler", 6)]
+
+
+def test_background_loader_groups_fetch_queries_into_an_action(bellek_engine):
+    tracer = get_query_tracer()
+    tracer.sifirla()
+    tracer.baslat(hedef=bellek_engine)
+    try:
+        def fetch(token):
+            with bellek_engine.connect() as conn:
+                return conn.execute(text("SELECT no FROM daireler ORDER BY id")).scalars().all()
+
+        # Panel yükleyicisi eylemleri widget'ın değil panelin adıyla gruplar
+        panel = DashboardPanel.__new__(DashboardPanel)
+        sonuclar = []
+        panel.loader.submit("daireler", fetch, sonuclar.append)
+        BackgroundLoader(None, ad="chart").submit("trend", fetch, sonuclar.append)
+    finally:
+        tracer.durdur()
+
+    assert sonuclar == [["101", "102"], ["101", "102"]]
+    assert [(o.ad, o.sorgu_sayisi) for o in tracer.eylem_ozetleri()[-2:]] == [
+        ("DashboardPanel:daireler", 1), ("chart:trend", 1)
+    ]
+    tracer.sifirla()
+
+
+def test_get_query_trace_settings_reads_env_and_validates(monkeypatch):
+    monkeypatch.delenv("AIDAT_QUERY_TRACE", raising=False)
+    monkeypatch.delenv("AIDAT_QUERY_TRACE_FILE", raising=False)
+    ayarlar = get_query_trace_settings(SahteConfig({"profiling.slow_query_ms": "250"}))
+    assert (ayarlar.etkin, ayarlar.rapor_yolu, ayarlar.yavas_sorgu_ms, ayarlar.tekrar_esigi) == (
+        False, "logs/query_trace.json", 250.0, 10
+    )
+
+    monkeypatch.setenv("AIDAT_QUERY_TRACE", "1")
+    monkeypatch.setenv("AIDAT_QUERY_TRACE_FILE", "sorgu.json")
+    ayarlar = get_query_trace_settings(SahteConfig({}))
+    assert (ayarlar.etkin, ayarlar.rapor_yolu) == (True, "sorgu.json")
+
+    with pytest.raises(ConfigError):
+        get_query_trace_settings(SahteConfig({"profiling.slow_query_ms": -5}))
+    with pytest.raises(ConfigError):
+        get_query_trace_settings(SahteConfig({"profiling.n_plus_one_threshold": 1}))
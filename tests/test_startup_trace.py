@@ -0,0 +1,169 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from configuration.config_manager import ConfigurationManager
+from models.exceptions import ConfigError
+from utils.startup_trace import StartupTracer, get_startup_trace_settings, izleme_istendi
+
+PROJE_DIZINI = Path(__file__).resolve().parent.parent
+
+
+class SahteSaat:
+    def __init__(self):
+        self.an = 100.0
+
+    def __call__(self):
+        return self.an
+
+
+class SahteConfig:
+    def __init__(self, degerler):
+        self.degerler = degerler
+
+    def get(self, anahtar, varsayilan=None):
+        return self.degerler.get(anahtar, varsayilan)
+
+
+def test_tracer_records_phases_marks_and_budget_overruns():
+    saat = SahteSaat()
+    tracer = StartupTracer(saat=saat, paketler=())
+    tracer.baslat()
+
+    with tracer.asama("konfigurasyon"):
+        saat.an += 0.120
+    saat.an += 0.010
+    with tracer.asama("veritabani"):
+        saat.an += 0.450
+    tracer.isaretle("ilk_pencere")
+    tracer.durdur()
+    saat.an += 5
+
+    sureler = tracer.sureler()
+    assert sureler["konfigurasyon"] == pytest.approx(120)
+    assert sureler["veritabani"] == pytest.approx(450)
+    assert sureler["ilk_pencere"] == sureler["toplam"] == pytest.approx(580)
+
+    asimlar = tracer.butce_asimlari({"veritabani": 300, "konfigurasyon": 200, "import:pandas": 0})
+    assert [(a.ad, a.butce_ms) for a in asimlar] == [("veritabani", 300.0)]
+
+    rapor = tracer.rapor({"veritabani": 300})
+    assert [a["ad"] for a in rapor["asamalar"]] == ["konfigurasyon", "veritabani"]
+    assert rapor["asamalar"][1]["baslangic_ms"] == pytest.approx(130)
+    assert rapor["butce_asimlari"] == [{"ad": "veritabani", "sure_ms": 450.0, "butce_ms": 300.0}]
+
+
+def test_import_hook_times_watched_package_and_restores_loader(tmp_path, monkeypatch):
+    paket = tmp_path / "izlenen_agir_paket"
+    paket.mkdir()
+    (paket / "__init__.py").write_text("import time\ntime.sleep(0.02)\nDEGER = 42\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, "izlenen_agir_paket", raising=False)
+
+    tracer = StartupTracer(paketler=("izlenen_agir_paket",))
+    tracer.baslat()
+    try:
+        import izlenen_agir_paket
+    finally:
+        tracer.durdur()
+
+    assert izlenen_agir_paket.DEGER == 42
+    assert type(izlenen_agir_paket.__loader__).__name__ == "SourceFileLoader"
+    assert izlenen_agir_paket.__spec__.loader is izlenen_agir_paket.__loader__
+    assert tracer.sureler()["import:izlenen_agir_paket"] >= 20
+    assert all(type(bulucu).__name__ != "_ImportBulucu" for bulucu in sys.meta_path)
+
+
+def test_get_startup_trace_settings_reads_env_and_validates_budgets(monkeypatch):
+    monkeypatch.delenv("AIDAT_STARTUP_TRACE", raising=False)
+    monkeypatch.delenv("AIDAT_STARTUP_TRACE_FILE", raising=False)
+    ayarlar = get_startup_trace_settings(SahteConfig({"profiling.startup_budgets_ms": {"veritabani": "250"}}))
+    assert (ayarlar.etkin, ayarlar.rapor_yolu, ayarlar.butceler_ms) == (
+        False, "logs/startup_trace.json", {"veritabani": 250.0}
+    )
+
+    monkeypatch.setenv("AIDAT_STARTUP_TRACE", "1")
+    monkeypatch.setenv("AIDAT_STARTUP_TRACE_FILE", "iz.json")
+    ayarlar = get_startup_trace_settings(SahteConfig({}))
+    assert (ayarlar.etkin, ayarlar.rapor_yolu) == (True, "iz.json")
+
+    with pytest.raises(ConfigError):
+        get_startup_trace_settings(SahteConfig({"profiling.startup_budgets_ms": {"veritabani": -1}}))
+    with pytest.raises(ConfigError):
+        get_startup_trace_settings(SahteConfig({"profiling.startup_budgets_ms": [100]}))
+
+
+def test_import_hook_is_installed_only_when_tracing_is_requested(tmp_path, monkeypatch):
+    monkeypatch.delenv("AIDAT_STARTUP_TRACE", raising=False)
+    assert izleme_istendi(str(tmp_path)) is False
+    (tmp_path / "app_config.json").write_text(json.dumps({"profiling": {"startup_trace": True}}))
+    assert izleme_istendi(str(tmp_path)) is True
+    # Sonraki dosya öncekini ezer; bozuk dosya atlanır
+    (tmp_path / "user_preferences.json").write_text(json.dumps({"profiling": {"startup_trace": False}}))
+    (tmp_path / "kategoriler.json").write_text("{bozuk")
+    assert izleme_istendi(str(tmp_path)) is False
+    monkeypatch.setenv("AIDAT_STARTUP_TRACE", "1")
+    assert izleme_istendi(str(tmp_path)) is True
+
+    onceki = list(sys.meta_path)
+    tracer = StartupTracer(paketler=("izlenmeyen_paket",))
+    tracer.baslat(importlari_izle=False)
+    assert sys.meta_path == onceki
+    with tracer.asama("veritabani"):
+        pass
+    tracer.durdur()
+    assert "veritabani" in tracer.sureler()
+
+
+def _arayuzsuz_acilis(tmp_path, butceler):
+    """main.veritabanini_hazirla'yı ayrı süreçte ölç; raporu ve yüklenen paketleri döndür"""
+    (tmp_path / "logs").mkdir()
+    kod = (
+        "import json, sys\n"
+        "from utils.startup_trace import get_startup_tracer\n"
+        "tracer = get_startup_tracer()\n"
+        "tracer.baslat()\n"
+        "import main\n"
+        "main.veritabanini_hazirla()\n"
+        "tracer.durdur()\n"
+        "rapor = tracer.rapor(json.loads(sys.argv[1]))\n"
+        "rapor['yuklenen'] = sorted(ad for ad in ('pandas', 'openpyxl') if ad in sys.modules)\n"
+        "print(json.dumps(rapor))\n"
+    )
+    sonuc = subprocess.run(
+        [sys.executable, "-c", kod, json.dumps(butceler)],
+        cwd=str(tmp_path), capture_output=True, text=True, timeout=120,
+        env={**os.environ, "PYTHONPATH": str(PROJE_DIZINI)},
+    )
+    assert sonuc.returncode == 0, sonuc.stderr
+    return json.loads(sonuc.stdout.strip().splitlines()[-1])
+
+
+def _konfigurasyon_butceleri():
+    return get_startup_trace_settings(
+        ConfigurationManager(config_dir=str(PROJE_DIZINI / "config"))
+    ).butceler_ms
+
+
+def test_headless_startup_records_phases_without_zero_budget_imports(tmp_path):
+    """Arayüzsüz açılış aşamaları ölçülmeli, 0 bütçeli paketler hiç import edilmemeli"""
+    butceler = _konfigurasyon_butceleri()
+    rapor = _arayuzsuz_acilis(tmp_path, butceler)
+
+    assert {"konfigurasyon", "modeller", "veritabani", "finans_ozeti"} <= {a["ad"] for a in rapor["asamalar"]}
+    assert "import:sqlalchemy" in {i["ad"] for i in rapor["importlar"]}
+    sifir_butceli = {ad.split(":", 1)[1] for ad, ms in butceler.items() if ad.startswith("import:") and ms == 0}
+    assert sifir_butceli and not sifir_butceli & set(rapor["yuklenen"])
+
+
+@pytest.mark.perf
+def test_headless_startup_stays_within_configured_budgets(tmp_path):
+    """Arayüzsüz açılış adımları config/app_config.json bütçelerini aşmamalı (duvar saati)"""
+    butceler = _konfigurasyon_butceleri()
+    assert butceler
+    rapor = _arayuzsuz_acilis(tmp_path, butceler)
+    assert rapor["butce_asimlari"] == [], json.dumps(rapor, indent=2)
@@ -0,0 +1,132 @@
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+import database.config as db_config
+from database.unit_of_work import (
+    unit_of_work, transactional, current_unit_of_work, session_metrics
+)
+from models.base import Lojman
+
+
+@pytest.fixture
+def uow_db(tmp_path, monkeypatch):
+    """Dosya tabanlı geçici veritabanına bağlı gerçek SessionLocal"""
+    test_engine = db_config.create_configured_engine(f"sqlite:///{tmp_path / 'uow.db'}")
+    db_config.Base.metadata.create_all(bind=test_engine)
+    factory = sessionmaker(class_=db_config.ScopedSession, autocommit=False,
+                           autoflush=False, bind=test_engine)
+    monkeypatch.setattr(db_config, "SessionLocal", factory)
+    session_metrics.reset()
+    try:
+        yield factory
+    finally:
+        test_engine.dispose()
+
+
+def _lojman_sayisi(factory):
+    session = factory()
+    try:
+        return session.query(Lojman).count()
+    finally:
+        session.close()
+
+
+def test_get_db_shares_one_session_inside_unit_of_work(uow_db):
+    with unit_of_work("test.shared") as uow:
+        first = db_config.get_db()
+        second = db_config.get_db()
+        with db_config.get_db_session() as third:
+            pass
+        assert first is second is third
+        assert uow.sessions_opened == 1
+        assert uow.session_requests == 3
+    assert current_unit_of_work() is None
+
+    counters = session_metrics.snapshot()["test.shared"]
+    assert counters == {"runs": 1, "sessions_opened": 1, "session_requests": 3}
+
+
+def test_controller_style_commit_and_close_are_deferred(uow_db):
+    with unit_of_work("test.commit"):
+        session = db_config.get_db()
+        session.add(Lojman(ad="UoW Lojman", adres="Adres"))
+        session.commit()
+        session.close()
+        # Commit yalnızca flush yapar; başka bir oturum henüz görmez
+        assert _lojman_sayisi(uow_db) == 0
+        # Kapatılmış sanılan oturum hâlâ kullanılabilir
+        assert db_config.get_db().query(Lojman).count() == 1
+
+    assert _lojman_sayisi(uow_db) == 1
+
+
+def test_exception_rolls_back_whole_unit_of_work(uow_db):
+    with pytest.raises(RuntimeError):
+        with unit_of_work("test.rollback"):
+            session = db_config.get_db()
+            session.add(Lojman(ad="Geri Alınacak", adres="Adres"))
+            session.commit()
+            raise RuntimeError("hata")
+
+    assert _lojman_sayisi(uow_db) == 0
+
+
+def test_nested_unit_of_work_joins_outer(uow_db):
+    with unit_of_work("test.outer") as outer:
+        with unit_of_work("test.inner") as inner:
+            assert inner is outer
+            inner.session.add(Lojman(ad="İç", adres="Adres"))
+            inner.session.commit()
+        assert _lojman_sayisi(uow_db) == 0
+    assert _lojman_sayisi(uow_db) == 1
+    assert "test.inner" not in session_metrics.snapshot()
+
+
+def test_transactional_decorator_and_unused_unit_of_work(uow_db):
+    @transactional()
+    def iki_sorgu():
+        db_config.get_db().query(Lojman).count()
+        db_config.get_db().query(Lojman).count()
+        return current_unit_of_work().action
+
+    action = iki_sorgu()
+    assert action.endswith("iki_sorgu")
+    assert session_metrics.snapshot()[action]["sessions_opened"] == 1
+
+    with unit_of_work("test.empty"):
+        pass
+    assert session_metrics.snapshot()["test.empty"]["sessions_opened"] == 0
+
+
+def test_sessions_outside_unit_of_work_are_independent(uow_db):
+    first = db_config.get_db()
+    second = db_config.get_db()
+    try:
+        assert first is not second
+    finally:
+        first.close()
+        second.close()
+
+
+def test_inner_controller_rollback_fails_whole_unit_of_work(uow_db):
+    from controllers.base_controller import BaseController
+    from controllers.lojman_controller import LojmanController
+    from models.exceptions import DatabaseError
+
+    ilk, ikinci = LojmanController(), BaseController(Lojman)
+    with pytest.raises(DatabaseError) as exc:
+        with unit_of_work("test.inner_rollback"):
+            ilk.create({"ad": "Birinci", "adres": "Adres"})
+            # İkinci controller IntegrityError'da rollback yapar; hata arayüzde yutulur
+            with pytest.raises(DatabaseError):
+                ikinci.create({"ad": "Birinci", "adres": "Adres"})
+            ilk.create({"ad": "Üçüncü", "adres": "Adres"})
+    assert exc.value.details == {"action": "test.inner_rollback"}
+    # Ne geri alınan ne de sonraki yazma kalıcı olur
+    assert _lojman_sayisi(uow_db) == 0
+
+    # Yalnızca okuma yapan aksiyonda yutulan hata sessizce kapanır
+    with unit_of_work("test.read_rollback"):
+        db_config.get_db().query(Lojman).count()
+        db_config.get_db().rollback()
+    assert _lojman_sayisi(uow_db) == 0
@@ -847,39 +847,48 @@ def test_get_sakin_at_date_returns_correct_name(monkeypatch):
     
     panel = AidatPanel(parent=None, colors=colors)
     
-    # Mock database session and query
-    class MockSakin:
-        def __init__(self, tam_ad):
-            self.tam_ad = tam_ad
-    
+    # Mock database session: the occupancy index loads all residents in one query
+    from datetime import datetime
+    from controllers.doluluk_controller import DolulukController
+
     class MockDB:
-        def query(self, model):
+        def __init__(self):
+            self.query_count = 0
+
+        def query(self, *columns):
+            self.query_count += 1
             return self
             
         def filter(self, *args):
             return self
             
-        def order_by(self, *args):
-            return self
-            
-        def first(self):
-            return MockSakin("Test Sakin")
+        def all(self):
+            # (ad_soyad, daire_id, eski_daire_id, tahsis_tarihi, cikis_tarihi)
+            return [
+                ("Test Sakin", 1, None, datetime(2024, 6, 1), None),
+                ("Eski Sakin", None, 1, datetime(2020, 1, 1), datetime(2024, 5, 31)),
+            ]
             
         def close(self):
             pass
     
-    def mock_get_db():
-        return MockDB()
+    mock_db = MockDB()
     
-    # Monkeypatch database access
+    # Monkeypatch database access and start from an empty index
     import database.config as db_config
-    monkeypatch.setattr(db_config, 'get_db', mock_get_db)
+    monkeypatch.setattr(db_config, 'get_db', lambda: mock_db)
+    monkeypatch.setattr(DolulukController, '_index', None)
     
     # Call the method
     result = panel.get_sakin_at_date(1, 2025, 1)
     
     # Check that correct name is returned
     assert result == "Test Sakin"
+    assert panel.get_sakin_at_date(1, 2023, 3) == "Eski Sakin"
+    assert panel.get_sakin_at_date(1, 2019, 12) is None
+    assert panel.get_sakin_at_date(2, 2025, 1) is None
+    # All lookups are answered from a single query
+    assert mock_db.query_count == 1
 
 
 def test_load_daireler_calls_controller(monkeypatch):
@@ -457,4 +457,28 @@ def test_sifirla_veritabani_requires_confirmation(monkeypatch):
     # Check that confirmation was asked
     assert confirm_calls == 1
     # Check that controller method was not called
-    panel.backup_controller.reset_database.assert_not_called()
\ No newline at end of file
+    panel.backup_controller.reset_database.assert_not_called()
+
+def test_yedek_al_sqlite_uses_compressed_online_backup(monkeypatch):
+    """SQLite formatı .db.gz dosyasına sıkıştırılmış online kopya almalı"""
+    monkeypatch.setattr(BasePanel, '__init__', fake_base_init)
+    colors = {'background': '#fff', 'surface': '#f7f7f7', 'primary': '#222', 'text': '#333',
+              'success': '#28a745', 'error': '#dc3545'}
+    panel = AyarlarPanel(parent=None, colors=colors)
+
+    dialog_args = {}
+    def mock_asksaveasfilename(**kwargs):
+        dialog_args.update(kwargs)
+        return "/tmp/yedek.db.gz"
+
+    monkeypatch.setattr("ui.ayarlar_panel.filedialog.asksaveasfilename", mock_asksaveasfilename)
+    monkeypatch.setattr("ui.ayarlar_panel.os.path.getsize", lambda x: 2048)
+    panel.backup_controller = MagicMock()
+    panel.backup_controller.backup_to_sqlite.return_value = True
+    panel.show_message = MagicMock()
+
+    panel.yedek_al("sqlite")
+
+    assert dialog_args["defaultextension"] == ".db.gz"
+    panel.backup_controller.backup_to_sqlite.assert_called_once_with("/tmp/yedek.db.gz", compress=True)
+    panel.show_message.assert_called_once()
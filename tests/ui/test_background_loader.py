@@ -0,0 +1,104 @@
+import threading
+import time
+
+import pytest
+
+from ui.background_loader import BackgroundLoader, LoadCancelled
+
+
+class FakeWidget:
+    """after() çağrılarını kaydeden, elle pompalanan Tk widget'ı"""
+
+    def __init__(self):
+        self.exists = True
+        self.callbacks = []
+        self.main_thread = threading.get_ident()
+
+    def winfo_exists(self):
+        return self.exists
+
+    def after(self, ms, callback):
+        assert threading.get_ident() == self.main_thread, "after() yalnızca ana thread'den çağrılmalı"
+        self.callbacks.append(callback)
+        return f"after#{len(self.callbacks)}"
+
+    def pump(self, loader, timeout=5.0):
+        """Bekleyen yüklemeler bitene kadar planlanmış callback'leri çalıştır"""
+        bitis = time.time() + timeout
+        while time.time() < bitis:
+            callbacks, self.callbacks = self.callbacks, []
+            for callback in callbacks:
+                callback()
+            if loader.pending == 0 and not self.callbacks:
+                return
+            time.sleep(0.01)
+        raise AssertionError("yükleme zaman aşımına uğradı")
+
+
+def test_without_widget_runs_synchronously():
+    loader = BackgroundLoader(None)
+    sonuclar, hatalar = [], []
+
+    loader.submit("a", lambda token: [1, 2], sonuclar.append)
+    loader.submit("b", lambda token: 1 / 0, sonuclar.append, on_error=hatalar.append)
+
+    assert sonuclar == [[1, 2]]
+    assert isinstance(hatalar[0], ZeroDivisionError)
+
+
+def test_fetch_runs_off_main_thread_and_render_on_main_thread():
+    widget = FakeWidget()
+    loader = BackgroundLoader(widget)
+    kayit = {}
+
+    def fetch(token):
+        kayit["fetch_thread"] = threading.get_ident()
+        return ("satir",)
+
+    def render(sonuc):
+        kayit["render_thread"] = threading.get_ident()
+        kayit["sonuc"] = sonuc
+
+    loader.submit("rapor", fetch, render)
+    assert "sonuc" not in kayit
+    widget.pump(loader)
+
+    assert kayit["sonuc"] == ("satir",)
+    assert kayit["fetch_thread"] != widget.main_thread
+    assert kayit["render_thread"] == widget.main_thread
+
+
+def test_superseded_load_is_dropped():
+    widget = FakeWidget()
+    loader = BackgroundLoader(widget)
+    birak = threading.Event()
+    cizilen = []
+
+    def yavas_fetch(token):
+        birak.wait(5)
+        return "eski filtre"
+
+    eski_token = loader.submit("filtre", yavas_fetch, cizilen.append)
+    yeni_token = loader.submit("filtre", lambda token: "yeni filtre", cizilen.append)
+    assert eski_token.cancelled and not yeni_token.cancelled
+
+    birak.set()
+    widget.pump(loader)
+    time.sleep(0.05)
+    widget.pump(loader)
+
+    assert cizilen == ["yeni filtre"]
+    with pytest.raises(LoadCancelled):
+        eski_token.raise_if_cancelled()
+
+
+def test_results_dropped_after_widget_destroyed():
+    widget = FakeWidget()
+    loader = BackgroundLoader(widget)
+    cizilen, hatalar = [], []
+
+    loader.submit("a", lambda token: "veri", cizilen.append, on_error=hatalar.append)
+    widget.exists = False
+    widget.pump(loader)
+
+    assert cizilen == [] and hatalar == []
@@ -4,6 +4,7 @@ from ui.base_panel import BasePanel
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch, ANY
 from datetime import datetime
+from utils.pagination import KeysetPage
 
 
 def fake_base_init(self, parent, title, colors):
@@ -136,10 +137,8 @@ def test_finans_panel_initialization(monkeypatch):
     assert panel.aktif_hesaplar == []
     assert panel.pasif_hesaplar == []
     assert panel.ana_kategoriler == []
-    assert panel.gelirler == []
-    assert panel.giderler == []
     assert panel.duzenlenen_islem_id is None
-    assert panel.tum_islemler_verisi == []
+    assert panel.islem_kaynagi is None
     assert panel.secili_belge_yolu is None
     assert panel.filter_tur == "Tümü"
     assert panel.filter_hesap == "Tümü"
@@ -258,6 +257,7 @@ def test_load_islemler_populates_tree(monkeypatch):
     # Use IDs in descending order to match the sorting behavior in the actual code
     transfer = SimpleNamespace(
         id=3, 
+        tur='Transfer',
         tutar=10.0, 
         tarih=now, 
         kategori=None, 
@@ -268,6 +268,7 @@ def test_load_islemler_populates_tree(monkeypatch):
     )
     gid = SimpleNamespace(
         id=2, 
+        tur='Gider',
         tutar=50.0, 
         tarih=now, 
         kategori=DummyKategori('Bakim', 'Gider'), 
@@ -277,6 +278,7 @@ def test_load_islemler_populates_tree(monkeypatch):
     )
     gel = SimpleNamespace(
         id=1, 
+        tur='Gelir',
         tutar=100.0, 
         tarih=now, 
         kategori=DummyKategori('Aidat'), 
@@ -285,14 +287,19 @@ def test_load_islemler_populates_tree(monkeypatch):
         belge_yolu=None
     )
     
-    panel.finans_controller = SimpleNamespace(
-        get_gelirler=lambda: [gel], 
-        get_giderler=lambda: [gid], 
-        get_transferler=lambda: [transfer]
-    )
+    aramalar = []
+
+    def search(filters, sort, limit, offset, after):
+        aramalar.append((filters, sort, offset, after))
+        return KeysetPage(items=[transfer, gid, gel], next_cursor=None, has_next=False)
+
+    panel.finans_controller = SimpleNamespace(search=search, count=lambda filters: 3)
     
     panel.load_islemler()
     
+    # Only the first page is requested from the controller
+    assert aramalar == [({}, "id_desc", 0, None)]
+
     # Check that tree has the right number of items
     assert len(panel.islemler_tree.rows) == 3
     
@@ -339,6 +346,19 @@ def test_load_islemler_populates_tree(monkeypatch):
     assert gelir_values[7] == ''  # belge
     assert gelir_values[8] == 'test gelir'  # aciklama
 
+    # Satırlar worker'da düz demetlere çevrilir; ORM nesnesi tutulmaz
+    kayit = panel._islem_kaydi("islem_2")
+    assert isinstance(kayit, tuple) and not any(v is gid for v in kayit)
+    assert (kayit.tur, kayit.id, kayit.belge_yolu) == ("gider", 2, '/path/to/document.pdf')
+
+    # Düzenleme modalı işlemi ilişkileriyle birlikte ID'den okur
+    panel.islemler_tree.selection = lambda: ["islem_2"]
+    panel.finans_controller.get_with_details = lambda islem_id: gid if islem_id == 2 else None
+    acilan = []
+    monkeypatch.setattr(panel, "open_gider_modal", acilan.append)
+    panel.duzenle_islem()
+    assert acilan == [gid] and panel.duzenlenen_islem_id == 2
+
 
 def test_open_yeni_hesap_modal_creates_window(monkeypatch):
     """Test that open_yeni_hesap_modal creates a modal window"""
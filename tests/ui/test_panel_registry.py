@@ -0,0 +1,92 @@
+import importlib
+import sys
+import types
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from database import tablo_surumleri
+from models.base import Hesap, Lojman
+from ui.panel_registry import PanelRegistry, PanelTanimi
+
+COLORS = {'primary': '#003366', 'surface': '#ffffff'}
+
+
+@pytest.fixture
+def sahte_panel_modulu(monkeypatch):
+    """Import edilene kadar kayıt tutan sahte panel modülü"""
+    modul = types.ModuleType("tests_sahte_panel")
+    modul.SahtePanel = MagicMock(side_effect=lambda parent, colors: MagicMock(name="panel"))
+    monkeypatch.setitem(sys.modules, "tests_sahte_panel", modul)
+    yuklenen = []
+    import_module = importlib.import_module
+
+    def izleyen_import(ad, *args):
+        yuklenen.append(ad)
+        return import_module(ad, *args)
+
+    monkeypatch.setattr(importlib, "import_module", izleyen_import)
+    return modul, yuklenen
+
+
+def test_panels_are_built_lazily_hidden_and_reused(sahte_panel_modulu):
+    modul, yuklenen = sahte_panel_modulu
+    center = MagicMock()
+    registry = PanelRegistry(MagicMock(), COLORS, center)
+    registry.kaydet(PanelTanimi("Finans", "💰 Finans", "tests_sahte_panel", "SahtePanel",
+                                tablolar=("hesaplar",)))
+    assert "tests_sahte_panel" not in yuklenen and registry.panel("Finans") is None
+
+    with patch('customtkinter.CTkToplevel') as toplevel, \
+         patch('customtkinter.CTkFrame'), patch('customtkinter.CTkLabel'), patch('customtkinter.CTkFont'):
+        panel = registry.goster("Finans")
+        pencere = toplevel.return_value
+        center.assert_called_once_with(pencere, 1200, 700)
+        assert "tests_sahte_panel" in yuklenen and modul.SahtePanel.call_count == 1
+
+        # Kapatma düğmesi pencereyi gizler, yüklemeleri iptal eder
+        kapat = pencere.protocol.call_args[0][1]
+        kapat()
+        pencere.withdraw.assert_called_once()
+        panel.cancel_loads.assert_called_once()
+
+        # Değişiklik yok: aynı panel, veri yeniden yüklenmeden geri gelir
+        assert registry.goster("Finans") is panel
+        pencere.deiconify.assert_called_once()
+        panel.load_data.assert_not_called()
+
+        # İlgisiz tablo değişti: yenileme yok
+        tablo_surumleri.artir(["lojmanlar"])
+        registry.goster("Finans")
+        panel.load_data.assert_not_called()
+
+        # İzlenen tablo değişti: yalnızca veri yenilenir
+        tablo_surumleri.artir(["hesaplar"])
+        registry.goster("Finans")
+        registry.goster("Finans")
+        panel.load_data.assert_called_once()
+        assert modul.SahtePanel.call_count == 1 and toplevel.call_count == 1
+
+        # Pencere dışarıdan yok edildiyse panel yeniden kurulur
+        pencere.winfo_exists.return_value = False
+        assert registry.goster("Finans") is not panel
+        assert modul.SahtePanel.call_count == 2
+
+
+def test_table_versions_follow_session_writes(db_session):
+    hesap_surumu = tablo_surumleri.surum(["hesaplar"])
+    lojman_surumu = tablo_surumleri.surum(["lojmanlar"])
+
+    db_session.add(Hesap(ad="Sürüm Kasa", tur="Kasa"))
+    db_session.commit()
+    assert tablo_surumleri.surum(["hesaplar"]) > hesap_surumu
+    assert tablo_surumleri.surum(["lojmanlar"]) == lojman_surumu
+
+    # Session üzerinden çalışan toplu ifadeler de sayılır
+    db_session.query(Lojman).filter(Lojman.id < 0).delete()
+    db_session.commit()
+    assert tablo_surumleri.surum(["lojmanlar"]) > lojman_surumu
+
+    genel = tablo_surumleri.surum(["aidatlar"])
+    tablo_surumleri.hepsini_artir()
+    assert tablo_surumleri.surum(["aidatlar"]) > genel
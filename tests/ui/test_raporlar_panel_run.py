@@ -136,21 +136,30 @@ def test_load_bilanco_populates_tree_and_labels(monkeypatch):
     panel.bilanco_donem_gider_label = DummyLabel()
     panel.bilanco_son_bakiye_label = DummyLabel()
 
-    # Dummy financial entries
-    class DummyKategori:
-        def __init__(self, name, ana_kat_name):
-            self.name = name
-            self.ana_kategori = SimpleNamespace(name=ana_kat_name)
-
-    from datetime import datetime as dt
-    now = dt.now()
-    gel1 = SimpleNamespace(id=1, tutar=100.0, tarih=now, kategori=DummyKategori('Aidat', 'Gelir'))
-    gid1 = SimpleNamespace(id=2, tutar=40.0, tarih=now, kategori=DummyKategori('Bakim','Gider'))
+    # Bilanço yalnızca rollup'tan okur: dönem öncesi ve dönem içi toplamlar
+    cagrilar = []
+
+    def get_toplamlar(**kwargs):
+        cagrilar.append(kwargs)
+        if kwargs["group_by"] == ["tur"]:
+            return [{"tur": "Gelir", "toplam": 500.0}, {"tur": "Gider", "toplam": 200.0}]
+        return [
+            {"tur": "Gelir", "ana_kategori": "Aidatlar", "hesap_id": 1, "toplam": 100.0},
+            {"tur": "Gelir", "ana_kategori": "Aidatlar", "hesap_id": 2, "toplam": 20.0},
+            {"tur": "Gider", "ana_kategori": None, "hesap_id": 2, "toplam": 40.0},
+        ]
+
+    def tum_islemler():
+        raise AssertionError("Bilanço işlem geçmişini taramamalı")
 
     monkeypatch.setattr(panel, 'finans_controller', SimpleNamespace(
-        get_gelirler=lambda: [gel1],
-        get_giderler=lambda: [gid1]
+        get_gelirler=tum_islemler,
+        get_giderler=tum_islemler
     ))
+    monkeypatch.setattr(panel, 'finans_ozet_controller', SimpleNamespace(get_toplamlar=get_toplamlar))
+    monkeypatch.setattr(panel, 'hesap_controller', SimpleNamespace(get_all=lambda: [
+        SimpleNamespace(id=1, para_birimi='₺'), SimpleNamespace(id=2, para_birimi='USD')
+    ]))
 
     # Ensure no filter combo boxes so default branch executes
     if hasattr(panel, 'bilanco_filtre_tur_combo'):
@@ -168,13 +177,22 @@ def test_load_bilanco_populates_tree_and_labels(monkeypatch):
     # Check there was no error
     assert panel.last_error is None
     # Check tree populated with 2 rows (1 gelir, 1 gider)
-    assert len(panel.bilanco_tree.rows) == 2
+    assert panel.bilanco_tree.rows == [
+        ("Gelir", "Aidatlar", "120.00 ₺"),
+        ("Gider", "Tanımsız", "40.00 USD"),
+    ]
+
+    # Dönem içi toplamlar yalnızca seçili ay için okunur
+    now = datetime.now()
+    donem = cagrilar[1]
+    assert donem["baslangic"] == (now.year, now.month)
+    assert donem["bitis"] == ((now.year + 1, 1) if now.month == 12 else (now.year, now.month + 1))
 
     # Check labels configured
-    assert panel.bilanco_onceki_bakiye_label.text is not None
-    assert panel.bilanco_donem_gelir_label.text is not None
-    assert panel.bilanco_donem_gider_label.text is not None
-    assert panel.bilanco_son_bakiye_label.text is not None
+    assert panel.bilanco_onceki_bakiye_label.text == "300.00 ₺"
+    assert panel.bilanco_donem_gelir_label.text == "120.00 ₺"
+    assert panel.bilanco_donem_gider_label.text == "40.00 ₺"
+    assert panel.bilanco_son_bakiye_label.text == "380.00 ₺"
 
 def test_load_icmal_populates_tree_and_labels(monkeypatch):
     # Patch BasePanel to avoid UI creation
@@ -331,29 +349,13 @@ def test_load_bos_konut_listesi_populates_tree(monkeypatch):
     # Provide dummy UI attributes
     panel.bos_konut_tree = DummyTree()
 
-    # Mock database session
-    def mock_get_db():
-        class MockSession:
-            def query(self, model):
-                return self
-            
-            def options(self, *args):
-                return self
-            
-            def filter(self, condition):
-                return self
-            
-            def all(self):
-                # Return minimal data for testing
-                return []
-            
-            def close(self):
-                pass
-        
-        return MockSession()
+    # Report computation is the controller's job; return an empty period
+    istenen = []
+    def fake_report(baslangic, bitis=None, dagitim="konut", db=None):
+        istenen.append(baslangic)
+        return {baslangic: ([], 0.0)}
+    monkeypatch.setattr(panel.bos_konut_controller, 'get_empty_housing_report', fake_report)
 
-    monkeypatch.setattr('ui.raporlar_panel.get_db', mock_get_db)
-    
     # Ensure no filter combo boxes so default branch executes
     if hasattr(panel, 'bos_konut_yil_combo'):
         panel.bos_konut_yil_combo = None
@@ -371,6 +373,8 @@ def test_load_bos_konut_listesi_populates_tree(monkeypatch):
     assert panel.last_error is None
     # Check tree populated
     assert len(panel.bos_konut_tree.rows) >= 1  # At least the "no empty units" message
+    from datetime import datetime as dt
+    assert istenen == [(dt.now().year, dt.now().month)]
 
 def test_load_kategori_dagilimi_executes_without_error(monkeypatch):
     # Patch BasePanel to avoid UI creation
@@ -430,21 +434,27 @@ def test_load_aylik_ozet_executes_without_error(monkeypatch):
 
     panel = RaporlarPanel(parent=None, colors=colors)
 
-    # Dummy financial entries
-    class DummyKategori:
-        def __init__(self, name, ana_kat_name):
-            self.name = name
-            self.ana_kategori = SimpleNamespace(name=ana_kat_name)
-
+    # Dummy aggregate rows (month x tur x kategori)
     from datetime import datetime as dt
     now = dt.now()
-    gel1 = SimpleNamespace(id=1, tutar=100.0, tarih=now, kategori=DummyKategori('Aidat', 'Gelir'))
-    gid1 = SimpleNamespace(id=2, tutar=40.0, tarih=now, kategori=DummyKategori('Bakim','Gider'))
-
-    monkeypatch.setattr(panel, 'finans_controller', SimpleNamespace(
-        get_gelirler=lambda: [gel1],
-        get_giderler=lambda: [gid1]
-    ))
+    satirlar = [
+        {"yil": now.year, "ay": now.month, "tur": "Gelir", "alt_kategori_id": 1,
+         "alt_kategori": "Aidat", "ana_kategori_id": 1, "ana_kategori": "Gelir",
+         "toplam_kurus": 10000, "toplam": 100.0, "adet": 1},
+        {"yil": now.year, "ay": now.month, "tur": "Gider", "alt_kategori_id": 2,
+         "alt_kategori": "Bakim", "ana_kategori_id": 2, "ana_kategori": "Gider",
+         "toplam_kurus": 4000, "toplam": 40.0, "adet": 1},
+        {"yil": now.year, "ay": now.month, "tur": "Gider", "alt_kategori_id": None,
+         "alt_kategori": None, "ana_kategori_id": None, "ana_kategori": None,
+         "toplam_kurus": 500, "toplam": 5.0, "adet": 1},
+    ]
+
+    calls = []
+    def fake_get_toplamlar(**kwargs):
+        calls.append(kwargs)
+        return satirlar
+
+    monkeypatch.setattr(panel, 'finans_ozet_controller', SimpleNamespace(get_toplamlar=fake_get_toplamlar))
 
     # Ensure no filter combo boxes so default branch executes
     if hasattr(panel, 'aylik_ozet_yil_combo'):
@@ -459,8 +469,11 @@ def test_load_aylik_ozet_executes_without_error(monkeypatch):
     # Run loader
     panel.load_aylik_ozet()
 
-    # Check there was no error
+    # Check there was no error and the totals were computed in one query
     assert panel.last_error is None
+    assert len(calls) == 1
+    assert calls[0]["baslangic"] == (now.year, 1)
+    assert calls[0]["bitis"] == (now.year + 1, 1)
 
 def test_load_trend_analizi_executes_without_error(monkeypatch):
     # Patch BasePanel to avoid UI creation
@@ -477,21 +490,27 @@ def test_load_trend_analizi_executes_without_error(monkeypatch):
 
     panel = RaporlarPanel(parent=None, colors=colors)
 
-    # Dummy financial entries
-    class DummyKategori:
-        def __init__(self, name, ana_kat_name):
-            self.name = name
-            self.ana_kategori = SimpleNamespace(name=ana_kat_name)
-
+    # Dummy aggregate rows (month x tur x kategori)
     from datetime import datetime as dt
     now = dt.now()
-    gel1 = SimpleNamespace(id=1, tutar=100.0, tarih=now, kategori=DummyKategori('Aidat', 'Gelir'))
-    gid1 = SimpleNamespace(id=2, tutar=40.0, tarih=now, kategori=DummyKategori('Bakim','Gider'))
-
-    monkeypatch.setattr(panel, 'finans_controller', SimpleNamespace(
-        get_gelirler=lambda: [gel1],
-        get_giderler=lambda: [gid1]
-    ))
+    satirlar = [
+        {"yil": now.year, "ay": now.month, "tur": "Gelir", "alt_kategori_id": 1,
+         "alt_kategori": "Aidat", "ana_kategori_id": 1, "ana_kategori": "Gelir",
+         "toplam_kurus": 10000, "toplam": 100.0, "adet": 1},
+        {"yil": now.year, "ay": now.month, "tur": "Gider", "alt_kategori_id": 2,
+         "alt_kategori": "Bakim", "ana_kategori_id": 2, "ana_kategori": "Gider",
+         "toplam_kurus": 4000, "toplam": 40.0, "adet": 1},
+        {"yil": now.year, "ay": now.month, "tur": "Gider", "alt_kategori_id": None,
+         "alt_kategori": None, "ana_kategori_id": None, "ana_kategori": None,
+         "toplam_kurus": 500, "toplam": 5.0, "adet": 1},
+    ]
+
+    calls = []
+    def fake_get_toplamlar(**kwargs):
+        calls.append(kwargs)
+        return satirlar
+
+    monkeypatch.setattr(panel, 'finans_ozet_controller', SimpleNamespace(get_toplamlar=fake_get_toplamlar))
 
     # Ensure no filter combo boxes so default branch executes
     if hasattr(panel, 'trend_analizi_yil_combo'):
@@ -506,6 +525,7 @@ def test_load_trend_analizi_executes_without_error(monkeypatch):
     # Run loader
     panel.load_trend_analizi()
 
-    # Check there was no error
+    # Check there was no error and the totals were computed in one query
     assert panel.last_error is None
+    assert len(calls) == 1
 
@@ -0,0 +1,190 @@
+from ui.virtual_treeview import KeysetRowSource, ListRowSource, QueryRowSource, VirtualTreeview
+from utils.pagination import KeysetPage
+
+
+class FakeTree:
+    """Treeview'in VirtualTreeview tarafından kullanılan alt kümesi"""
+
+    def __init__(self, height=10):
+        self.height = height
+        self.nodes = {}
+        self.selected = ()
+        self.insert_count = 0
+        self.moveto = None
+
+    def cget(self, option):
+        return self.height
+
+    def winfo_height(self):
+        return 0
+
+    def get_children(self, item=''):
+        return list(self.nodes.keys())
+
+    def delete(self, item):
+        self.nodes.pop(item, None)
+
+    def insert(self, parent, index, iid=None, values=(), tags=()):
+        self.nodes[iid] = {'values': values, 'tags': tags}
+        self.insert_count += 1
+        return iid
+
+    def selection(self):
+        return tuple(i for i in self.selected if i in self.nodes)
+
+    def selection_set(self, items):
+        self.selected = tuple(items)
+
+    def yview(self):
+        return (0.0, 1.0)
+
+    def yview_moveto(self, fraction):
+        self.moveto = fraction
+
+
+def _formatter(row):
+    return (row, f"Satır {row}"), ("cift",) if row % 2 == 0 else ()
+
+
+def test_only_visible_window_is_materialized():
+    tree = FakeTree(height=10)
+    view = VirtualTreeview(tree, buffer=5)
+
+    view.set_rows(list(range(10000)), _formatter, key=lambda r: f"r{r}")
+
+    assert view.total == 10000
+    assert view.window == (0, 15)
+    assert list(tree.nodes) == [f"r{i}" for i in range(15)]
+    assert tree.nodes["r4"] == {'values': (4, "Satır 4"), 'tags': ("cift",)}
+    assert view.row_for_item("r3") == 3
+
+
+def test_scrollbar_moves_window_and_keeps_selection():
+    tree = FakeTree(height=10)
+    view = VirtualTreeview(tree, buffer=5)
+    view.set_rows(ListRowSource(list(range(1000))), _formatter, key=lambda r: f"r{r}")
+
+    tree.selected = ("r2",)
+    view.yview("moveto", "0.5")
+    # 500. satır en üstte: 5 satır tampon üstte, 10 görünür + 5 tampon altta
+    assert view.window == (495, 515)
+    assert "r2" not in tree.nodes
+    assert tree.moveto == 5 / 20
+
+    view.yview("moveto", "0.0")
+    assert view.window == (0, 15)
+    assert tree.selection() == ("r2",)
+
+    view.scroll_to_end()
+    assert view.window == (985, 1000)
+    assert len(tree.nodes) == 15
+
+
+def test_set_rows_replaces_source_and_resets_position():
+    tree = FakeTree(height=10)
+    view = VirtualTreeview(tree, buffer=5)
+    view.set_rows(list(range(1000)), _formatter)
+    view.yview("moveto", "0.9")
+
+    view.set_rows([7, 8, 9], _formatter)
+    assert view.window == (0, 3)
+    assert [n['values'][0] for n in tree.nodes.values()] == [7, 8, 9]
+
+
+def test_query_row_source_pages_and_counts(db_session):
+    from controllers.hesap_controller import HesapController
+    from models.base import Hesap
+
+    hesap_ctrl = HesapController()
+    for i in range(7):
+        hesap_ctrl.create({"ad": f"VT{i}", "tur": "Kasa", "bakiye": float(i)}, db=db_session)
+
+    kaynak = QueryRowSource(
+        lambda s: s.query(Hesap.ad).filter(Hesap.ad.like("VT%")).order_by(Hesap.ad),
+        page_size=3, max_pages=2
+    )
+
+    assert len(kaynak) == 7
+    assert [r.ad for r in kaynak.fetch(2, 4)] == ["VT2", "VT3", "VT4", "VT5"]
+    assert [r.ad for r in kaynak.fetch(6, 10)] == ["VT6"]
+    assert len(kaynak._pages) == 2
+
+
+def test_keyset_row_source_follows_cursors_and_falls_back_to_offset():
+    satirlar = list(range(100, 0, -1))
+    cagrilar = []
+
+    def sayfa_getir(after, offset, limit):
+        cagrilar.append((after, offset))
+        kalan = [s for s in satirlar if after is None or s < after[0]][offset:]
+        parca = kalan[:limit]
+        devam = len(kalan) > limit
+        return KeysetPage(items=parca, next_cursor=(parca[-1],) if devam else None, has_next=devam)
+
+    kaynak = KeysetRowSource(sayfa_getir, lambda: len(satirlar), page_size=10, max_pages=3)
+
+    assert len(kaynak) == 100
+    assert kaynak.fetch(5, 10) == list(range(95, 85, -1))
+    # Sıralı sayfalar imleçle, uzak atlama offset ile okunur
+    assert cagrilar == [(None, 0), ((91,), 0)]
+    assert kaynak.fetch(70, 3) == [30, 29, 28]
+    assert cagrilar[-1] == (None, 70)
+    assert len(kaynak._pages) == 3
+
+    kaynak.invalidate()
+    assert kaynak.fetch(0, 1) == [100] and cagrilar[-1] == (None, 0)
+
+
+class ElleLoader:
+    """Yüklemeleri sıraya alan, testte elle çalıştırılan BackgroundLoader yerine geçen sınıf"""
+
+    def __init__(self):
+        self.bekleyen = {}
+
+    def submit(self, key, fetch, render, on_error=None):
+        self.bekleyen[key] = (fetch, render)
+
+    def cancel(self, key=None):
+        self.bekleyen.pop(key, None)
+
+    def calistir(self):
+        for fetch, render in list(self.bekleyen.values()):
+            render(fetch(None))
+        self.bekleyen.clear()
+
+
+def test_uncached_pages_are_fetched_on_loader_and_rendered_later():
+    satirlar = list(range(1000))
+    cagrilar = []
+
+    def sayfa_getir(after, offset, limit):
+        cagrilar.append(offset)
+        parca = satirlar[offset:offset + limit]
+        return KeysetPage(items=parca, next_cursor=None, has_next=False)
+
+    kaynak = KeysetRowSource(sayfa_getir, lambda: len(satirlar), page_size=50)
+    # Panel fetch aşaması: sayı ve ilk sayfa worker'da okunur
+    len(kaynak)
+    kaynak.fetch(0, 50)
+
+    loader = ElleLoader()
+    tree = FakeTree(height=10)
+    view = VirtualTreeview(tree, buffer=5, loader=loader)
+    view.set_rows(kaynak, _formatter, key=lambda r: f"r{r}")
+    # İlk pencere önbellekte: doğrudan çizilir
+    assert view.window == (0, 15) and not loader.bekleyen
+    assert cagrilar == [0]
+
+    view.yview("moveto", "0.5")
+    # Sayfa önbellekte değil: Tk thread'inde okunmaz, eski pencere kalır
+    assert cagrilar == [0] and view.window == (0, 15)
+    assert len(loader.bekleyen) == 1
+
+    loader.calistir()
+    assert cagrilar == [0, 450, 500]
+    assert view.window == (495, 515) and "r500" in tree.nodes
+
+    # Okuma bitmeden önbellekteki bir pencereye dönülürse geç sonuç çizilmez
+    view.yview("moveto", "0.8")
+    view.yview("moveto", "0.0")
+    assert not loader.bekleyen and view.window == (0, 15)
@@ -5,9 +5,10 @@ Aidat paneli
 import customtkinter as ctk
 from tkinter import ttk, Menu, Toplevel, filedialog
 import tkinter as tk
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 from ui.base_panel import BasePanel
+from ui.background_loader import LoadToken
 from ui.error_handler import (
     ErrorHandler, handle_exception, show_error, show_success, show_warning,
     UIValidator
@@ -18,6 +19,8 @@ from controllers.finans_islem_controller import FinansIslemController
 from controllers.hesap_controller import HesapController
 from controllers.kategori_yonetim_controller import KategoriYonetimController
 from controllers.belge_controller import BelgeController
+from controllers.doluluk_controller import DolulukController
+from database.fts import turkce_katla
 from models.base import AidatIslem, AidatOdeme, Daire
 from models.exceptions import (
     ValidationError, DatabaseError, NotFoundError, DuplicateError, BusinessLogicError
@@ -38,6 +41,7 @@ class AidatPanel(BasePanel):
         hesap_controller (HesapController): Hesap yönetim denetleyicisi
         kategori_controller (KategoriYonetimController): Kategori yönetim denetleyicisi
         belge_controller (BelgeController): Belge yönetim denetleyicisi
+        doluluk_controller (DolulukController): Tarihe göre daire sakini indeksi
     """
 
     def __init__(self, parent: ctk.CTk, colors: dict) -> None:
@@ -48,10 +52,12 @@ class AidatPanel(BasePanel):
         self.hesap_controller = HesapController()
         self.kategori_controller = KategoriYonetimController()
         self.belge_controller = BelgeController()
+        self.doluluk_controller = DolulukController()
         self.secili_belge_yolu: Optional[str] = None
 
         # Veri saklama
         self.aidat_islemleri: List[AidatIslem] = []
+        self.aidat_islem_sakinleri: Dict[int, str] = {}  # İşlem ID → dönem sakini
         self.aidat_odemeleri: List[AidatOdeme] = []
         self.daireler: List[Daire] = []
         self.tum_aidat_islemleri_verisi: List[AidatIslem] = []  # Tüm işlemlerin orijinal listesi
@@ -160,9 +166,9 @@ class AidatPanel(BasePanel):
         self.aidat_islem_tree.column("aciklama", width=150, anchor="center")
         self.aidat_islem_tree.column("son_odeme", width=60, anchor="center")
 
-        # Scrollbar
-        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.aidat_islem_tree.yview)
-        self.aidat_islem_tree.configure(yscrollcommand=v_scrollbar.set)
+        # Scrollbar - sanal kaydırma, yalnızca görünür satırlar çizilir
+        v_scrollbar = ttk.Scrollbar(table_frame, orient="vertical")
+        self.virtual_tree(self.aidat_islem_tree, scrollbar=v_scrollbar)
 
         # Grid layout
         self.aidat_islem_tree.grid(row=0, column=0, sticky="nsew")
@@ -249,6 +255,9 @@ class AidatPanel(BasePanel):
     def get_sakin_at_date(self, daire_id: int, yil: int, ay: int) -> Optional[str]:
         """Verilen tarihte dairede yaşayan sakinin adını getir
         
+        Sakinler tablosu tek sorguda yüklenen paylaşılan doluluk indeksinden
+        çözümlenir; satır başına veritabanı sorgusu yapılmaz.
+        
         Args:
             daire_id (int): Daire ID'si
             yil (int): Yıl
@@ -258,31 +267,8 @@ class AidatPanel(BasePanel):
             Optional[str]: Sakin adı ya da None
         """
         try:
-            from datetime import datetime
-            from database.config import get_db
-            from models.base import Sakin
-            
-            # İşlem tarihi
-            islem_tarihi = datetime(yil, ay, 1)
-            
-            db = get_db()
-            # Dairede tahsis tarihi <= işlem tarihi ve (çıkış tarihi None veya >= işlem tarihi) olan sakinleri bul
-            sakin = db.query(Sakin).filter(
-                Sakin.daire_id == daire_id,
-                Sakin.tahsis_tarihi <= islem_tarihi,
-                (Sakin.cikis_tarihi == None) | (Sakin.cikis_tarihi >= islem_tarihi)
-            ).order_by(Sakin.tahsis_tarihi.desc()).first()
-            
-            # Eski daire olarak kayıtlı sakinleri de kontrol et (çıkış sonrası)
-            if not sakin:
-                sakin = db.query(Sakin).filter(
-                    Sakin.eski_daire_id == daire_id,
-                    Sakin.tahsis_tarihi <= islem_tarihi,
-                    (Sakin.cikis_tarihi == None) | (Sakin.cikis_tarihi >= islem_tarihi)
-                ).order_by(Sakin.tahsis_tarihi.desc()).first()
-            
-            db.close()
-            return sakin.tam_ad if sakin else None
+            controller = getattr(self, "doluluk_controller", None) or DolulukController()
+            return controller.sakin_at_date(daire_id, yil, ay)
         except Exception as e:
             print(f"Sakin sorgulama hatası: {e}")
             return None
@@ -294,63 +280,114 @@ class AidatPanel(BasePanel):
         self.load_daireler()
 
     def load_aidat_islemleri(self) -> None:
-        """Aidat işlemlerini yükle"""
-        for item in self.aidat_islem_tree.get_children():
-            self.aidat_islem_tree.delete(item)
+        """Aidat işlemlerini yükle (veri worker thread'de çekilir, tablo ana thread'de çizilir)"""
+        self.run_in_background(
+            "aidat_islemleri", self._fetch_aidat_islemleri, self._render_aidat_islemleri,
+            on_error=lambda e: self.show_error(f"Aidat işlemleri yüklenirken hata oluştu: {str(e)}")
+        )
+
+    def _fetch_aidat_islemleri(self, token: LoadToken) -> Tuple[List[AidatIslem], Dict[int, str], Tuple[list, list, list]]:
+        """
+        Aidat işlemlerini, dönem sakinlerini ve filtre seçeneklerini hazırla (worker thread).
 
-        self.aidat_islemleri = self.aidat_islem_controller.get_all_with_details()
+        Args:
+            token (LoadToken): Yükleme iptal token'ı
+
+        Returns:
+            Tuple: (sıralı işlemler, işlem ID → sakin adı, (daire, yıl, ay) filtre seçenekleri)
+        """
+        islemler = self.aidat_islem_controller.get_all_with_details()
+        token.raise_if_cancelled()
         
         # ID'ye göre sırala (en son eklenen en üstte)
-        self.aidat_islemleri = sorted(self.aidat_islemleri, key=lambda x: x.id, reverse=True)
+        islemler = sorted(islemler, key=lambda x: x.id, reverse=True)
+
+        # İşlem tarihinde dairede oturan sakinler (doluluk indeksinden)
+        sakinler = {}
+        daire_listesi = set()
+        yil_listesi = set()
+        ay_listesi = set()
+        for islem in islemler:
+            sakinler[islem.id] = self.get_sakin_at_date(islem.daire.id, islem.yil, islem.ay) or "Boş"
+            daire_listesi.add(f"{islem.daire.blok.lojman.ad} {islem.daire.blok.ad}-{islem.daire.daire_no}")
+            yil_listesi.add(str(islem.yil))
+            ay_listesi.add(islem.ay_adi)
+
+        secenekler = (
+            ["Tümü"] + sorted(daire_listesi),
+            ["Tümü"] + sorted(yil_listesi, reverse=True),
+            ["Tümü"] + sorted(ay_listesi),
+        )
+        return islemler, sakinler, secenekler
+
+    def _render_aidat_islemleri(self, sonuc: Tuple[List[AidatIslem], Dict[int, str], Tuple[list, list, list]]) -> None:
+        """
+        Aidat işlemleri tablosunu ve filtre seçeneklerini çiz (ana thread).
+
+        Args:
+            sonuc: ``_fetch_aidat_islemleri`` sonucu
+        """
+        self.aidat_islemleri, self.aidat_islem_sakinleri, secenekler = sonuc
         
         # Tüm işlemleri sakla (filtreleme için)
         self.tum_aidat_islemleri_verisi = self.aidat_islemleri.copy()
         
         # Filtre combo'larını güncelle
         if hasattr(self, 'filter_islem_daire_combo'):
-            daire_listesi = set()
-            yil_listesi = set()
-            ay_listesi = set()
-            for islem in self.aidat_islemleri:
-                daire_info = f"{islem.daire.blok.lojman.ad} {islem.daire.blok.ad}-{islem.daire.daire_no}"
-                daire_listesi.add(daire_info)
-                yil_listesi.add(str(islem.yil))
-                ay_listesi.add(islem.ay_adi)
-            daire_options = ["Tümü"] + sorted(list(daire_listesi))
-            yil_options = ["Tümü"] + sorted(list(yil_listesi), reverse=True)
-            ay_options = ["Tümü"] + sorted(list(ay_listesi))
+            daire_options, yil_options, ay_options = secenekler
             self.filter_islem_daire_combo.configure(values=daire_options)
             self.filter_islem_yil_combo.configure(values=yil_options)
             self.filter_islem_ay_combo.configure(values=ay_options)
 
-        for islem in self.aidat_islemleri:
-            daire_info = f"{islem.daire.blok.lojman.ad} {islem.daire.blok.ad}-{islem.daire.daire_no}"
-            # İşlem tarihinde dairede oturan sakinini bul
+        # Yalnızca görünür pencere çizilir
+        self.virtual_tree(self.aidat_islem_tree).set_rows(
+            self.aidat_islemleri, self._aidat_islem_satiri, key=self._aidat_islem_iid
+        )
+
+    @staticmethod
+    def _aidat_islem_iid(islem: AidatIslem) -> str:
+        """Aidat işlemi satırı için kalıcı Treeview item ID'si"""
+        return f"aidat_{islem.id}"
+
+    def _aidat_islem_satiri(self, islem: AidatIslem) -> Tuple[tuple, tuple]:
+        """
+        Aidat işlemini Treeview satır değerlerine çevir.
+
+        Args:
+            islem (AidatIslem): Aidat işlemi
+
+        Returns:
+            Tuple[tuple, tuple]: (values, tags)
+        """
+        daire_info = f"{islem.daire.blok.lojman.ad} {islem.daire.blok.ad}-{islem.daire.daire_no}"
+        # İşlem tarihinde dairede oturan sakin (yüklemede hazırlandıysa oradan)
+        sakin_info = self.aidat_islem_sakinleri.get(islem.id)
+        if sakin_info is None:
             sakin_info = self.get_sakin_at_date(islem.daire.id, islem.yil, islem.ay) or "Boş"
-            
-            # İlişkili finans işleminden para birimini al
-            para_birimi = "₺"  # Varsayılan
-            for odeme in islem.odemeler:
-                if odeme.finans_islem and odeme.finans_islem.hesap:
-                    para_birimi = odeme.finans_islem.hesap.para_birimi or "₺"
-                    break
 
-            self.aidat_islem_tree.insert("", "end", values=(
-                islem.id,
-                daire_info,
-                sakin_info,
-                islem.yil,
-                islem.ay_adi,
-                f"{islem.aidat_tutari:.2f} {para_birimi}",
-                f"{islem.katki_payi:.2f} {para_birimi}",
-                f"{islem.elektrik:.2f} {para_birimi}",
-                f"{islem.su:.2f} {para_birimi}",
-                f"{islem.isinma:.2f} {para_birimi}",
-                f"{islem.ek_giderler:.2f} {para_birimi}",
-                f"{islem.toplam_tutar:.2f} {para_birimi}",
-                islem.aciklama or "",
-                islem.son_odeme_tarihi.strftime("%d.%m.%Y") if islem.son_odeme_tarihi else ""
-            ))
+        # İlişkili finans işleminden para birimini al
+        para_birimi = "₺"  # Varsayılan
+        for odeme in islem.odemeler:
+            if odeme.finans_islem and odeme.finans_islem.hesap:
+                para_birimi = odeme.finans_islem.hesap.para_birimi or "₺"
+                break
+
+        return (
+            islem.id,
+            daire_info,
+            sakin_info,
+            islem.yil,
+            islem.ay_adi,
+            f"{islem.aidat_tutari:.2f} {para_birimi}",
+            f"{islem.katki_payi:.2f} {para_birimi}",
+            f"{islem.elektrik:.2f} {para_birimi}",
+            f"{islem.su:.2f} {para_birimi}",
+            f"{islem.isinma:.2f} {para_birimi}",
+            f"{islem.ek_giderler:.2f} {para_birimi}",
+            f"{islem.toplam_tutar:.2f} {para_birimi}",
+            islem.aciklama or "",
+            islem.son_odeme_tarihi.strftime("%d.%m.%Y") if islem.son_odeme_tarihi else ""
+        ), ()
 
     def load_aidat_odemeleri(self) -> None:
         """Aidat ödemelerini yükle"""
@@ -1403,16 +1440,13 @@ class AidatPanel(BasePanel):
     def uygula_islem_filtreler(self) -> None:
         """Aidat işlemleri sekmesine seçili filtreleri uygula"""
         try:
-            # Treeview'i temizle
-            for item in self.aidat_islem_tree.get_children():
-                self.aidat_islem_tree.delete(item)
-            
             # Filtre değerlerini al
             filter_daire = self.filter_islem_daire_combo.get()
             filter_yil = self.filter_islem_yil_combo.get()
             filter_ay = self.filter_islem_ay_combo.get()
             
             # Tüm işlemleri filtrele
+            filtrelenmis = []
             for islem in self.tum_aidat_islemleri_verisi:
                 daire_info = f"{islem.daire.blok.lojman.ad} {islem.daire.blok.ad}-{islem.daire.daire_no}"
                 
@@ -1428,33 +1462,12 @@ class AidatPanel(BasePanel):
                 if filter_ay != "Tümü" and islem.ay_adi != filter_ay:
                     continue
                 
-                # İşlemi tabloya ekle
-                # İşlem tarihinde dairede oturan sakinini bul
-                sakin_info = self.get_sakin_at_date(islem.daire.id, islem.yil, islem.ay) or "Boş"
-                
-                # İlişkili finans işleminden para birimini al
-                para_birimi = "₺"  # Varsayılan
-                for odeme in islem.odemeler:
-                    if odeme.finans_islem and odeme.finans_islem.hesap:
-                        para_birimi = odeme.finans_islem.hesap.para_birimi or "₺"
-                        break
+                filtrelenmis.append(islem)
 
-                self.aidat_islem_tree.insert("", "end", values=(
-                    islem.id,
-                    daire_info,
-                    sakin_info,
-                    islem.yil,
-                    islem.ay_adi,
-                    f"{islem.aidat_tutari:.2f} {para_birimi}",
-                    f"{islem.katki_payi:.2f} {para_birimi}",
-                    f"{islem.elektrik:.2f} {para_birimi}",
-                    f"{islem.su:.2f} {para_birimi}",
-                    f"{islem.isinma:.2f} {para_birimi}",
-                    f"{islem.ek_giderler:.2f} {para_birimi}",
-                    f"{islem.toplam_tutar:.2f} {para_birimi}",
-                    islem.aciklama or "",
-                    islem.son_odeme_tarihi.strftime("%d.%m.%Y") if islem.son_odeme_tarihi else ""
-                ))
+            # Filtrelenmiş işlemleri tabloya ver - yalnızca görünür pencere çizilir
+            self.virtual_tree(self.aidat_islem_tree).set_rows(
+                filtrelenmis, self._aidat_islem_satiri, key=self._aidat_islem_iid
+            )
         except Exception as e:
             print(f"İşlem filtreleme hatası: {e}")
 
@@ -1583,7 +1596,7 @@ class AidatPanel(BasePanel):
             # Filtre değerlerini al
             filter_daire = self.filter_odeme_daire_combo.get()
             filter_durum = self.filter_odeme_durum_combo.get()
-            filter_aciklama = self.filter_odeme_aciklama_entry.get().lower()
+            filter_aciklama = turkce_katla(self.filter_odeme_aciklama_entry.get())
             
             # Tüm ödemeleri filtrele
             for odeme in self.tum_aidat_odemeleri_verisi:
@@ -1601,7 +1614,7 @@ class AidatPanel(BasePanel):
                     continue
                 
                 # Açıklama filtresi
-                aciklama = (odeme.aciklama or "").lower()
+                aciklama = turkce_katla(odeme.aciklama)
                 if filter_aciklama and filter_aciklama not in aciklama:
                     continue
                 
@@ -228,6 +228,22 @@ class AyarlarPanel(BasePanel):
         )
         xml_button.pack(side="right", padx=10, pady=10)
 
+        # SQLite (online kopya) yedekleme
+        sqlite_frame = ctk.CTkFrame(yedek_frame, fg_color=self.colors["surface"])
+        sqlite_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        sqlite_label = ctk.CTkLabel(sqlite_frame, text="Veritabanı kopyası al (hızlı, sıkıştırılmış):", text_color=self.colors["text"])
+        sqlite_label.pack(side="left", padx=10, pady=10)
+
+        sqlite_button = ctk.CTkButton(
+            sqlite_frame,
+            text="Veritabanı Yedeği Al",
+            command=lambda: self.yedek_al("sqlite"),
+            fg_color=self.colors["success"],
+            hover_color=self.colors["primary"]
+        )
+        sqlite_button.pack(side="right", padx=10, pady=10)
+
         # Geri yükleme işlemleri
         yukle_frame = ctk.CTkFrame(main_frame, fg_color=self.colors["surface"])
         yukle_frame.pack(fill="x", padx=0, pady=(0, 20))
@@ -267,6 +283,22 @@ class AyarlarPanel(BasePanel):
         )
         xml_yukle_button.pack(side="right", padx=10, pady=10)
 
+        # SQLite kopyasından geri yükleme
+        sqlite_yukle_frame = ctk.CTkFrame(yukle_frame, fg_color=self.colors["surface"])
+        sqlite_yukle_frame.pack(fill="x", padx=10, pady=(0, 10))
+
+        sqlite_yukle_label = ctk.CTkLabel(sqlite_yukle_frame, text="Veritabanı kopyasından geri yükle:", text_color=self.colors["text"])
+        sqlite_yukle_label.pack(side="left", padx=10, pady=10)
+
+        sqlite_yukle_button = ctk.CTkButton(
+            sqlite_yukle_frame,
+            text="Kopyadan Yükle",
+            command=lambda: self.yedekten_yukle("sqlite"),
+            fg_color=self.colors["warning"],
+            hover_color=self.colors["error"]
+        )
+        sqlite_yukle_button.pack(side="right", padx=10, pady=10)
+
         # Uyarı metni
         warning_frame = ctk.CTkFrame(main_frame, fg_color=self.colors["accent"])
         warning_frame.pack(fill="x", padx=0, pady=(20, 10))
@@ -286,7 +318,7 @@ class AyarlarPanel(BasePanel):
         
         info_label = ctk.CTkLabel(
             info_frame,
-            text="💡 TİP: Excel ve XML formatlarında tam veri yedekleme yapabilirsiniz.\nYedek dosyalarını güvenli bir yerde saklayın.",
+            text="💡 TİP: Excel ve XML formatlarında tam veri yedekleme yapabilirsiniz.\nVeritabanı kopyası en hızlı yedekleme ve geri yükleme yoludur.\nYedek dosyalarını güvenli bir yerde saklayın.",
             text_color=self.colors["text_secondary"],
             font=ctk.CTkFont(size=10),
             justify="left"
@@ -731,13 +763,19 @@ class AyarlarPanel(BasePanel):
             if format_type == "excel":
                 filename = f"aidat_plus_yedek_{timestamp}.xlsx"
                 filetypes = [("Excel files", "*.xlsx")]
+                extension = ".xlsx"
+            elif format_type == "sqlite":
+                filename = f"aidat_plus_yedek_{timestamp}.db.gz"
+                filetypes = [("SQLite yedeği", "*.db.gz"), ("SQLite veritabanı", "*.db")]
+                extension = ".db.gz"
             else:  # xml
                 filename = f"aidat_plus_yedek_{timestamp}.xml"
                 filetypes = [("XML files", "*.xml")]
+                extension = ".xml"
 
             # Dosya kaydetme dialog'u
             filepath = filedialog.asksaveasfilename(
-                defaultextension=f".{format_type}",
+                defaultextension=extension,
                 filetypes=filetypes,
                 initialfile=filename,
                 title=f"Yedek Dosyası Olarak Kaydet ({format_type.upper()})"
@@ -750,6 +788,8 @@ class AyarlarPanel(BasePanel):
             success = False
             if format_type == "excel":
                 success = self.backup_controller.backup_to_excel(filepath)
+            elif format_type == "sqlite":
+                success = self.backup_controller.backup_to_sqlite(filepath, compress=filepath.endswith(".gz"))
             else:  # xml
                 success = self.backup_controller.backup_to_xml(filepath)
 
@@ -768,6 +808,8 @@ class AyarlarPanel(BasePanel):
             # Dosya seçme dialog'u
             if format_type == "excel":
                 filetypes = [("Excel files", "*.xlsx")]
+            elif format_type == "sqlite":
+                filetypes = [("SQLite yedeği", "*.db.gz *.db")]
             else:  # xml
                 filetypes = [("XML files", "*.xml")]
 
@@ -796,6 +838,8 @@ class AyarlarPanel(BasePanel):
             try:
                 if format_type == "excel":
                     success = self.backup_controller.restore_from_excel(filepath)
+                elif format_type == "sqlite":
+                    success = self.backup_controller.restore_from_sqlite(filepath)
                 else:  # xml
                     success = self.backup_controller.restore_from_xml(filepath)
             except Exception as restore_error:
@@ -0,0 +1,272 @@
+"""
+Panel arka plan yükleyicisi - veri çekme worker thread'de, çizim Tk thread'inde
+
+Panellerin ``load_*`` metotları iki aşamaya ayrılır:
+
+* **fetch**: Paylaşılan thread havuzunda çalışır, controller'ları çağırır ve
+  Tk'ye dokunmadan düz demetler / listeler döndürür.
+* **render**: Tk ana thread'inde ``after()`` ile çalışır ve sonucu widget'lara
+  yazar.
+
+Aynı anahtarla yeni bir yükleme başlatıldığında önceki yüklemenin token'ı
+iptal edilir; geç gelen eski sonuç çizilmez (ör. hızlı filtre değişimleri).
+
+Tk thread-safe olmadığı için worker'lar widget'lara veya ``after()``'a
+dokunmaz; sonuçlar bir kuyruğa yazılır ve ana thread kuyruğu ``after()`` ile
+yoklar.
+
+Her yüklemenin fetch aşaması sorgu izleyicisinde (bkz.
+``utils.query_trace``) ``<Panel>:<anahtar>`` adlı bir eylem olarak
+gruplanır (grafik yüklemeleri ``chart:<grafik>``); böylece N+1 kalıpları
+hangi panelin hangi yüklemesinden geldiğine göre raporlanır.
+"""
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from utils.logger import get_logger
+from utils.query_trace import get_query_tracer
+
+# Paylaşılan havuzdaki worker sayısı (SQLite tek yazıcı; okumalar paralel)
+MAX_WORKERS = 4
+
+# Ana thread'in sonuç kuyruğunu yoklama aralığı (ms)
+POLL_INTERVAL_MS = 30
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+logger = get_logger(__name__)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    """
+    Paneller arasında paylaşılan thread havuzunu döndür (ilk çağrıda oluşturulur).
+
+    Returns:
+        ThreadPoolExecutor: Paylaşılan executor
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="panel-loader")
+        return _executor
+
+
+def shutdown_executor(wait: bool = False) -> None:
+    """
+    Paylaşılan thread havuzunu kapat (uygulama çıkışında).
+
+    Args:
+        wait (bool): Çalışan işlerin bitmesini bekle
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=wait, cancel_futures=True)
+            _executor = None
+
+
+class LoadCancelled(Exception):
+    """Fetch aşaması iptal edilen token nedeniyle erken sonlandı"""
+
+
+class LoadToken:
+    """
+    Tek bir yükleme isteğinin iptal işareti.
+
+    Fetch fonksiyonları uzun döngülerde ``raise_if_cancelled()`` çağırarak
+    gereksiz işi erken bırakabilir.
+
+    Attributes:
+        key (str): Yükleme anahtarı (ör. "islemler")
+    """
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        """Token iptal edildi mi?"""
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Token'ı iptal et"""
+        self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """İptal edildiyse ``LoadCancelled`` fırlat"""
+        if self._event.is_set():
+            raise LoadCancelled(self.key)
+
+
+# (token, render, on_error)
+_Yukleme = Tuple[LoadToken, Callable[[Any], None], Callable[[Exception], None]]
+
+
+class BackgroundLoader:
+    """
+    Bir panelin arka plan yüklemelerini yöneten sınıf.
+
+    Widget yoksa veya yok edildiyse (ör. testlerde) fetch ve render aynı
+    thread'de sırayla çalışır.
+
+    Example:
+        >>> loader = BackgroundLoader(panel.frame, ad="AidatPanel")
+        >>> loader.submit(
+        ...     "islemler",
+        ...     fetch=lambda token: controller.get_rows(),
+        ...     render=lambda rows: view.set_rows(rows, formatter),
+        ... )
+    """
+
+    def __init__(self, widget: Any, on_error: Optional[Callable[[Exception], None]] = None,
+                 ad: Optional[str] = None) -> None:
+        """
+        Args:
+            widget: ``after()`` çağrılarında kullanılacak Tk widget'ı
+            on_error: Varsayılan hata işleyicisi (fetch veya render hatası)
+            ad: Sorgu izleyicisindeki eylem adlarının ön eki (ör. panel sınıfının adı);
+                None ise widget'ın sınıf adı
+        """
+        self.widget = widget
+        self.ad = ad or type(widget).__name__
+        self.default_on_error = on_error
+        self._active: Dict[str, _Yukleme] = {}
+        self._results: "queue.Queue[Tuple[LoadToken, Any, Optional[Exception]]]" = queue.Queue()
+        self._poll_job: Optional[Any] = None
+
+    @property
+    def pending(self) -> int:
+        """Henüz çizilmemiş yükleme sayısı"""
+        return len(self._active)
+
+    def _is_async(self) -> bool:
+        """Widget canlıysa arka plan modunda çalış"""
+        if self.widget is None:
+            return False
+        try:
+            return bool(self.widget.winfo_exists())
+        except Exception:
+            return False
+
+    def submit(self, key: str, fetch: Callable[[LoadToken], Any], render: Callable[[Any], None],
+               on_error: Optional[Callable[[Exception], None]] = None) -> LoadToken:
+        """
+        Yükleme başlat; aynı anahtarlı önceki yükleme iptal edilir.
+
+        Args:
+            key (str): Yükleme anahtarı
+            fetch: Worker thread'de çalışacak fonksiyon (token alır, sonuç döndürür)
+            render: Ana thread'de sonucu çizecek fonksiyon
+            on_error: Hata işleyicisi (yoksa varsayılan işleyici / log)
+
+        Returns:
+            LoadToken: Yüklemenin iptal token'ı
+        """
+        self.cancel(key)
+        token = LoadToken(key)
+        hata_isleyici = on_error or self.default_on_error or self._log_error
+
+        if not self._is_async():
+            with get_query_tracer().eylem(self._eylem_adi(key)):
+                self._run_sync(token, fetch, render, hata_isleyici)
+            return token
+
+        self._active[key] = (token, render, hata_isleyici)
+        get_executor().submit(self._work, token, fetch)
+        self._schedule_poll()
+        return token
+
+    def cancel(self, key: Optional[str] = None) -> None:
+        """
+        Yüklemeleri iptal et.
+
+        Args:
+            key (str, optional): Yalnızca bu anahtar; None ise tümü
+        """
+        anahtarlar = list(self._active) if key is None else [key]
+        for anahtar in anahtarlar:
+            yukleme = self._active.pop(anahtar, None)
+            if yukleme is not None:
+                yukleme[0].cancel()
+
+    # ------------------------------------------------------------------
+
+    def _eylem_adi(self, key: str) -> str:
+        """Sorgu izleyicisi için eylem adı (ör. "AidatPanel:islemler")"""
+        return f"{self.ad}:{key}"
+
+    @staticmethod
+    def _run_sync(token: LoadToken, fetch: Callable[[LoadToken], Any], render: Callable[[Any], None],
+                  on_error: Callable[[Exception], None]) -> None:
+        """Fetch ve render'ı aynı thread'de çalıştır"""
+        try:
+            render(fetch(token))
+        except LoadCancelled:
+            pass
+        except Exception as e:
+            on_error(e)
+
+    def _work(self, token: LoadToken, fetch: Callable[[LoadToken], Any]) -> None:
+        """Worker thread: fetch'i çalıştır ve sonucu kuyruğa yaz"""
+        if token.cancelled:
+            return
+        try:
+            with get_query_tracer().eylem(self._eylem_adi(token.key)):
+                sonuc = fetch(token)
+        except LoadCancelled:
+            return
+        except Exception as e:
+            self._results.put((token, None, e))
+            return
+        self._results.put((token, sonuc, None))
+
+    def _schedule_poll(self) -> None:
+        """Kuyruk yoklamasını planla (yalnızca ana thread'den çağrılır)"""
+        if self._poll_job is None:
+            try:
+                self._poll_job = self.widget.after(POLL_INTERVAL_MS, self._poll)
+            except Exception:
+                # Widget yok edildi - bekleyen yüklemeler çizilmeyecek
+                self.cancel()
+
+    def _poll(self) -> None:
+        """Ana thread: tamamlanan yüklemeleri çiz"""
+        self._poll_job = None
+        if not self._is_async():
+            # Panel kapatıldı - bekleyen sonuçları çizme
+            self.cancel()
+            return
+
+        while True:
+            try:
+                token, sonuc, hata = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            yukleme = self._active.get(token.key)
+            if yukleme is None or yukleme[0] is not token or token.cancelled:
+                # Yerine yenisi başlatılmış veya iptal edilmiş yükleme
+                continue
+            del self._active[token.key]
+
+            _, render, on_error = yukleme
+            try:
+                if hata is not None:
+                    on_error(hata)
+                else:
+                    render(sonuc)
+            except Exception as e:
+                on_error(e)
+
+        if self._active:
+            self._schedule_poll()
+
+    @staticmethod
+    def _log_error(error: Exception) -> None:
+        """Varsayılan hata işleyicisi"""
+        logger.error(f"Background load failed: {error}", exc_info=error)
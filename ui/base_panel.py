@@ -3,10 +3,12 @@ Temel panel sınıfı - Responsive destek ile
 """
 
 import customtkinter as ctk
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 
 from utils.logger import get_logger
 from ui.responsive import ScrollableFrame, ResponsiveFrame
+from ui.virtual_treeview import VirtualTreeview
+from ui.background_loader import BackgroundLoader, LoadToken
 
 if TYPE_CHECKING:
     from main import COLORS
@@ -73,4 +75,66 @@ class BasePanel:
                 return bool(widget.winfo_exists())
             return False
         except Exception:
-            return False
\ No newline at end of file
+            return False
+
+    def virtual_tree(self, tree: Any, scrollbar: Optional[Any] = None) -> VirtualTreeview:
+        """
+        Treeview için sanal çizim yöneticisini döndür (yoksa oluştur).
+
+        Aynı Treeview için her çağrıda aynı ``VirtualTreeview`` döner; Treeview
+        değiştirildiyse yeni yönetici oluşturulur. Kaydırmada gereken sayfalar
+        panelin ``loader``'ı ile arka planda okunur.
+
+        Args:
+            tree: Sarmalanacak Treeview
+            scrollbar: Dikey scrollbar (ilk bağlamada verilir)
+
+        Returns:
+            VirtualTreeview: Treeview'e bağlı sanal tablo
+        """
+        views = self.__dict__.setdefault("_virtual_trees", {})
+        view = views.get(id(tree))
+        if view is None or view.tree is not tree:
+            view = VirtualTreeview(tree, scrollbar=scrollbar)
+            views[id(tree)] = view
+        elif scrollbar is not None:
+            view.attach_scrollbar(scrollbar)
+        # Önbellekte olmayan sayfalar panelin yükleyicisiyle worker'da okunur
+        view.loader = self.loader
+        return view
+
+    @property
+    def loader(self) -> BackgroundLoader:
+        """Panelin arka plan yükleyicisi (panel frame'ine bağlı)"""
+        loader = self.__dict__.get("_loader")
+        frame = getattr(self, "frame", None)
+        if loader is None or loader.widget is not frame:
+            loader = BackgroundLoader(frame, ad=type(self).__name__)
+            self.__dict__["_loader"] = loader
+        return loader
+
+    def run_in_background(self, key: str, fetch: Callable[[LoadToken], Any],
+                          render: Callable[[Any], None],
+                          on_error: Optional[Callable[[Exception], None]] = None) -> LoadToken:
+        """
+        Veriyi worker thread'de çek, sonucu ana thread'de çiz.
+
+        Aynı anahtarla başlatılan önceki yükleme iptal edilir ve sonucu çizilmez.
+        Fetch fonksiyonu Tk widget'larına dokunmamalıdır.
+
+        Args:
+            key (str): Yükleme anahtarı (ör. "islemler")
+            fetch: Token alıp düz veri döndüren fonksiyon (worker thread)
+            render: Veriyi widget'lara yazan fonksiyon (ana thread)
+            on_error: Hata işleyicisi (ana thread)
+
+        Returns:
+            LoadToken: Yüklemenin iptal token'ı
+        """
+        return self.loader.submit(key, fetch, render, on_error)
+
+    def cancel_loads(self) -> None:
+        """Paneldeki bekleyen tüm arka plan yüklemelerini iptal et"""
+        loader = self.__dict__.get("_loader")
+        if loader is not None:
+            loader.cancel()
@@ -4,13 +4,11 @@ Dashboard paneli - Ana sayfa için istatistikler ve grafikler
 
 import customtkinter as ctk
 from tkinter import ttk
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
-from datetime import datetime, timedelta
+from datetime import datetime
 from ui.base_panel import BasePanel
 from ui.responsive_charts import ResponsiveChartManager, ResponsiveChartBuilder
-from typing import Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from ui.error_handler import (
     ErrorHandler, handle_exception, show_error, show_success, show_warning
 )
@@ -19,11 +17,17 @@ from controllers.finans_islem_controller import FinansIslemController
 from controllers.sakin_controller import SakinController
 from controllers.aidat_controller import AidatIslemController
 from controllers.daire_controller import DaireController
+from controllers.dashboard_controller import DashboardController, DashboardSnapshot
 from models.base import FinansIslem, Hesap
 from models.exceptions import DatabaseError
-from database.config import get_db
+from database.unit_of_work import transactional
 from sqlalchemy import and_
 
+# Pasta grafik renkleri ve etiketleri (oluşturma ve güncelleme aynı değerleri kullanır)
+HESAP_RENKLERI = ['#28A745', '#0055A4', '#FFC107', '#DC3545', '#17A2B8']
+AIDAT_ETIKETLERI = ['Ödenen', 'Ödenmemiş']
+AIDAT_RENKLERI = ['#28A745', '#DC3545']
+
 
 class DashboardPanel(BasePanel):
     """Dashboard/Ana sayfa paneli
@@ -36,6 +40,7 @@ class DashboardPanel(BasePanel):
         sakin_controller (SakinController): Sakin yönetim denetleyicisi
         aidat_controller (AidatIslemController): Aidat yönetim denetleyicisi
         daire_controller (DaireController): Daire yönetim denetleyicisi
+        dashboard_controller (DashboardController): KPI/grafik anlık görüntü servisi
         colors (dict): Renk şeması
         refresh_interval (int): Otomatik yenileme aralığı (milisaniye)
         refresh_job: Otomatik yenileme işi referansı
@@ -48,9 +53,16 @@ class DashboardPanel(BasePanel):
         self.sakin_controller = SakinController()
         self.aidat_controller = AidatIslemController()
         self.daire_controller = DaireController()
+        self.dashboard_controller = DashboardController()
         self.colors = colors
         self.refresh_interval = 300000  # 5 dakika (milisaniye cinsinden)
         self.refresh_job = None
+        # Ekrandaki değerlerin alındığı anlık görüntü (değişmediyse otomatik yenileme atlanır)
+        self._gosterilen_snapshot: Optional[DashboardSnapshot] = None
+        # Uzun ömürlü bileşenler: yenilemede yalnızca değişen metin ve grafik verisi güncellenir
+        self._kpi_etiketleri: Dict[int, Any] = {}
+        self._kpi_metinleri: Dict[int, Tuple[str, str]] = {}
+        self._grafikler: Dict[str, Dict[str, Any]] = {}
         self.last_update_label: Optional[ctk.CTkLabel] = None
         self.chart_manager: Optional[ResponsiveChartManager] = None
         self.chart_builder: Optional[ResponsiveChartBuilder] = None
@@ -77,41 +89,182 @@ class DashboardPanel(BasePanel):
         now = datetime.now()
         return now.strftime("Güncelleme: %d.%m.%Y %H:%M:%S")
     
+    @transactional("dashboard.refresh")
     def refresh_dashboard(self) -> None:
-        """Dashboard'u yenile - tüm bileşenleri temizle ve yeniden oluştur
+        """Dashboard'u yenile
         
-        KPI kartlarını ve grafikleri temizleyip yeniden oluşturur.
+        İlk çağrıda KPI kartlarını ve grafikleri oluşturur. Sonraki
+        çağrılarda bileşenler korunur; yalnızca değeri değişen kart
+        etiketleri ve verisi değişen grafikler güncellenir.
         """
-        # Önceki bileşenleri temizle
-        for widget in self.scroll_frame.winfo_children():
-            widget.destroy()
-        
-        # ===== KPI CARDS BÖLÜMÜ =====
-        self.setup_kpi_cards(self.scroll_frame)
+        if self._kpi_etiketleri and self._grafikler:
+            self._kpi_kartlarini_guncelle()
+            self._grafikleri_guncelle()
+        else:
+            # Önceki bileşenleri temizle
+            for widget in self.scroll_frame.winfo_children():
+                widget.destroy()
+            self._kpi_etiketleri.clear()
+            self._kpi_metinleri.clear()
+            self._grafikler.clear()
+            
+            # ===== KPI CARDS BÖLÜMÜ =====
+            self.setup_kpi_cards(self.scroll_frame)
+
+            # Divider
+            divider = ctk.CTkFrame(self.scroll_frame, fg_color=self.colors["border"], height=1)
+            divider.pack(fill="x", pady=(3, 5))
+
+            # ===== GRAFIKLER BÖLÜMÜ =====
+            self.setup_charts(self.scroll_frame)
         
         # Son güncelleme saatini güncelle
         if self.last_update_label is not None:
             self.last_update_label.configure(text=self._get_formatted_time())
 
-        # Divider
-        divider = ctk.CTkFrame(self.scroll_frame, fg_color=self.colors["border"], height=1)
-        divider.pack(fill="x", pady=(3, 5))
+    def _kpi_kartlarini_guncelle(self) -> None:
+        """Yalnızca değeri veya rengi değişen KPI kartlarının etiketlerini güncelle"""
+        for column, (_, value, accent_color) in enumerate(self._kpi_degerleri()):
+            if self._kpi_metinleri.get(column) == (value, accent_color):
+                continue
+            label = self._kpi_etiketleri.get(column)
+            if label is None:
+                continue
+            label.configure(text=value, text_color=accent_color)
+            self._kpi_metinleri[column] = (value, accent_color)
+
+    def _grafik_kaydet(self, anahtar: str, chart_frame: ctk.CTkFrame, veri: Any,
+                       olustur: Callable[[], None]) -> Dict[str, Any]:
+        """Grafik bileşenini sonraki yenilemeler için kaydet
+        
+        Args:
+            anahtar (str): Grafik anahtarı ("trend", "hesap", "aidat")
+            chart_frame (ctk.CTkFrame): Grafiğin çerçevesi
+            veri: Grafiğin çizildiği veri (değişiklik kontrolü için)
+            olustur (Callable): Çerçeveyi aynı konumda yeniden oluşturan fonksiyon
+        
+        Returns:
+            dict: Kayıt ("frame", "veri", "olustur", "goster"); "goster" grafik
+            çizildiğinde veriyi alıp görüntüyü isteyen fonksiyondur
+        """
+        kayit = {"frame": chart_frame, "veri": veri, "olustur": olustur, "goster": None}
+        self._grafikler[anahtar] = kayit
+        return kayit
 
-        # ===== GRAFIKLER BÖLÜMÜ =====
-        self.setup_charts(self.scroll_frame)
+    def _grafikleri_guncelle(self) -> None:
+        """Verisi değişen grafiklerin yeni görüntüsünü iste
+        
+        Figure'lar arka planda mevcut eksenler üzerinde güncellenip çizilir
+        (bkz. ``ResponsiveChartManager.show_chart``). Grafik boş/dolu durumu
+        arasında geçiş olursa (ör. ilk hesap eklendiğinde) yalnızca o
+        grafiğin çerçevesi yeniden oluşturulur.
+        """
+        guncellemeler = (
+            ("trend", self.get_6ay_trend_data),
+            ("hesap", self.get_hesap_dagitimi_data),
+            ("aidat", self.get_aidat_durum_data),
+        )
+        for anahtar, veri_al in guncellemeler:
+            kayit = self._grafikler.get(anahtar)
+            if kayit is None:
+                continue
+            veri = veri_al()
+            if veri == kayit["veri"]:
+                continue
+            try:
+                if kayit["goster"] is None or not self._grafik_verisi_var(anahtar, veri):
+                    kayit["frame"].destroy()
+                    kayit["olustur"]()
+                    continue
+                kayit["goster"](veri)
+                kayit["veri"] = veri
+            except Exception as e:
+                self.logger.error(f"Chart update error ({anahtar}): {str(e)}")
+
+    @staticmethod
+    def _grafik_verisi_var(anahtar: str, veri: Any) -> bool:
+        """Grafik çizilecek veri var mı? (yoksa bilgi mesajı gösterilir)"""
+        if anahtar == "hesap":
+            return bool(veri[0])
+        if anahtar == "aidat":
+            return not (veri[0] == 0 and veri[1] == 0)
+        return True
+
+    def _yuzey_rengi_uygula(self, figure: Figure) -> Figure:
+        """Figure ve eksenlerin arka planını kart rengine ayarla"""
+        for ax in figure.get_axes():
+            ax.set_facecolor(self.colors["surface"])
+        figure.patch.set_facecolor(self.colors["surface"])
+        return figure
+
+    def _trend_figuru(self, veri: tuple, figsize: Tuple[float, float], dpi: int) -> Figure:
+        """Trend çizgi grafiği Figure'ı (arka plan thread'inde çağrılır)"""
+        aylar, gelirler, giderler = veri
+        return self._yuzey_rengi_uygula(self.chart_builder.create_responsive_line_chart(
+            x_data=aylar,
+            y_data_dict={
+                'Gelirler': gelirler,
+                'Giderler': giderler
+            },
+            xlabel="",
+            ylabel='Miktar (₺)',
+            colors={'Gelirler': '#28A745', 'Giderler': '#DC3545'},
+            figsize=figsize,
+            dpi=dpi
+        ))
+
+    def _hesap_figuru(self, veri: tuple, figsize: Tuple[float, float], dpi: int) -> Figure:
+        """Hesap dağılımı pasta grafiği Figure'ı (arka plan thread'inde çağrılır)"""
+        hesap_adlari, bakiyeler = veri
+        return self._yuzey_rengi_uygula(self.chart_builder.create_responsive_pie_chart(
+            sizes=bakiyeler,
+            labels=hesap_adlari,
+            colors=HESAP_RENKLERI[:len(hesap_adlari)],
+            figsize=figsize,
+            dpi=dpi
+        ))
+
+    def _aidat_figuru(self, veri: tuple, figsize: Tuple[float, float], dpi: int) -> Figure:
+        """Aidat durumu pasta grafiği Figure'ı (arka plan thread'inde çağrılır)"""
+        return self._yuzey_rengi_uygula(self.chart_builder.create_responsive_pie_chart(
+            sizes=list(veri),
+            labels=AIDAT_ETIKETLERI,
+            colors=AIDAT_RENKLERI,
+            figsize=figsize,
+            dpi=dpi
+        ))
+
+    def _trend_grafigini_guncelle(self, figure: Figure, veri: tuple) -> None:
+        """Trend çizgilerinin verisini güncelle"""
+        aylar, gelirler, giderler = veri
+        self.chart_builder.update_line_chart(figure, aylar, {'Gelirler': gelirler, 'Giderler': giderler})
+
+    def _hesap_grafigini_guncelle(self, figure: Figure, veri: tuple) -> None:
+        """Hesap dağılımı dilimlerini güncelle"""
+        hesap_adlari, bakiyeler = veri
+        self.chart_builder.update_pie_chart(
+            figure, bakiyeler, hesap_adlari, HESAP_RENKLERI[:len(hesap_adlari)]
+        )
+
+    def _aidat_grafigini_guncelle(self, figure: Figure, veri: tuple) -> None:
+        """Aidat ödeme durumu dilimlerini güncelle"""
+        odenen, odenmeyen = veri
+        self.chart_builder.update_pie_chart(figure, [odenen, odenmeyen], AIDAT_ETIKETLERI, AIDAT_RENKLERI)
     
     def start_auto_refresh(self) -> None:
         """Otomatik yenileme başlat
         
         Dashboard'u belirli aralıklarla yenilemek için periyodik görev başlatır.
-        5 dakikada bir otomatik yenilenir.
+        5 dakikada bir otomatik yenilenir; gösterilen anlık görüntü hâlâ
+        geçerliyse (araya yazma girmediyse) yeniden çizim yapılmaz.
         """
         # Önceki görev varsa iptal et
         if self.refresh_job:
             self.frame.after_cancel(self.refresh_job)
         
-        # Dashboard'u yenile
-        self.refresh_dashboard()
+        # Veri değiştiyse dashboard'u yenile
+        if not self.dashboard_controller.guncel_mi(self._gosterilen_snapshot):
+            self.refresh_dashboard()
         
         # Sonraki yenilemeyi planla
         self.refresh_job = self.frame.after(self.refresh_interval, self.start_auto_refresh)
@@ -204,6 +357,16 @@ class DashboardPanel(BasePanel):
         kpi_grid = ctk.CTkFrame(cards_frame, fg_color=self.colors["background"])
         kpi_grid.pack(fill="both", expand=False)
 
+        for column, (title, value, accent_color) in enumerate(self._kpi_degerleri()):
+            self._kpi_etiketleri[column] = self.create_kpi_card(kpi_grid, title, value, accent_color, column)
+            self._kpi_metinleri[column] = (value, accent_color)
+
+    def _kpi_degerleri(self) -> List[Tuple[str, str, str]]:
+        """6 KPI kartının başlık, değer metni ve vurgu rengi
+        
+        Returns:
+            list: (başlık, değer, renk) demetleri, kart sırasıyla
+        """
         # KPI 1: Toplam Hesap Bakiyesi
         try:
             toplam_bakiye = self.get_toplam_bakiye()
@@ -211,13 +374,6 @@ class DashboardPanel(BasePanel):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Toplam bakiye alınırken hata: {e}")
             toplam_bakiye = 0.0
-        self.create_kpi_card(
-            kpi_grid, 
-            "💰 Toplam Bakiye", 
-            f"₺{toplam_bakiye:,.2f}",
-            self.colors["success"],
-            0
-        )
 
         # KPI 2: Bu Ay Gelirleri
         try:
@@ -226,13 +382,6 @@ class DashboardPanel(BasePanel):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Bu ay geliri alınırken hata: {e}")
             bu_ay_geliri = 0.0
-        self.create_kpi_card(
-            kpi_grid,
-            "📈 Bu Ay Gelirleri",
-            f"₺{bu_ay_geliri:,.2f}",
-            self.colors["primary"],
-            1
-        )
 
         # KPI 3: Bu Ay Giderleri
         try:
@@ -241,13 +390,6 @@ class DashboardPanel(BasePanel):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Bu ay gideri alınırken hata: {e}")
             bu_ay_gideri = 0.0
-        self.create_kpi_card(
-            kpi_grid,
-            "📉 Bu Ay Giderleri",
-            f"₺{bu_ay_gideri:,.2f}",
-            self.colors["error"],
-            2
-        )
 
         # KPI 4: Net Durum
         try:
@@ -258,13 +400,6 @@ class DashboardPanel(BasePanel):
                 self.logger.error(f"Net durum hesaplanırken hata: {e}")
             net_durum = 0.0
             renk = self.colors["error"]
-        self.create_kpi_card(
-            kpi_grid,
-            "⚖️ Aylık Net Durum",
-            f"₺{net_durum:,.2f}",
-            renk,
-            3
-        )
 
         # KPI 5: Dolu Lojmanlar
         try:
@@ -273,13 +408,6 @@ class DashboardPanel(BasePanel):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Dolu lojman sayısı alınırken hata: {e}")
             dolu_lojman = 0
-        self.create_kpi_card(
-            kpi_grid,
-            "🏘️ Dolu Lojmanlar",
-            str(dolu_lojman),
-            self.colors["secondary"],
-            4
-        )
 
         # KPI 6: Aidat Tahsilatı
         try:
@@ -288,15 +416,18 @@ class DashboardPanel(BasePanel):
             if hasattr(self, 'logger'):
                 self.logger.error(f"Aidat tahsilat oranı alınırken hata: {e}")
             aidat_tahsilat = 0.0
-        self.create_kpi_card(
-            kpi_grid,
-            "💳 Aidat Tahsilatı",
-            f"%{aidat_tahsilat:.1f}",
-            self.colors["warning"],
-            5
-        )
 
-    def create_kpi_card(self, parent: ctk.CTkFrame, title: str, value: str, accent_color: str, column: int) -> None:
+        return [
+            ("💰 Toplam Bakiye", f"₺{toplam_bakiye:,.2f}", self.colors["success"]),
+            ("📈 Bu Ay Gelirleri", f"₺{bu_ay_geliri:,.2f}", self.colors["primary"]),
+            ("📉 Bu Ay Giderleri", f"₺{bu_ay_gideri:,.2f}", self.colors["error"]),
+            ("⚖️ Aylık Net Durum", f"₺{net_durum:,.2f}", renk),
+            ("🏘️ Dolu Lojmanlar", str(dolu_lojman), self.colors["secondary"]),
+            ("💳 Aidat Tahsilatı", f"%{aidat_tahsilat:.1f}", self.colors["warning"]),
+        ]
+
+    def create_kpi_card(self, parent: ctk.CTkFrame, title: str, value: str, accent_color: str,
+                        column: int) -> ctk.CTkLabel:
         """KPI kartı oluştur
         
         Belirtilen başlık ve değerle görsel KPI kartı oluşturur.
@@ -307,6 +438,9 @@ class DashboardPanel(BasePanel):
             value (str): Kart değeri (sayı, yüzde, vb.)
             accent_color (str): Kartın vurgu rengi (hex)
             column (int): Grid kolon indeksi
+        
+        Returns:
+            ctk.CTkLabel: Değer etiketi (sonraki yenilemelerde güncellenir)
         """
         card = ctk.CTkFrame(parent, fg_color=self.colors["surface"], corner_radius=6, height=55)
         card.grid(row=0, column=column, padx=4, pady=3, sticky="ew")
@@ -338,6 +472,7 @@ class DashboardPanel(BasePanel):
             text_color=accent_color
         )
         value_label.pack(anchor="w", pady=(1, 0))
+        return value_label
 
     def setup_charts(self, parent: ctk.CTkFrame) -> None:
         """Grafikleri oluştur
@@ -408,30 +543,20 @@ class DashboardPanel(BasePanel):
         title.pack(anchor="w", padx=6, pady=(5, 2))
         
         # Veriler
-        aylar, gelirler, giderler = self.get_6ay_trend_data()
+        veri = self.get_6ay_trend_data()
+        kayit = self._grafik_kaydet(
+            "trend", chart_frame, veri, lambda: self.create_trend_chart(parent, row, col, colspan)
+        )
         
         # Responsive grafik oluştur
         try:
             if self.chart_builder and self.chart_manager:
-                fig = self.chart_builder.create_responsive_line_chart(
-                    x_data=aylar,
-                    y_data_dict={
-                        'Gelirler': gelirler,
-                        'Giderler': giderler
-                    },
-                    xlabel="",
-                    ylabel='Miktar (₺)',
-                    colors={'Gelirler': '#28A745', 'Giderler': '#DC3545'},
-                    colspan=colspan
+                # Görüntü arka planda çizilir, hazır olunca çerçeveye konur
+                kayit["goster"] = lambda v: self.chart_manager.show_chart(
+                    chart_frame, "dashboard.trend", v, self._trend_figuru,
+                    self._trend_grafigini_guncelle, "trend", colspan
                 )
-                
-                # Arka plan rengi ayarla
-                for ax in fig.get_axes():
-                    ax.set_facecolor(self.colors["surface"])
-                fig.patch.set_facecolor(self.colors["surface"])
-                
-                # Canvas'ı embed et
-                self.chart_manager.embed_chart(chart_frame, fig, "trend", colspan)
+                kayit["goster"](veri)
         except Exception as e:
             self.logger.error(f"Trend chart creation error: {str(e)}")
             error_label = ctk.CTkLabel(
@@ -468,7 +593,10 @@ class DashboardPanel(BasePanel):
         title.pack(anchor="w", padx=6, pady=(5, 2))
 
         # Veriler
-        hesap_adlari, bakiyeler = self.get_hesap_dagitimi_data()
+        hesap_adlari, bakiyeler = veri = self.get_hesap_dagitimi_data()
+        kayit = self._grafik_kaydet(
+            "hesap", chart_frame, veri, lambda: self.create_hesap_dagitimi_chart(parent, row, col)
+        )
 
         if not hesap_adlari:
             info_label = ctk.CTkLabel(
@@ -483,20 +611,12 @@ class DashboardPanel(BasePanel):
         # Responsive grafik oluştur
         try:
             if self.chart_builder and self.chart_manager:
-                colors_list = ['#28A745', '#0055A4', '#FFC107', '#DC3545', '#17A2B8']
-                fig = self.chart_builder.create_responsive_pie_chart(
-                    sizes=bakiyeler,
-                    labels=hesap_adlari,
-                    colors=colors_list[:len(hesap_adlari)]
+                # Görüntü arka planda çizilir, hazır olunca çerçeveye konur
+                kayit["goster"] = lambda v: self.chart_manager.show_chart(
+                    chart_frame, "dashboard.hesap", v, self._hesap_figuru,
+                    self._hesap_grafigini_guncelle, "pie"
                 )
-                
-                # Arka plan rengi ayarla
-                for ax in fig.get_axes():
-                    ax.set_facecolor(self.colors["surface"])
-                fig.patch.set_facecolor(self.colors["surface"])
-                
-                # Canvas'ı embed et
-                self.chart_manager.embed_chart(chart_frame, fig, "pie")
+                kayit["goster"](veri)
         except Exception as e:
             self.logger.error(f"Hesap dağılımı chart error: {str(e)}")
             error_label = ctk.CTkLabel(
@@ -533,7 +653,10 @@ class DashboardPanel(BasePanel):
         title.pack(anchor="w", padx=6, pady=(5, 2))
 
         # Veriler
-        odenen, odenmeyen = self.get_aidat_durum_data()
+        odenen, odenmeyen = veri = self.get_aidat_durum_data()
+        kayit = self._grafik_kaydet(
+            "aidat", chart_frame, veri, lambda: self.create_aidat_durum_chart(parent, row, col)
+        )
 
         # Hiç veri yoksa mesaj göster
         if odenen == 0 and odenmeyen == 0:
@@ -549,23 +672,12 @@ class DashboardPanel(BasePanel):
         # Responsive grafik oluştur
         try:
             if self.chart_builder and self.chart_manager:
-                labels = ['Ödenen', 'Ödenmemiş']
-                sizes = [odenen, odenmeyen]
-                colors_list = ['#28A745', '#DC3545']
-                
-                fig = self.chart_builder.create_responsive_pie_chart(
-                    sizes=sizes,
-                    labels=labels,
-                    colors=colors_list
+                # Görüntü arka planda çizilir, hazır olunca çerçeveye konur
+                kayit["goster"] = lambda v: self.chart_manager.show_chart(
+                    chart_frame, "dashboard.aidat", v, self._aidat_figuru,
+                    self._aidat_grafigini_guncelle, "pie"
                 )
-                
-                # Arka plan rengi ayarla
-                for ax in fig.get_axes():
-                    ax.set_facecolor(self.colors["surface"])
-                fig.patch.set_facecolor(self.colors["surface"])
-                
-                # Canvas'ı embed et
-                self.chart_manager.embed_chart(chart_frame, fig, "pie")
+                kayit["goster"](veri)
         except Exception as e:
             self.logger.error(f"Aidat durum chart error: {str(e)}")
             error_label = ctk.CTkLabel(
@@ -578,6 +690,16 @@ class DashboardPanel(BasePanel):
 
     # ===== VERİ ALMA FONKSİYONLARI =====
 
+    def _snapshot_al(self) -> DashboardSnapshot:
+        """Paylaşılan dashboard anlık görüntüsünü al ve gösterilen olarak işaretle
+
+        Returns:
+            DashboardSnapshot: Güncel KPI ve grafik değerleri
+        """
+        snapshot = self.dashboard_controller.get_snapshot()
+        self._gosterilen_snapshot = snapshot
+        return snapshot
+
     def get_toplam_bakiye(self) -> float:
         """Tüm hesapların toplam bakiyesi
         
@@ -585,8 +707,7 @@ class DashboardPanel(BasePanel):
             float: Tüm aktif hesapların toplam bakiyesi
         """
         try:
-            hesaplar = self.hesap_controller.get_aktif_hesaplar()
-            return float(sum(h.bakiye for h in hesaplar)) if hesaplar else 0.0
+            return self._snapshot_al().toplam_bakiye
         except Exception as e:
             self.logger.error(f"Toplam bakiye hatası: {e}")
             return 0.0
@@ -598,16 +719,7 @@ class DashboardPanel(BasePanel):
             float: Cari ayın toplam gelirleri
         """
         try:
-            islemler = self.finans_controller.get_gelirler()
-            if not islemler:
-                return 0.0
-            
-            bugun = datetime.now()
-            baslangic = datetime(bugun.year, bugun.month, 1)
-            
-            # Bu ay'ın gelirlerini filtrele
-            bu_ay_islemler = [i for i in islemler if i.tarih >= baslangic and i.tarih <= bugun]
-            return float(sum(i.tutar for i in bu_ay_islemler))
+            return self._snapshot_al().bu_ay_geliri
         except Exception as e:
             self.logger.error(f"Gelir hesaplama hatası: {e}")
             return 0.0
@@ -619,16 +731,7 @@ class DashboardPanel(BasePanel):
             float: Cari ayın toplam giderleri
         """
         try:
-            islemler = self.finans_controller.get_giderler()
-            if not islemler:
-                return 0.0
-            
-            bugun = datetime.now()
-            baslangic = datetime(bugun.year, bugun.month, 1)
-            
-            # Bu ay'ın giderlerini filtrele
-            bu_ay_islemler = [i for i in islemler if i.tarih >= baslangic and i.tarih <= bugun]
-            return float(sum(i.tutar for i in bu_ay_islemler))
+            return self._snapshot_al().bu_ay_gideri
         except Exception as e:
             self.logger.error(f"Gider hesaplama hatası: {e}")
             return 0.0
@@ -640,8 +743,7 @@ class DashboardPanel(BasePanel):
             int: Sakin barındıran daire sayısı
         """
         try:
-            dolu_daireler = self.daire_controller.get_dolu_daireler()
-            return len(dolu_daireler) if dolu_daireler else 0
+            return self._snapshot_al().dolu_daire_sayisi
         except Exception as e:
             self.logger.error(f"Dolu lojman sayısı hatası: {e}")
             return 0
@@ -653,37 +755,7 @@ class DashboardPanel(BasePanel):
             float: Aidat tahsilat yüzdesi (0-100)
         """
         try:
-            # Tüm aktif aidatları getir
-            db = get_db()
-            try:
-                from models.base import AidatIslem
-                aidatlar = db.query(AidatIslem).filter(
-                    AidatIslem.aktif == True
-                ).options(
-                    __import__('sqlalchemy.orm', fromlist=['joinedload']).joinedload(AidatIslem.odemeler)
-                ).all()
-            finally:
-                db.close()
-            
-            if not aidatlar:
-                return 0.0
-            
-            # Toplam aidat tutarı
-            toplam_aidat = sum(a.toplam_tutar for a in aidatlar)
-            if toplam_aidat == 0:
-                return 0.0
-            
-            # Ödenen toplam tutar
-            odenen_tutar = 0.0
-            for aidat in aidatlar:
-                if aidat.odemeler:
-                    # Ödemeler içinde odendi=True olanların toplamı
-                    ödenen = sum(o.tutar for o in aidat.odemeler if o.odendi)
-                    odenen_tutar += float(ödenen)
-            
-            # Yüzde hesapla
-            oran = (odenen_tutar / float(toplam_aidat)) * 100.0
-            return float(min(oran, 100.0))  # 100'den fazla olmasın
+            return self._snapshot_al().aidat_tahsilat_orani
         except Exception as e:
             self.logger.error(f"Toplam aidat tahsilat oranı hatası: {e}")
             return 0.0
@@ -694,43 +766,12 @@ class DashboardPanel(BasePanel):
         Returns:
             tuple: (ay_kısaltmaları, gelirler, giderler) listelerinin tuple'ı
         """
-        aylar = []
-        gelirler = []
-        giderler = []
-        
-        # Türkçe ay kısaltmaları
-        tr_aylar = ["Oca", "Şub", "Mar", "Nis", "May", "Haz", "Tem", "Ağu", "Eyl", "Eki", "Kas", "Ara"]
-        
         try:
-            all_gelirler = self.finans_controller.get_gelirler() or []
-            all_giderler = self.finans_controller.get_giderler() or []
-            
-            for i in range(11, -1, -1):
-                tarih = datetime.now() - timedelta(days=30*i)
-                ay_baslangic = datetime(tarih.year, tarih.month, 1)
-                
-                # Sonraki ayın ilk günü
-                if tarih.month == 12:
-                    ay_sonu = datetime(tarih.year + 1, 1, 1)
-                else:
-                    ay_sonu = datetime(tarih.year, tarih.month + 1, 1)
-                
-                # Bu aydaki işlemleri filtrele
-                ay_gelir_list = [g for g in all_gelirler if g.tarih >= ay_baslangic and g.tarih <= ay_sonu]
-                ay_gider_list = [g for g in all_giderler if g.tarih >= ay_baslangic and g.tarih <= ay_sonu]
-                
-                ay_gelir = sum(i.tutar for i in ay_gelir_list)
-                ay_gider = sum(i.tutar for i in ay_gider_list)
-                
-                # Türkçe ay kısaltması kullan
-                aylar.append(tr_aylar[tarih.month - 1])
-                gelirler.append(ay_gelir)
-                giderler.append(ay_gider)
+            snapshot = self._snapshot_al()
+            return list(snapshot.trend_aylar), list(snapshot.trend_gelirler), list(snapshot.trend_giderler)
         except Exception as e:
-            print(f"Trend veri hatası: {e}")
-            pass
-        
-        return aylar or ["Veri Yok"], gelirler or [0.0], giderler or [0.0]
+            self.logger.error(f"Trend veri hatası: {e}")
+            return ["Veri Yok"], [0.0], [0.0]
 
     def get_hesap_dagitimi_data(self) -> tuple[list[str], list[float]]:
         """Hesaplar arası bakiye dağılımı
@@ -738,21 +779,12 @@ class DashboardPanel(BasePanel):
         Returns:
             tuple: (hesap_adları, bakiyeler) listelerinin tuple'ı
         """
-        hesap_adlari = []
-        bakiyeler = []
-        
         try:
-            hesaplar = self.hesap_controller.get_aktif_hesaplar()
-            if hesaplar:
-                for h in hesaplar:
-                    if h.bakiye > 0:
-                        hesap_adlari.append(h.ad)
-                        bakiyeler.append(h.bakiye)
+            snapshot = self._snapshot_al()
+            return list(snapshot.hesap_adlari), list(snapshot.hesap_bakiyeleri)
         except Exception as e:
-            print(f"Hesap dağılımı hatası: {e}")
-            pass
-        
-        return hesap_adlari, bakiyeler
+            self.logger.error(f"Hesap dağılımı hatası: {e}")
+            return [], []
 
     def get_aidat_durum_data(self) -> tuple[float, float]:
         """Bu ay aidat ödeme durumu (tutar bazında) - grafik için
@@ -760,29 +792,9 @@ class DashboardPanel(BasePanel):
         Returns:
             tuple: (ödenen_tutar, ödenmemiş_tutar)
         """
-        odenen_tutar = 0
-        odenmeyen_tutar = 0
-        
         try:
-            bugun = datetime.now()
-            aidatlar = self.aidat_controller.get_by_yil_ay(bugun.year, bugun.month)
-            
-            if aidatlar:
-                for aidat in aidatlar:
-                    if aidat.odemeler:
-                        toplam_odenen = sum(o.tutar for o in aidat.odemeler if o.odendi)
-                        ödenen = toplam_odenen
-                        ödenmemiş = aidat.toplam_tutar - toplam_odenen
-                    else:
-                        ödenen = 0
-                        ödenmemiş = aidat.toplam_tutar
-                    
-                    odenen_tutar += ödenen
-                    odenmeyen_tutar += ödenmemiş
+            snapshot = self._snapshot_al()
+            return snapshot.aidat_odenen, snapshot.aidat_odenmeyen
         except Exception as e:
-            print(f"Aidat durum hatası: {e}")
-            pass
-        
-        return odenen_tutar, odenmeyen_tutar
-
-
+            self.logger.error(f"Aidat durum hatası: {e}")
+            return 0.0, 0.0
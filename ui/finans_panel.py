@@ -5,9 +5,11 @@ Finans paneli
 import customtkinter as ctk
 from tkinter import ttk, Menu, Toplevel, filedialog
 import tkinter as tk
-from typing import List, Optional, Dict, Any, Tuple
-from datetime import datetime
+from typing import List, NamedTuple, Optional, Dict, Any, Tuple
+from datetime import datetime, timedelta
 from ui.base_panel import BasePanel
+from ui.background_loader import LoadToken
+from ui.virtual_treeview import KeysetRowSource
 from ui.error_handler import (
     ErrorHandler, handle_exception, show_error, show_success, show_warning,
     UIValidator
@@ -16,11 +18,31 @@ from controllers.hesap_controller import HesapController
 from controllers.finans_islem_controller import FinansIslemController
 from controllers.kategori_yonetim_controller import KategoriYonetimController
 from controllers.belge_controller import BelgeController
+from database.unit_of_work import transactional
 from models.base import Hesap, FinansIslem, AnaKategori
 from models.validation import Validator
 from models.exceptions import (
     ValidationError, DatabaseError, NotFoundError, DuplicateError, BusinessLogicError
 )
+from utils.pagination import KeysetPage
+
+# İşlemler tablosu için sayfa boyutu (bellekte en fazla birkaç sayfa tutulur)
+ISLEM_SAYFA_BOYUTU = 200
+
+
+class IslemSatiri(NamedTuple):
+    """İşlemler tablosunun worker thread'de hazırlanan düz satırı
+
+    Attributes:
+        tur (str): 'gelir', 'gider' veya 'transfer' (satır etiketi)
+        id (int): İşlem ID'si
+        degerler (Tuple[str, ...]): Treeview kolon değerleri
+        belge_yolu (Optional[str]): İşleme bağlı belgenin yolu
+    """
+    tur: str
+    id: int
+    degerler: Tuple[str, ...]
+    belge_yolu: Optional[str]
 
 
 class FinansPanel(BasePanel):
@@ -36,8 +58,7 @@ class FinansPanel(BasePanel):
         belge_controller (BelgeController): Belge yönetim denetleyicisi
         aktif_hesaplar (List[Hesap]): Aktif hesaplar listesi
         pasif_hesaplar (List[Hesap]): Pasif hesaplar listesi
-        gelirler (List[FinansIslem]): Gelir işlemleri listesi
-        giderler (List[FinansIslem]): Gider işlemleri listesi
+        islem_kaynagi (KeysetRowSource): İşlemler tablosunun sayfalı satır kaynağı
     """
 
     def __init__(self, parent: ctk.CTk, colors: Dict[str, str]) -> None:
@@ -50,10 +71,8 @@ class FinansPanel(BasePanel):
         self.aktif_hesaplar: List[Hesap] = []
         self.pasif_hesaplar: List[Hesap] = []
         self.ana_kategoriler: List[AnaKategori] = []
-        self.gelirler: List[FinansIslem] = []
-        self.giderler: List[FinansIslem] = []
         self.duzenlenen_islem_id = None
-        self.tum_islemler_verisi: List[Tuple[str, FinansIslem]] = []  # Tüm işlemlerin orijinal listesi
+        self.islem_kaynagi: Optional[KeysetRowSource] = None  # Yalnızca filtrelenmiş işlemlerin açık sayfaları
         self.secili_belge_yolu: Optional[str] = None  # Seçili belgenin yolu
         
         # Filtre değişkenleri
@@ -63,6 +82,7 @@ class FinansPanel(BasePanel):
 
         super().__init__(parent, "💰 Finans Yönetimi", colors)
 
+    @transactional("finans.load_data")
     def load_data(self) -> None:
         """Verileri yükle"""
         self.load_hesaplar()
@@ -232,8 +252,13 @@ class FinansPanel(BasePanel):
         self.islemler_tree.column("belge", width=15, anchor="center")
         self.islemler_tree.column("aciklama", width=350, anchor="center")
 
+        # Sanal kaydırma scrollbar'ı - yalnızca görünür satırlar çizilir
+        islemler_scrollbar = ttk.Scrollbar(table_frame, orient="vertical")
+        islemler_scrollbar.pack(side="right", fill="y")
+
         # Treeview'i scrollable frame'e yerleştir
-        self.islemler_tree.pack(fill="both", expand=True)
+        self.islemler_tree.pack(side="left", fill="both", expand=True)
+        self.virtual_tree(self.islemler_tree, scrollbar=islemler_scrollbar)
 
         # Sağ tık menüsü
         self.islemler_context_menu = Menu(tab, tearoff=0)
@@ -298,95 +323,104 @@ class FinansPanel(BasePanel):
         self.hesap_tree.tag_configure("pasif", background="#f0f0f0")  # Açık gri
 
     def load_islemler(self) -> None:
-        """Tüm işlemleri yükle - gelir, gider ve transferler"""
+        """İşlemler tablosunu mevcut filtrelerle yeniden yükle"""
         # Widget'ın geçerli olup olmadığını kontrol et
         if not hasattr(self, 'islemler_tree') or self.islemler_tree is None:
             return
         
         try:
-            for item in self.islemler_tree.get_children():
-                self.islemler_tree.delete(item)
+            self.islemler_tree.get_children()
         except tk.TclError:
             # Widget geçersizse, işlemi atla
             return
 
-        # Gelirleri, giderleri ve transferleri yükle
-        self.gelirler = self.finans_controller.get_gelirler()
-        self.giderler = self.finans_controller.get_giderler()
-        self.transferler = self.finans_controller.get_transferler()
-
-        # Tüm işlemleri birleştir ve tarihe göre sırala (en yeni en üstte)
-        tum_islemler = []
-        for gelir in self.gelirler:
-            tum_islemler.append(('gelir', gelir))
-        for gider in self.giderler:
-            tum_islemler.append(('gider', gider))
-        for transfer in self.transferler:
-            tum_islemler.append(('transfer', transfer))
-
-        # ID göre sırala (en büyük en üstte)
-        tum_islemler.sort(key=lambda x: x[1].id, reverse=True)
-        
-        # Tüm işlemleri saklası (filtreleme için)
-        self.tum_islemler_verisi = tum_islemler
-        
-        # İşlem ID ve türü eşleme (gerçek ID bulma için)
-        self.islem_id_map = {}  # TreeView row ID'den gerçek işlem bilgisine
-
-        # Sıralanmış işlemleri tabloya ekle
-        for islem_tur, islem in tum_islemler:
-            # İşlem tutarını para birimiyle birlikte göster
-            tutar_gosterimi = f"{islem.tutar:.2f}"
-            if islem.hesap and hasattr(islem.hesap, 'para_birimi'):
-                tutar_gosterimi = f"{islem.tutar:.2f} {islem.hesap.para_birimi}"
-            
-            # Belge göstergesi
-            belge_gostergesi = "📎" if (hasattr(islem, 'belge_yolu') and islem.belge_yolu) else ""
-            
-            if islem_tur == 'gelir':
-                row_id = self.islemler_tree.insert("", "end", values=(
-                    f"İşlem#{islem.id}",
-                    "Gelir",
-                    islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                    (islem.kategori.ana_kategori.name if islem.kategori and islem.kategori.ana_kategori else islem.ana_kategori_text or ""),
-                    islem.kategori.name if islem.kategori else "",
-                    islem.hesap.ad if islem.hesap else "",
-                    tutar_gosterimi,
-                    belge_gostergesi,
-                    islem.aciklama or ""
-                ), tags=("gelir",))
-                self.islem_id_map[row_id] = {'tur': 'gelir', 'id': islem.id}
-            elif islem_tur == 'gider':
-                row_id = self.islemler_tree.insert("", "end", values=(
-                    f"İşlem#{islem.id}",
-                    "Gider",
-                    islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                    (islem.kategori.ana_kategori.name if islem.kategori and islem.kategori.ana_kategori else islem.ana_kategori_text or ""),
-                    islem.kategori.name if islem.kategori else "",
-                    islem.hesap.ad if islem.hesap else "",
-                    tutar_gosterimi,
-                    belge_gostergesi,
-                    islem.aciklama or ""
-                ), tags=("gider",))
-                self.islem_id_map[row_id] = {'tur': 'gider', 'id': islem.id}
-            else:  # transfer
-                # Transfer işlemleri için kaynak ve hedef hesapların para birimlerini göster
-                transfer_tutar = f"{islem.tutar:.2f}"
-                if islem.hesap and hasattr(islem.hesap, 'para_birimi'):
-                    transfer_tutar = f"{islem.tutar:.2f} {islem.hesap.para_birimi}"
-                
-                row_id = self.islemler_tree.insert("", "end", values=(
-                    f"İşlem#{islem.id}",
-                    "Transfer",
-                    islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                    "",  # Ana kategori yok
-                    "",  # Alt kategori yok
-                    f"{islem.hesap.ad if islem.hesap else ''} → {islem.hedef_hesap.ad if islem.hedef_hesap else ''}",
-                    transfer_tutar,
-                    belge_gostergesi,
-                    islem.aciklama or ""
-                ), tags=("transfer",))
-                self.islem_id_map[row_id] = {'tur': 'transfer', 'id': islem.id}
+        self.uygula_filtreler()
+
+    def _islem_filtreleri(self) -> Dict[str, Any]:
+        """
+        Filtre panelindeki değerleri ``FinansIslemController.search`` filtrelerine çevir.
+
+        Returns:
+            Dict[str, Any]: Arama filtreleri (filtre paneli yoksa boş)
+        """
+        filtreler: Dict[str, Any] = {}
+        if not hasattr(self, 'filter_tur_combo'):
+            return filtreler
+
+        filter_tur = self.filter_tur_combo.get()
+        if filter_tur != "Tümü":
+            filtreler["tur"] = filter_tur
+
+        # Hesap filtresi adla seçilir; aynı adlı hesapların hepsi dahil
+        filter_hesap = self.filter_hesap_combo.get()
+        if filter_hesap != "Tümü":
+            filtreler["hesap_id"] = [
+                h.id for h in self.aktif_hesaplar + self.pasif_hesaplar if h.ad == filter_hesap
+            ]
+
+        filter_aciklama = self.filter_aciklama_entry.get().strip()
+        if filter_aciklama:
+            filtreler["aciklama"] = filter_aciklama
+
+        # Tarih aralığı - bitiş günü dahil; geçersiz tarih yok sayılır
+        baslangic = bitis = None
+        try:
+            if self.filter_tarih_from_entry.get().strip():
+                baslangic = datetime.strptime(self.filter_tarih_from_entry.get().strip(), "%d.%m.%Y")
+        except ValueError:
+            pass
+        try:
+            if self.filter_tarih_to_entry.get().strip():
+                bitis = datetime.strptime(self.filter_tarih_to_entry.get().strip(), "%d.%m.%Y") + timedelta(days=1)
+        except ValueError:
+            pass
+        if baslangic or bitis:
+            filtreler["tarih_araligi"] = (baslangic, bitis)
+
+        return filtreler
+
+    def _fetch_islemler(self, token: LoadToken, filtreler: Dict[str, Any]) -> KeysetRowSource:
+        """
+        Filtrelenmiş işlemler için sayfalı satır kaynağı oluştur ve ilk sayfayı oku (worker thread).
+
+        Args:
+            token (LoadToken): Yükleme iptal token'ı
+            filtreler (Dict[str, Any]): ``FinansIslemController.search`` filtreleri
+
+        Returns:
+            KeysetRowSource: ``IslemSatiri`` satırları veren kaynak
+        """
+        def sayfa_getir(after: Optional[Tuple[Any, ...]], offset: int, limit: int) -> KeysetPage:
+            sayfa = self.finans_controller.search(
+                filtreler, sort="id_desc", limit=limit, offset=offset, after=after
+            )
+            # ORM nesneleri Tk thread'ine geçmez; satırlar burada düz demetlere çevrilir
+            sayfa.items = [self._islem_satiri_olustur(islem) for islem in sayfa.items]
+            return sayfa
+
+        kaynak = KeysetRowSource(
+            sayfa_getir, lambda: self.finans_controller.count(filtreler), page_size=ISLEM_SAYFA_BOYUTU
+        )
+        # Sayı ve ilk sayfa worker'da okunur; sonraki sayfalar da kaydırmada
+        # panelin yükleyicisiyle worker'da okunur, ana thread yalnızca çizer
+        len(kaynak)
+        token.raise_if_cancelled()
+        kaynak.fetch(0, ISLEM_SAYFA_BOYUTU)
+        return kaynak
+
+    def _render_islemler(self, kaynak: KeysetRowSource) -> None:
+        """
+        İşlemler tablosunu ve filtre seçeneklerini çiz (ana thread).
+
+        Args:
+            kaynak: ``_fetch_islemler`` sonucu
+        """
+        self.islem_kaynagi = kaynak
+
+        # Yalnızca görünür pencere çizilir; diğer sayfalar kaydırdıkça arka planda okunur
+        self.virtual_tree(self.islemler_tree).set_rows(
+            kaynak, self._islem_satiri, key=self._islem_iid
+        )
 
         # Renk kodlaması
         self.islemler_tree.tag_configure("gelir", background="#e8f5e8")  # Açık yeşil
@@ -395,12 +429,8 @@ class FinansPanel(BasePanel):
 
         # Hesap filtre combo'sunu güncelle
         if hasattr(self, 'filter_hesap_combo'):
-            hesap_listesi = set()
-            for _, islem in tum_islemler:
-                if islem.hesap:
-                    hesap_listesi.add(islem.hesap.ad)
-            hesap_options = ["Tümü"] + sorted(list(hesap_listesi))
-            self.filter_hesap_combo.configure(values=hesap_options)
+            hesap_adlari = sorted({h.ad for h in self.aktif_hesaplar + self.pasif_hesaplar})
+            self.filter_hesap_combo.configure(values=["Tümü"] + hesap_adlari)
 
         # Transfer butonunu aktif/pasif yap (en az 2 hesap varsa aktif)
         if hasattr(self, 'transfer_btn') and len(self.aktif_hesaplar) >= 2:
@@ -408,13 +438,107 @@ class FinansPanel(BasePanel):
         elif hasattr(self, 'transfer_btn'):
             self.transfer_btn.configure(state="disabled", fg_color=self.colors["text_secondary"])
 
+    def _islem_kaydi(self, item_id: str) -> Optional[IslemSatiri]:
+        """
+        Treeview satırının kaydını döndür.
+
+        Args:
+            item_id (str): Treeview item ID'si
+
+        Returns:
+            Optional[IslemSatiri]: Kayıt (satır çizili değilse None)
+        """
+        return self.virtual_tree(self.islemler_tree).row_for_item(item_id)
+
+    @staticmethod
+    def _islem_iid(kayit: IslemSatiri) -> str:
+        """İşlem satırı için kalıcı Treeview item ID'si"""
+        return f"islem_{kayit.id}"
+
+    @staticmethod
+    def _islem_satiri(kayit: IslemSatiri) -> Tuple[tuple, tuple]:
+        """
+        Hazır satırı Treeview değerlerine çevir (ana thread).
+
+        Args:
+            kayit: ``_islem_satiri_olustur`` ile hazırlanan satır
+
+        Returns:
+            Tuple[tuple, tuple]: (values, tags)
+        """
+        return kayit.degerler, (kayit.tur,)
+
+    @classmethod
+    def _islem_satiri_olustur(cls, islem: FinansIslem) -> IslemSatiri:
+        """
+        İşlemi Treeview satırına çevir (worker thread; ilişkiler yüklü olmalı).
+
+        Args:
+            islem (FinansIslem): Hesap, hedef hesap ve kategorisi yüklü işlem
+
+        Returns:
+            IslemSatiri: Düz satır
+        """
+        islem_tur = islem.tur.lower()
+        return IslemSatiri(
+            tur=islem_tur,
+            id=islem.id,
+            degerler=cls._islem_degerleri(islem_tur, islem),
+            belge_yolu=getattr(islem, 'belge_yolu', None) or None
+        )
+
+    @staticmethod
+    def _islem_degerleri(islem_tur: str, islem: FinansIslem) -> Tuple[str, ...]:
+        """
+        İşlemin Treeview kolon değerleri.
+
+        Args:
+            islem_tur: 'gelir' | 'gider' | 'transfer'
+            islem (FinansIslem): İşlem
+
+        Returns:
+            Tuple[str, ...]: Kolon değerleri
+        """
+        # İşlem tutarını para birimiyle birlikte göster
+        tutar_gosterimi = f"{islem.tutar:.2f}"
+        if islem.hesap and hasattr(islem.hesap, 'para_birimi'):
+            tutar_gosterimi = f"{islem.tutar:.2f} {islem.hesap.para_birimi}"
+
+        # Belge göstergesi
+        belge_gostergesi = "📎" if (hasattr(islem, 'belge_yolu') and islem.belge_yolu) else ""
+
+        if islem_tur == 'transfer':
+            # Transfer işlemlerinde kategori yok, kaynak → hedef hesap gösterilir
+            return (
+                f"İşlem#{islem.id}",
+                "Transfer",
+                islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
+                "",  # Ana kategori yok
+                "",  # Alt kategori yok
+                f"{islem.hesap.ad if islem.hesap else ''} → {islem.hedef_hesap.ad if islem.hedef_hesap else ''}",
+                tutar_gosterimi,
+                belge_gostergesi,
+                islem.aciklama or ""
+            )
+
+        return (
+            f"İşlem#{islem.id}",
+            "Gelir" if islem_tur == 'gelir' else "Gider",
+            islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
+            (islem.kategori.ana_kategori.name if islem.kategori and islem.kategori.ana_kategori else islem.ana_kategori_text or ""),
+            islem.kategori.name if islem.kategori else "",
+            islem.hesap.ad if islem.hesap else "",
+            tutar_gosterimi,
+            belge_gostergesi,
+            islem.aciklama or ""
+        )
+
     # Scroll fonksiyonu
     def scroll_to_bottom(self) -> None:
         """Tabloyu en alta kaydır"""
         try:
-            # Scrollable frame'in alt kısmına git
-            self.islemler_tree.yview_moveto(1.0)
-        except:
+            self.virtual_tree(self.islemler_tree).scroll_to_end()
+        except tk.TclError:
             pass
 
     # Context menu handlers
@@ -581,38 +705,29 @@ class FinansPanel(BasePanel):
              self.show_error("Lütfen düzenlenecek işlemi seçin!")
              return
 
-         # TreeView row ID'den işlem bilgisini al
-         row_id = selection[0]
-         if row_id not in self.islem_id_map:
+         # TreeView row ID'den işlemi al (yalnızca çizili sayfadaki satırlar seçilebilir)
+         kayit = self._islem_kaydi(selection[0])
+         if kayit is None:
              self.show_error("İşlem bulunamadı!")
              return
-         
-         islem_info = self.islem_id_map[row_id]
-         islem_tur = islem_info['tur']
-         islem_id = islem_info['id']
 
-         # Doğru liste'den işlemi bul
-         islem = None
+         # Tablo satırı düz demettir; modal için işlem ilişkileriyle birlikte okunur
+         islem_tur = kayit.tur
+         islem = self.finans_controller.get_with_details(kayit.id)
+         if islem is None:
+             self.show_error("İşlem bulunamadı!")
+             return
+
+         # Düzenleme modunu belirt ve işlem ID'sini sakla
+         self.duzenleme_modu = True
+         self.duzenlenen_islem_id = islem.id
+         
          if islem_tur == 'gelir':
-             islem = next((g for g in self.gelirler if g.id == islem_id), None)
+             self.open_gelir_modal(islem)
          elif islem_tur == 'gider':
-             islem = next((g for g in self.giderler if g.id == islem_id), None)
+             self.open_gider_modal(islem)
          elif islem_tur == 'transfer':
-             islem = next((t for t in self.transferler if t.id == islem_id), None)
-
-         if islem:
-             # Düzenleme modunu belirt ve işlem ID'sini sakla
-             self.duzenleme_modu = True
-             self.duzenlenen_islem_id = islem_id
-             
-             if islem_tur == 'gelir':
-                 self.open_gelir_modal(islem)
-             elif islem_tur == 'gider':
-                 self.open_gider_modal(islem)
-             elif islem_tur == 'transfer':
-                 self.open_transfer_modal(islem)
-         else:
-             self.show_error("İşlem bulunamadı!")
+             self.open_transfer_modal(islem)
 
     def sil_islem(self) -> None:
         """Seçili işlemi sil"""
@@ -622,14 +737,12 @@ class FinansPanel(BasePanel):
             return
 
         # TreeView row ID'den işlem bilgisini al
-        row_id = selection[0]
-        if row_id not in self.islem_id_map:
+        kayit = self._islem_kaydi(selection[0])
+        if kayit is None:
             self.show_error("İşlem bulunamadı!")
             return
-        
-        islem_info = self.islem_id_map[row_id]
-        islem_tur = islem_info['tur']
-        islem_id = islem_info['id']
+
+        islem_tur, islem_id = kayit.tur, kayit.id
         
         # Türü Türkçeleştir
         tur_text = {'gelir': 'Gelir', 'gider': 'Gider', 'transfer': 'Transfer'}.get(islem_tur, 'İşlem')
@@ -669,27 +782,17 @@ class FinansPanel(BasePanel):
 
     def _ac_islem_belgesi(self, item_id: str) -> None:
         """İşlemin belgesini aç"""
-        # islem_id_map'den işlem bilgisini al
-        if item_id not in self.islem_id_map:
+        kayit = self._islem_kaydi(item_id)
+        if kayit is None:
             self.show_error("İşlem bulunamadı!")
             return
-        
-        islem_info = self.islem_id_map[item_id]
-        islem_id = islem_info['id']
-        islem_tur = islem_info['tur']
-        
-        # tum_islemler_verisi'nde işlemi bul
-        for tur, islem in self.tum_islemler_verisi:
-            if tur == islem_tur and islem.id == islem_id:
-                if hasattr(islem, 'belge_yolu') and islem.belge_yolu:
-                    basarili, mesaj = self.belge_controller.dosya_ac(islem.belge_yolu)
-                    if not basarili:
-                        self.show_error(mesaj)
-                else:
-                    self.show_error("Bu işlemde belge bulunmamaktadır!")
-                return
-        
-        self.show_error("İşlem bulunamadı!")
+
+        if kayit.belge_yolu:
+            basarili, mesaj = self.belge_controller.dosya_ac(kayit.belge_yolu)
+            if not basarili:
+                self.show_error(mesaj)
+        else:
+            self.show_error("Bu işlemde belge bulunmamaktadır!")
 
     # Modal açma fonksiyonları
     def open_yeni_hesap_modal(self) -> None:
@@ -1856,113 +1959,12 @@ class FinansPanel(BasePanel):
         temizle_btn.pack(side="left", padx=(0, 0))
 
     def uygula_filtreler(self) -> None:
-        """Seçili filtreleri tabloya uygula"""
-        try:
-            # Treeview'i temizle
-            for item in self.islemler_tree.get_children():
-                self.islemler_tree.delete(item)
-            
-            # Filtre değerlerini al
-            filter_tur = self.filter_tur_combo.get()
-            filter_hesap = self.filter_hesap_combo.get()
-            filter_aciklama = self.filter_aciklama_entry.get().lower()
-            
-            # Tarih aralığı
-            filter_tarih_from = None
-            filter_tarih_to = None
-            try:
-                if self.filter_tarih_from_entry.get().strip():
-                    filter_tarih_from = datetime.strptime(self.filter_tarih_from_entry.get().strip(), "%d.%m.%Y")
-            except ValueError:
-                pass
-            
-            try:
-                if self.filter_tarih_to_entry.get().strip():
-                    filter_tarih_to = datetime.strptime(self.filter_tarih_to_entry.get().strip(), "%d.%m.%Y")
-            except ValueError:
-                pass
-            
-            # Tüm işlemleri filtrele
-            for islem_tur, islem in self.tum_islemler_verisi:
-                # Tür filtresi
-                if filter_tur != "Tümü" and islem_tur.capitalize() != filter_tur:
-                    continue
-                
-                # Hesap filtresi
-                hesap_adi = islem.hesap.ad if islem.hesap else ""
-                if filter_hesap != "Tümü" and hesap_adi != filter_hesap:
-                    continue
-                
-                # Açıklama filtresi
-                aciklama = (islem.aciklama or "").lower()
-                if filter_aciklama and filter_aciklama not in aciklama:
-                    continue
-                
-                # Tarih filtresi
-                if islem.tarih:
-                    if filter_tarih_from and islem.tarih.date() < filter_tarih_from.date():
-                        continue
-                    if filter_tarih_to and islem.tarih.date() > filter_tarih_to.date():
-                        continue
-                elif filter_tarih_from or filter_tarih_to:
-                    # Tarih filtesi aktif ama işlemde tarih yoksa geç
-                    continue
-                
-                # İşlemi tabloya ekle
-                tutar_gosterimi = f"{islem.tutar:.2f}"
-                if islem.hesap and hasattr(islem.hesap, 'para_birimi'):
-                    tutar_gosterimi = f"{islem.tutar:.2f} {islem.hesap.para_birimi}"
-                
-                # Belge göstergesi
-                belge_gostergesi = "📎" if (hasattr(islem, 'belge_yolu') and islem.belge_yolu) else ""
-                
-                if islem_tur == 'gelir':
-                    self.islemler_tree.insert("", "end", values=(
-                        f"G{islem.id}",
-                        "Gelir",
-                        islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                        (islem.kategori.ana_kategori.name if islem.kategori and islem.kategori.ana_kategori else islem.ana_kategori_text or ""),
-                        islem.kategori.name if islem.kategori else "",
-                        islem.hesap.ad if islem.hesap else "",
-                        tutar_gosterimi,
-                        belge_gostergesi,
-                        islem.aciklama or ""
-                    ), tags=("gelir",))
-                elif islem_tur == 'gider':
-                    self.islemler_tree.insert("", "end", values=(
-                        f"Gd{islem.id}",
-                        "Gider",
-                        islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                        (islem.kategori.ana_kategori.name if islem.kategori and islem.kategori.ana_kategori else islem.ana_kategori_text or ""),
-                        islem.kategori.name if islem.kategori else "",
-                        islem.hesap.ad if islem.hesap else "",
-                        tutar_gosterimi,
-                        belge_gostergesi,
-                        islem.aciklama or ""
-                    ), tags=("gider",))
-                else:  # transfer
-                    transfer_tutar = f"{islem.tutar:.2f}"
-                    if islem.hesap and hasattr(islem.hesap, 'para_birimi'):
-                        transfer_tutar = f"{islem.tutar:.2f} {islem.hesap.para_birimi}"
-                    
-                    self.islemler_tree.insert("", "end", values=(
-                        f"T{islem.id}",
-                        "Transfer",
-                        islem.tarih.strftime("%d.%m.%Y") if islem.tarih else "",
-                        "",
-                        "",
-                        f"{islem.hesap.ad if islem.hesap else ''} → {islem.hedef_hesap.ad if islem.hedef_hesap else ''}",
-                        transfer_tutar,
-                        belge_gostergesi,
-                        islem.aciklama or ""
-                    ), tags=("transfer",))
-            
-            # Renk kodlaması
-            self.islemler_tree.tag_configure("gelir", background="#e8f5e8")
-            self.islemler_tree.tag_configure("gider", background="#ffeaea")
-            self.islemler_tree.tag_configure("transfer", background="#e8f0ff")
-        except Exception as e:
-            print(f"Filtreleme hatası: {e}")
+        """Seçili filtreleri tek bir SQL sorgusuyla uygula (yalnızca görünen sayfalar okunur)"""
+        filtreler = self._islem_filtreleri()
+        self.run_in_background(
+            "islemler", lambda token: self._fetch_islemler(token, filtreler), self._render_islemler,
+            on_error=lambda e: self.show_error(f"İşlemler yüklenirken hata oluştu: {str(e)}")
+        )
 
     def temizle_filtreler(self) -> None:
         """Tüm filtreleri temizle ve tüm işlemleri göster"""
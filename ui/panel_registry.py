@@ -0,0 +1,228 @@
+"""
+Panel kayıt defteri - Modül pencerelerinin tembel oluşturulması ve yeniden kullanımı
+
+Paneller ilk açıldıklarında oluşturulur; panel modülü de (ve onunla gelen
+matplotlib/pandas gibi ağır bağımlılıklar) ancak o anda import edilir.
+Kapatılan panel penceresi yok edilmez, gizlenir; tekrar açıldığında aynı
+widget ağacı gösterilir. Panel en son gösterildiğinden beri izlediği
+tablolardan biri değiştiyse (bkz. ``database.tablo_surumleri``) yalnızca
+panelin yenileme metodu çağrılır, arayüz yeniden kurulmaz. Kurulum ve
+yenileme sorgu izleyicisinde ``panel:<anahtar>`` eylemi olarak gruplanır.
+"""
+
+import importlib
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import customtkinter as ctk
+
+from database import tablo_surumleri
+from utils.logger import get_logger
+from utils.query_trace import get_query_tracer
+
+
+@dataclass(frozen=True)
+class PanelTanimi:
+    """
+    Bir modül panelinin tanımı.
+
+    Attributes:
+        anahtar (str): Panel anahtarı (ör. "Finans")
+        baslik (str): Pencere ve başlık çubuğu metni (ör. "💰 Finans Yönetimi")
+        modul (str): Panel sınıfının modülü (ör. "ui.finans_panel")
+        sinif (str): Panel sınıfı adı (ör. "FinansPanel")
+        genislik (int): Pencere genişliği (piksel)
+        yukseklik (int): Pencere yüksekliği (piksel)
+        tablolar (Tuple[str, ...], optional): Panelin gösterdiği tablolar;
+            None ise herhangi bir değişiklik paneli eskitir
+        yenileme_metodu (str): Veri eskidiğinde çağrılacak panel metodu
+    """
+
+    anahtar: str
+    baslik: str
+    modul: str
+    sinif: str
+    genislik: int = 1200
+    yukseklik: int = 700
+    tablolar: Optional[Tuple[str, ...]] = None
+    yenileme_metodu: str = "load_data"
+
+
+@dataclass
+class _AcikPanel:
+    """Oluşturulmuş bir panelin penceresi ve durumu"""
+
+    pencere: Any
+    panel: Any
+    surum: int
+    gizli: bool = False
+
+
+class PanelRegistry:
+    """
+    Modül panellerini tembel oluşturan ve gizli tutarak yeniden kullanan sınıf.
+
+    Example:
+        >>> registry = PanelRegistry(root, COLORS, app.center_window)
+        >>> registry.kaydet(PanelTanimi("Finans", "💰 Finans Yönetimi", "ui.finans_panel", "FinansPanel"))
+        >>> registry.goster("Finans")   # ilk açılış: modül import edilir, panel kurulur
+        >>> registry.gizle("Finans")    # pencere kapatılır ama widget'lar korunur
+        >>> registry.goster("Finans")   # aynı panel gösterilir, gerekiyorsa veri yenilenir
+    """
+
+    def __init__(self, root: Any, colors: Dict[str, str],
+                 center_window: Callable[[Any, int, int], None]) -> None:
+        """
+        Args:
+            root: Ana pencere (panel pencerelerinin sahibi)
+            colors: Uygulama renk şeması
+            center_window: ``(pencere, genişlik, yükseklik)`` konumlandırma fonksiyonu
+        """
+        self.root = root
+        self.colors = colors
+        self.center_window = center_window
+        self.logger = get_logger(self.__class__.__name__)
+        self._tanimlar: Dict[str, PanelTanimi] = {}
+        self._acik: Dict[str, _AcikPanel] = {}
+
+    def kaydet(self, tanim: PanelTanimi) -> None:
+        """
+        Paneli kaydet (panel oluşturulmaz, modülü import edilmez).
+
+        Args:
+            tanim: Panel tanımı
+        """
+        self._tanimlar[tanim.anahtar] = tanim
+
+    def panel(self, anahtar: str) -> Optional[Any]:
+        """
+        Oluşturulmuş paneli döndür.
+
+        Args:
+            anahtar: Panel anahtarı
+
+        Returns:
+            Panel nesnesi; henüz açılmadıysa None
+        """
+        acik = self._acik.get(anahtar)
+        return acik.panel if acik is not None else None
+
+    def goster(self, anahtar: str) -> Any:
+        """
+        Paneli göster; yoksa oluştur, gizliyse geri getir.
+
+        Args:
+            anahtar: Panel anahtarı
+
+        Returns:
+            Panel nesnesi
+        """
+        tanim = self._tanimlar[anahtar]
+        acik = self._acik.get(anahtar)
+        if acik is not None and not self._pencere_var(acik.pencere):
+            del self._acik[anahtar]
+            acik = None
+
+        if acik is None:
+            acik = self._olustur(tanim)
+        else:
+            self._yeniden_goster(tanim, acik)
+
+        acik.pencere.lift()
+        acik.pencere.focus_force()
+        return acik.panel
+
+    def gizle(self, anahtar: str) -> None:
+        """
+        Panel penceresini gizle (widget'lar ve veri korunur).
+
+        Args:
+            anahtar: Panel anahtarı
+        """
+        acik = self._acik.get(anahtar)
+        if acik is None or acik.gizli:
+            return
+        cancel_loads = getattr(acik.panel, "cancel_loads", None)
+        if cancel_loads is not None:
+            cancel_loads()
+        acik.pencere.withdraw()
+        acik.gizli = True
+        self.logger.debug(f"Panel hidden: {anahtar}")
+
+    def kapat(self, anahtar: str) -> None:
+        """
+        Paneli tamamen kapat (sonraki açılışta yeniden oluşturulur).
+
+        Args:
+            anahtar: Panel anahtarı
+        """
+        acik = self._acik.pop(anahtar, None)
+        if acik is not None and self._pencere_var(acik.pencere):
+            acik.pencere.destroy()
+
+    def _olustur(self, tanim: PanelTanimi) -> _AcikPanel:
+        """Panel modülünü import et, pencereyi ve paneli kur"""
+        baslangic = time.perf_counter()
+        panel_sinifi = getattr(importlib.import_module(tanim.modul), tanim.sinif)
+
+        pencere = ctk.CTkToplevel(self.root)
+        pencere.title(f"Aidat Plus - {tanim.baslik}")
+        self.center_window(pencere, tanim.genislik, tanim.yukseklik)
+
+        # Ana pencerenin önünde kalması için
+        pencere.transient(self.root)
+
+        # Kapatma düğmesi pencereyi gizler
+        pencere.protocol("WM_DELETE_WINDOW", lambda: self.gizle(tanim.anahtar))
+
+        # Panel başlığı
+        header_frame = ctk.CTkFrame(pencere, fg_color=self.colors["primary"], height=60)
+        header_frame.pack(fill="x", padx=0, pady=0)
+        header_frame.pack_propagate(False)
+
+        title_label = ctk.CTkLabel(
+            header_frame,
+            text=tanim.baslik,
+            font=ctk.CTkFont(size=20, weight="bold"),
+            text_color=self.colors["surface"]
+        )
+        title_label.pack(pady=15)
+
+        # Sürüm panel veriyi okumadan önce alınır; kurulum sırasındaki yazmalar sonraki gösterimde yenilenir
+        surum = tablo_surumleri.surum(tanim.tablolar)
+        with get_query_tracer().eylem(f"panel:{tanim.anahtar}"):
+            panel = panel_sinifi(pencere, self.colors)
+        acik = _AcikPanel(pencere=pencere, panel=panel, surum=surum)
+        self._acik[tanim.anahtar] = acik
+        self.logger.info(
+            f"Panel created: {tanim.anahtar} ({(time.perf_counter() - baslangic) * 1000:.0f} ms)"
+        )
+        return acik
+
+    def _yeniden_goster(self, tanim: PanelTanimi, acik: _AcikPanel) -> None:
+        """Gizli paneli geri getir; verisi eskidiyse yalnızca veriyi yenile"""
+        if acik.gizli:
+            acik.pencere.deiconify()
+            acik.gizli = False
+
+        surum = tablo_surumleri.surum(tanim.tablolar)
+        if surum == acik.surum:
+            self.logger.debug(f"Panel reshown without reload: {tanim.anahtar}")
+            return
+
+        acik.surum = surum
+        try:
+            with get_query_tracer().eylem(f"panel:{tanim.anahtar}"):
+                getattr(acik.panel, tanim.yenileme_metodu)()
+            self.logger.debug(f"Panel data refreshed: {tanim.anahtar}")
+        except Exception as e:
+            self.logger.error(f"Panel refresh error ({tanim.anahtar}): {str(e)}")
+
+    @staticmethod
+    def _pencere_var(pencere: Any) -> bool:
+        """Pencere hâlâ mevcut mu? (ör. dışarıdan yok edilmiş olabilir)"""
+        try:
+            return bool(pencere.winfo_exists())
+        except Exception:
+            return False
@@ -4,7 +4,7 @@ Raporlar paneli - Tüm İşlem Detayları, Bilanço, İcmal, Konut Mali Durumlar
 
 import customtkinter as ctk
 from tkinter import ttk
-from typing import List, TYPE_CHECKING
+from typing import List, Tuple, TYPE_CHECKING
 from datetime import datetime
 
 if TYPE_CHECKING:
@@ -21,17 +21,19 @@ if TYPE_CHECKING:
     from datetime import datetime as datetime_type
 
 from ui.base_panel import BasePanel
+from ui.background_loader import LoadToken
 from ui.error_handler import (
     ErrorHandler, handle_exception, show_error, show_success, show_warning
 )
 from controllers.finans_islem_controller import FinansIslemController
+from controllers.finans_ozet_controller import FinansOzetController
 from controllers.hesap_controller import HesapController
 from controllers.sakin_controller import SakinController
 from controllers.daire_controller import DaireController
 from controllers.aidat_controller import AidatIslemController
 from controllers.kategori_yonetim_controller import KategoriYonetimController
 from controllers.bos_konut_controller import BosKonutController
-from models.base import Daire, Blok, Lojman, Sakin, FinansIslem
+from models.base import Daire, FinansIslem
 from models.exceptions import DatabaseError, InsufficientDataError
 from database.config import get_db
 from sqlalchemy.orm import joinedload
@@ -57,11 +59,13 @@ class RaporlarPanel(BasePanel):
 
     def __init__(self, parent: ctk.CTkFrame, colors: dict) -> None:
         self.finans_controller = FinansIslemController()
+        self.finans_ozet_controller = FinansOzetController()
         self.hesap_controller = HesapController()
         self.sakin_controller = SakinController()
         self.daire_controller = DaireController()
         self.aidat_controller = AidatIslemController()
         self.kategori_controller = KategoriYonetimController()  # Add this for category management
+        self.bos_konut_controller = BosKonutController()
 
         super().__init__(parent, "📊 Raporlar", colors)
 
@@ -97,6 +101,14 @@ class RaporlarPanel(BasePanel):
         # self.setup_aylik_ozet_tab()
         # self.setup_trend_analizi_tab()
 
+    def load_data(self) -> None:
+        """Tüm rapor sekmelerini mevcut filtrelerle yeniden yükle"""
+        self.load_tum_islem_detaylari()
+        self.load_bilanco()
+        self.load_icmal()
+        self.load_konut_mali_durumlari()
+        self.load_bos_konut_listesi()
+
     def setup_tum_islem_detaylari_tab(self) -> None:
         """Tüm İşlem Detayları tab'ı - Dönemsel filtreleme ile"""
         tab = self.tabview.tab("Tüm İşlem Detayları")
@@ -206,8 +218,8 @@ class RaporlarPanel(BasePanel):
         self.islem_tree.column("tur", width=30, anchor="center")
 
         # Scrollbar
-        scrollbar = ttk.Scrollbar(table_frame, orient="vertical", command=self.islem_tree.yview)
-        self.islem_tree.configure(yscrollcommand=scrollbar.set)
+        scrollbar = ttk.Scrollbar(table_frame, orient="vertical")
+        self.virtual_tree(self.islem_tree, scrollbar=scrollbar)
 
         self.islem_tree.pack(side="left", fill="both", expand=True, padx=0, pady=0)
         scrollbar.pack(side="right", fill="y", pady=0)
@@ -1123,25 +1135,11 @@ class RaporlarPanel(BasePanel):
     def get_veritabani_yillari(self) -> List[str]:
         """Veritabanında bulunan tüm işlem yıllarını al"""
         try:
-            yillar_set = set()
-            
-            # Gelirlerden yılları al
-            gelirler = self.finans_controller.get_gelirler()
-            for gelir in gelirler:
-                if gelir.tarih:
-                    yillar_set.add(gelir.tarih.year)
-            
-            # Giderlerden yılları al
-            giderler = self.finans_controller.get_giderler()
-            for gider in giderler:
-                if gider.tarih:
-                    yillar_set.add(gider.tarih.year)
-            
-            # Transferlerden yılları al
-            transferler = self.finans_controller.get_transferler()
-            for transfer in transferler:
-                if transfer.tarih:
-                    yillar_set.add(transfer.tarih.year)
+            # İşlem yıllarını veritabanında grupla
+            yillar_set = {
+                satir["yil"] for satir in self.finans_controller.aggregate(group_by=["year"])
+                if satir["yil"] is not None
+            }
             
             # Eğer hiç yıl bulunamadıysa, cari yılı ekle
             if not yillar_set:
@@ -1345,12 +1343,13 @@ class RaporlarPanel(BasePanel):
 
     # Veri yükleme metodları
     def load_tum_islem_detaylari(self) -> None:
-        """Tüm işlem detaylarını yükle ve filtreleme uygula"""
-        try:
-            # Treeview'i temizle
-            for item in self.islem_tree.get_children():
-                self.islem_tree.delete(item)
+        """Tüm işlem detaylarını yükle ve filtreleme uygula
 
+        Filtre değerleri ana thread'de okunur; işlemler worker thread'de çekilip
+        satırlara çevrilir ve sonuç ana thread'de çizilir. Filtre hızlı
+        değiştirilirse önceki yüklemenin sonucu atılır.
+        """
+        try:
             # Filtre parametrelerini al (combo box'lar varsa)
             from datetime import datetime
             
@@ -1372,92 +1371,128 @@ class RaporlarPanel(BasePanel):
                 }
                 ay_text = self.islem_ay_combo.get()
                 ay = aylar_dict.get(ay_text, datetime.now().month)
-
-            # Tüm işlemleri al
-            gelirler = self.finans_controller.get_gelirler()
-            giderler = self.finans_controller.get_giderler()
-            transferler = self.finans_controller.get_transferler()
-
-            # Özet değişkenleri
-            donem_toplam_gelir = 0.0
-            donem_toplam_gider = 0.0
-
-            # Gelirleri filtreleme ve ekleme
-            for gelir in gelirler:
-                if self.uygula_tarih_filtresi(gelir.tarih, filtre_tur, yil, ay):
-                    donem_toplam_gelir += gelir.tutar
-                    ana_kat = gelir.kategori.ana_kategori.name if (gelir.kategori and gelir.kategori.ana_kategori) else ""
-                    alt_kat = gelir.kategori.name if gelir.kategori else ""
-                    # Para birimi ile tutar göster
-                    para_birimi = gelir.hesap.para_birimi if gelir.hesap and hasattr(gelir.hesap, 'para_birimi') else "₺"
-                    tutar_gosterimi = f"{gelir.tutar:.2f} {para_birimi}"
-                    self.islem_tree.insert("", "end", values=(
-                        f"İşlem#{gelir.id}",
-                        gelir.tarih.strftime("%d.%m.%Y") if gelir.tarih else "",
-                        gelir.aciklama or "",
-                        ana_kat,
-                        alt_kat,
-                        gelir.hesap.ad if gelir.hesap else "",
-                        tutar_gosterimi,
-                        "Gelir"
-                    ), tags=("gelir",))
-
-            # Giderleri filtreleme ve ekleme
-            for gider in giderler:
-                if self.uygula_tarih_filtresi(gider.tarih, filtre_tur, yil, ay):
-                    donem_toplam_gider += gider.tutar
-                    ana_kat = gider.kategori.ana_kategori.name if (gider.kategori and gider.kategori.ana_kategori) else ""
-                    alt_kat = gider.kategori.name if gider.kategori else ""
-                    # Para birimi ile tutar göster
-                    para_birimi = gider.hesap.para_birimi if gider.hesap and hasattr(gider.hesap, 'para_birimi') else "₺"
-                    tutar_gosterimi = f"{gider.tutar:.2f} {para_birimi}"
-                    self.islem_tree.insert("", "end", values=(
-                        f"İşlem#{gider.id}",
-                        gider.tarih.strftime("%d.%m.%Y") if gider.tarih else "",
-                        gider.aciklama or "",
-                        ana_kat,
-                        alt_kat,
-                        gider.hesap.ad if gider.hesap else "",
-                        tutar_gosterimi,
-                        "Gider"
-                    ), tags=("gider",))
-
-            # Transferleri filtreleme ve ekleme
-            for transfer in transferler:
-                if self.uygula_tarih_filtresi(transfer.tarih, filtre_tur, yil, ay):
-                    # Para birimi ile tutar göster
-                    para_birimi = transfer.hesap.para_birimi if transfer.hesap and hasattr(transfer.hesap, 'para_birimi') else "₺"
-                    tutar_gosterimi = f"{transfer.tutar:.2f} {para_birimi}"
-                    self.islem_tree.insert("", "end", values=(
-                        f"İşlem#{transfer.id}",
-                        transfer.tarih.strftime("%d.%m.%Y") if transfer.tarih else "",
-                        transfer.aciklama or "",
-                        "",
-                        "",
-                        f"{transfer.hesap.ad if transfer.hesap else ''} → {transfer.hedef_hesap.ad if transfer.hedef_hesap else ''}",
-                        tutar_gosterimi,
-                        "Transfer"
-                    ), tags=("transfer",))
-
-            # Renk kodlaması
-            self.islem_tree.tag_configure("gelir", background="#e8f5e8")
-            self.islem_tree.tag_configure("gider", background="#ffeaea")
-            self.islem_tree.tag_configure("transfer", background="#e8f0ff")
-
-            # Özet bilgilerini güncelle
-            donem_net_bakiye = donem_toplam_gelir - donem_toplam_gider
-            self.donem_toplam_gelir_label.configure(text=f"{donem_toplam_gelir:.2f} ₺")
-            self.donem_toplam_gider_label.configure(text=f"{donem_toplam_gider:.2f} ₺")
-            self.donem_net_bakiye_label.configure(text=f"{donem_net_bakiye:.2f} ₺")
-
-            # Net bakiyeye göre renk ayarla
-            if donem_net_bakiye >= 0:
-                self.donem_net_bakiye_label.configure(text_color=self.colors["success"])
-            else:
-                self.donem_net_bakiye_label.configure(text_color=self.colors["error"])
-
         except Exception as e:
             self.show_error(f"İşlem detayları yüklenirken hata oluştu: {str(e)}")
+            return
+
+        self.run_in_background(
+            "islem_detaylari",
+            lambda token: self._fetch_islem_detaylari(token, filtre_tur, yil, ay),
+            self._render_islem_detaylari,
+            on_error=lambda e: self.show_error(f"İşlem detayları yüklenirken hata oluştu: {str(e)}")
+        )
+
+    def _fetch_islem_detaylari(self, token: LoadToken, filtre_tur: str, yil: int,
+                               ay: int) -> Tuple[List[tuple], float, float]:
+        """
+        Dönem işlemlerini çek ve tablo satırlarına çevir (worker thread).
+
+        Args:
+            token (LoadToken): Yükleme iptal token'ı
+            filtre_tur (str): "Aylık" veya "Yıllık"
+            yil (int): Yıl
+            ay (int): Ay (1-12)
+
+        Returns:
+            Tuple[List[tuple], float, float]: ((iid, values, tags) satırları, dönem geliri, dönem gideri)
+        """
+        # Tüm işlemleri al
+        gelirler = self.finans_controller.get_gelirler()
+        giderler = self.finans_controller.get_giderler()
+        transferler = self.finans_controller.get_transferler()
+        token.raise_if_cancelled()
+
+        # Özet değişkenleri
+        donem_toplam_gelir = 0.0
+        donem_toplam_gider = 0.0
+
+        # Dönem işlemlerini sırayla topla: gelirler, giderler, transferler
+        satirlar = []
+        for islem_tur, islemler in (("gelir", gelirler), ("gider", giderler), ("transfer", transferler)):
+            for islem in islemler:
+                if not self.uygula_tarih_filtresi(islem.tarih, filtre_tur, yil, ay):
+                    continue
+                if islem_tur == "gelir":
+                    donem_toplam_gelir += islem.tutar
+                elif islem_tur == "gider":
+                    donem_toplam_gider += islem.tutar
+                values, tags = self._islem_detay_satiri((islem_tur, islem))
+                satirlar.append((f"islem_{islem.id}", values, tags))
+
+        return satirlar, donem_toplam_gelir, donem_toplam_gider
+
+    def _render_islem_detaylari(self, sonuc: Tuple[List[tuple], float, float]) -> None:
+        """
+        İşlem detayları tablosunu ve dönem özetini çiz (ana thread).
+
+        Args:
+            sonuc: ``_fetch_islem_detaylari`` sonucu
+        """
+        satirlar, donem_toplam_gelir, donem_toplam_gider = sonuc
+
+        # Yalnızca görünür pencere çizilir
+        self.virtual_tree(self.islem_tree).set_rows(
+            satirlar, lambda satir: (satir[1], satir[2]), key=lambda satir: satir[0]
+        )
+
+        # Renk kodlaması
+        self.islem_tree.tag_configure("gelir", background="#e8f5e8")
+        self.islem_tree.tag_configure("gider", background="#ffeaea")
+        self.islem_tree.tag_configure("transfer", background="#e8f0ff")
+
+        # Özet bilgilerini güncelle
+        donem_net_bakiye = donem_toplam_gelir - donem_toplam_gider
+        self.donem_toplam_gelir_label.configure(text=f"{donem_toplam_gelir:.2f} ₺")
+        self.donem_toplam_gider_label.configure(text=f"{donem_toplam_gider:.2f} ₺")
+        self.donem_net_bakiye_label.configure(text=f"{donem_net_bakiye:.2f} ₺")
+
+        # Net bakiyeye göre renk ayarla
+        if donem_net_bakiye >= 0:
+            self.donem_net_bakiye_label.configure(text_color=self.colors["success"])
+        else:
+            self.donem_net_bakiye_label.configure(text_color=self.colors["error"])
+
+    def _islem_detay_satiri(self, kayit: Tuple[str, FinansIslem]) -> Tuple[tuple, tuple]:
+        """
+        (tür, işlem) kaydını işlem detayları tablosu satırına çevir.
+
+        Args:
+            kayit: ('gelir' | 'gider' | 'transfer', FinansIslem)
+
+        Returns:
+            Tuple[tuple, tuple]: (values, tags)
+        """
+        islem_tur, islem = kayit
+
+        # Para birimi ile tutar göster
+        para_birimi = islem.hesap.para_birimi if islem.hesap and hasattr(islem.hesap, 'para_birimi') else "₺"
+        tutar_gosterimi = f"{islem.tutar:.2f} {para_birimi}"
+        tarih = islem.tarih.strftime("%d.%m.%Y") if islem.tarih else ""
+
+        if islem_tur == "transfer":
+            return (
+                f"İşlem#{islem.id}",
+                tarih,
+                islem.aciklama or "",
+                "",
+                "",
+                f"{islem.hesap.ad if islem.hesap else ''} → {islem.hedef_hesap.ad if islem.hedef_hesap else ''}",
+                tutar_gosterimi,
+                "Transfer"
+            ), ("transfer",)
+
+        ana_kat = islem.kategori.ana_kategori.name if (islem.kategori and islem.kategori.ana_kategori) else ""
+        alt_kat = islem.kategori.name if islem.kategori else ""
+        return (
+            f"İşlem#{islem.id}",
+            tarih,
+            islem.aciklama or "",
+            ana_kat,
+            alt_kat,
+            islem.hesap.ad if islem.hesap else "",
+            tutar_gosterimi,
+            "Gelir" if islem_tur == "gelir" else "Gider"
+        ), (islem_tur,)
 
     def uygula_tarih_filtresi(self, islem_tarihi: datetime, filtre_tur: str, yil: int, ay: int) -> bool:
         """Tarih filtresini uygula"""
@@ -1635,10 +1670,6 @@ class RaporlarPanel(BasePanel):
                 ay_text = self.bilanco_ay_combo.get()
                 ay = aylar_dict.get(ay_text, datetime.now().month)
 
-            # Tüm işlemleri al
-            gelirler = self.finans_controller.get_gelirler()
-            giderler = self.finans_controller.get_giderler()
-
             # Seçilen dönem başlangıcını belirle
             if filtre_tur == "Aylık":
                 donem_baslangic = datetime(yil, ay, 1)
@@ -1651,74 +1682,56 @@ class RaporlarPanel(BasePanel):
                 donem_baslangic = datetime(yil, 1, 1)
                 donem_son = datetime(yil + 1, 1, 1)
 
-            # Dönem öncesi net bakiye hesapla (seçilen dönemden önceki tüm işlemlerin toplamı)
-            onceki_gelir_toplam = sum(g.tutar for g in gelirler if g.tarih < donem_baslangic)
-            onceki_gider_toplam = sum(g.tutar for g in giderler if g.tarih < donem_baslangic)
+            # Dönem öncesi net bakiye hesapla (aylık özet tablosundan, dönem başı ay sınırındadır)
+            onceki_toplamlar = {
+                satir["tur"]: satir["toplam"]
+                for satir in self.finans_ozet_controller.get_toplamlar(
+                    group_by=["tur"],
+                    tur=["Gelir", "Gider"],
+                    bitis=(donem_baslangic.year, donem_baslangic.month)
+                )
+            }
+            onceki_gelir_toplam = onceki_toplamlar.get("Gelir", 0.0)
+            onceki_gider_toplam = onceki_toplamlar.get("Gider", 0.0)
             onceki_donem_bakiye = onceki_gelir_toplam - onceki_gider_toplam
 
-            # Dönem içi gelir ve giderleri hesapla
+            # Dönem içi gelir ve giderleri hesapla (dönem ay sınırında; yalnızca dönemin
+            # rollup satırları okunur, işlem geçmişi taranmaz)
             donem_toplam_gelir: float = 0.0
             donem_toplam_gider: float = 0.0
-            gelir_kategorileri: dict = {}  # {ana_kategori: toplam}
-            gider_kategorileri: dict = {}  # {ana_kategori: toplam}
-            
-            # Gelirleri işle
-            gelir_kategorileri_para: dict = {}  # {ana_kategori: {tutar: toplam, para_birimi: ₺}}
-            for gelir in gelirler:
-                if self.uygula_tarih_filtresi(gelir.tarih, filtre_tur, yil, ay):
-                    donem_toplam_gelir += float(gelir.tutar)
-                    
-                    # Kategori bilgisini al
-                    ana_kat = gelir.kategori.ana_kategori.name if (gelir.kategori and gelir.kategori.ana_kategori) else "Tanımsız"
-                    
-                    # Para birimini al
-                    para_birimi = "₺"
-                    if gelir.hesap:
-                        para_birimi = gelir.hesap.para_birimi or "₺"
-                    
-                    if ana_kat not in gelir_kategorileri_para:
-                        gelir_kategorileri_para[ana_kat] = {"tutar": 0.0, "para_birimi": str(para_birimi)}
-                    gelir_kategorileri_para[ana_kat]["tutar"] += float(gelir.tutar)
-                    gelir_kategorileri[ana_kat] = float(gelir_kategorileri_para[ana_kat]["tutar"])
-            
-            # Giderleri işle
-            gider_kategorileri_para: dict = {}  # {ana_kategori: {tutar: toplam, para_birimi: ₺}}
-            for gider in giderler:
-                if self.uygula_tarih_filtresi(gider.tarih, filtre_tur, yil, ay):
-                    donem_toplam_gider += float(gider.tutar)
-                    
-                    # Kategori bilgisini al
-                    ana_kat = gider.kategori.ana_kategori.name if (gider.kategori and gider.kategori.ana_kategori) else "Tanımsız"
-                    
-                    # Para birimini al
-                    para_birimi = "₺"
-                    if gider.hesap:
-                        para_birimi = gider.hesap.para_birimi or "₺"
-                    
-                    if ana_kat not in gider_kategorileri_para:
-                        gider_kategorileri_para[ana_kat] = {"tutar": 0.0, "para_birimi": str(para_birimi)}
-                    gider_kategorileri_para[ana_kat]["tutar"] += float(gider.tutar)
-                    gider_kategorileri[ana_kat] = float(gider_kategorileri_para[ana_kat]["tutar"])
-            
+            kategoriler: dict = {"Gelir": {}, "Gider": {}}  # {tur: {ana_kategori: toplam}}
+            kategori_para_birimleri: dict = {"Gelir": {}, "Gider": {}}  # {tur: {ana_kategori: ₺}}
+            para_birimleri = {h.id: h.para_birimi or "₺" for h in self.hesap_controller.get_all()}
+
+            for satir in self.finans_ozet_controller.get_toplamlar(
+                group_by=["tur", "ana_kategori", "hesap"],
+                tur=["Gelir", "Gider"],
+                baslangic=(donem_baslangic.year, donem_baslangic.month),
+                bitis=(donem_son.year, donem_son.month)
+            ):
+                tur = satir["tur"]
+                ana_kat = satir["ana_kategori"] or "Tanımsız"
+                if tur == "Gelir":
+                    donem_toplam_gelir += satir["toplam"]
+                else:
+                    donem_toplam_gider += satir["toplam"]
+                kategoriler[tur][ana_kat] = kategoriler[tur].get(ana_kat, 0.0) + satir["toplam"]
+                # Kategori birden çok hesapta geçiyorsa ilk hesabın para birimi gösterilir
+                kategori_para_birimleri[tur].setdefault(
+                    ana_kat, str(para_birimleri.get(satir["hesap_id"], "₺"))
+                )
+
             # Dönem sonu bakiyesi = Önceki dönem bakiyesi + (dönem gelir - dönem gider)
             donem_sonu_bakiye = float(onceki_donem_bakiye) + (float(donem_toplam_gelir) - float(donem_toplam_gider))
             
             # Detayları tabloya ekle (önce gelirler, sonra giderler)
-            for ana_kat in sorted(gelir_kategorileri.keys()):
-                gelir_para_birimi: str = str(gelir_kategorileri_para[ana_kat]["para_birimi"])
-                self.bilanco_tree.insert("", "end", values=(
-                    "Gelir",
-                    ana_kat,
-                    f"{float(gelir_kategorileri[ana_kat]):.2f} {gelir_para_birimi}"
-                ), tags=("gelir",))
-            
-            for ana_kat in sorted(gider_kategorileri.keys()):
-                gider_para_birimi: str = str(gider_kategorileri_para[ana_kat]["para_birimi"])
-                self.bilanco_tree.insert("", "end", values=(
-                    "Gider",
-                    ana_kat,
-                    f"{float(gider_kategorileri[ana_kat]):.2f} {gider_para_birimi}"
-                ), tags=("gider",))
+            for tur in ("Gelir", "Gider"):
+                for ana_kat in sorted(kategoriler[tur].keys()):
+                    self.bilanco_tree.insert("", "end", values=(
+                        tur,
+                        ana_kat,
+                        f"{float(kategoriler[tur][ana_kat]):.2f} {kategori_para_birimleri[tur][ana_kat]}"
+                    ), tags=(tur.lower(),))
 
             # Özet değerlerini güncelle
             self.bilanco_onceki_bakiye_label.configure(
@@ -1992,35 +2005,12 @@ class RaporlarPanel(BasePanel):
         self.load_bos_konut_listesi()
 
     def load_bos_konut_listesi(self) -> None:
-        """Boş konut listesini yükle ve hesaplamaları yap"""
-        try:
-            # Treeview'i temizle
-            for item in self.bos_konut_tree.get_children():
-                self.bos_konut_tree.delete(item)
+        """Boş konut listesini yükle ve hesaplamaları yap
 
-            # Veritabanından verileri al
-            db = get_db()
-            
-            # Daireler (eager loading ile)
-            daireler = db.query(Daire).options(
-                joinedload(Daire.sakini),
-                joinedload(Daire.blok).joinedload(Blok.lojman)
-            ).filter(Daire.aktif == True).all()
-            
-            # Bloklar
-            bloklar = db.query(Blok).all()
-            
-            # Lojmanlar
-            lojmanlar = db.query(Lojman).all()
-            
-            # Sakinler (hem aktif hem pasif - boş konut analizi için gerekli)
-            sakinler = db.query(Sakin).all()  # Tüm sakinleri al (aktif ve pasif)
-            
-            # Giderler (FinansIslem - tip='Gider')
-            giderler = db.query(FinansIslem).filter(FinansIslem.tur == 'Gider').all()
-            
-            db.close()
-            
+        Hesaplama ``BosKonutController.get_empty_housing_report`` ile worker
+        thread'de yapılır; sonuç ana thread'de çizilir.
+        """
+        try:
             # Filtre değerlerini al
             from datetime import datetime
             
@@ -2037,110 +2027,71 @@ class RaporlarPanel(BasePanel):
                 }
                 ay_text = self.bos_konut_ay_combo.get()
                 ay = aylar_dict.get(ay_text, datetime.now().month)
-            
-            # Verileri hesaplama fonksiyonu için format et
-            daire_listesi = [
-                {
-                    'id': d.id,
-                    'daire_no': d.daire_no,
-                    'bagliBlokId': d.blok_id,
-                    'kiraya_esasi_alan': d.kiraya_esas_alan
-                }
-                for d in daireler
-            ]
-            
-            blok_listesi = [
-                {
-                    'id': b.id,
-                    'blok_adi': b.ad,
-                    'bagliLojmanId': b.lojman_id
-                }
-                for b in bloklar
-            ]
-            
-            lojman_listesi = [
-                {
-                    'id': l.id,
-                    'lojman_adi': l.ad
-                }
-                for l in lojmanlar
-            ]
-            
-            gider_kayitlari = [
-                {
-                    'id': g.id,
-                    'tutar': g.tutar_kurus / 100.0,  # kuruş → TL
-                    'islem_tarihi': g.tarih
-                }
-                for g in giderler
-            ]
-            
-            sakin_listesi = [
-                {
-                    'daire_id': s.daire_id or s.eski_daire_id,  # Aktif daire veya eski daire
-                    'tahsis_tarihi': s.tahsis_tarihi,
-                    'giris_tarihi': s.giris_tarihi,
-                    'cikis_tarihi': s.cikis_tarihi  # Çıkış tarihi (pasif sakinler için)
-                }
-                for s in sakinler
-                if (s.daire_id or s.eski_daire_id)  # Hiç daire kaydı olmayan sakinleri filtrele
-            ]
-            
-            # Hesaplamaları yap
-            records, total_cost = BosKonutController.calculate_empty_housing_costs(
-                year=yil,
-                month=ay,
-                daire_listesi=daire_listesi,
-                blok_listesi=blok_listesi,
-                lojman_listesi=lojman_listesi,
-                gider_kayitlari=gider_kayitlari,
-                sakin_listesi=sakin_listesi
-            )
-            
-            # Sonuçları tabloya ekle
-            if records:
-                for record in records:
-                    self.bos_konut_tree.insert("", "end", values=(
-                        record['sira_no'],
-                        record['daire_adi'],
-                        record['daire_no'],
-                        f"{record['alan']:.2f}" if record['alan'] else "0.00",
-                        BosKonutController.format_date(record['ilk_tarih']),
-                        BosKonutController.format_date(record['son_tarih']),
-                        record['sorumlu_gun_sayisi'],
-                        BosKonutController.format_currency(record['konut_aidat_bedeli'])
-                    ), tags=("bos",))
-                
-                # Toplam maliyet satırı ekle
-                self.bos_konut_tree.insert("", "end", values=(
-                    "",
-                    "TOPLAM",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    BosKonutController.format_currency(total_cost)
-                ), tags=("toplam",))
-            else:
-                # Boş konut yoksa bilgi mesajı
-                self.bos_konut_tree.insert("", "end", values=(
-                    "",
-                    "Seçilen dönemde boş konut bulunmamaktadır",
-                    "",
-                    "",
-                    "",
-                    "",
-                    "",
-                    ""
-                ))
-            
-            # Tag'ları ayarla
-            self.bos_konut_tree.tag_configure("bos", background="#fff3cd")
-            self.bos_konut_tree.tag_configure("toplam", background="#d4edda", font=("TkDefaultFont", 9, "bold"))
-            
         except Exception as e:
             self.show_error(f"Boş konut listesi yüklenirken hata oluştu: {str(e)}")
+            return
+
+        self.run_in_background(
+            "bos_konut",
+            lambda token: self.bos_konut_controller.get_empty_housing_report((yil, ay))[(yil, ay)],
+            self._render_bos_konut_listesi,
+            on_error=lambda e: self.show_error(f"Boş konut listesi yüklenirken hata oluştu: {str(e)}")
+        )
+
+    def _render_bos_konut_listesi(self, sonuc: Tuple[List[dict], float]) -> None:
+        """
+        Boş konut tablosunu çiz (ana thread).
+
+        Args:
+            sonuc: (rapor kayıtları, toplam maliyet)
+        """
+        records, total_cost = sonuc
+
+        # Treeview'i temizle
+        for item in self.bos_konut_tree.get_children():
+            self.bos_konut_tree.delete(item)
+
+        # Sonuçları tabloya ekle
+        if records:
+            for record in records:
+                self.bos_konut_tree.insert("", "end", values=(
+                    record['sira_no'],
+                    record['daire_adi'],
+                    record['daire_no'],
+                    f"{record['alan']:.2f}" if record['alan'] else "0.00",
+                    BosKonutController.format_date(record['ilk_tarih']),
+                    BosKonutController.format_date(record['son_tarih']),
+                    record['sorumlu_gun_sayisi'],
+                    BosKonutController.format_currency(record['konut_aidat_bedeli'])
+                ), tags=("bos",))
+            
+            # Toplam maliyet satırı ekle
+            self.bos_konut_tree.insert("", "end", values=(
+                "",
+                "TOPLAM",
+                "",
+                "",
+                "",
+                "",
+                "",
+                BosKonutController.format_currency(total_cost)
+            ), tags=("toplam",))
+        else:
+            # Boş konut yoksa bilgi mesajı
+            self.bos_konut_tree.insert("", "end", values=(
+                "",
+                "Seçilen dönemde boş konut bulunmamaktadır",
+                "",
+                "",
+                "",
+                "",
+                "",
+                ""
+            ))
+        
+        # Tag'ları ayarla
+        self.bos_konut_tree.tag_configure("bos", background="#fff3cd")
+        self.bos_konut_tree.tag_configure("toplam", background="#d4edda", font=("TkDefaultFont", 9, "bold"))
 
     # Removed setup_kategori_dagilimi_tab method
     # Removed load_kategori_dagilimi method
@@ -2242,9 +2193,13 @@ class RaporlarPanel(BasePanel):
             else:
                 yil = int(self.aylik_ozet_yil_combo.get())
             
-            # Tüm işlemleri al
-            gelirler = self.finans_controller.get_gelirler()
-            giderler = self.finans_controller.get_giderler()
+            # Yılın aylık toplamlarını aylık özet tablosundan al
+            satirlar = self.finans_ozet_controller.get_toplamlar(
+                group_by=["month", "tur", "alt_kategori", "ana_kategori"],
+                tur=["Gelir", "Gider"],
+                baslangic=(yil, 1),
+                bitis=(yil + 1, 1)
+            )
             
             # Aylık verileri hazırla
             aylar = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", 
@@ -2254,35 +2209,21 @@ class RaporlarPanel(BasePanel):
             aylik_gelirler = [0.0] * 12
             aylik_giderler = [0.0] * 12
             
-            # Gelirleri aylık olarak grupla
-            for gelir in gelirler:
-                if gelir.tarih and gelir.tarih.year == yil:
-                    aylik_gelirler[gelir.tarih.month - 1] += gelir.tutar
-            
-            # Giderleri aylık olarak grupla
-            for gider in giderler:
-                if gider.tarih and gider.tarih.year == yil:
-                    aylik_giderler[gider.tarih.month - 1] += gider.tutar
-            
             # Kategori bazlı karşılaştırmalar için veri hazırla
-            kategori_gelirler = {}
-            kategori_giderler = {}
-            
-            # Gelir kategorileri
-            for gelir in gelirler:
-                if gelir.tarih and gelir.tarih.year == yil and gelir.kategori:
-                    ana_kategori = gelir.kategori.ana_kategori.name if gelir.kategori.ana_kategori else "Tanımsız"
-                    if ana_kategori not in kategori_gelirler:
-                        kategori_gelirler[ana_kategori] = [0.0] * 12
-                    kategori_gelirler[ana_kategori][gelir.tarih.month - 1] += gelir.tutar
+            kategori_gelirler: dict = {}
+            kategori_giderler: dict = {}
             
-            # Gider kategorileri
-            for gider in giderler:
-                if gider.tarih and gider.tarih.year == yil and gider.kategori:
-                    ana_kategori = gider.kategori.ana_kategori.name if gider.kategori.ana_kategori else "Tanımsız"
-                    if ana_kategori not in kategori_giderler:
-                        kategori_giderler[ana_kategori] = [0.0] * 12
-                    kategori_giderler[ana_kategori][gider.tarih.month - 1] += gider.tutar
+            for satir in satirlar:
+                ay_index = satir["ay"] - 1
+                gelir_mi = satir["tur"] == "Gelir"
+                (aylik_gelirler if gelir_mi else aylik_giderler)[ay_index] += satir["toplam"]
+                
+                # Kategorisiz işlemler kategori karşılaştırmasına girmez
+                if satir["alt_kategori_id"] is None:
+                    continue
+                ana_kategori = satir["ana_kategori"] or "Tanımsız"
+                kategoriler = kategori_gelirler if gelir_mi else kategori_giderler
+                kategoriler.setdefault(ana_kategori, [0.0] * 12)[ay_index] += satir["toplam"]
             
             # Burada grafik çizim işlemleri yapılacak
             # Şimdilik placeholder olarak bırakıyoruz
@@ -2437,9 +2378,13 @@ class RaporlarPanel(BasePanel):
             else:
                 yil = int(self.trend_analizi_yil_combo.get())
             
-            # Tüm işlemleri al
-            gelirler = self.finans_controller.get_gelirler()
-            giderler = self.finans_controller.get_giderler()
+            # Yılın aylık toplamlarını aylık özet tablosundan al
+            satirlar = self.finans_ozet_controller.get_toplamlar(
+                group_by=["month", "tur", "alt_kategori", "ana_kategori"],
+                tur=["Gelir", "Gider"],
+                baslangic=(yil, 1),
+                bitis=(yil + 1, 1)
+            )
             
             # Aylık kümülatif verileri hazırla
             aylar = ["Ocak", "Şubat", "Mart", "Nisan", "Mayıs", "Haziran", 
@@ -2449,43 +2394,25 @@ class RaporlarPanel(BasePanel):
             kumulatif_gelirler = [0.0] * 12
             kumulatif_giderler = [0.0] * 12
             
-            # Gelirleri aylık olarak kümülatif grupla
-            for gelir in gelirler:
-                if gelir.tarih and gelir.tarih.year == yil:
-                    ay_index = gelir.tarih.month - 1
-                    for i in range(ay_index, 12):
-                        kumulatif_gelirler[i] += gelir.tutar
-            
-            # Giderleri aylık olarak kümülatif grupla
-            for gider in giderler:
-                if gider.tarih and gider.tarih.year == yil:
-                    ay_index = gider.tarih.month - 1
-                    for i in range(ay_index, 12):
-                        kumulatif_giderler[i] += gider.tutar
-            
             # Kategori bazlı kümülatif karşılaştırmalar için veri hazırla
-            kategori_kumulatif_gelirler = {}
-            kategori_kumulatif_giderler = {}
-            
-            # Gelir kategorileri
-            for gelir in gelirler:
-                if gelir.tarih and gelir.tarih.year == yil and gelir.kategori:
-                    ana_kategori = gelir.kategori.ana_kategori.name if gelir.kategori.ana_kategori else "Tanımsız"
-                    if ana_kategori not in kategori_kumulatif_gelirler:
-                        kategori_kumulatif_gelirler[ana_kategori] = [0.0] * 12
-                    ay_index = gelir.tarih.month - 1
-                    for i in range(ay_index, 12):
-                        kategori_kumulatif_gelirler[ana_kategori][i] += gelir.tutar
-            
-            # Gider kategorileri
-            for gider in giderler:
-                if gider.tarih and gider.tarih.year == yil and gider.kategori:
-                    ana_kategori = gider.kategori.ana_kategori.name if gider.kategori.ana_kategori else "Tanımsız"
-                    if ana_kategori not in kategori_kumulatif_giderler:
-                        kategori_kumulatif_giderler[ana_kategori] = [0.0] * 12
-                    ay_index = gider.tarih.month - 1
-                    for i in range(ay_index, 12):
-                        kategori_kumulatif_giderler[ana_kategori][i] += gider.tutar
+            kategori_kumulatif_gelirler: dict = {}
+            kategori_kumulatif_giderler: dict = {}
+            
+            for satir in satirlar:
+                ay_index = satir["ay"] - 1
+                gelir_mi = satir["tur"] == "Gelir"
+                kumulatif = kumulatif_gelirler if gelir_mi else kumulatif_giderler
+                for i in range(ay_index, 12):
+                    kumulatif[i] += satir["toplam"]
+                
+                # Kategorisiz işlemler kategori karşılaştırmasına girmez
+                if satir["alt_kategori_id"] is None:
+                    continue
+                ana_kategori = satir["ana_kategori"] or "Tanımsız"
+                kategoriler = kategori_kumulatif_gelirler if gelir_mi else kategori_kumulatif_giderler
+                kategori_kumulatif = kategoriler.setdefault(ana_kategori, [0.0] * 12)
+                for i in range(ay_index, 12):
+                    kategori_kumulatif[i] += satir["toplam"]
             
             # Burada grafik çizim işlemleri yapılacak
             # Şimdilik placeholder olarak bırakıyoruz
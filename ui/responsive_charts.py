@@ -3,14 +3,156 @@ Responsive Grafikler - Pencere boyutuna göre dinamik grafik ölçeklendirmesi
 
 Bu modül, matplotlib grafiklerinin pencere boyutuna göre dinamik olarak
 boyutlandırılmasını ve konumlandırılmasını sağlar.
+
+Görüntü hattı (``ResponsiveChartManager.show_chart``):
+    Figure'lar Tk'ye gömülü canlı canvas yerine Agg ile worker thread'de
+    PNG'ye çizilir (``ui.background_loader``). PNG'ler (grafik id, veri
+    özeti, boyut, dpi) anahtarıyla paylaşılan bir LRU cache'te tutulur;
+    Tk tarafı yalnızca hazır görüntüyü bir ``PhotoImage`` olarak etikete
+    koyar. Her grafiğin Figure'ı grafik başına bir kez oluşturulur, veri
+    değiştiğinde aynı eksenler güncellenip yeniden çizilir. Aynı veri ve
+    boyut tekrar istendiğinde hiçbir çizim yapılmaz.
 """
 
+import base64
+import hashlib
+import io
+import math
+import threading
+import tkinter as tk
+from collections import OrderedDict
 import customtkinter as ctk
+from matplotlib.axes import Axes
 from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from typing import Tuple, Optional, Any
+from matplotlib.patches import Wedge
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from typing import TYPE_CHECKING, Callable, Dict, Tuple, Optional, Any
 import logging
 
+from ui.background_loader import BackgroundLoader, LoadToken
+
+if TYPE_CHECKING:
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+# Pasta grafik ayarları (oluşturma ve yerinde güncelleme aynı değerleri kullanır)
+PIE_START_ANGLE = 90.0
+PIE_LABEL_DISTANCE = 1.1
+PIE_PCT_DISTANCE = 0.6
+
+# Paylaşılan PNG cache'inde tutulacak en fazla görüntü sayısı
+CHART_CACHE_MAX_ENTRIES = 64
+
+# (grafik id, veri özeti, genişlik inç, yükseklik inç, dpi)
+ChartKey = Tuple[str, str, float, float, int]
+
+
+def chart_data_hash(data: Any) -> str:
+    """
+    Grafik verisinin kısa özeti (cache anahtarı için).
+
+    Args:
+        data: Grafiğin çizildiği veri (liste/demet/sayı/metin)
+
+    Returns:
+        str: ``repr`` tabanlı SHA-1 özeti
+    """
+    return hashlib.sha1(repr(data).encode("utf-8")).hexdigest()
+
+
+def render_figure_png(figure: Figure) -> bytes:
+    """
+    Figure'ı Agg ile PNG'ye çiz (Tk gerektirmez, worker thread'de çalışabilir).
+
+    Args:
+        figure: Çizilecek Figure
+
+    Returns:
+        bytes: PNG verisi
+    """
+    canvas = figure.canvas if isinstance(figure.canvas, FigureCanvasAgg) else FigureCanvasAgg(figure)
+    buffer = io.BytesIO()
+    canvas.print_png(buffer)
+    return buffer.getvalue()
+
+
+class ChartImageCache:
+    """
+    Çizilmiş grafik PNG'leri için thread-safe LRU cache.
+
+    Attributes:
+        max_entries (int): En fazla görüntü sayısı
+        hits (int): Cache isabet sayısı
+        misses (int): Cache kaçırma sayısı
+    """
+
+    def __init__(self, max_entries: int = CHART_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._items: "OrderedDict[ChartKey, bytes]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: ChartKey) -> Optional[bytes]:
+        """Görüntüyü döndür ve en yeni olarak işaretle (yoksa None)"""
+        with self._lock:
+            png = self._items.get(key)
+            if png is None:
+                self.misses += 1
+                return None
+            self._items.move_to_end(key)
+            self.hits += 1
+            return png
+
+    def put(self, key: ChartKey, png: bytes) -> None:
+        """Görüntüyü ekle; sınır aşılırsa en eski görüntüyü at"""
+        with self._lock:
+            self._items[key] = png
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        """Tüm görüntüleri sil"""
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._items)
+
+
+_chart_cache = ChartImageCache()
+
+
+def get_chart_cache() -> ChartImageCache:
+    """
+    Paneller arasında paylaşılan grafik görüntü cache'ini döndür.
+
+    Returns:
+        ChartImageCache: Paylaşılan cache
+    """
+    return _chart_cache
+
+
+class _ChartSlot:
+    """``show_chart`` ile gösterilen tek bir grafiğin durumu"""
+
+    def __init__(self, chart_id: str, parent: Any, label: Any) -> None:
+        self.chart_id = chart_id
+        self.parent = parent
+        self.label = label
+        self.data: Any = None
+        self.build: Optional[Callable[[Any, Tuple[float, float], int], Figure]] = None
+        self.update: Optional[Callable[[Figure, Any], None]] = None
+        self.chart_type = "default"
+        self.colspan = 1
+        # Yalnızca worker thread'de, lock altında kullanılır
+        self.figure: Optional[Figure] = None
+        self.lock = threading.Lock()
+        # Ana thread: etikette gösterilen görüntünün anahtarı ve referansı
+        self.shown_key: Optional[ChartKey] = None
+        self.image: Any = None
+
 
 class ResponsiveChartManager:
     """
@@ -37,6 +179,11 @@ class ResponsiveChartManager:
         self.container = container
         self.logger = logging.getLogger(self.__class__.__name__)
         
+        # PNG görüntü hattı: grafik id -> durum
+        self.cache = get_chart_cache()
+        self.loader = BackgroundLoader(container, on_error=self._on_render_error, ad="chart")
+        self._charts: Dict[str, _ChartSlot] = {}
+        
         # Container'ın boyutunu al (sabit kalacak)
         self.container_width = container.winfo_width() or 800
         self.container_height = container.winfo_height() or 600
@@ -93,6 +240,10 @@ class ResponsiveChartManager:
         self.logger.debug(
             f"Container resized (stable): {self.container_width}x{self.container_height}"
         )
+        
+        # Görüntüleri yeni boyutta iste (daha önce görülen boyutlar cache'ten gelir)
+        for slot in list(self._charts.values()):
+            self._request(slot)
     
     def calculate_chart_figsize(
         self,
@@ -176,13 +327,124 @@ class ResponsiveChartManager:
         
         return dpi
     
+    def show_chart(
+        self,
+        parent: Any,
+        chart_id: str,
+        data: Any,
+        build: Callable[[Any, Tuple[float, float], int], Figure],
+        update: Optional[Callable[[Figure, Any], None]] = None,
+        chart_type: str = "default",
+        colspan: int = 1
+    ) -> Any:
+        """
+        Grafiği worker thread'de PNG'ye çizip etikette göster.
+        
+        İlk çağrıda ``parent`` içine bir görüntü etiketi eklenir; sonraki
+        çağrılarda aynı etiket kullanılır. Veri ve boyut değişmediyse hiçbir
+        iş yapılmaz; görüntü cache'teyse worker'a gidilmeden gösterilir.
+        
+        Args:
+            parent: Grafiği içerecek frame
+            chart_id: Grafiğin kalıcı kimliği (ör. "dashboard.trend")
+            data: Çizilecek veri (özeti cache anahtarına girer)
+            build: ``(data, figsize, dpi) -> Figure``; Tk'ye dokunmamalıdır
+            update: ``(figure, data)``; verilirse sonraki çizimlerde mevcut
+                Figure güncellenir, yoksa her seferinde ``build`` çağrılır
+            chart_type: Boyut hesabı için grafik türü
+            colspan: Sütun genişliği
+        
+        Returns:
+            Görüntü etiketi
+        """
+        slot = self._charts.get(chart_id)
+        if slot is None or slot.parent is not parent:
+            label = tk.Label(parent, bd=0, highlightthickness=0, bg=self._background_of(parent))
+            label.pack(fill="both", expand=True, padx=3, pady=3)
+            slot = _ChartSlot(chart_id, parent, label)
+            self._charts[chart_id] = slot
+        
+        slot.data = data
+        slot.build = build
+        slot.update = update
+        slot.chart_type = chart_type
+        slot.colspan = colspan
+        self._request(slot)
+        return slot.label
+    
+    def _request(self, slot: _ChartSlot) -> None:
+        """Grafiğin güncel veri ve boyuttaki görüntüsünü iste (ana thread)"""
+        figsize = self.calculate_chart_figsize(slot.chart_type, slot.colspan)
+        dpi = self.get_responsive_dpi()
+        key: ChartKey = (
+            slot.chart_id, chart_data_hash(slot.data), round(figsize[0], 3), round(figsize[1], 3), dpi
+        )
+        if key == slot.shown_key:
+            return
+        
+        png = self.cache.get(key)
+        if png is not None:
+            self._blit(slot, key, png)
+            return
+        
+        data = slot.data
+        self.loader.submit(
+            f"chart:{slot.chart_id}",
+            fetch=lambda token: self._render(slot, key, data, figsize, dpi, token),
+            render=lambda png: self._blit(slot, key, png),
+        )
+    
+    def _render(self, slot: _ChartSlot, key: ChartKey, data: Any,
+                figsize: Tuple[float, float], dpi: int, token: LoadToken) -> bytes:
+        """Worker thread: Figure'ı oluştur/güncelle ve PNG'ye çiz"""
+        with slot.lock:
+            png = self.cache.get(key)
+            if png is not None:
+                return png
+            token.raise_if_cancelled()
+            
+            if slot.figure is None or slot.update is None:
+                slot.figure = slot.build(data, figsize, dpi)
+            else:
+                slot.update(slot.figure, data)
+                slot.figure.set_size_inches(*figsize)
+                slot.figure.set_dpi(dpi)
+            
+            png = render_figure_png(slot.figure)
+            self.cache.put(key, png)
+            self.logger.debug(f"Chart rendered off main thread: {slot.chart_id} ({len(png)} bytes)")
+            return png
+    
+    def _blit(self, slot: _ChartSlot, key: ChartKey, png: bytes) -> None:
+        """Ana thread: PNG'yi etikete koy"""
+        image = tk.PhotoImage(master=slot.label, data=base64.b64encode(png))
+        slot.label.configure(image=image)
+        # PhotoImage referansı tutulmazsa Tk görüntüyü siler
+        slot.image = image
+        slot.shown_key = key
+    
+    def _on_render_error(self, error: Exception) -> None:
+        """Worker'da çizim hatası (ana thread)"""
+        self.logger.error(f"Chart render error: {str(error)}")
+    
+    @staticmethod
+    def _background_of(parent: Any) -> str:
+        """Etiket arka planı için parent'ın rengi (CTk/Tk)"""
+        try:
+            color = parent.cget("fg_color")
+            if isinstance(color, (list, tuple)):
+                color = color[0] if ctk.get_appearance_mode() == "Light" else color[1]
+            return color if isinstance(color, str) and color != "transparent" else "white"
+        except Exception:
+            return "white"
+    
     def embed_chart(
         self,
         parent: ctk.CTkFrame,
         figure: Figure,
         chart_type: str = "default",
         colspan: int = 1
-    ) -> FigureCanvasTkAgg:
+    ) -> "FigureCanvasTkAgg":
         """
         Matplotlib figürünü responsive olarak embed et.
         
@@ -197,6 +459,8 @@ class ResponsiveChartManager:
         """
         try:
             # Canvas oluştur
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
             canvas = FigureCanvasTkAgg(figure, master=parent)
             canvas.draw()
             
@@ -237,7 +501,9 @@ class ResponsiveChartBuilder:
         xlabel: str = "",
         ylabel: str = "",
         colors: Optional[dict] = None,
-        colspan: int = 1
+        colspan: int = 1,
+        figsize: Optional[Tuple[float, float]] = None,
+        dpi: Optional[int] = None
     ) -> Figure:
         """
         Responsive çizgi grafik oluştur.
@@ -250,14 +516,17 @@ class ResponsiveChartBuilder:
             ylabel: Y ekseni etiketi
             colors: Renk dictionary'si (label: color)
             colspan: Sütun genişliği
+            figsize: Boyut (inç); verilirse container'dan hesaplanmaz
+            dpi: Çözünürlük; verilirse ekrandan okunmaz (worker thread'de
+                çizimde ikisi de verilmelidir)
         
         Returns:
             Figure: Matplotlib Figure nesnesi
         """
         try:
             # Responsive boyut
-            figsize = self.manager.calculate_chart_figsize("trend", colspan)
-            dpi = self.manager.get_responsive_dpi()
+            figsize = figsize or self.manager.calculate_chart_figsize("trend", colspan)
+            dpi = dpi or self.manager.get_responsive_dpi()
             
             # Figure oluştur
             fig = Figure(figsize=figsize, dpi=dpi)
@@ -294,7 +563,9 @@ class ResponsiveChartBuilder:
         sizes: list,
         labels: list,
         colors: Optional[list] = None,
-        title: str = ""
+        title: str = "",
+        figsize: Optional[Tuple[float, float]] = None,
+        dpi: Optional[int] = None
     ) -> Figure:
         """
         Responsive pasta grafik oluştur.
@@ -304,31 +575,23 @@ class ResponsiveChartBuilder:
             labels: Etiketler
             colors: Renkler (liste)
             title: Grafik başlığı
+            figsize: Boyut (inç); verilirse container'dan hesaplanmaz
+            dpi: Çözünürlük; verilirse ekrandan okunmaz
         
         Returns:
             Figure: Matplotlib Figure nesnesi
         """
         try:
             # Responsive boyut
-            figsize = self.manager.calculate_chart_figsize("pie")
-            dpi = self.manager.get_responsive_dpi()
+            figsize = figsize or self.manager.calculate_chart_figsize("pie")
+            dpi = dpi or self.manager.get_responsive_dpi()
             
             # Figure oluştur
             fig = Figure(figsize=figsize, dpi=dpi)
             ax = fig.add_subplot(111)
             
             # Pasta grafik çiz
-            default_colors = ['#28A745', '#0055A4', '#FFC107', '#DC3545', '#17A2B8']
-            pie_colors = colors or default_colors[:len(sizes)]
-            
-            ax.pie(
-                sizes,
-                labels=labels,
-                autopct='%1.0f%%',
-                colors=pie_colors,
-                startangle=90,
-                textprops={'fontsize': 6}
-            )
+            self._draw_pie(ax, sizes, labels, colors)
             
             if title:
                 ax.set_title(title, fontsize=8, weight='bold')
@@ -342,6 +605,101 @@ class ResponsiveChartBuilder:
             self.logger.error(f"Pie chart creation error: {str(e)}")
             raise
     
+    @staticmethod
+    def _draw_pie(ax: Axes, sizes: list, labels: list, colors: Optional[list] = None) -> None:
+        """Pasta dilimlerini verilen eksene çiz"""
+        default_colors = ['#28A745', '#0055A4', '#FFC107', '#DC3545', '#17A2B8']
+        pie_colors = colors or default_colors[:len(sizes)]
+        
+        ax.pie(
+            sizes,
+            labels=labels,
+            autopct='%1.0f%%',
+            colors=pie_colors,
+            startangle=PIE_START_ANGLE,
+            labeldistance=PIE_LABEL_DISTANCE,
+            pctdistance=PIE_PCT_DISTANCE,
+            textprops={'fontsize': 6}
+        )
+    
+    def update_line_chart(self, figure: Figure, x_data: list, y_data_dict: dict) -> None:
+        """
+        ``create_responsive_line_chart`` ile oluşturulan grafiğin verisini yerinde güncelle.
+        
+        Figure ve çizgiler korunur; yalnızca çizgi verisi, x etiketleri ve
+        eksen sınırları değişir. Çizim için canvas'ın ``draw_idle`` metodu
+        çağrılmalıdır.
+        
+        Args:
+            figure: Güncellenecek Figure
+            x_data: X ekseni verileri (liste)
+            y_data_dict: Y ekseni verileri ({label: [values]}, oluşturma sırasıyla)
+        """
+        ax = figure.axes[0]
+        x_range = range(len(x_data))
+        for line, y_values in zip(ax.get_lines(), y_data_dict.values()):
+            line.set_data(x_range, y_values)
+        
+        ax.set_xticks(x_range)
+        ax.set_xticklabels(x_data, rotation=45, ha='right', fontsize=8)
+        ax.relim()
+        ax.autoscale_view()
+        
+        self.logger.debug(f"Line chart updated: {len(x_data)} points")
+    
+    def update_pie_chart(
+        self,
+        figure: Figure,
+        sizes: list,
+        labels: list,
+        colors: Optional[list] = None
+    ) -> None:
+        """
+        ``create_responsive_pie_chart`` ile oluşturulan grafiğin dilimlerini güncelle.
+        
+        Etiketler aynıysa mevcut dilimlerin açıları ve yazı konumları
+        değiştirilir; etiketler değiştiyse yalnızca eksen yeniden çizilir
+        (Figure korunur). Çizim için canvas'ın ``draw_idle`` metodu
+        çağrılmalıdır.
+        
+        Args:
+            figure: Güncellenecek Figure
+            sizes: Pasta dilimlerinin boyutları
+            labels: Etiketler
+            colors: Renkler (etiketler değiştiğinde kullanılır)
+        """
+        ax = figure.axes[0]
+        wedges = [p for p in ax.patches if isinstance(p, Wedge)]
+        n = len(wedges)
+        # ax.pie önce etiketleri, sonra yüzde yazılarını ekler
+        label_texts, pct_texts = ax.texts[:n], ax.texts[n:2 * n]
+        
+        if n != len(sizes) or [t.get_text() for t in label_texts] != list(labels) or len(pct_texts) != n:
+            facecolor = ax.get_facecolor()
+            ax.clear()
+            ax.set_facecolor(facecolor)
+            self._draw_pie(ax, sizes, labels, colors)
+            self.logger.debug(f"Pie chart redrawn: {len(sizes)} wedges")
+            return
+        
+        total = float(sum(sizes))
+        theta = PIE_START_ANGLE
+        for wedge, label_text, pct_text, size in zip(wedges, label_texts, pct_texts, sizes):
+            frac = size / total if total else 0.0
+            theta2 = theta + 360.0 * frac
+            wedge.set_theta1(theta)
+            wedge.set_theta2(theta2)
+            
+            mid = math.radians((theta + theta2) / 2)
+            x, y = math.cos(mid), math.sin(mid)
+            label_text.set_position((PIE_LABEL_DISTANCE * x, PIE_LABEL_DISTANCE * y))
+            label_text.set_horizontalalignment('left' if x > 0 else 'right')
+            pct_text.set_position((PIE_PCT_DISTANCE * x, PIE_PCT_DISTANCE * y))
+            pct_text.set_text(f"{frac * 100:.0f}%")
+            theta = theta2
+        
+        self.logger.debug(f"Pie chart updated in place: {n} wedges")
+    
     def create_responsive_bar_chart(
         self,
         x_data: list,
@@ -349,7 +707,9 @@ class ResponsiveChartBuilder:
         colors: Optional[list] = None,
         title: str = "",
         xlabel: str = "",
-        ylabel: str = ""
+        ylabel: str = "",
+        figsize: Optional[Tuple[float, float]] = None,
+        dpi: Optional[int] = None
     ) -> Figure:
         """
         Responsive bar grafik oluştur.
@@ -361,14 +721,16 @@ class ResponsiveChartBuilder:
             title: Grafik başlığı
             xlabel: X ekseni etiketi
             ylabel: Y ekseni etiketi
+            figsize: Boyut (inç); verilirse container'dan hesaplanmaz
+            dpi: Çözünürlük; verilirse ekrandan okunmaz
         
         Returns:
             Figure: Matplotlib Figure nesnesi
         """
         try:
             # Responsive boyut
-            figsize = self.manager.calculate_chart_figsize("bar")
-            dpi = self.manager.get_responsive_dpi()
+            figsize = figsize or self.manager.calculate_chart_figsize("bar")
+            dpi = dpi or self.manager.get_responsive_dpi()
             
             # Figure oluştur
             fig = Figure(figsize=figsize, dpi=dpi)
@@ -5,7 +5,7 @@ Sakin paneli
 import customtkinter as ctk
 from tkinter import ttk, Menu, Toplevel
 import tkinter as tk
-from typing import List, Optional, Any
+from typing import List, Optional, Any, Tuple
 from datetime import datetime
 from ui.base_panel import BasePanel
 from ui.error_handler import (
@@ -14,6 +14,7 @@ from ui.error_handler import (
 )
 from controllers.sakin_controller import SakinController
 from controllers.daire_controller import DaireController
+from database.fts import turkce_katla
 from models.base import Sakin, Daire
 from models.exceptions import (
     ValidationError, DatabaseError, NotFoundError, DuplicateError
@@ -153,9 +154,9 @@ class SakinPanel(BasePanel):
         self.aktif_sakin_tree.column("giris_tarihi", width=30, anchor="center")
         self.aktif_sakin_tree.column("notlar", width=150, anchor="center")
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.aktif_sakin_tree.yview)
-        self.aktif_sakin_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar - sanal kaydırma, yalnızca görünür satırlar çizilir
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.virtual_tree(self.aktif_sakin_tree, scrollbar=scrollbar)
 
         self.aktif_sakin_tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -223,9 +224,9 @@ class SakinPanel(BasePanel):
         self.pasif_sakin_tree.column("giris_tarihi", width=30, anchor="center")
         self.pasif_sakin_tree.column("cikis_tarihi", width=30, anchor="center")
 
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.pasif_sakin_tree.yview)
-        self.pasif_sakin_tree.configure(yscrollcommand=scrollbar.set)
+        # Scrollbar - sanal kaydırma, yalnızca görünür satırlar çizilir
+        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical")
+        self.virtual_tree(self.pasif_sakin_tree, scrollbar=scrollbar)
 
         self.pasif_sakin_tree.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -248,93 +249,132 @@ class SakinPanel(BasePanel):
         self.load_daireler()
 
     def load_aktif_sakinler(self) -> None:
-        """Aktif sakinleri yükle"""
-        try:
-            # Treeview'i temizle
-            for item in self.aktif_sakin_tree.get_children():
-                self.aktif_sakin_tree.delete(item)
-
-            self.aktif_sakinler = self.sakin_controller.get_aktif_sakinler()
-
-            # Daire listesini güncelle
-            if hasattr(self, 'filter_aktif_daire_combo'):
-                daire_listesi = set()
-                for sakin in self.aktif_sakinler:
-                    if sakin.daire:
-                        daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
-                        daire_listesi.add(daire_info)
-                daire_options = ["Tümü"] + sorted(list(daire_listesi))
-                self.filter_aktif_daire_combo.configure(values=daire_options)
-
-            # Tüm verileri yükle
-            for sakin in self.aktif_sakinler:
-                daire_info = ""
-                if sakin.daire:
-                    daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
-
-                self.aktif_sakin_tree.insert("", "end", values=(
-                    sakin.id,
-                    sakin.ad_soyad,
-                    sakin.rutbe_unvan or "",
-                    daire_info,
-                    sakin.telefon or "",
-                    sakin.email or "",
-                    sakin.aile_birey_sayisi,
-                    sakin.tahsis_tarihi.strftime("%d.%m.%Y") if sakin.tahsis_tarihi else "",
-                    sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
-                    sakin.notlar or ""
-                ))
-        except DatabaseError as e:
-            show_error(parent=self.frame, title="Veritabanı Hatası", message=str(e.message))
-        except Exception as e:
-            show_error(parent=self.frame, title="Hata", message=f"Aktif sakinler yüklenirken hata oluştu: {str(e)}")
+        """Aktif sakinleri yükle (veri worker thread'de çekilir, tablo ana thread'de çizilir)"""
+        self.run_in_background(
+            "aktif_sakinler",
+            lambda token: self._fetch_sakinler(self.sakin_controller.get_aktif_sakinler, False),
+            self._render_aktif_sakinler,
+            on_error=lambda e: self._sakin_yukleme_hatasi(e, "Aktif")
+        )
 
     def load_pasif_sakinler(self) -> None:
-        """Pasif sakinleri yükle"""
-        try:
-            # Treeview'i temizle
-            for item in self.pasif_sakin_tree.get_children():
-                self.pasif_sakin_tree.delete(item)
-
-            self.pasif_sakinler = self.sakin_controller.get_pasif_sakinler()
-
-            # Daire listesini güncelle
-            if hasattr(self, 'filter_pasif_daire_combo'):
-                daire_listesi = set()
-                for sakin in self.pasif_sakinler:
-                    if sakin.daire:
-                        daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
-                        daire_listesi.add(daire_info)
-                    elif sakin.eski_daire:
-                        daire_info = f"{sakin.eski_daire.blok.lojman.ad} {sakin.eski_daire.blok.ad}-{sakin.eski_daire.daire_no}"
-                        daire_listesi.add(daire_info)
-                daire_options = ["Tümü"] + sorted(list(daire_listesi))
-                self.filter_pasif_daire_combo.configure(values=daire_options)
-
-            # Tüm verileri yükle
-            for sakin in self.pasif_sakinler:
-                daire_info = ""
-                if sakin.daire:
-                    daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
-                elif sakin.eski_daire:
-                    daire_info = f"{sakin.eski_daire.blok.lojman.ad} {sakin.eski_daire.blok.ad}-{sakin.eski_daire.daire_no}"
-
-                self.pasif_sakin_tree.insert("", "end", values=(
-                    sakin.id,
-                    sakin.ad_soyad,
-                    sakin.rutbe_unvan or "",
-                    daire_info,
-                    sakin.telefon or "",
-                    sakin.email or "",
-                    sakin.aile_birey_sayisi,
-                    sakin.tahsis_tarihi.strftime("%d.%m.%Y") if sakin.tahsis_tarihi else "",
-                    sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
-                    sakin.cikis_tarihi.strftime("%d.%m.%Y") if sakin.cikis_tarihi else ""
-                ))
-        except DatabaseError as e:
-            show_error(parent=self.frame, title="Veritabanı Hatası", message=str(e.message))
-        except Exception as e:
-            show_error(parent=self.frame, title="Hata", message=f"Pasif sakinler yüklenirken hata oluştu: {str(e)}")
+        """Pasif sakinleri yükle (veri worker thread'de çekilir, tablo ana thread'de çizilir)"""
+        self.run_in_background(
+            "pasif_sakinler",
+            lambda token: self._fetch_sakinler(self.sakin_controller.get_pasif_sakinler, True),
+            self._render_pasif_sakinler,
+            on_error=lambda e: self._sakin_yukleme_hatasi(e, "Pasif")
+        )
+
+    def _fetch_sakinler(self, getir: Any, eski_daire_dahil: bool) -> Tuple[List[Sakin], List[str]]:
+        """
+        Sakinleri ve daire filtre seçeneklerini hazırla (worker thread).
+
+        Args:
+            getir: Sakin listesini döndüren controller metodu
+            eski_daire_dahil (bool): Dairesi olmayanlar için eski daireyi kullan (arşiv)
+
+        Returns:
+            Tuple[List[Sakin], List[str]]: (sakinler, daire filtre seçenekleri)
+        """
+        sakinler = getir()
+        daire_listesi = set()
+        for sakin in sakinler:
+            daire = sakin.daire or (sakin.eski_daire if eski_daire_dahil else None)
+            if daire:
+                daire_listesi.add(self._daire_bilgisi(daire))
+        return sakinler, ["Tümü"] + sorted(daire_listesi)
+
+    def _render_aktif_sakinler(self, sonuc: Tuple[List[Sakin], List[str]]) -> None:
+        """Aktif sakinler tablosunu ve daire filtresini çiz (ana thread)"""
+        self.aktif_sakinler, daire_options = sonuc
+
+        # Daire listesini güncelle
+        if hasattr(self, 'filter_aktif_daire_combo'):
+            self.filter_aktif_daire_combo.configure(values=daire_options)
+
+        # Tüm verileri tabloya ver - yalnızca görünür pencere çizilir
+        self.virtual_tree(self.aktif_sakin_tree).set_rows(
+            self.aktif_sakinler, self._aktif_sakin_satiri, key=self._sakin_iid
+        )
+
+    def _render_pasif_sakinler(self, sonuc: Tuple[List[Sakin], List[str]]) -> None:
+        """Pasif sakinler tablosunu ve daire filtresini çiz (ana thread)"""
+        self.pasif_sakinler, daire_options = sonuc
+
+        # Daire listesini güncelle
+        if hasattr(self, 'filter_pasif_daire_combo'):
+            self.filter_pasif_daire_combo.configure(values=daire_options)
+
+        # Tüm verileri tabloya ver - yalnızca görünür pencere çizilir
+        self.virtual_tree(self.pasif_sakin_tree).set_rows(
+            self.pasif_sakinler, self._pasif_sakin_satiri, key=self._sakin_iid
+        )
+
+    def _sakin_yukleme_hatasi(self, hata: Exception, grup: str) -> None:
+        """Sakin yükleme hatasını kullanıcıya göster"""
+        if isinstance(hata, DatabaseError):
+            show_error(parent=self.frame, title="Veritabanı Hatası", message=str(hata.message))
+        else:
+            show_error(parent=self.frame, title="Hata", message=f"{grup} sakinler yüklenirken hata oluştu: {str(hata)}")
+
+    @staticmethod
+    def _sakin_iid(sakin: Sakin) -> str:
+        """Sakin satırı için kalıcı Treeview item ID'si"""
+        return f"sakin_{sakin.id}"
+
+    @staticmethod
+    def _daire_bilgisi(daire: Optional[Daire]) -> str:
+        """Daireyi 'Lojman Blok-No' biçiminde göster"""
+        if not daire:
+            return ""
+        return f"{daire.blok.lojman.ad} {daire.blok.ad}-{daire.daire_no}"
+
+    def _aktif_sakin_satiri(self, sakin: Sakin) -> Tuple[tuple, tuple]:
+        """
+        Aktif sakini Treeview satır değerlerine çevir.
+
+        Args:
+            sakin (Sakin): Aktif sakin
+
+        Returns:
+            Tuple[tuple, tuple]: (values, tags)
+        """
+        return (
+            sakin.id,
+            sakin.ad_soyad,
+            sakin.rutbe_unvan or "",
+            self._daire_bilgisi(sakin.daire),
+            sakin.telefon or "",
+            sakin.email or "",
+            sakin.aile_birey_sayisi,
+            sakin.tahsis_tarihi.strftime("%d.%m.%Y") if sakin.tahsis_tarihi else "",
+            sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
+            sakin.notlar or ""
+        ), ()
+
+    def _pasif_sakin_satiri(self, sakin: Sakin) -> Tuple[tuple, tuple]:
+        """
+        Pasif sakini Treeview satır değerlerine çevir (daire yoksa eski daire gösterilir).
+
+        Args:
+            sakin (Sakin): Pasif sakin
+
+        Returns:
+            Tuple[tuple, tuple]: (values, tags)
+        """
+        return (
+            sakin.id,
+            sakin.ad_soyad,
+            sakin.rutbe_unvan or "",
+            self._daire_bilgisi(sakin.daire or sakin.eski_daire),
+            sakin.telefon or "",
+            sakin.email or "",
+            sakin.aile_birey_sayisi,
+            sakin.tahsis_tarihi.strftime("%d.%m.%Y") if sakin.tahsis_tarihi else "",
+            sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
+            sakin.cikis_tarihi.strftime("%d.%m.%Y") if sakin.cikis_tarihi else ""
+        ), ()
 
     def load_daireler(self) -> None:
         """Daireleri yükle"""
@@ -1369,76 +1409,51 @@ class SakinPanel(BasePanel):
 
     def uygula_aktif_filtreler(self, event: Optional[Any] = None) -> None:
         """Aktif sakinler için filtreleri uygula"""
-        ad_soyad = self.filter_aktif_ad_entry.get().strip().lower()
+        ad_soyad = turkce_katla(self.filter_aktif_ad_entry.get().strip())
         daire = self.filter_aktif_daire_combo.get().strip()
         
-        # Treeview'i temizle
-        for item in self.aktif_sakin_tree.get_children():
-            self.aktif_sakin_tree.delete(item)
-        
         # Filtre uygula
+        filtrelenmis = []
         for sakin in self.aktif_sakinler:
             # Ad soyad filtresi
-            if ad_soyad and ad_soyad not in sakin.ad_soyad.lower():
+            if ad_soyad and ad_soyad not in turkce_katla(sakin.ad_soyad):
                 continue
                 
             # Daire filtresi
-            daire_info = ""
-            if sakin.daire:
-                daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
+            daire_info = self._daire_bilgisi(sakin.daire)
             if daire != "Tümü" and daire != daire_info:
                 continue
             
-            # Filtreden geçen kayıtları ekle
-            self.aktif_sakin_tree.insert("", "end", values=(
-                sakin.id,
-                sakin.ad_soyad,
-                sakin.rutbe_unvan or "",
-                daire_info,
-                sakin.telefon or "",
-                sakin.email or "",
-                sakin.aile_birey_sayisi,
-                sakin.tahsis_tarihi.strftime("%d.%m.%Y") if sakin.tahsis_tarihi else "",
-                sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
-                sakin.notlar or ""
-            ))
+            filtrelenmis.append(sakin)
+
+        # Filtreden geçen kayıtları tabloya ver - yalnızca görünür pencere çizilir
+        self.virtual_tree(self.aktif_sakin_tree).set_rows(
+            filtrelenmis, self._aktif_sakin_satiri, key=self._sakin_iid
+        )
 
     def uygula_pasif_filtreler(self, event: Optional[Any] = None) -> None:
         """Pasif sakinler için filtreleri uygula"""
-        ad_soyad = self.filter_pasif_ad_entry.get().strip().lower()
+        ad_soyad = turkce_katla(self.filter_pasif_ad_entry.get().strip())
         daire = self.filter_pasif_daire_combo.get().strip()
         
-        # Treeview'i temizle
-        for item in self.pasif_sakin_tree.get_children():
-            self.pasif_sakin_tree.delete(item)
-        
         # Filtre uygula
+        filtrelenmis = []
         for sakin in self.pasif_sakinler:
             # Ad soyad filtresi
-            if ad_soyad and ad_soyad not in sakin.ad_soyad.lower():
+            if ad_soyad and ad_soyad not in turkce_katla(sakin.ad_soyad):
                 continue
                 
             # Daire filtresi
-            daire_info = ""
-            if sakin.daire:
-                daire_info = f"{sakin.daire.blok.lojman.ad} {sakin.daire.blok.ad}-{sakin.daire.daire_no}"
-            elif sakin.eski_daire:
-                daire_info = f"{sakin.eski_daire.blok.lojman.ad} {sakin.eski_daire.blok.ad}-{sakin.eski_daire.daire_no}"
+            daire_info = self._daire_bilgisi(sakin.daire or sakin.eski_daire)
             if daire != "Tümü" and daire != daire_info:
                 continue
             
-            # Filtreden geçen kayıtları ekle
-            self.pasif_sakin_tree.insert("", "end", values=(
-                sakin.id,
-                sakin.ad_soyad,
-                sakin.rutbe_unvan or "",
-                daire_info,
-                sakin.telefon or "",
-                sakin.email or "",
-                sakin.aile_birey_sayisi,
-                sakin.giris_tarihi.strftime("%d.%m.%Y") if sakin.giris_tarihi else "",
-                sakin.cikis_tarihi.strftime("%d.%m.%Y") if sakin.cikis_tarihi else ""
-            ))
+            filtrelenmis.append(sakin)
+
+        # Filtreden geçen kayıtları tabloya ver - yalnızca görünür pencere çizilir
+        self.virtual_tree(self.pasif_sakin_tree).set_rows(
+            filtrelenmis, self._pasif_sakin_satiri, key=self._sakin_iid
+        )
 
     def temizle_aktif_filtreler(self) -> None:
         """Aktif sakinler için filtreleri temizle"""
@@ -0,0 +1,581 @@
+"""
+Sanal (virtualized) Treeview - büyük tablolar için pencereli çizim
+
+``ttk.Treeview`` binlerce satırı tek tek ``insert`` ile çizdiğinde Tk ana
+thread'i saniyelerce kilitlenir. ``VirtualTreeview`` mevcut bir Treeview'i
+sarmalar ve yalnızca görünür satırları + üst/alt tampon satırlarını
+oluşturur. Kullanıcı kaydırdıkça pencere kayar ve satırlar satır
+kaynağından (liste veya SQL sorgusu) sayfa sayfa okunur.
+
+Bir ``BackgroundLoader`` verilirse önbellekte olmayan sayfalar worker
+thread'de okunur ve pencere render geri çağrısında değiştirilir; Tk thread'i
+kaydırma sırasında veritabanını beklemez. Okuma sürerken eski pencere
+ekranda kalır.
+
+Sıralama ve filtreleme durumu widget'ın dışında tutulur: panel filtrelenmiş /
+sıralanmış satır kaynağını ``set_rows`` ile verir, widget yalnızca çizer.
+"""
+
+import threading
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+import database.config as db_config
+from utils.logger import get_logger
+
+# Görünür alanın üstünde ve altında hazır tutulan satır sayısı
+VARSAYILAN_TAMPON = 40
+
+# Yükseklik ölçülemediğinde kullanılan görünür satır sayısı
+VARSAYILAN_GORUNUR_SATIR = 20
+
+# Tema satır yüksekliği bildirmezse kullanılan piksel değeri
+VARSAYILAN_SATIR_YUKSEKLIGI = 20
+
+# formatter(satır) -> (values, tags)
+SatirFormatter = Callable[[Any], Tuple[Sequence[Any], Sequence[str]]]
+
+
+def _sayfalar_hazir(sayfalar: Dict[int, Any], sayfa_boyutu: int, offset: int, limit: int) -> bool:
+    """``[offset, offset + limit)`` aralığının tüm sayfaları önbellekte mi?"""
+    if limit <= 0:
+        return True
+    ilk = offset // sayfa_boyutu
+    son = (offset + limit - 1) // sayfa_boyutu
+    return all(numara in sayfalar for numara in range(ilk, son + 1))
+
+
+class ListRowSource:
+    """
+    Bellekteki listeden okuyan satır kaynağı.
+
+    Example:
+        >>> kaynak = ListRowSource(islemler)
+        >>> len(kaynak)
+        50000
+        >>> kaynak.fetch(100, 60)  # 100-159 arası satırlar
+    """
+
+    def __init__(self, rows: Sequence[Any]) -> None:
+        self.rows = rows
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def fetch(self, offset: int, limit: int) -> List[Any]:
+        """
+        Satır aralığını döndür.
+
+        Args:
+            offset (int): Başlangıç indeksi
+            limit (int): En fazla satır sayısı
+
+        Returns:
+            List[Any]: Satırlar
+        """
+        return list(self.rows[offset:offset + limit])
+
+
+class QueryRowSource:
+    """
+    SQLAlchemy sorgusundan sayfa sayfa okuyan satır kaynağı.
+
+    Her sayfa için kısa ömürlü bir session açılır; okunan sayfalar sınırlı
+    bir LRU önbellekte tutulur. Sorgu deterministik bir ``order_by``
+    içermelidir. Session kapandıktan sonra lazy ilişkiler yüklenemeyeceği
+    için sorgu kolon demetleri veya eager-load edilmiş nesneler döndürmelidir.
+
+    Example:
+        >>> kaynak = QueryRowSource(
+        ...     lambda s: s.query(FinansIslem.id, FinansIslem.tarih, FinansIslem.tutar)
+        ...                .order_by(FinansIslem.id.desc()),
+        ...     page_size=200
+        ... )
+        >>> view.set_rows(kaynak, formatter)
+    """
+
+    def __init__(self, query_factory: Callable[[Any], Any], page_size: int = 200,
+                 max_pages: int = 20) -> None:
+        """
+        Args:
+            query_factory: Session alıp sorgu döndüren fonksiyon
+            page_size (int): Bir sayfadaki satır sayısı
+            max_pages (int): Önbellekte tutulacak en fazla sayfa
+        """
+        self.query_factory = query_factory
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._count: Optional[int] = None
+        self._pages: "OrderedDict[int, List[Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        if self._count is None:
+            session = db_config.get_db()
+            try:
+                self._count = self.query_factory(session).order_by(None).count()
+            finally:
+                session.close()
+        return self._count
+
+    def _page(self, numara: int) -> List[Any]:
+        """Sayfayı önbellekten veya veritabanından getir"""
+        with self._lock:
+            if numara in self._pages:
+                self._pages.move_to_end(numara)
+                return self._pages[numara]
+
+            session = db_config.get_db()
+            try:
+                satirlar = self.query_factory(session).offset(
+                    numara * self.page_size
+                ).limit(self.page_size).all()
+            finally:
+                session.close()
+
+            self._pages[numara] = satirlar
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            return satirlar
+
+    def fetch(self, offset: int, limit: int) -> List[Any]:
+        """
+        Satır aralığını gerekli sayfaları okuyarak döndür.
+
+        Args:
+            offset (int): Başlangıç indeksi
+            limit (int): En fazla satır sayısı
+
+        Returns:
+            List[Any]: Satırlar
+        """
+        if limit <= 0:
+            return []
+        ilk = offset // self.page_size
+        son = (offset + limit - 1) // self.page_size
+        satirlar: List[Any] = []
+        for numara in range(ilk, son + 1):
+            satirlar.extend(self._page(numara))
+        bas = offset - ilk * self.page_size
+        return satirlar[bas:bas + limit]
+
+    def hazir_mi(self, offset: int, limit: int) -> bool:
+        """
+        Aralık veritabanına gitmeden okunabilir mi?
+
+        Args:
+            offset (int): Başlangıç indeksi
+            limit (int): En fazla satır sayısı
+
+        Returns:
+            bool: Sayı ve aralığın tüm sayfaları önbellekteyse True
+        """
+        return self._count is not None and _sayfalar_hazir(self._pages, self.page_size, offset, limit)
+
+    def invalidate(self) -> None:
+        """Sayı ve sayfa önbelleğini temizle"""
+        with self._lock:
+            self._count = None
+            self._pages.clear()
+
+
+class KeysetRowSource:
+    """
+    Keyset pagination yapan bir arama fonksiyonundan sayfa sayfa okuyan kaynak.
+
+    ``page_fetcher(after, offset, limit)`` bir ``KeysetPage`` döndürmelidir
+    (ör. ``FinansIslemController.search``). Sıralı kaydırmada her sayfa bir
+    önceki sayfanın imlecinden okunur; imleci bilinmeyen uzak atlamalarda
+    (scrollbar sürükleme) ``offset`` kullanılır. Bellekte yalnızca sınırlı
+    sayıda sayfa ve sayfa başlangıç imleçleri tutulur.
+
+    Example:
+        >>> kaynak = KeysetRowSource(
+        ...     lambda after, offset, limit: controller.search(filtreler, limit=limit,
+        ...                                                    offset=offset, after=after),
+        ...     lambda: controller.count(filtreler)
+        ... )
+        >>> view.set_rows(kaynak, formatter)
+    """
+
+    def __init__(self, page_fetcher: Callable[[Optional[Tuple[Any, ...]], int, int], Any],
+                 counter: Callable[[], int], page_size: int = 200, max_pages: int = 20) -> None:
+        """
+        Args:
+            page_fetcher: (after, offset, limit) alıp ``KeysetPage`` döndüren fonksiyon
+            counter: Toplam satır sayısını döndüren fonksiyon
+            page_size (int): Bir sayfadaki satır sayısı
+            max_pages (int): Önbellekte tutulacak en fazla sayfa
+        """
+        self.page_fetcher = page_fetcher
+        self.counter = counter
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self._count: Optional[int] = None
+        self._pages: "OrderedDict[int, List[Any]]" = OrderedDict()
+        # Sayfa numarası -> o sayfanın başladığı imleç (0. sayfa imleçsizdir)
+        self._cursors: Dict[int, Tuple[Any, ...]] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        if self._count is None:
+            self._count = int(self.counter())
+        return self._count
+
+    def _page(self, numara: int) -> List[Any]:
+        """Sayfayı önbellekten, imleçten veya offset ile getir"""
+        with self._lock:
+            if numara in self._pages:
+                self._pages.move_to_end(numara)
+                return self._pages[numara]
+
+            imlec = self._cursors.get(numara)
+            if numara == 0 or imlec is not None:
+                sayfa = self.page_fetcher(imlec, 0, self.page_size)
+            else:
+                sayfa = self.page_fetcher(None, numara * self.page_size, self.page_size)
+
+            if sayfa.next_cursor is not None:
+                self._cursors[numara + 1] = sayfa.next_cursor
+
+            self._pages[numara] = sayfa.items
+            while len(self._pages) > self.max_pages:
+                self._pages.popitem(last=False)
+            return sayfa.items
+
+    def fetch(self, offset: int, limit: int) -> List[Any]:
+        """
+        Satır aralığını gerekli sayfaları okuyarak döndür.
+
+        Args:
+            offset (int): Başlangıç indeksi
+            limit (int): En fazla satır sayısı
+
+        Returns:
+            List[Any]: Satırlar
+        """
+        if limit <= 0:
+            return []
+        ilk = offset // self.page_size
+        son = (offset + limit - 1) // self.page_size
+        satirlar: List[Any] = []
+        for numara in range(ilk, son + 1):
+            satirlar.extend(self._page(numara))
+        bas = offset - ilk * self.page_size
+        return satirlar[bas:bas + limit]
+
+    def hazir_mi(self, offset: int, limit: int) -> bool:
+        """
+        Aralık veritabanına gitmeden okunabilir mi?
+
+        Args:
+            offset (int): Başlangıç indeksi
+            limit (int): En fazla satır sayısı
+
+        Returns:
+            bool: Sayı ve aralığın tüm sayfaları önbellekteyse True
+        """
+        return self._count is not None and _sayfalar_hazir(self._pages, self.page_size, offset, limit)
+
+    def invalidate(self) -> None:
+        """Sayı, sayfa ve imleç önbelleğini temizle"""
+        with self._lock:
+            self._count = None
+            self._pages.clear()
+            self._cursors.clear()
+
+
+class VirtualTreeview:
+    """
+    ``ttk.Treeview`` üzerine pencereli (sanal) çizim.
+
+    Treeview'de her an yalnızca ``[başlangıç, bitiş)`` aralığındaki satırlar
+    bulunur. Dikey scrollbar tüm veri kümesine göre ayarlanır; kaydırma
+    tampon sınırına yaklaştığında pencere yeniden oluşturulur. Seçim,
+    satır anahtarları (iid) üzerinden pencere değişimlerinde korunur.
+
+    Attributes:
+        tree: Sarmalanan Treeview
+        buffer (int): Görünür alanın üstünde/altında tutulan satır sayısı
+        loader: Önbellekte olmayan sayfaları okuyan ``BackgroundLoader`` (opsiyonel)
+
+    Example:
+        >>> view = VirtualTreeview(tree, scrollbar=v_scrollbar)
+        >>> view.set_rows(ListRowSource(islemler), lambda i: ((i.id, i.ad), ()),
+        ...               key=lambda i: f"islem_{i.id}")
+        >>> view.row_for_item(tree.selection()[0])
+    """
+
+    def __init__(self, tree: Any, scrollbar: Optional[Any] = None,
+                 buffer: int = VARSAYILAN_TAMPON, loader: Optional[Any] = None) -> None:
+        """
+        Args:
+            tree: Sarmalanacak Treeview
+            scrollbar: Dikey scrollbar (opsiyonel)
+            buffer (int): Tampon satır sayısı
+            loader: Sayfaları worker thread'de okuyacak ``BackgroundLoader``;
+                None ise sayfalar Tk thread'inde okunur
+        """
+        self.tree = tree
+        self.buffer = buffer
+        self.loader = loader
+        self._yukleme_anahtari = f"pencere:{id(self)}"
+        self.logger = get_logger(self.__class__.__name__)
+
+        self._source: Any = ListRowSource([])
+        self._formatter: SatirFormatter = lambda row: (row, ())
+        self._key: Optional[Callable[[Any], str]] = None
+        self._start = 0
+        self._end = 0
+        self._top = 0
+        self._items: Dict[str, Any] = {}
+        self._selected: Set[str] = set()
+        self._restored: Set[str] = set()
+        self._rendering = False
+        self._pending: Optional[Any] = None
+        self._scrollbar: Optional[Any] = None
+
+        if scrollbar is not None:
+            self.attach_scrollbar(scrollbar)
+
+    # ------------------------------------------------------------------
+    # Genel API
+    # ------------------------------------------------------------------
+
+    @property
+    def total(self) -> int:
+        """Kaynaktaki toplam satır sayısı"""
+        return len(self._source)
+
+    @property
+    def window(self) -> Tuple[int, int]:
+        """Treeview'de bulunan satır aralığı ``(başlangıç, bitiş)``"""
+        return self._start, self._end
+
+    def attach_scrollbar(self, scrollbar: Any) -> None:
+        """
+        Dikey scrollbar'ı sanal kaydırmaya bağla.
+
+        Args:
+            scrollbar: ``ttk.Scrollbar`` (orient="vertical")
+        """
+        self._scrollbar = scrollbar
+        scrollbar.configure(command=self.yview)
+        self.tree.configure(yscrollcommand=self._on_tree_yscroll)
+
+    def set_rows(self, source: Any, formatter: SatirFormatter,
+                 key: Optional[Callable[[Any], str]] = None,
+                 keep_position: bool = False) -> None:
+        """
+        Satır kaynağını değiştir ve ilk pencereyi çiz.
+
+        Args:
+            source: ``ListRowSource``, ``QueryRowSource``, ``KeysetRowSource`` veya düz liste
+            formatter: Satırı ``(values, tags)`` demetine çeviren fonksiyon
+            key: Satırdan benzersiz iid üreten fonksiyon (yoksa satır indeksi)
+            keep_position (bool): Kaydırma konumunu koru (ör. yenilemede)
+        """
+        if not hasattr(source, "fetch"):
+            source = ListRowSource(source)
+
+        self._source = source
+        self._formatter = formatter
+        self._key = key
+        if not keep_position:
+            self._top = 0
+            self._selected.clear()
+            self._restored.clear()
+        self._show(self._top, force=True)
+        self.logger.debug(f"Virtual table source set: {self.total} rows, window {self.window}")
+
+    def refresh(self) -> None:
+        """Aynı kaynak ve konumla pencereyi yeniden çiz"""
+        self._show(self._top, force=True)
+
+    def row_for_item(self, iid: str) -> Optional[Any]:
+        """
+        Treeview satırına karşılık gelen kaynak satırını döndür.
+
+        Args:
+            iid (str): Treeview item ID'si
+
+        Returns:
+            Optional[Any]: Kaynak satırı (pencere dışındaysa None)
+        """
+        return self._items.get(iid)
+
+    def see_index(self, index: int) -> None:
+        """
+        Verilen satır indeksini görünür yap.
+
+        Args:
+            index (int): Kaynak içindeki satır indeksi
+        """
+        self._show(index - self._gorunur_satir_sayisi() // 2)
+
+    def scroll_to_end(self) -> None:
+        """Son satırlara kaydır"""
+        self._show(self.total)
+
+    def yview(self, *args: Any) -> None:
+        """
+        Scrollbar komutu: ``moveto <kesir>`` veya ``scroll <n> units|pages``.
+        """
+        if not args:
+            return
+        if args[0] == "moveto":
+            self._show(int(float(args[1]) * self.total))
+        elif args[0] == "scroll":
+            adim = int(args[1])
+            if len(args) > 2 and args[2] == "pages":
+                adim *= self._gorunur_satir_sayisi()
+            self._show(self._current_top() + adim)
+
+    # ------------------------------------------------------------------
+    # Pencere yönetimi
+    # ------------------------------------------------------------------
+
+    def _gorunur_satir_sayisi(self) -> int:
+        """Treeview'de aynı anda görünen satır sayısını tahmin et"""
+        satir = VARSAYILAN_GORUNUR_SATIR
+        try:
+            satir = int(self.tree.cget("height")) or satir
+            satir_yuksekligi = int(
+                ttk.Style().lookup("Treeview", "rowheight") or VARSAYILAN_SATIR_YUKSEKLIGI
+            )
+            satir = max(satir, self.tree.winfo_height() // satir_yuksekligi)
+        except (AttributeError, ValueError, tk.TclError):
+            pass
+        return max(1, satir)
+
+    def _current_top(self) -> int:
+        """Şu anda en üstte görünen satırın kaynak indeksi"""
+        adet = self._end - self._start
+        if adet <= 0:
+            return self._top
+        try:
+            ilk = float(self.tree.yview()[0])
+        except (AttributeError, tk.TclError):
+            return self._top
+        return self._start + int(round(ilk * adet))
+
+    def _show(self, top: int, force: bool = False) -> None:
+        """``top`` indeksli satır en üstte olacak şekilde pencereyi ayarla"""
+        toplam = self.total
+        gorunur = self._gorunur_satir_sayisi()
+        top = max(0, min(top, toplam - gorunur))
+        bas = max(0, top - self.buffer)
+        son = min(toplam, top + gorunur + self.buffer)
+
+        if not force and (bas, son) == (self._start, self._end):
+            self._konumla(top)
+            return
+
+        kaynak = self._source
+        hazir_mi = getattr(kaynak, "hazir_mi", None)
+        if self.loader is None or hazir_mi is None or hazir_mi(bas, son - bas):
+            if self.loader is not None:
+                # Geç gelen eski bir okuma bu pencerenin üstüne çizilmesin
+                self.loader.cancel(self._yukleme_anahtari)
+            self._materialize(bas, son, kaynak.fetch(bas, son - bas) if son > bas else [])
+            self._konumla(top)
+            return
+
+        # Önbellekte olmayan sayfalar worker'da okunur; eski pencere ekranda kalır
+        def uygula(satirlar: List[Any]) -> None:
+            if kaynak is not self._source:
+                return
+            self._materialize(bas, son, satirlar)
+            self._konumla(top)
+
+        self.loader.submit(
+            self._yukleme_anahtari,
+            fetch=lambda token: kaynak.fetch(bas, son - bas),
+            render=uygula,
+            on_error=self._log_fetch_error
+        )
+
+    def _konumla(self, top: int) -> None:
+        """Pencere içinde ``top`` satırını en üste kaydır"""
+        self._top = top
+        adet = self._end - self._start
+        if adet:
+            try:
+                self.tree.yview_moveto((top - self._start) / adet)
+            except (AttributeError, tk.TclError):
+                pass
+
+    def _log_fetch_error(self, error: Exception) -> None:
+        """Arka planda sayfa okuma hatasını logla (pencere değişmez)"""
+        self.logger.error(f"Failed to fetch virtual table rows: {error}")
+
+    def _materialize(self, bas: int, son: int, satirlar: Sequence[Any]) -> None:
+        """Treeview içeriğini ``[bas, son)`` aralığının okunmuş satırlarıyla değiştir"""
+        self._rendering = True
+        try:
+            eski = self.tree.get_children()
+            gorunen = {str(iid) for iid in self._secili()} if eski else set()
+            if gorunen != self._restored:
+                # Kullanıcı pencere içindeki seçimi değiştirdi
+                self._selected = gorunen
+            for item in eski:
+                self.tree.delete(item)
+
+            self._items = {}
+            for offset, row in enumerate(satirlar):
+                iid = self._key(row) if self._key else f"r{bas + offset}"
+                values, tags = self._formatter(row)
+                self.tree.insert("", "end", iid=iid, values=tuple(values), tags=tuple(tags))
+                self._items[iid] = row
+
+            self._start = bas
+            self._end = bas + len(satirlar)
+
+            secili = [iid for iid in self._selected if iid in self._items]
+            if secili:
+                self.tree.selection_set(secili)
+            self._restored = set(secili)
+        finally:
+            self._rendering = False
+
+    def _secili(self) -> Tuple[Any, ...]:
+        """Treeview seçimini güvenle oku"""
+        try:
+            return tuple(self.tree.selection())
+        except (AttributeError, tk.TclError):
+            return ()
+
+    # ------------------------------------------------------------------
+    # Tk geri çağrıları
+    # ------------------------------------------------------------------
+
+    def _on_tree_yscroll(self, first: str, last: str) -> None:
+        """Treeview'in yerel kaydırma bilgisini global scrollbar'a çevir"""
+        toplam = self.total
+        adet = self._end - self._start
+        if self._scrollbar is None or toplam == 0 or adet == 0:
+            if self._scrollbar is not None:
+                self._scrollbar.set(first, last)
+            return
+
+        ust = self._start + float(first) * adet
+        alt = self._start + float(last) * adet
+        self._scrollbar.set(ust / toplam, alt / toplam)
+
+        if self._rendering or self._pending is not None:
+            return
+
+        # Tampon sınırına yaklaşıldıysa pencereyi kaydır (idle'da, tek sefer)
+        esik = self.buffer // 2
+        ust_yakin = self._start > 0 and ust - self._start < esik
+        alt_yakin = self._end < toplam and self._end - alt < esik
+        if ust_yakin or alt_yakin:
+            hedef = int(round(ust))
+            self._pending = self.tree.after_idle(lambda: self._kaydir(hedef))
+
+    def _kaydir(self, hedef: int) -> None:
+        """Bekleyen pencere kaydırmasını uygula"""
+        self._pending = None
+        self._show(hedef)
@@ -26,6 +26,19 @@ class PaginationResult:
         return (self.page - 1) * self.page_size
 
 
+@dataclass
+class KeysetPage:
+    """
+    Keyset (seek) pagination sonuç modeli.
+
+    Sonraki sayfa ``OFFSET`` yerine son satırın sıralama anahtarından
+    (``next_cursor``) devam eder; sayfa derinliği sorgu süresini etkilemez.
+    """
+    items: List
+    next_cursor: Optional[Tuple[Any, ...]]
+    has_next: bool
+
+
 class PaginationHelper(Generic[T]):
     """Generic pagination helper"""
     
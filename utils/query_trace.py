@@ -0,0 +1,558 @@
+"""
+Sorgu izleyici (query tracer)
+
+Etkinleştirildiğinde SQLAlchemy engine'lerinin ``before_cursor_execute`` /
+``after_cursor_execute`` olaylarını dinleyerek çalışan her SQL ifadesinin
+parmak izini (literal ve parametreleri ``?`` ile değiştirilmiş normalize
+metin), süresini, etkilenen satır sayısını ve ifadeyi çalıştıran controller
+metodunu kaydeder. Profiler bağlamadan üretimde yavaş yolları bulmak içindir.
+
+Bir arayüz eylemi (panel kurulumu, arka plan yüklemesi, ...) ``eylem(ad)``
+ile sarılır; eylem bittiğinde aynı parmak izi ``tekrar_esigi`` veya daha
+fazla kez çalıştıysa N+1 şüphesi olarak loglanır (ör. her satır için ayrı
+``sakin_at_date`` sorgusu). Eylemler thread başınadır; iç içe ``eylem``
+çağrıları dıştaki eyleme katılır.
+
+İzleme kapalıyken olay dinleyicileri kurulmaz; ``eylem`` yalnızca bir
+bayrak kontrolüdür. Açmak için ``AIDAT_QUERY_TRACE=1`` ortam değişkeni veya
+``profiling.query_trace`` ayarı kullanılır. Uygulama kapanırken özet loga
+ve ``profiling.query_report`` (veya ``AIDAT_QUERY_TRACE_FILE``) JSON
+dosyasına yazılır.
+
+SQLite sürücüsü SELECT ifadelerinde satırlar okunmadan satır sayısı
+bildirmediği için satır sayısı yalnızca INSERT/UPDATE/DELETE için tutulur.
+"""
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set
+
+from models.exceptions import ConfigError
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# İzlemeyi açan ortam değişkenleri
+TRACE_ENV = "AIDAT_QUERY_TRACE"
+TRACE_FILE_ENV = "AIDAT_QUERY_TRACE_FILE"
+
+# Varsayılanlar (ConfigDefaults ile aynı değerler)
+VARSAYILAN_RAPOR_YOLU = "logs/query_trace.json"
+VARSAYILAN_YAVAS_SORGU_MS = 100.0
+VARSAYILAN_TEKRAR_ESIGI = 10
+
+# Saklanan son eylem özeti sayısı
+EYLEM_GECMISI = 50
+
+# Çağıran aranırken öncelikli paket ve geri dönüş paketleri (modül adı önekleri)
+CONTROLLER_PAKETI = "controllers."
+CAGIRAN_PAKETLERI = ("ui.", "database.", "scripts.", "main")
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_SAYI_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PARAMETRE_LISTESI = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_BOSLUK = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=2048)
+def parmak_izi(statement: str) -> str:
+    """
+    SQL ifadesinin parametreden bağımsız parmak izini üret.
+
+    Literaller ``?`` olur, ``IN (?, ?, ...)`` listeleri tek ``(?)``'e indirgenir
+    ve boşluklar sadeleştirilir; aynı sorgunun farklı parametrelerle
+    çalıştırılması aynı parmak izini verir.
+
+    Args:
+        statement: Sürücüye giden SQL metni
+
+    Returns:
+        str: Normalize edilmiş SQL
+
+    Example:
+        >>> parmak_izi("SELECT * FROM daireler WHERE id IN (?, ?, ?) AND kat = 3")
+        'SELECT * FROM daireler WHERE id IN (?) AND kat = ?'
+    """
+    metin = _STRING_LITERAL.sub("?", statement)
+    metin = _SAYI_LITERAL.sub("?", metin)
+    metin = _PARAMETRE_LISTESI.sub("(?)", metin)
+    return _BOSLUK.sub(" ", metin).strip()
+
+
+def _cagiran_bul(cerceve: Any) -> str:
+    """Yığında ifadeyi çalıştıran controller metodunu (yoksa ilk uygulama fonksiyonunu) bul"""
+    yedek = None
+    while cerceve is not None:
+        modul = cerceve.f_globals.get("__name__", "")
+        if modul.startswith(CONTROLLER_PAKETI) or (yedek is None and modul.startswith(CAGIRAN_PAKETLERI)):
+            kod = cerceve.f_code
+            ad = getattr(kod, "co_qualname", None)
+            if ad is None:
+                sahip = cerceve.f_locals.get("self")
+                ad = f"{type(sahip).__name__}.{kod.co_name}" if sahip is not None else kod.co_name
+            cagiran = f"{modul}.{ad}"
+            if modul.startswith(CONTROLLER_PAKETI):
+                return cagiran
+            yedek = cagiran
+        cerceve = cerceve.f_back
+    return yedek or "?"
+
+
+@dataclass
+class SorguIstatistigi:
+    """
+    Bir parmak izinin birikimli istatistikleri.
+
+    Attributes:
+        parmak_izi (str): Normalize edilmiş SQL
+        adet (int): Çalıştırılma sayısı
+        toplam_ms (float): Toplam süre
+        en_uzun_ms (float): En uzun tek çalıştırma
+        satir (int): Etkilenen toplam satır (INSERT/UPDATE/DELETE)
+        cagiranlar (Counter): Çağıran -> adet
+    """
+
+    parmak_izi: str
+    adet: int = 0
+    toplam_ms: float = 0.0
+    en_uzun_ms: float = 0.0
+    satir: int = 0
+    cagiranlar: Counter = field(default_factory=Counter)
+
+    def ekle(self, sure_ms: float, satir: Optional[int], cagiran: str) -> None:
+        """Bir çalıştırmayı istatistiğe ekle"""
+        self.adet += 1
+        self.toplam_ms += sure_ms
+        self.en_uzun_ms = max(self.en_uzun_ms, sure_ms)
+        if satir is not None and satir > 0:
+            self.satir += satir
+        self.cagiranlar[cagiran] += 1
+
+    def sozluk(self) -> Dict[str, Any]:
+        """JSON raporu için sözlük"""
+        return {
+            "parmak_izi": self.parmak_izi,
+            "adet": self.adet,
+            "toplam_ms": round(self.toplam_ms, 2),
+            "ortalama_ms": round(self.toplam_ms / self.adet, 3) if self.adet else 0.0,
+            "en_uzun_ms": round(self.en_uzun_ms, 2),
+            "satir": self.satir,
+            "cagiranlar": dict(self.cagiranlar.most_common(5)),
+        }
+
+
+@dataclass(frozen=True)
+class TekrarEdenSorgu:
+    """
+    Bir eylem içinde eşiği aşan sayıda çalışan sorgu (N+1 şüphesi).
+
+    Attributes:
+        parmak_izi (str): Normalize edilmiş SQL
+        adet (int): Eylem içindeki çalıştırma sayısı
+        farkli_parametre (int): Farklı parametre kümesi sayısı
+        toplam_ms (float): Eylem içindeki toplam süre
+        cagiran (str): En sık çağıran
+    """
+
+    parmak_izi: str
+    adet: int
+    farkli_parametre: int
+    toplam_ms: float
+    cagiran: str
+
+
+@dataclass(frozen=True)
+class EylemOzeti:
+    """
+    Tamamlanmış bir arayüz eyleminin sorgu özeti.
+
+    Attributes:
+        ad (str): Eylem adı
+        sure_ms (float): Eylemin toplam süresi
+        sorgu_sayisi (int): Çalışan ifade sayısı
+        sorgu_ms (float): İfadelerin toplam süresi
+        tekrarlar (List[TekrarEdenSorgu]): N+1 şüpheleri (en çok tekrar eden önce)
+    """
+
+    ad: str
+    sure_ms: float
+    sorgu_sayisi: int
+    sorgu_ms: float
+    tekrarlar: List[TekrarEdenSorgu]
+
+
+@dataclass(frozen=True)
+class QueryTraceAyarlari:
+    """
+    Sorgu izleme ayarları.
+
+    Attributes:
+        etkin (bool): İzleme açık mı
+        rapor_yolu (str): Kapanışta yazılan JSON rapor dosyası
+        yavas_sorgu_ms (float): Bu süreyi aşan tek ifade loglanır
+        tekrar_esigi (int): Bir eylemde bu kadar tekrar eden ifade N+1 şüphesidir
+    """
+
+    etkin: bool = False
+    rapor_yolu: str = VARSAYILAN_RAPOR_YOLU
+    yavas_sorgu_ms: float = VARSAYILAN_YAVAS_SORGU_MS
+    tekrar_esigi: int = VARSAYILAN_TEKRAR_ESIGI
+
+
+class _Eylem:
+    """Süren bir eylemde parmak izi başına sayaçlar"""
+
+    def __init__(self, ad: str, baslangic: float) -> None:
+        self.ad = ad
+        self.baslangic = baslangic
+        self.sorgu_sayisi = 0
+        self.sorgu_ms = 0.0
+        self.sorgular: Dict[str, SorguIstatistigi] = {}
+        self.parametreler: Dict[str, Set[int]] = {}
+
+
+class QueryTracer:
+    """
+    Engine seviyesinde SQL ifadelerini ölçen ve N+1 kalıplarını işaretleyen sınıf.
+
+    Example:
+        >>> tracer = get_query_tracer()
+        >>> tracer.baslat(tekrar_esigi=10)
+        >>> with tracer.eylem("AidatPanel.load_data"):
+        ...     panel.load_data()
+        >>> tracer.ozeti_logla()
+        >>> tracer.durdur()
+    """
+
+    def __init__(self, saat: Callable[[], float] = time.perf_counter) -> None:
+        """
+        Args:
+            saat: Saniye döndüren monoton saat
+        """
+        self.saat = saat
+        self.yavas_sorgu_ms = VARSAYILAN_YAVAS_SORGU_MS
+        self.tekrar_esigi = VARSAYILAN_TEKRAR_ESIGI
+        self._hedef: Any = None
+        self._istatistikler: Dict[str, SorguIstatistigi] = {}
+        self._eylemler: Deque[EylemOzeti] = deque(maxlen=EYLEM_GECMISI)
+        self._yerel = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def etkin(self) -> bool:
+        """Olay dinleyicileri kurulu mu?"""
+        return self._hedef is not None
+
+    def baslat(self, yavas_sorgu_ms: float = VARSAYILAN_YAVAS_SORGU_MS,
+               tekrar_esigi: int = VARSAYILAN_TEKRAR_ESIGI, hedef: Any = None) -> None:
+        """
+        Olay dinleyicilerini kur (tekrar çağrılırsa yalnızca eşikler güncellenir).
+
+        Args:
+            yavas_sorgu_ms: Tek ifade için yavaş sayılma eşiği
+            tekrar_esigi: Eylem içi N+1 eşiği
+            hedef: Dinlenecek Engine; None ise tüm engine'ler (Engine sınıfı)
+        """
+        self.yavas_sorgu_ms = float(yavas_sorgu_ms)
+        self.tekrar_esigi = int(tekrar_esigi)
+        if self.etkin:
+            return
+
+        from sqlalchemy import event
+        from sqlalchemy.engine import Engine
+
+        self._hedef = Engine if hedef is None else hedef
+        event.listen(self._hedef, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(self._hedef, "after_cursor_execute", self._after_cursor_execute)
+
+    def durdur(self) -> None:
+        """Olay dinleyicilerini kaldır (toplanan istatistikler korunur)"""
+        if not self.etkin:
+            return
+        from sqlalchemy import event
+
+        event.remove(self._hedef, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(self._hedef, "after_cursor_execute", self._after_cursor_execute)
+        self._hedef = None
+
+    def sifirla(self) -> None:
+        """Toplanan istatistikleri ve eylem geçmişini temizle"""
+        with self._lock:
+            self._istatistikler.clear()
+            self._eylemler.clear()
+
+    @contextmanager
+    def eylem(self, ad: str) -> Iterator[None]:
+        """
+        Bir arayüz eyleminin sorgularını grupla ve bitince N+1 kontrolü yap.
+
+        İzleme kapalıysa veya bu thread'de zaten bir eylem sürüyorsa hiçbir
+        şey yapmaz.
+
+        Args:
+            ad: Eylem adı (ör. "AidatPanel:islemler")
+        """
+        if not self.etkin or getattr(self._yerel, "eylem", None) is not None:
+            yield
+            return
+        aktif = _Eylem(ad, self.saat())
+        self._yerel.eylem = aktif
+        try:
+            yield
+        finally:
+            self._yerel.eylem = None
+            self._eylemi_bitir(aktif)
+
+    # ------------------------------------------------------------------
+
+    def _before_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any,
+                               context: Any, executemany: bool) -> None:
+        conn.info.setdefault("sorgu_baslangic", []).append(self.saat())
+
+    def _after_cursor_execute(self, conn: Any, cursor: Any, statement: str, parameters: Any,
+                              context: Any, executemany: bool) -> None:
+        baslangiclar = conn.info.get("sorgu_baslangic")
+        if not baslangiclar:
+            return
+        sure_ms = (self.saat() - baslangiclar.pop()) * 1000.0
+        satir = getattr(cursor, "rowcount", -1)
+        self.kaydet(statement, sure_ms, satir if satir >= 0 else None,
+                    _cagiran_bul(sys._getframe(1)), None if executemany else parameters)
+
+    def kaydet(self, statement: str, sure_ms: float, satir: Optional[int] = None,
+               cagiran: str = "?", parametreler: Any = None) -> None:
+        """
+        Bir ifade çalıştırmasını kaydet (olay dinleyicisinden çağrılır).
+
+        Args:
+            statement: SQL metni
+            sure_ms: Süre (ms)
+            satir: Etkilenen satır sayısı (bilinmiyorsa None)
+            cagiran: Çağıran fonksiyon
+            parametreler: İfade parametreleri (aynı parametreli tekrarları ayırt etmek için)
+        """
+        iz = parmak_izi(statement)
+        with self._lock:
+            istatistik = self._istatistikler.get(iz)
+            if istatistik is None:
+                istatistik = self._istatistikler[iz] = SorguIstatistigi(iz)
+            istatistik.ekle(sure_ms, satir, cagiran)
+
+        aktif: Optional[_Eylem] = getattr(self._yerel, "eylem", None)
+        if aktif is not None:
+            aktif.sorgu_sayisi += 1
+            aktif.sorgu_ms += sure_ms
+            eylem_istatistigi = aktif.sorgular.get(iz)
+            if eylem_istatistigi is None:
+                eylem_istatistigi = aktif.sorgular[iz] = SorguIstatistigi(iz)
+            eylem_istatistigi.ekle(sure_ms, satir, cagiran)
+            try:
+                aktif.parametreler.setdefault(iz, set()).add(hash(repr(parametreler)))
+            except Exception:
+                pass
+
+        if sure_ms >= self.yavas_sorgu_ms:
+            logger.warning(f"Slow query ({sure_ms:.0f} ms) from {cagiran}: {iz[:300]}")
+
+    def _eylemi_bitir(self, aktif: _Eylem) -> None:
+        """Eylem özetini oluştur, N+1 şüphelerini logla"""
+        tekrarlar = sorted(
+            (
+                TekrarEdenSorgu(
+                    parmak_izi=iz,
+                    adet=istatistik.adet,
+                    farkli_parametre=len(aktif.parametreler.get(iz, ())),
+                    toplam_ms=istatistik.toplam_ms,
+                    cagiran=istatistik.cagiranlar.most_common(1)[0][0],
+                )
+                for iz, istatistik in aktif.sorgular.items()
+                if istatistik.adet >= self.tekrar_esigi
+            ),
+            key=lambda t: t.adet,
+            reverse=True,
+        )
+        ozet = EylemOzeti(
+            ad=aktif.ad,
+            sure_ms=(self.saat() - aktif.baslangic) * 1000.0,
+            sorgu_sayisi=aktif.sorgu_sayisi,
+            sorgu_ms=aktif.sorgu_ms,
+            tekrarlar=tekrarlar,
+        )
+        with self._lock:
+            self._eylemler.append(ozet)
+        for tekrar in tekrarlar:
+            logger.warning(
+                f"Possible N+1 in {ozet.ad}: {tekrar.adet}x ({tekrar.farkli_parametre} distinct params, "
+                f"{tekrar.toplam_ms:.0f} ms) from {tekrar.cagiran}: {tekrar.parmak_izi[:300]}"
+            )
+
+    # ------------------------------------------------------------------
+
+    def istatistikler(self, limit: Optional[int] = None) -> List[SorguIstatistigi]:
+        """
+        Parmak izi istatistikleri (toplam süreye göre azalan).
+
+        Args:
+            limit: En fazla kaç kayıt; None ise tümü
+
+        Returns:
+            List[SorguIstatistigi]: İstatistikler
+        """
+        with self._lock:
+            sirali = sorted(self._istatistikler.values(), key=lambda s: s.toplam_ms, reverse=True)
+        return sirali[:limit] if limit is not None else sirali
+
+    def eylem_ozetleri(self) -> List[EylemOzeti]:
+        """
+        Son tamamlanan eylemlerin özetleri (eskiden yeniye).
+
+        Returns:
+            List[EylemOzeti]: En fazla ``EYLEM_GECMISI`` özet
+        """
+        with self._lock:
+            return list(self._eylemler)
+
+    def rapor(self, limit: int = 25) -> Dict[str, Any]:
+        """
+        Yapılandırılmış sorgu raporu.
+
+        Args:
+            limit: Listelenecek en pahalı parmak izi sayısı
+
+        Returns:
+            Dict[str, Any]: "olusturma", "toplam_sorgu", "toplam_ms",
+            "en_pahali", "eylemler" ve "n_arti_bir"
+        """
+        tumu = self.istatistikler()
+        eylemler = self.eylem_ozetleri()
+
+        def tekrar_satiri(ad: str, t: TekrarEdenSorgu) -> Dict[str, Any]:
+            return {"eylem": ad, "parmak_izi": t.parmak_izi, "adet": t.adet,
+                    "farkli_parametre": t.farkli_parametre, "toplam_ms": round(t.toplam_ms, 2),
+                    "cagiran": t.cagiran}
+
+        return {
+            "olusturma": datetime.now().isoformat(timespec="seconds"),
+            "toplam_sorgu": sum(s.adet for s in tumu),
+            "toplam_ms": round(sum(s.toplam_ms for s in tumu), 2),
+            "en_pahali": [s.sozluk() for s in tumu[:limit]],
+            "eylemler": [
+                {"ad": e.ad, "sure_ms": round(e.sure_ms, 1), "sorgu_sayisi": e.sorgu_sayisi,
+                 "sorgu_ms": round(e.sorgu_ms, 2), "tekrar_sayisi": len(e.tekrarlar)}
+                for e in eylemler
+            ],
+            "n_arti_bir": [tekrar_satiri(e.ad, t) for e in eylemler for t in e.tekrarlar],
+        }
+
+    def rapor_yaz(self, yol: str, limit: int = 25) -> Path:
+        """
+        Raporu JSON olarak yaz.
+
+        Args:
+            yol: Rapor dosyası
+            limit: Listelenecek en pahalı parmak izi sayısı
+
+        Returns:
+            Path: Yazılan dosya
+        """
+        hedef = Path(yol)
+        hedef.parent.mkdir(parents=True, exist_ok=True)
+        hedef.write_text(json.dumps(self.rapor(limit), ensure_ascii=False, indent=2), encoding="utf-8")
+        return hedef
+
+    def ozeti_logla(self, limit: int = 10) -> None:
+        """
+        En pahalı ifadeleri loga yaz.
+
+        Args:
+            limit: Loglanacak parmak izi sayısı
+        """
+        tumu = self.istatistikler()
+        logger.info(
+            f"Query trace: {sum(s.adet for s in tumu)} statements, "
+            f"{sum(s.toplam_ms for s in tumu):.0f} ms, {len(tumu)} distinct"
+        )
+        for s in tumu[:limit]:
+            cagiran = s.cagiranlar.most_common(1)[0][0] if s.cagiranlar else "?"
+            logger.info(
+                f"  {s.toplam_ms:8.1f} ms {s.adet:6d}x max {s.en_uzun_ms:6.1f} ms "
+                f"{cagiran}: {s.parmak_izi[:200]}"
+            )
+
+
+_query_tracer = QueryTracer()
+
+
+def get_query_tracer() -> QueryTracer:
+    """
+    Paylaşılan sorgu izleyicisini döndür.
+
+    Returns:
+        QueryTracer: Paylaşılan izleyici
+    """
+    return _query_tracer
+
+
+def _env_etkin() -> bool:
+    return os.getenv(TRACE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def get_query_trace_settings(config: Optional[Any] = None) -> QueryTraceAyarlari:
+    """
+    Sorgu izleme ayarlarını ortam değişkenlerinden ve konfigürasyondan oku.
+
+    Ortam değişkenleri konfigürasyondan önce gelir.
+
+    Args:
+        config: ConfigurationManager instance'ı. None ise singleton kullanılır.
+
+    Returns:
+        QueryTraceAyarlari: Doğrulanmış ayarlar
+
+    Raises:
+        ConfigError: Yavaş sorgu süresi negatifse veya tekrar eşiği 2'den küçükse
+    """
+    if config is None:
+        from configuration.config_manager import ConfigurationManager
+        config = ConfigurationManager.get_instance()
+
+    varsayilan = QueryTraceAyarlari()
+    etkin = _env_etkin() or bool(config.get("profiling.query_trace", varsayilan.etkin))
+    rapor_yolu = os.getenv(TRACE_FILE_ENV) or str(config.get("profiling.query_report", varsayilan.rapor_yolu))
+
+    deger = config.get("profiling.slow_query_ms", varsayilan.yavas_sorgu_ms)
+    try:
+        yavas_sorgu_ms = float(deger)
+    except (TypeError, ValueError):
+        yavas_sorgu_ms = -1.0
+    if yavas_sorgu_ms < 0:
+        raise ConfigError(
+            f"Geçersiz yavaş sorgu süresi: {deger}",
+            code="CFG_002",
+            details={"key": "profiling.slow_query_ms"}
+        )
+
+    deger = config.get("profiling.n_plus_one_threshold", varsayilan.tekrar_esigi)
+    try:
+        tekrar_esigi = int(deger)
+    except (TypeError, ValueError):
+        tekrar_esigi = 0
+    if tekrar_esigi < 2:
+        raise ConfigError(
+            f"Geçersiz N+1 tekrar eşiği: {deger}",
+            code="CFG_002",
+            details={"key": "profiling.n_plus_one_threshold"}
+        )
+
+    return QueryTraceAyarlari(etkin=etkin, rapor_yolu=rapor_yolu,
+                              yavas_sorgu_ms=yavas_sorgu_ms, tekrar_esigi=tekrar_esigi)
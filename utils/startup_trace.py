@@ -0,0 +1,445 @@
+"""
+Açılış süresi izleyici (startup tracer)
+
+``main.py`` açılışını aşamalara ayırıp her aşamanın ve ağır paket
+import'larının (customtkinter, SQLAlchemy, matplotlib, pandas, ...) duvar
+saati süresini ölçer. Aşama süreleri her zaman tutulur (birkaç
+``perf_counter`` çağrısı); import süreleri ``sys.meta_path``'e eklenen bir
+bulucu ile yalnızca izlenen paketlerin ilk import'unda ölçülür. Bir paketin
+süresi, içinde import ettiği diğer paketleri de kapsar. Bulucu yalnızca
+izleme etkinse kurulur (bkz. ``izleme_istendi``); konfigürasyon henüz
+yüklenmediği için ayar doğrudan JSON dosyalarından okunur.
+
+Rapor (JSON) ve bütçe uyarıları yalnızca izleme etkinse üretilir:
+``AIDAT_STARTUP_TRACE=1`` ortam değişkeni veya ``profiling.startup_trace``
+ayarı. Rapor yolu ``AIDAT_STARTUP_TRACE_FILE`` veya
+``profiling.startup_report`` ile değiştirilebilir. Bütçeler
+``profiling.startup_budgets_ms`` altında ölçüm adı -> milisaniye olarak
+tanımlanır (ör. ``{"import:matplotlib": 800, "ilk_pencere": 3000}``); 0
+bütçe paketin açılışta hiç import edilmemesi gerektiği anlamına gelir.
+
+Bu modül ölçülecek import'lardan önce yüklenebilmesi için yalnızca standart
+kütüphaneyi ve ``models.exceptions``'ı import eder.
+"""
+
+import importlib.util
+import json
+import os
+import platform
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+from models.exceptions import ConfigError
+
+# İzlemeyi açan ortam değişkenleri (konfigürasyon yüklenmeden önce okunur)
+TRACE_ENV = "AIDAT_STARTUP_TRACE"
+TRACE_FILE_ENV = "AIDAT_STARTUP_TRACE_FILE"
+
+# Varsayılan rapor yolu (ConfigDefaults.DEFAULT_STARTUP_REPORT ile aynı)
+VARSAYILAN_RAPOR_YOLU = "logs/startup_trace.json"
+
+# Import süresi ölçülen paketler (üst seviye adlar)
+IZLENEN_PAKETLER = (
+    "customtkinter", "sqlalchemy", "pandas", "openpyxl", "matplotlib", "numpy", "PIL", "dotenv",
+)
+
+# Toplam süre ölçüm adı (bütçelerde kullanılabilir)
+TOPLAM = "toplam"
+
+# ConfigurationManager'ın yükleme sırasıyla konfigürasyon dosyaları
+KONFIGURASYON_DOSYALARI = ("app_config.json", "user_preferences.json", "kategoriler.json")
+
+
+@dataclass(frozen=True)
+class Olcum:
+    """
+    Tek bir ölçüm.
+
+    Attributes:
+        ad (str): Ölçüm adı (aşama adı veya "import:<paket>")
+        baslangic_ms (float): İzleme başlangıcından itibaren başlangıç anı
+        sure_ms (float): Süre
+    """
+
+    ad: str
+    baslangic_ms: float
+    sure_ms: float
+
+
+@dataclass(frozen=True)
+class ButceAsimi:
+    """
+    Bütçesini aşan ölçüm.
+
+    Attributes:
+        ad (str): Ölçüm adı
+        sure_ms (float): Ölçülen süre
+        butce_ms (float): İzin verilen süre
+    """
+
+    ad: str
+    sure_ms: float
+    butce_ms: float
+
+
+@dataclass(frozen=True)
+class StartupTraceAyarlari:
+    """
+    Açılış izleme ayarları.
+
+    Attributes:
+        etkin (bool): Rapor yazılsın ve bütçeler denetlensin mi
+        rapor_yolu (str): JSON rapor dosyası
+        butceler_ms (Dict[str, float]): Ölçüm adı -> bütçe (ms)
+    """
+
+    etkin: bool = False
+    rapor_yolu: str = VARSAYILAN_RAPOR_YOLU
+    butceler_ms: Dict[str, float] = field(default_factory=dict)
+
+
+class _ZamanlayanLoader:
+    """Modülün çalıştırılma süresini ölçen loader sarmalayıcısı"""
+
+    def __init__(self, loader: Any, ad: str, tracer: "StartupTracer") -> None:
+        self._loader = loader
+        self._ad = ad
+        self._tracer = tracer
+
+    def create_module(self, spec: Any) -> Any:
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module: Any) -> None:
+        baslangic = self._tracer.saat()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._tracer._import_kaydet(self._ad, baslangic)
+            # Modül gerçek loader'ını görsün (importlib.resources, inspect, ...)
+            module.__loader__ = self._loader
+            if getattr(module, "__spec__", None) is not None:
+                module.__spec__.loader = self._loader
+
+    def __getattr__(self, ad: str) -> Any:
+        return getattr(self._loader, ad)
+
+
+class _ImportBulucu:
+    """İzlenen paketlerin ilk import'unda spec'in loader'ını saran meta path bulucusu"""
+
+    def __init__(self, tracer: "StartupTracer", paketler: Set[str]) -> None:
+        self._tracer = tracer
+        self._paketler = paketler
+        self._aranan: Set[str] = set()
+
+    def find_spec(self, fullname: str, path: Any = None, target: Any = None) -> Any:
+        if fullname not in self._paketler or fullname in self._aranan:
+            return None
+        # Asıl spec'i diğer bulucular bulur (bu bulucu kendini atlar)
+        self._aranan.add(fullname)
+        try:
+            spec = importlib.util.find_spec(fullname)
+        finally:
+            self._aranan.discard(fullname)
+        if spec is None or spec.loader is None:
+            return None
+        spec.loader = _ZamanlayanLoader(spec.loader, fullname, self._tracer)
+        return spec
+
+
+class StartupTracer:
+    """
+    Açılış aşamalarının ve ağır import'ların süresini ölçen sınıf.
+
+    Example:
+        >>> tracer = get_startup_tracer()
+        >>> tracer.baslat()
+        >>> with tracer.asama("veritabani"):
+        ...     init_database()
+        >>> tracer.isaretle("ilk_pencere")
+        >>> tracer.durdur()
+        >>> tracer.butce_asimlari({"veritabani": 500})
+        []
+    """
+
+    def __init__(self, saat: Callable[[], float] = time.perf_counter,
+                 paketler: Any = IZLENEN_PAKETLER) -> None:
+        """
+        Args:
+            saat: Saniye döndüren monoton saat
+            paketler: Import süresi ölçülecek üst seviye paketler
+        """
+        self.saat = saat
+        self.paketler = set(paketler)
+        self._baslangic: Optional[float] = None
+        self._bitis: Optional[float] = None
+        self._asamalar: List[Olcum] = []
+        self._importlar: List[Olcum] = []
+        self._isaretler: Dict[str, float] = {}
+        self._bulucu: Optional[_ImportBulucu] = None
+        self._lock = threading.Lock()
+
+    @property
+    def basladi(self) -> bool:
+        """İzleme başlatıldı mı?"""
+        return self._baslangic is not None
+
+    def baslat(self, importlari_izle: bool = True) -> None:
+        """
+        İzlemeyi başlat (tekrar çağrılırsa etkisizdir).
+
+        Args:
+            importlari_izle: False ise import bulucusu kurulmaz, yalnızca
+                aşama süreleri tutulur
+        """
+        if self.basladi:
+            return
+        self._baslangic = self.saat()
+        if not importlari_izle:
+            return
+        # Başlangıçtan önce yüklenmiş paketler ölçülemez
+        izlenecek = {ad for ad in self.paketler if ad not in sys.modules}
+        if izlenecek:
+            self._bulucu = _ImportBulucu(self, izlenecek)
+            sys.meta_path.insert(0, self._bulucu)
+
+    def durdur(self) -> None:
+        """Import bulucusunu kaldır ve toplam süreyi sabitle"""
+        if self._bulucu is not None:
+            try:
+                sys.meta_path.remove(self._bulucu)
+            except ValueError:
+                pass
+            self._bulucu = None
+        if self.basladi and self._bitis is None:
+            self._bitis = self.saat()
+
+    def _gecen_ms(self, an: float) -> float:
+        return (an - (self._baslangic if self._baslangic is not None else an)) * 1000.0
+
+    @contextmanager
+    def asama(self, ad: str) -> Iterator[None]:
+        """
+        Bir açılış aşamasının süresini ölç.
+
+        Args:
+            ad: Aşama adı (ör. "veritabani")
+        """
+        if not self.basladi:
+            self.baslat(importlari_izle=False)
+        baslangic = self.saat()
+        try:
+            yield
+        finally:
+            olcum = Olcum(ad, self._gecen_ms(baslangic), (self.saat() - baslangic) * 1000.0)
+            with self._lock:
+                self._asamalar.append(olcum)
+
+    def isaretle(self, ad: str) -> None:
+        """
+        İzleme başlangıcından bu ana kadar geçen süreyi kaydet.
+
+        Args:
+            ad: İşaret adı (ör. "ilk_pencere")
+        """
+        with self._lock:
+            self._isaretler[ad] = self._gecen_ms(self.saat())
+
+    def _import_kaydet(self, paket: str, baslangic: float) -> None:
+        """Bir paketin import süresini kaydet (loader sarmalayıcısından)"""
+        olcum = Olcum(f"import:{paket}", self._gecen_ms(baslangic), (self.saat() - baslangic) * 1000.0)
+        with self._lock:
+            self._importlar.append(olcum)
+
+    def sureler(self) -> Dict[str, float]:
+        """
+        Tüm ölçümleri ad -> süre (ms) olarak döndür.
+
+        Aynı adlı aşamaların süreleri toplanır; işaretler başlangıçtan geçen
+        süredir. ``toplam`` izleme başlangıcından ``durdur`` çağrısına (veya
+        şu ana) kadar geçen süredir.
+
+        Returns:
+            Dict[str, float]: Ölçüm adı -> milisaniye
+        """
+        with self._lock:
+            sonuc: Dict[str, float] = {}
+            for olcum in (*self._asamalar, *self._importlar):
+                sonuc[olcum.ad] = sonuc.get(olcum.ad, 0.0) + olcum.sure_ms
+            sonuc.update(self._isaretler)
+        if self.basladi:
+            sonuc[TOPLAM] = self._gecen_ms(self._bitis if self._bitis is not None else self.saat())
+        return sonuc
+
+    def butce_asimlari(self, butceler_ms: Dict[str, float]) -> List[ButceAsimi]:
+        """
+        Bütçesini aşan ölçümleri bul.
+
+        Ölçülmemiş adlar (ör. hiç import edilmeyen paket) aşım sayılmaz.
+
+        Args:
+            butceler_ms: Ölçüm adı -> bütçe (ms)
+
+        Returns:
+            List[ButceAsimi]: Aşımlar (en büyük aşım önce)
+        """
+        sureler = self.sureler()
+        asimlar = [
+            ButceAsimi(ad, sureler[ad], float(butce))
+            for ad, butce in butceler_ms.items()
+            if ad in sureler and sureler[ad] > float(butce)
+        ]
+        return sorted(asimlar, key=lambda a: a.sure_ms - a.butce_ms, reverse=True)
+
+    def rapor(self, butceler_ms: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Yapılandırılmış açılış raporu.
+
+        Args:
+            butceler_ms: Denetlenecek bütçeler (opsiyonel)
+
+        Returns:
+            Dict[str, Any]: "olusturma", "python", "platform", "toplam_ms",
+            "asamalar", "importlar", "isaretler", "butceler_ms" ve "butce_asimlari"
+        """
+        butceler_ms = dict(butceler_ms or {})
+        sureler = self.sureler()
+        with self._lock:
+            asamalar = sorted(self._asamalar, key=lambda o: o.baslangic_ms)
+            importlar = sorted(self._importlar, key=lambda o: o.baslangic_ms)
+            isaretler = dict(self._isaretler)
+
+        def satir(olcum: Olcum) -> Dict[str, Any]:
+            return {"ad": olcum.ad, "baslangic_ms": round(olcum.baslangic_ms, 1),
+                    "sure_ms": round(olcum.sure_ms, 1)}
+
+        return {
+            "olusturma": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "toplam_ms": round(sureler.get(TOPLAM, 0.0), 1),
+            "asamalar": [satir(o) for o in asamalar],
+            "importlar": [satir(o) for o in importlar],
+            "isaretler": {ad: round(ms, 1) for ad, ms in isaretler.items()},
+            "butceler_ms": butceler_ms,
+            "butce_asimlari": [
+                {"ad": a.ad, "sure_ms": round(a.sure_ms, 1), "butce_ms": a.butce_ms}
+                for a in self.butce_asimlari(butceler_ms)
+            ],
+        }
+
+    def rapor_yaz(self, yol: str, butceler_ms: Optional[Dict[str, float]] = None) -> Path:
+        """
+        Raporu JSON olarak yaz.
+
+        Args:
+            yol: Rapor dosyası
+            butceler_ms: Denetlenecek bütçeler (opsiyonel)
+
+        Returns:
+            Path: Yazılan dosya
+        """
+        hedef = Path(yol)
+        hedef.parent.mkdir(parents=True, exist_ok=True)
+        hedef.write_text(
+            json.dumps(self.rapor(butceler_ms), ensure_ascii=False, indent=2), encoding="utf-8"
+        )
+        return hedef
+
+
+_startup_tracer = StartupTracer()
+
+
+def get_startup_tracer() -> StartupTracer:
+    """
+    Uygulama açılışının paylaşılan izleyicisini döndür.
+
+    Returns:
+        StartupTracer: Paylaşılan izleyici
+    """
+    return _startup_tracer
+
+
+def _env_etkin() -> bool:
+    return os.getenv(TRACE_ENV, "").strip().lower() in ("1", "true", "yes", "on")
+
+
+def izleme_istendi(config_dir: str = "config") -> bool:
+    """
+    Konfigürasyon yüklenmeden önce açılış izlemesinin açık olup olmadığını belirle.
+
+    ``AIDAT_STARTUP_TRACE`` ortam değişkeni veya konfigürasyon dosyalarındaki
+    ``profiling.startup_trace`` değeri okunur; sonraki dosya öncekini ezer.
+    Okunamayan dosyalar atlanır (hatayı ConfigurationManager raporlar).
+
+    Args:
+        config_dir: Konfigürasyon dizini
+
+    Returns:
+        bool: Import bulucusu kurulmalı mı
+    """
+    if _env_etkin():
+        return True
+    etkin = False
+    for dosya in KONFIGURASYON_DOSYALARI:
+        try:
+            veri = json.loads((Path(config_dir) / dosya).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        profiling = veri.get("profiling") if isinstance(veri, dict) else None
+        if isinstance(profiling, dict) and "startup_trace" in profiling:
+            etkin = bool(profiling["startup_trace"])
+    return etkin
+
+
+def get_startup_trace_settings(config: Optional[Any] = None) -> StartupTraceAyarlari:
+    """
+    Açılış izleme ayarlarını ortam değişkenlerinden ve konfigürasyondan oku.
+
+    Ortam değişkenleri konfigürasyondan önce gelir.
+
+    Args:
+        config: ConfigurationManager instance'ı. None ise singleton kullanılır.
+
+    Returns:
+        StartupTraceAyarlari: Doğrulanmış ayarlar
+
+    Raises:
+        ConfigError: Bütçelerden biri sayı değilse veya negatifse
+    """
+    if config is None:
+        from configuration.config_manager import ConfigurationManager
+        config = ConfigurationManager.get_instance()
+
+    varsayilan = StartupTraceAyarlari()
+    etkin = _env_etkin() or bool(config.get("profiling.startup_trace", varsayilan.etkin))
+    rapor_yolu = os.getenv(TRACE_FILE_ENV) or str(config.get("profiling.startup_report", varsayilan.rapor_yolu))
+
+    butceler = config.get("profiling.startup_budgets_ms", None) or {}
+    if not isinstance(butceler, dict):
+        raise ConfigError(
+            "Açılış bütçeleri ölçüm adı -> milisaniye sözlüğü olmalı",
+            code="CFG_002",
+            details={"key": "profiling.startup_budgets_ms"}
+        )
+    butceler_ms: Dict[str, float] = {}
+    for ad, deger in butceler.items():
+        try:
+            butce = float(deger)
+        except (TypeError, ValueError):
+            butce = -1.0
+        if butce < 0:
+            raise ConfigError(
+                f"Geçersiz açılış bütçesi: {ad}={deger}",
+                code="CFG_002",
+                details={"key": f"profiling.startup_budgets_ms.{ad}"}
+            )
+        butceler_ms[str(ad)] = butce
+
+    return StartupTraceAyarlari(etkin=etkin, rapor_yolu=rapor_yolu, butceler_ms=butceler_ms)